@@ -6,34 +6,55 @@ This script tests the resilience and capacity of Virtual Machines and Volumes
 by running concurrent chaos operations including VM creation, volume resize,
 volume clone, VM restart, and VM snapshots.
 
-Each iteration performs (concurrently where possible):
+Each iteration runs a scenario of operations. The default scenario performs
+(concurrently where possible):
 1. Create VMs with multiple data volumes
 2. Resize root and data volumes
 3. Clone volumes
 4. Restart VMs
 5. Snapshot VMs
 
+--scenario loads a YAML scenario instead, declaring the operations, their
+dependencies, per-operation concurrency, counts, retries and failure policy
+(see scenarios/).
+
+--capacity-search skips the operations and only looks for the maximum number
+of schedulable VMs: the VM count grows geometrically until VMs cannot be
+scheduled, then bisects between the last count that fit and the first that
+did not.
+
+--namespace-shards spreads the VMs over several namespaces; a VM's namespace
+only depends on its name.
+
 Usage:
     python3 measure-chaos.py --storage-class YOUR-STORAGE-CLASS --vms 5 --concurrency 2
 """
 
 import argparse
+import csv
 import json
+import math
 import os
+import random
+import re
 import sys
+import threading
 import time
+import zlib
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from typing import Optional, Tuple, List, Dict
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from utils.common import (
-    setup_logging, run_kubectl_command, create_namespace, namespace_exists,
+    setup_logging, run_kubectl_command, namespace_exists, create_namespaces_parallel,
+    delete_namespaces_parallel, wait_for_namespaces_deleted,
     get_vm_status, restart_vm, resize_pvc, wait_for_pvc_resize,
-    create_vm_snapshot, wait_for_snapshot_ready, delete_vm_snapshot,
-    get_pvc_size, get_vm_volume_names, Colors, save_capacity_results
+    create_vm_snapshot, wait_for_snapshot_ready, delete_vm_snapshot, delete_vm,
+    get_pvc_size, get_vm_volume_names, Colors, save_capacity_results, summarize_distribution,
+    count_kubectl_call, get_kubectl_call_count
 )
 
 # Default configuration
@@ -45,6 +66,7 @@ DEFAULT_DATA_VOLUME_COUNT = 1  # Reduced from 9 to 1
 DEFAULT_MIN_VOL_SIZE = '30Gi'
 DEFAULT_MIN_VOL_INC_SIZE = '10Gi'
 DEFAULT_CONCURRENCY = 2
+DEFAULT_VOLUME_CONCURRENCY = 10
 
 
 def parse_args():
@@ -66,6 +88,15 @@ Examples:
   # Skip specific phases
   python3 measure-chaos.py --storage-class YOUR-STORAGE-CLASS --skip-resize --skip-clone --concurrency 2
 
+  # Run a YAML scenario
+  python3 measure-chaos.py --storage-class YOUR-STORAGE-CLASS --scenario scenarios/fan-out.yaml --concurrency 2
+
+  # Search the maximum VM density to within 4 VMs, starting at 16 VMs
+  python3 measure-chaos.py --storage-class YOUR-STORAGE-CLASS --capacity-search --vms 16 --search-precision 4 --concurrency 10
+
+  # Spread the VMs over 8 namespaces (virt-chaos-benchmark-1 .. -8)
+  python3 measure-chaos.py --storage-class YOUR-STORAGE-CLASS --namespace-shards 8 --concurrency 4
+
   # Cleanup only mode
   python3 measure-chaos.py --cleanup-only
         """
@@ -80,6 +111,9 @@ Examples:
     # Test configuration
     parser.add_argument('--namespace', '-n', type=str, default=DEFAULT_NAMESPACE,
                         help=f'Namespace for test resources (default: {DEFAULT_NAMESPACE})')
+    parser.add_argument('--namespace-shards', type=int, default=1,
+                        help='Spread the VMs over this many namespaces, <namespace>-1 .. <namespace>-N; '
+                             'a VM always lands in the same one (default: 1 = just --namespace)')
     parser.add_argument('--max-iterations', type=int, default=0,
                         help='Maximum number of iterations (0 for infinite, default: 0)')
     parser.add_argument('--vms', type=int, default=DEFAULT_VMS_PER_ITERATION,
@@ -90,6 +124,9 @@ Examples:
                         help=f'Minimum volume size, e.g., 30Gi, 100Mi (default: {DEFAULT_MIN_VOL_SIZE})')
     parser.add_argument('--min-vol-inc-size', type=str, default=DEFAULT_MIN_VOL_INC_SIZE,
                         help=f'Volume size increment for resize, e.g., 10Gi, 50Mi (default: {DEFAULT_MIN_VOL_INC_SIZE})')
+    parser.add_argument('--volume-concurrency', type=int, default=DEFAULT_VOLUME_CONCURRENCY,
+                        help='PVC resizes/clones in flight at once, shared by all VMs; the PVCs of a VM run '
+                             f'in parallel within this limit (default: {DEFAULT_VOLUME_CONCURRENCY})')
 
     # VM template configuration
     parser.add_argument('--vm-yaml', type=str, default=DEFAULT_VM_YAML,
@@ -105,7 +142,50 @@ Examples:
     parser.add_argument('--vm-cpu-cores', type=int, default=1,
                         help='VM CPU cores (default: 1)')
 
-    # Skip options
+    # Scenario
+    parser.add_argument('--scenario', type=str, default=None,
+                        help='YAML scenario declaring the operations of an iteration '
+                             '(default: create, resize, clone, restart, snapshot)')
+
+    # Pipelined mode
+    parser.add_argument('--pipelined', action='store_true',
+                        help='Move every VM through the scenario on its own and admit the next iteration\'s VMs '
+                             'as soon as fewer than --max-in-flight VMs are in the pipeline, instead of '
+                             'running iterations in lock step')
+
+    # Open-loop mode
+    parser.add_argument('--open-loop', type=int, default=0, metavar='SECONDS',
+                        help='Open-loop mode: issue a weighted mix of operations at a steady arrival rate against '
+                             'a live pool of --vms VMs for this many seconds instead of running iterations '
+                             '(default: 0 = off)')
+    parser.add_argument('--arrival-rate', type=float, default=6.0,
+                        help='Open-loop arrivals per minute (default: 6)')
+    parser.add_argument('--arrival-process', type=str, default='poisson', choices=ARRIVAL_PROCESSES,
+                        help='Open-loop inter-arrival times: exponential (poisson) or constant (fixed) '
+                             '(default: poisson)')
+    parser.add_argument('--op-mix', type=str, default=DEFAULT_OP_MIX,
+                        help=f'Open-loop operation weights (default: {DEFAULT_OP_MIX})')
+    parser.add_argument('--max-in-flight', type=int, default=20,
+                        help='Open loop: arrivals beyond this many running operations are rejected; '
+                             'pipelined: VMs in the pipeline at once (default: 20)')
+    parser.add_argument('--window', type=int, default=60,
+                        help='Open-loop reporting window in seconds for error rates over time (default: 60)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Random seed for open-loop arrivals and VM picks (default: random)')
+
+    # Capacity search
+    parser.add_argument('--capacity-search', action='store_true',
+                        help='Only search the maximum number of schedulable VMs: grow from --vms VMs by '
+                             '--search-growth until VMs cannot be scheduled, then bisect')
+    parser.add_argument('--search-growth', type=float, default=2.0,
+                        help='Capacity search: factor the VM count grows by until the first failure (default: 2)')
+    parser.add_argument('--search-precision', type=int, default=1,
+                        help='Capacity search: stop bisecting once the gap between the largest count that fit '
+                             'and the smallest that did not is at most this many VMs (default: 1 = exact)')
+    parser.add_argument('--search-max', type=int, default=0,
+                        help='Capacity search: never probe more than this many VMs (default: 0 = no limit)')
+
+    # Skip options (remove operations of that type from the scenario)
     parser.add_argument('--skip-resize', action='store_true',
                         help='Skip volume resize phase')
     parser.add_argument('--skip-clone', action='store_true',
@@ -127,7 +207,8 @@ Examples:
     parser.add_argument('--cleanup', action='store_true',
                         help='Cleanup resources after test completion')
     parser.add_argument('--cleanup-only', action='store_true',
-                        help='Only cleanup resources from previous runs')
+                        help='Only cleanup resources from previous runs; deletes --namespace and every '
+                             '<namespace>-<n> shard, whatever --namespace-shards the run used')
 
     # Results options
     parser.add_argument('--save-results', action='store_true',
@@ -149,10 +230,86 @@ Examples:
     # Validate arguments
     if not args.cleanup_only and not args.storage_class:
         parser.error('--storage-class is required (unless using --cleanup-only)')
+    if args.namespace_shards < 1:
+        parser.error('--namespace-shards must be >= 1')
+    if args.volume_concurrency < 1:
+        parser.error('--volume-concurrency must be >= 1')
+
+    args.scenario_name = 'default'
+    args.operations = []
+    if not args.cleanup_only:
+        try:
+            if args.scenario:
+                args.scenario_name, args.operations = load_scenario(args.scenario)
+            else:
+                args.operations = default_scenario(args)
+        except ValueError as e:
+            parser.error(f"Invalid scenario: {e}")
+
+    if args.capacity_search:
+        if args.open_loop or args.pipelined or args.scenario:
+            parser.error('--capacity-search cannot be combined with --open-loop, --pipelined or --scenario')
+        if args.vms < 1 or args.search_growth <= 1 or args.search_precision < 1 or args.search_max < 0:
+            parser.error('--capacity-search needs --vms >= 1, --search-growth > 1 and --search-precision >= 1')
+    if args.pipelined and (args.open_loop or args.max_in_flight < 1):
+        parser.error('--pipelined cannot be combined with --open-loop and needs --max-in-flight >= 1')
+    if args.open_loop:
+        if args.scenario:
+            parser.error('--open-loop cannot be combined with --scenario')
+        if args.arrival_rate <= 0 or args.max_in_flight < 1 or args.window < 1:
+            parser.error('--arrival-rate, --max-in-flight and --window must be > 0')
+        try:
+            args.op_mix = parse_op_mix(args.op_mix)
+        except ValueError as e:
+            parser.error(f"Invalid --op-mix: {e}")
+        # --skip-* flags remove their operation type from the mix
+        args.op_mix = {t: w for t, w in args.op_mix.items()
+                       if not (OPERATION_TYPES[t]['skip'] and getattr(args, OPERATION_TYPES[t]['skip']))}
+        if not args.op_mix:
+            parser.error('Every operation type of --op-mix is skipped')
+        if 'create-vm' not in args.op_mix and args.vms < 1:
+            parser.error('--op-mix without create-vm needs an initial pool (--vms)')
 
     return args
 
 
+def shard_namespaces(namespace: str, shards: int) -> List[str]:
+    """The test namespaces: just namespace, or namespace-1 .. namespace-<shards>."""
+    if shards == 1:
+        return [namespace]
+    return [f"{namespace}-{i}" for i in range(1, shards + 1)]
+
+
+def find_test_namespaces(namespace: str, logger) -> List[str]:
+    """
+    The existing test namespaces of any shard count: namespace and namespace-<n>.
+
+    Cleanup uses this so it does not depend on repeating the --namespace-shards
+    of the run. Returns an empty list if the namespaces cannot be listed.
+    """
+    try:
+        returncode, stdout, stderr = run_kubectl_command(
+            ['get', 'namespaces', '-o', 'jsonpath={.items[*].metadata.name}'], check=False, logger=logger)
+    except Exception as e:
+        logger.error(f"Error listing namespaces: {e}")
+        return []
+    if returncode != 0:
+        logger.error(f"Failed to list namespaces: {stderr.strip()}")
+        return []
+    pattern = re.compile(rf'^{re.escape(namespace)}(-\d+)?$')
+    return sorted((ns for ns in stdout.split() if pattern.match(ns)),
+                  key=lambda ns: (len(ns), ns))
+
+
+def vm_namespace(vm_name: str, namespaces: List[str]) -> str:
+    """
+    Namespace of a VM. The placement only depends on the VM name, so a VM, its
+    volumes, clones and snapshots always share one namespace, in every mode
+    and across runs with the same shard count.
+    """
+    return namespaces[zlib.crc32(vm_name.encode()) % len(namespaces)]
+
+
 def parse_size_to_gi(size_str: str) -> int:
     """Parse size string to GiB integer."""
     size_str = size_str.strip().upper()
@@ -216,6 +373,7 @@ def clone_pvc(source_pvc: str, clone_name: str, namespace: str, storage_class: s
             }
         }
 
+        count_kubectl_call()
         process = subprocess.Popen(
             ['kubectl', 'create', '-f', '-', '-n', namespace],
             stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
@@ -337,6 +495,7 @@ def create_vm_with_data_volumes(vm_name: str, namespace: str, vm_yaml: str,
             domain['devices']['disks'] = disks
 
             # Create VM
+            count_kubectl_call()
             process = subprocess.Popen(
                 ['kubectl', 'create', '-f', '-', '-n', namespace],
                 stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
@@ -413,52 +572,384 @@ def wait_for_vm_running(vm_name: str, namespace: str, logger, timeout: int = 180
     return False, 'timeout'
 
 
-def wait_for_vms_running_concurrent(vm_names: List[str], namespace: str, logger,
-                                     timeout: int = 1800, scheduling_timeout: int = 120,
-                                     concurrency: int = 10) -> Tuple[List[str], List[str], str]:
-    """Wait for multiple VMs concurrently. Returns (successful, failed, failure_reason)."""
-    successful = []
-    failed = []
-    failure_reason = ''
+# ---------------- Scenario operations ----------------
+# Every operation acts on one VM. `start` issues the operation and `wait`
+# (optional) waits until it has taken effect; both return (success, error).
+# A wait error in CAPACITY_REASONS means the cluster is full.
 
-    with ThreadPoolExecutor(max_workers=concurrency) as executor:
-        futures = {
-            executor.submit(wait_for_vm_running, vm, namespace, logger, timeout, scheduling_timeout): vm
-            for vm in vm_names
-        }
+CAPACITY_REASONS = ('scheduling', 'capacity')
+
+
+def op_create_vm(vm_name: str, op: dict, ctx: dict) -> Tuple[bool, Optional[str]]:
+    """Create the VM with its data volumes; the scenario's retries replace the create retries."""
+    args = ctx['args']
+    if not create_vm_with_data_volumes(vm_name, vm_namespace(vm_name, ctx['namespaces']), args.vm_yaml, ctx['storage_class'],
+                                       args.data_volume_count, args.min_vol_size, args, ctx['logger'],
+                                       max_retries=1):
+        return False, f"Failed to create VM {vm_name}"
+    return True, None
+
+
+def op_wait_running(vm_name: str, op: dict, ctx: dict) -> Tuple[bool, Optional[str]]:
+    """Wait for the VM to be Running; the error is the failure reason of wait_for_vm_running."""
+    args = ctx['args']
+    success, reason = wait_for_vm_running(vm_name, vm_namespace(vm_name, ctx['namespaces']), ctx['logger'], args.vm_timeout,
+                                          args.scheduling_timeout)
+    return success, None if success else reason
 
-        for future in as_completed(futures):
-            vm_name = futures[future]
+
+def run_volume_operations(vm_name: str, op: dict, ctx: dict, func) -> Tuple[bool, Optional[str]]:
+    """
+    Run func(pvc_name, namespace) -> (success, error) on every PVC of the VM.
+
+    The PVCs run in parallel, each holding one of the --volume-concurrency
+    slots shared by all VMs (ctx['volumes']['slots']), and each gets a record
+    with its own timing in ctx['volumes']['records'].
+    Returns the first failure in PVC order, or (True, None).
+    """
+    namespace, logger, volumes = vm_namespace(vm_name, ctx['namespaces']), ctx['logger'], ctx['volumes']
+    pvc_names = get_vm_volume_names(vm_name, namespace, logger)
+    if not pvc_names:
+        return True, None
+
+    def run_pvc(pvc_name):
+        with volumes['slots']:
+            start = time.time()
             try:
-                success, reason = future.result()
-                if success:
-                    successful.append(vm_name)
-                else:
-                    failed.append(vm_name)
-                    if not failure_reason:
-                        failure_reason = reason
+                success, error = func(pvc_name, namespace)
             except Exception as e:
-                logger.error(f"Error waiting for VM {vm_name}: {e}")
-                failed.append(vm_name)
-                if not failure_reason:
-                    failure_reason = 'error'
+                success, error = False, str(e)
+            end = time.time()
+        logger.debug(f"[{op['name']}] {vm_name}/{pvc_name}: {end - start:.2f}s"
+                     + ("" if success else f" ({error})"))
+        with volumes['lock']:
+            volumes['records'].append({
+                'iteration': ctx['iteration'],
+                'operation': op['name'],
+                'type': op['type'],
+                'vm': vm_name,
+                'namespace': namespace,
+                'pvc': pvc_name,
+                'start': start,
+                'end': end,
+                'duration_sec': round(end - start, 3),
+                'success': success,
+                'error': None if success else error or 'failed',
+            })
+        return success, error
+
+    with ThreadPoolExecutor(max_workers=len(pvc_names)) as executor:
+        results = list(executor.map(run_pvc, pvc_names))
+    for success, error in results:
+        if not success:
+            return False, error
+    return True, None
+
+
+def op_resize_volumes(vm_name: str, op: dict, ctx: dict) -> Tuple[bool, Optional[str]]:
+    """Grow every PVC of the VM by params.increment (default --min-vol-inc-size)."""
+    logger = ctx['logger']
+    increment = op['params'].get('increment', ctx['args'].min_vol_inc_size)
+
+    def resize(pvc_name, namespace):
+        current_size = get_pvc_size(pvc_name, namespace, logger)
+        if not current_size:
+            return False, f"Failed to get size for PVC {pvc_name}"
+        new_size = increment_size(current_size, increment)
+        if not resize_pvc(pvc_name, namespace, new_size, logger):
+            return False, f"Failed to resize PVC {pvc_name}"
+        if not wait_for_pvc_resize(pvc_name, namespace, new_size, logger=logger):
+            return False, f"PVC {pvc_name} resize did not complete"
+        return True, None
+
+    return run_volume_operations(vm_name, op, ctx, resize)
+
+
+def op_clone_volumes(vm_name: str, op: dict, ctx: dict) -> Tuple[bool, Optional[str]]:
+    """Clone every PVC of the VM to <pvc>-<params.suffix> (default: clone) and wait until Bound."""
+    logger = ctx['logger']
+    suffix = op['params'].get('suffix', 'clone')
+
+    def clone(pvc_name, namespace):
+        clone_name = f"{pvc_name}-{suffix}"
+        if not clone_pvc(pvc_name, clone_name, namespace, ctx['storage_class'], logger):
+            return False, f"Failed to clone PVC {pvc_name}"
+        success, _ = wait_for_pvc_bound(clone_name, namespace, logger=logger)
+        if not success:
+            return False, f"Clone PVC {clone_name} did not become bound"
+        return True, None
+
+    return run_volume_operations(vm_name, op, ctx, clone)
+
+
+def op_restart_vm(vm_name: str, op: dict, ctx: dict) -> Tuple[bool, Optional[str]]:
+    """Restart the VM."""
+    if not restart_vm(vm_name, vm_namespace(vm_name, ctx['namespaces']), ctx['logger']):
+        return False, f"Failed to restart VM {vm_name}"
+    return True, None
+
+
+def op_snapshot_vm(vm_name: str, op: dict, ctx: dict) -> Tuple[bool, Optional[str]]:
+    """Snapshot the VM to <vm>-<params.suffix> (default: snapshot) and wait until ready."""
+    namespace, logger = vm_namespace(vm_name, ctx['namespaces']), ctx['logger']
+    snapshot_name = f"{vm_name}-{op['params'].get('suffix', 'snapshot')}"
+    if not create_vm_snapshot(vm_name, snapshot_name, namespace, logger):
+        return False, f"Failed to create snapshot for VM {vm_name}"
+    if not wait_for_snapshot_ready(snapshot_name, namespace, logger=logger):
+        return False, f"Snapshot {snapshot_name} did not become ready"
+    return True, None
+
+
+# Operation types a scenario can use
+OPERATION_TYPES = {
+    'create-vm': {'label': 'Create VMs', 'start': op_create_vm, 'wait': op_wait_running, 'skip': None},
+    'resize-volumes': {'label': 'Resize Volumes', 'start': op_resize_volumes, 'wait': None, 'skip': 'skip_resize'},
+    'clone-volumes': {'label': 'Clone Volumes', 'start': op_clone_volumes, 'wait': None, 'skip': 'skip_clone'},
+    'restart-vm': {'label': 'Restart VMs', 'start': op_restart_vm, 'wait': op_wait_running, 'skip': 'skip_restart'},
+    'snapshot-vm': {'label': 'Create Snapshots', 'start': op_snapshot_vm, 'wait': None, 'skip': 'skip_snapshot'},
+}
+
+FAILURE_POLICIES = ('abort', 'continue')
+
+
+# ---------------- Scenarios ----------------
+def normalize_operations(operations: list) -> List[dict]:
+    """
+    Validate scenario operations and fill in the defaults.
+
+    Without depends_on an operation depends on the one listed before it, so a
+    plain list runs in order; depends_on: [] starts it with the iteration.
+
+    Raises:
+        ValueError: If the scenario is invalid
+    """
+    if not operations:
+        raise ValueError("scenario has no operations")
+
+    normalized = []
+    names = set()
+    for i, raw in enumerate(operations):
+        if not isinstance(raw, dict) or 'type' not in raw:
+            raise ValueError(f"operation {i + 1} needs a type")
+        op_type = raw['type']
+        if op_type not in OPERATION_TYPES:
+            raise ValueError(f"operation {i + 1}: unknown type '{op_type}' "
+                             f"(known: {', '.join(OPERATION_TYPES)})")
+        name = str(raw.get('name', op_type))
+        if name in names:
+            raise ValueError(f"duplicate operation name '{name}'")
+        depends_on = raw.get('depends_on', [normalized[-1]['name']] if normalized else [])
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        unknown = [d for d in depends_on if d not in names]
+        if unknown:
+            raise ValueError(f"operation '{name}' depends on {', '.join(unknown)}, which must be listed before it")
+        on_failure = raw.get('on_failure', 'abort')
+        if on_failure not in FAILURE_POLICIES:
+            raise ValueError(f"operation '{name}': on_failure must be one of {', '.join(FAILURE_POLICIES)}")
+        for key in ('concurrency', 'count'):
+            if raw.get(key) is not None and (not isinstance(raw[key], int) or raw[key] < 1):
+                raise ValueError(f"operation '{name}': {key} must be a positive integer")
+        # VMs beyond count pass an operation untouched, which a VM that was never created cannot do
+        if op_type == 'create-vm' and raw.get('count') is not None:
+            raise ValueError(f"operation '{name}': count is not supported on create-vm, --vms sets the number of VMs")
+        if not isinstance(raw.get('retries', 0), int) or raw.get('retries', 0) < 0:
+            raise ValueError(f"operation '{name}': retries must be >= 0")
+
+        names.add(name)
+        normalized.append({
+            'name': name,
+            'type': op_type,
+            'depends_on': list(depends_on),
+            'concurrency': raw.get('concurrency'),
+            'count': raw.get('count'),
+            'on_failure': on_failure,
+            'retries': raw.get('retries', 0),
+            'retry_delay': raw.get('retry_delay', 5),
+            'params': raw.get('params') or {},
+        })
+    return normalized
+
+
+def load_scenario(path: str) -> Tuple[str, List[dict]]:
+    """
+    Load a YAML chaos scenario.
+
+    Returns:
+        Tuple of (scenario name, normalized operations)
+
+    Raises:
+        ValueError: If the file cannot be parsed or the scenario is invalid
+    """
+    import yaml as pyyaml
+
+    try:
+        with open(path, 'r') as f:
+            scenario = pyyaml.safe_load(f) or {}
+    except (OSError, pyyaml.YAMLError) as e:
+        raise ValueError(f"cannot read {path}: {e}")
+    if not isinstance(scenario, dict):
+        raise ValueError(f"{path} must contain a mapping with an operations list")
+    name = scenario.get('name', os.path.splitext(os.path.basename(path))[0])
+    return name, normalize_operations(scenario.get('operations'))
+
+
+def default_scenario(args) -> List[dict]:
+    """The classic five lock-step phases: create, resize, clone, restart, snapshot."""
+    return normalize_operations([
+        {'type': 'create-vm', 'retries': max(0, args.max_create_retries - 1)},
+        {'type': 'resize-volumes'},
+        {'type': 'clone-volumes'},
+        {'type': 'restart-vm'},
+        {'type': 'snapshot-vm'},
+    ])
+
+
+def drop_operations(operations: List[dict], drop: List[str]) -> List[dict]:
+    """Remove the named operations; their dependents inherit their dependencies."""
+    inherited = {}
+    kept = []
+    for op in operations:
+        depends_on = []
+        for dep in op['depends_on']:
+            for d in inherited.get(dep, [dep]):
+                if d not in depends_on:
+                    depends_on.append(d)
+        if op['name'] in drop:
+            inherited[op['name']] = depends_on
+        else:
+            kept.append(dict(op, depends_on=depends_on))
+    return kept
+
+
+def operation_label(op: dict) -> str:
+    """Phase label of an operation, e.g. 'Create VMs' or 'Clone Volumes (clone-again)'."""
+    label = OPERATION_TYPES[op['type']]['label']
+    return label if op['name'] == op['type'] else f"{label} ({op['name']})"
+
+
+# ---------------- Scenario executor ----------------
+def _run_with_retries(func, vm_name: str, op: dict, ctx: dict) -> Tuple[bool, Optional[str], int]:
+    """Run an operation step, retrying failures op['retries'] times. Returns (success, error, attempts)."""
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            success, error = func(vm_name, op, ctx)
+        except Exception as e:
+            success, error = False, str(e)
+        if success or attempt > op['retries'] or error in CAPACITY_REASONS:
+            return success, error, attempt
+        ctx['logger'].warning(f"[{op['name']}] {vm_name}: {error}, retrying ({attempt}/{op['retries']})")
+        time.sleep(op['retry_delay'])
+
+
+def _run_wait(func, vm_name: str, op: dict, ctx: dict) -> Tuple[bool, Optional[str]]:
+    """Run an operation's wait step; exceptions count as failures."""
+    try:
+        return func(vm_name, op, ctx)
+    except Exception as e:
+        return False, str(e)
+
+
+def _operation_record(ctx: dict, op: dict, vm_name: str, start: float, end: float,
+                      attempts: int, error: Optional[str]) -> dict:
+    """One record per operation per VM; error is None on success."""
+    return {
+        'iteration': ctx['iteration'],
+        'operation': op['name'],
+        'type': op['type'],
+        'vm': vm_name,
+        'namespace': vm_namespace(vm_name, ctx['namespaces']),
+        'start': start,
+        'end': end,
+        'duration_sec': round(end - start, 3),
+        'attempts': attempts,
+        'success': error is None,
+        'error': error,
+    }
 
-    return successful, failed, failure_reason
 
+def run_on_vm(op: dict, vm_name: str, ctx: dict) -> dict:
+    """Run one operation on one VM, start then wait, and return its record."""
+    spec = OPERATION_TYPES[op['type']]
+    start = time.time()
+    success, error, attempts = _run_with_retries(spec['start'], vm_name, op, ctx)
+    if success and spec['wait']:
+        success, error = _run_wait(spec['wait'], vm_name, op, ctx)
+    return _operation_record(ctx, op, vm_name, start, time.time(), attempts,
+                             None if success else error or 'failed')
 
 
-def run_iteration(iteration: int, namespace: str, storage_class: str, args, logger,
-                  phases_executed: List[str]) -> Tuple[bool, bool, int]:
+def run_operation(op: dict, vm_names: List[str], ctx: dict,
+                  records: List[dict]) -> Tuple[List[str], Dict[str, str]]:
     """
-    Run a single chaos test iteration with concurrent operations.
+    Run one scenario operation on up to op['count'] of the given VMs.
+
+    VMs beyond op['count'] pass through unchanged; normalize_operations
+    rejects count on create-vm, so every passed VM exists. All starts run first, then all waits, each on a pool of op['concurrency']
+    workers (default --concurrency). Every VM gets a record with its start,
+    end, duration, attempts and outcome.
+
+    Returns:
+        Tuple of (VMs that passed, {failed VM: error})
+    """
+    spec = OPERATION_TYPES[op['type']]
+    targets = vm_names[:op['count']] if op['count'] else list(vm_names)
+    workers = max(1, min(op['concurrency'] or ctx['args'].concurrency, len(targets) or 1))
+    started_at = {}
+    ended_at = {}
+    failed: Dict[str, str] = {}
+    attempts: Dict[str, int] = {}
+
+    def start_vm(vm_name):
+        started_at[vm_name] = time.time()
+        success, error, attempts[vm_name] = _run_with_retries(spec['start'], vm_name, op, ctx)
+        ended_at[vm_name] = time.time()
+        if not success:
+            failed[vm_name] = error or 'failed'
+
+    def wait_vm(vm_name):
+        success, error = _run_wait(spec['wait'], vm_name, op, ctx)
+        ended_at[vm_name] = time.time()
+        if not success:
+            failed[vm_name] = error or 'failed'
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(start_vm, targets))
+        if spec['wait']:
+            list(executor.map(wait_vm, [vm for vm in targets if vm not in failed]))
+
+    for vm_name in targets:
+        records.append(_operation_record(ctx, op, vm_name, started_at[vm_name], ended_at[vm_name],
+                                         attempts[vm_name], failed.get(vm_name)))
+
+    return [vm for vm in vm_names if vm not in failed], failed
+
+
+def run_iteration(iteration: int, namespaces: List[str], storage_class: str, args, logger,
+                  phases_executed: List[str], operations: List[dict],
+                  records: List[dict], volumes: dict) -> Tuple[bool, bool, int]:
+    """
+    Run a single chaos test iteration by executing the scenario operations.
+
+    An operation starts as soon as all operations it depends on have finished
+    and acts on the VMs that passed all of them; independent operations run
+    at the same time. A failure in an operation with on_failure: abort fails
+    the iteration once the running operations finish; with continue the
+    failed VMs just drop out of the dependent operations. VMs that cannot be
+    scheduled end the iteration with capacity reached.
 
     Args:
         iteration: Iteration number
-        namespace: Namespace
+        namespaces: Test namespaces the VMs are spread over
         storage_class: Storage class name
         args: Command line arguments
         logger: Logger instance
         phases_executed: List to track which phases actually executed (modified in place)
+        operations: Normalized scenario operations
+        records: Per-VM operation records (appended to)
+        volumes: Per-PVC records and slots of the resize/clone operations (see new_volume_tracker)
 
     Returns:
         Tuple of (success, capacity_reached, vms_created)
@@ -470,219 +961,779 @@ def run_iteration(iteration: int, namespace: str, storage_class: str, args, logg
     logger.info("=" * 100)
 
     vm_names = [f"{args.vm_name}-{iteration}-{i}" for i in range(1, args.vms + 1)]
+    ctx = {'iteration': iteration, 'namespaces': namespaces, 'storage_class': storage_class,
+           'args': args, 'logger': logger, 'volumes': volumes}
 
-    # Phase 1: Create VMs (concurrent)
-    logger.info(f"\n{Colors.HEADER}Phase 1: Creating {args.vms} VMs (concurrency: {args.concurrency}){Colors.ENDC}")
-    phase_start = time.time()
-
-    created_vms = []
-    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-        futures = {
-            executor.submit(
-                create_vm_with_data_volumes, vm_name, namespace, args.vm_yaml,
-                storage_class, args.data_volume_count, args.min_vol_size, args, logger,
-                args.max_create_retries
-            ): vm_name for vm_name in vm_names
-        }
-        for future in as_completed(futures):
-            vm_name = futures[future]
-            try:
-                if future.result():
-                    created_vms.append(vm_name)
-                else:
-                    logger.error(f"Failed to create VM {vm_name}")
-                    return False, False, 0
-            except Exception as e:
-                logger.error(f"Exception creating VM {vm_name}: {e}")
-                return False, False, 0
-
-    # Wait for VMs to be running (concurrent)
-    logger.info(f"Waiting for {len(created_vms)} VMs to reach Running state (scheduling timeout: {args.scheduling_timeout}s)...")
-    successful_vms, failed_vms, failure_reason = wait_for_vms_running_concurrent(
-        created_vms, namespace, logger, args.vm_timeout, args.scheduling_timeout, args.concurrency
-    )
+    passed: Dict[str, List[str]] = {}
+    created = set()
+    aborted = False
+    capacity_reached = False
+    pending = list(operations)
+
+    def execute(op, targets):
+        count = min(op['count'] or len(targets), len(targets))
+        logger.info(f"\n{Colors.HEADER}{operation_label(op)}: {count} VMs "
+                    f"(concurrency: {op['concurrency'] or args.concurrency}){Colors.ENDC}")
+        op_start = time.time()
+        survivors, failed = run_operation(op, targets, ctx, records)
+        return survivors, failed, time.time() - op_start
+
+    with ThreadPoolExecutor(max_workers=len(operations)) as executor:
+        running = {}
+        while pending or running:
+            for op in [o for o in pending if all(d in passed for d in o['depends_on'])]:
+                pending.remove(op)
+                if aborted or capacity_reached:
+                    continue
+                targets = vm_names
+                for dep in op['depends_on']:
+                    targets = [vm for vm in targets if vm in passed[dep]]
+                running[executor.submit(execute, op, targets)] = op
+            if not running:
+                break
 
-    if failed_vms:
-        if failure_reason in ('scheduling', 'capacity'):
-            logger.warning(f"{Colors.WARNING}CAPACITY REACHED: {len(failed_vms)} VMs could not be scheduled{Colors.ENDC}")
-            return False, True, len(successful_vms)
-        logger.error(f"Phase 1 FAILED: {len(failed_vms)} VMs failed to start (reason: {failure_reason})")
-        return False, False, len(successful_vms)
-
-    phase_duration = time.time() - phase_start
-    phases_executed.append('Create VMs')
-    logger.info(f"{Colors.OKGREEN}Phase 1 COMPLETE: {len(successful_vms)} VMs running (took {phase_duration:.2f}s){Colors.ENDC}")
-
-    # Phase 2: Resize Volumes (concurrent)
-    if not args.skip_resize:
-        logger.info(f"\n{Colors.HEADER}Phase 2: Resizing Volumes (concurrency: {args.concurrency}){Colors.ENDC}")
-        phase_start = time.time()
-
-        def resize_vm_volumes(vm_name):
-            pvc_names = get_vm_volume_names(vm_name, namespace, logger)
-            for pvc_name in pvc_names:
-                current_size = get_pvc_size(pvc_name, namespace, logger)
-                if not current_size:
-                    return False, f"Failed to get size for PVC {pvc_name}"
-                new_size = increment_size(current_size, args.min_vol_inc_size)
-                if not resize_pvc(pvc_name, namespace, new_size, logger):
-                    return False, f"Failed to resize PVC {pvc_name}"
-                if not wait_for_pvc_resize(pvc_name, namespace, new_size, logger=logger):
-                    return False, f"PVC {pvc_name} resize did not complete"
-            return True, None
-
-        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-            futures = {executor.submit(resize_vm_volumes, vm): vm for vm in successful_vms}
-            for future in as_completed(futures):
-                vm_name = futures[future]
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                op = running.pop(future)
                 try:
-                    success, error = future.result()
-                    if not success:
-                        logger.error(f"Phase 2 FAILED for {vm_name}: {error}")
-                        return False, False, len(successful_vms)
+                    survivors, failed, op_sec = future.result()
                 except Exception as e:
-                    logger.error(f"Phase 2 FAILED for {vm_name}: {e}")
-                    return False, False, len(successful_vms)
+                    logger.error(f"{operation_label(op)} FAILED: {e}")
+                    aborted = True
+                    passed[op['name']] = []
+                    continue
+                passed[op['name']] = survivors
+                if op['type'] == 'create-vm':
+                    created.update(survivors)
+
+                for vm_name, error in failed.items():
+                    logger.error(f"{operation_label(op)} FAILED for {vm_name}: {error}")
+                if any(error in CAPACITY_REASONS for error in failed.values()):
+                    logger.warning(f"{Colors.WARNING}CAPACITY REACHED: {len(failed)} VMs could not be scheduled{Colors.ENDC}")
+                    capacity_reached = True
+                elif failed and op['on_failure'] == 'abort':
+                    aborted = True
+                else:
+                    phases_executed.append(operation_label(op))
+                    logger.info(f"{Colors.OKGREEN}{operation_label(op)} COMPLETE: {len(survivors)} VMs passed"
+                                + (f", {len(failed)} failed" if failed else "")
+                                + f" (took {op_sec:.2f}s){Colors.ENDC}")
 
-        phase_duration = time.time() - phase_start
-        phases_executed.append('Resize Volumes')
-        logger.info(f"{Colors.OKGREEN}Phase 2 COMPLETE: All volumes resized (took {phase_duration:.2f}s){Colors.ENDC}")
-    else:
-        logger.info(f"\n{Colors.WARNING}Phase 2: SKIPPED (--skip-resize){Colors.ENDC}")
-
-    # Phase 3: Clone Volumes (concurrent)
-    if not args.skip_clone:
-        logger.info(f"\n{Colors.HEADER}Phase 3: Cloning Volumes (concurrency: {args.concurrency}){Colors.ENDC}")
-        phase_start = time.time()
-        clones_created = []
-
-        def clone_vm_volumes(vm_name):
-            pvc_names = get_vm_volume_names(vm_name, namespace, logger)
-            cloned = []
-            for pvc_name in pvc_names:
-                clone_name = f"{pvc_name}-clone"
-                if not clone_pvc(pvc_name, clone_name, namespace, storage_class, logger):
-                    return False, cloned, f"Failed to clone PVC {pvc_name}"
-                success, _ = wait_for_pvc_bound(clone_name, namespace, logger=logger)
-                if not success:
-                    return False, cloned, f"Clone PVC {clone_name} did not become bound"
-                cloned.append(clone_name)
-            return True, cloned, None
-
-        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-            futures = {executor.submit(clone_vm_volumes, vm): vm for vm in successful_vms}
-            for future in as_completed(futures):
-                vm_name = futures[future]
-                try:
-                    success, cloned, error = future.result()
-                    clones_created.extend(cloned)
-                    if not success:
-                        logger.error(f"Phase 3 FAILED for {vm_name}: {error}")
-                        return False, False, len(successful_vms)
-                except Exception as e:
-                    logger.error(f"Phase 3 FAILED for {vm_name}: {e}")
-                    return False, False, len(successful_vms)
+    if capacity_reached:
+        return False, True, len(created)
+    if aborted:
+        return False, False, len(created)
 
-        phase_duration = time.time() - phase_start
-        phases_executed.append('Clone Volumes')
-        logger.info(f"{Colors.OKGREEN}Phase 3 COMPLETE: {len(clones_created)} clones created (took {phase_duration:.2f}s){Colors.ENDC}")
-    else:
-        logger.info(f"\n{Colors.WARNING}Phase 3: SKIPPED (--skip-clone){Colors.ENDC}")
+    logger.info(f"\n{Colors.OKGREEN}{Colors.BOLD}ITERATION {iteration} COMPLETE{Colors.ENDC}")
+    return True, False, len(created)
 
-    # Phase 4: Restart VMs (concurrent)
-    if not args.skip_restart:
-        logger.info(f"\n{Colors.HEADER}Phase 4: Restarting VMs (concurrency: {args.concurrency}){Colors.ENDC}")
-        phase_start = time.time()
 
-        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-            futures = {executor.submit(restart_vm, vm, namespace, logger): vm for vm in successful_vms}
-            for future in as_completed(futures):
-                vm_name = futures[future]
-                try:
-                    if not future.result():
-                        logger.error(f"Phase 4 FAILED: Failed to restart VM {vm_name}")
-                        return False, False, len(successful_vms)
-                except Exception as e:
-                    logger.error(f"Phase 4 FAILED for {vm_name}: {e}")
-                    return False, False, len(successful_vms)
+# ---------------- Pipelined mode ----------------
+def run_pipelined(namespaces: List[str], storage_classes: List[str], operations: List[dict], args, logger,
+                  records: List[dict], volumes: dict) -> dict:
+    """
+    Run the scenario per VM instead of per iteration, so consecutive iterations overlap.
+
+    Every VM walks through the scenario operations on its own (in listed
+    order, skipping operations whose dependencies failed for it). VMs are
+    admitted iteration by iteration while fewer than --max-in-flight VMs are
+    in the pipeline, so the next iteration's creates start as soon as slots
+    free up instead of after the slowest operation of the previous iteration.
+    Each operation still runs on at most its concurrency (default
+    --concurrency) VMs at a time. Admission stops when a VM cannot be
+    scheduled (capacity), when an operation with on_failure: abort fails, or
+    after --max-iterations; the VMs already admitted finish their pipeline.
 
-        # Wait for VMs to be running again
-        logger.info("Waiting for VMs to be running after restart...")
-        successful_vms, failed_vms, failure_reason = wait_for_vms_running_concurrent(
-            successful_vms, namespace, logger, args.vm_timeout, args.scheduling_timeout, args.concurrency
-        )
-        if failed_vms:
-            logger.error(f"Phase 4 FAILED: {len(failed_vms)} VMs failed to restart")
-            return False, False, len(successful_vms)
+    Returns:
+        Dict with end_reason, iterations_started, iterations_completed,
+        total_vms, time_to_capacity_sec, cluster_vms per iteration and the
+        labels of the operations that ran
+    """
+    lock = threading.Lock()
+    slots = threading.Semaphore(args.max_in_flight)
+    stages = {op['name']: threading.Semaphore(op['concurrency'] or args.concurrency) for op in operations}
+    start = time.time()
+    state = {'stop': None, 'created': 0, 'time_to_capacity': None}
+    iterations: Dict[int, dict] = {}
+    executed = set()
+
+    def stop(reason):
+        with lock:
+            if not state['stop']:
+                state['stop'] = reason
+                if reason == 'capacity':
+                    state['time_to_capacity'] = time.time() - start
+                    logger.warning(f"{Colors.WARNING}CAPACITY REACHED after {state['time_to_capacity']:.0f}s, "
+                                   f"no more VMs are admitted{Colors.ENDC}")
+
+    def pipeline(vm_name, iteration, index, storage_class):
+        ctx = {'iteration': iteration, 'namespaces': namespaces, 'storage_class': storage_class,
+               'args': args, 'logger': logger, 'volumes': volumes}
+        passed = set()
+        try:
+            for op in operations:
+                if not all(dep in passed for dep in op['depends_on']):
+                    continue
+                # Past count the VM passes untouched, as in run_operation; create-vm never has a count
+                if op['count'] and index > op['count']:
+                    passed.add(op['name'])
+                    continue
+                if op['type'] == 'create-vm' and state['stop']:
+                    break
+                with stages[op['name']]:
+                    record = run_on_vm(op, vm_name, ctx)
+                with lock:
+                    records.append(record)
+                    executed.add(op['name'])
+                    if record['success'] and op['type'] == 'create-vm':
+                        state['created'] += 1
+                if record['success']:
+                    passed.add(op['name'])
+                    continue
+                logger.error(f"{operation_label(op)} FAILED for {vm_name}: {record['error']}")
+                if record['error'] in CAPACITY_REASONS:
+                    stop('capacity')
+                elif op['on_failure'] == 'abort':
+                    stop('error')
+        finally:
+            slots.release()
+            with lock:
+                iterations[iteration]['finished'] += 1
+                if len(passed) == len(operations):
+                    iterations[iteration]['passed'] += 1
+                info = iterations[iteration]
+                if info['finished'] == args.vms:
+                    logger.info(f"{Colors.OKGREEN}Iteration {iteration} finished: {info['passed']}/{args.vms} VMs "
+                                f"passed every operation ({time.time() - info['admitted_at']:.1f}s since "
+                                f"admission){Colors.ENDC}")
+
+    logger.info(f"\n{Colors.HEADER}Pipelined mode: up to {args.max_in_flight} VMs in flight, "
+                f"{args.vms} VMs per iteration{Colors.ENDC}")
+    iteration = 0
+    with ThreadPoolExecutor(max_workers=args.max_in_flight) as executor:
+        try:
+            while not state['stop']:
+                if args.max_iterations > 0 and iteration >= args.max_iterations:
+                    logger.info(f"Reached maximum iterations ({args.max_iterations})")
+                    stop('max_iterations')
+                    break
+                iteration += 1
+                storage_class = storage_classes[(iteration - 1) % len(storage_classes)]
+                admitted = 0
+                for index in range(1, args.vms + 1):
+                    # Wait for a free slot, but give up as soon as admission stops
+                    while not slots.acquire(timeout=1):
+                        if state['stop']:
+                            break
+                    if state['stop']:
+                        break
+                    if index == 1:
+                        with lock:
+                            iterations[iteration] = {'cluster_vms': state['created'], 'finished': 0, 'passed': 0,
+                                                     'admitted_at': time.time()}
+                        logger.info(f"Admitting iteration {iteration} ({storage_class}, "
+                                    f"{state['created']} VMs created so far)")
+                    executor.submit(pipeline, f"{args.vm_name}-{iteration}-{index}", iteration, index, storage_class)
+                    admitted += 1
+                if state['stop'] and admitted == 0:
+                    iteration -= 1
+        except KeyboardInterrupt:
+            logger.info("\nTest interrupted by user, waiting for the VMs in the pipeline")
+            stop('interrupted')
+
+    return {
+        'end_reason': state['stop'],
+        'iterations_started': iteration,
+        'iterations_completed': sum(1 for info in iterations.values() if info['passed'] == args.vms),
+        'total_vms': state['created'],
+        'time_to_capacity_sec': round(state['time_to_capacity'], 2) if state['time_to_capacity'] else None,
+        'cluster_vms': {i: info['cluster_vms'] for i, info in iterations.items()},
+        'phases_executed': [operation_label(op) for op in operations if op['name'] in executed],
+    }
 
-        phase_duration = time.time() - phase_start
-        phases_executed.append('Restart VMs')
-        logger.info(f"{Colors.OKGREEN}Phase 4 COMPLETE: All VMs restarted (took {phase_duration:.2f}s){Colors.ENDC}")
-    else:
-        logger.info(f"\n{Colors.WARNING}Phase 4: SKIPPED (--skip-restart){Colors.ENDC}")
-
-    # Phase 5: Snapshot VMs (concurrent)
-    if not args.skip_snapshot:
-        logger.info(f"\n{Colors.HEADER}Phase 5: Creating VM Snapshots (concurrency: {args.concurrency}){Colors.ENDC}")
-        phase_start = time.time()
-        snapshots_created = []
-
-        def create_snapshot_for_vm(vm_name):
-            snapshot_name = f"{vm_name}-snapshot"
-            if not create_vm_snapshot(vm_name, snapshot_name, namespace, logger):
-                return False, None, f"Failed to create snapshot for VM {vm_name}"
-            if not wait_for_snapshot_ready(snapshot_name, namespace, logger=logger):
-                return False, snapshot_name, f"Snapshot {snapshot_name} did not become ready"
-            return True, snapshot_name, None
-
-        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-            futures = {executor.submit(create_snapshot_for_vm, vm): vm for vm in successful_vms}
-            for future in as_completed(futures):
-                vm_name = futures[future]
-                try:
-                    success, snapshot_name, error = future.result()
-                    if snapshot_name:
-                        snapshots_created.append(snapshot_name)
-                    if not success:
-                        logger.error(f"Phase 5 FAILED for {vm_name}: {error}")
-                        return False, False, len(successful_vms)
-                except Exception as e:
-                    logger.error(f"Phase 5 FAILED for {vm_name}: {e}")
-                    return False, False, len(successful_vms)
 
-        phase_duration = time.time() - phase_start
-        phases_executed.append('Create Snapshots')
-        logger.info(f"{Colors.OKGREEN}Phase 5 COMPLETE: {len(snapshots_created)} snapshots created (took {phase_duration:.2f}s){Colors.ENDC}")
-    else:
-        logger.info(f"\n{Colors.WARNING}Phase 5: SKIPPED (--skip-snapshot){Colors.ENDC}")
+# ---------------- Open-loop mode ----------------
+DEFAULT_OP_MIX = 'create-vm=40,resize-volumes=20,snapshot-vm=20,restart-vm=20'
+ARRIVAL_PROCESSES = ('poisson', 'fixed')
 
-    logger.info(f"\n{Colors.OKGREEN}{Colors.BOLD}ITERATION {iteration} COMPLETE{Colors.ENDC}")
-    return True, False, len(successful_vms)
 
+def parse_op_mix(spec: str) -> Dict[str, float]:
+    """
+    Parse an operation mix such as 'create-vm=40,restart-vm=20' into {type: weight}.
+
+    Raises:
+        ValueError: On unknown types or weights that are not positive numbers
+    """
+    mix = {}
+    for item in spec.split(','):
+        op_type, _, weight = item.strip().partition('=')
+        if op_type not in OPERATION_TYPES:
+            raise ValueError(f"unknown operation type '{op_type}' (known: {', '.join(OPERATION_TYPES)})")
+        try:
+            mix[op_type] = float(weight)
+        except ValueError:
+            raise ValueError(f"'{item.strip()}' needs a numeric weight, e.g. {op_type}=20")
+        if mix[op_type] <= 0:
+            raise ValueError(f"weight of {op_type} must be > 0")
+    return mix
+
+
+def summarize_operations(records: List[dict], key: str = 'type') -> Dict[str, dict]:
+    """
+    Per operation type (or per scenario operation with key='operation'): count,
+    successes, error rate and latency distribution of the successful runs.
+    """
+    summary = {}
+    for name in dict.fromkeys(r[key] for r in records):
+        ops = [r for r in records if r[key] == name]
+        ok = [r['duration_sec'] for r in ops if r['success']]
+        summary[name] = {
+            'count': len(ops),
+            'succeeded': len(ok),
+            'failed': len(ops) - len(ok),
+            'error_rate_pct': round((len(ops) - len(ok)) * 100.0 / len(ops), 2),
+            'latency_sec': summarize_distribution(ok, 3),
+        }
+    return summary
+
+
+def summarize_iteration_latency(iteration: int, records: List[dict], cluster_vms: int) -> List[dict]:
+    """
+    Latency rows of one iteration, one per scenario operation.
+
+    cluster_vms is the number of VMs the earlier iterations left running, so
+    the rows show how latency changes as the cluster fills up.
+    """
+    rows = []
+    for name, s in summarize_operations([r for r in records if r['iteration'] == iteration], 'operation').items():
+        rows.append(dict({'iteration': iteration, 'cluster_vms': cluster_vms, 'operation': name}, **s))
+    return rows
+
+
+def summarize_windows(records: List[dict], rejected: List[dict], start: float, window_sec: int) -> List[dict]:
+    """
+    Bucket open-loop operations into windows of window_sec by arrival time.
+
+    Returns one row per window and operation type with arrivals, rejected
+    arrivals, failures, error rate and p50/p95 latency of the successful runs.
+    """
+    rows = {}
+    for r in records + rejected:
+        window = int((r['start'] - start) // window_sec)
+        row = rows.setdefault((window, r['type']), {
+            'window': window + 1,
+            'window_start_sec': window * window_sec,
+            'type': r['type'],
+            'arrivals': 0, 'rejected': 0, 'completed': 0, 'failed': 0, '_latencies': [],
+        })
+        row['arrivals'] += 1
+        if 'reason' in r:
+            row['rejected'] += 1
+        elif r['success']:
+            row['completed'] += 1
+            row['_latencies'].append(r['duration_sec'])
+        else:
+            row['failed'] += 1
+
+    windows = []
+    for key in sorted(rows):
+        row = rows[key]
+        latencies = row.pop('_latencies')
+        run = row['completed'] + row['failed']
+        row['error_rate_pct'] = round(row['failed'] * 100.0 / run, 2) if run else None
+        latency = summarize_distribution(latencies, 3)
+        row['p50_sec'] = latency['p50']
+        row['p95_sec'] = latency['p95']
+        windows.append(row)
+    return windows
+
+
+def run_open_loop(namespaces: List[str], storage_classes: List[str], args, logger,
+                  volumes: dict) -> Tuple[List[dict], List[dict], dict]:
+    """
+    Issue a weighted mix of operations by an open-loop arrival process for --open-loop seconds.
 
-def cleanup_namespace(namespace: str, logger) -> bool:
-    """Cleanup test namespace and all resources."""
+    First --vms VMs are created as the initial pool, outside the measured
+    window. Arrivals then come at --arrival-rate per minute (Poisson or fixed
+    interval) and do not wait for earlier operations: creates add a VM to the
+    pool, every other operation picks a random pool VM without an operation in
+    flight. An arrival is rejected when no such VM exists or
+    --max-in-flight operations are running. After the window the in-flight
+    operations are drained.
+
+    Returns:
+        Tuple of (operation records, rejected arrivals, run info)
+    """
+    rng = random.Random(args.seed)
+    types = list(args.op_mix)
+    weights = [args.op_mix[t] for t in types]
+    lock = threading.Lock()
+    idle: List[str] = []
+    storage_class_of: Dict[str, str] = {}
+    records: List[dict] = []
+    rejected: List[dict] = []
+    in_flight = [0]
+    created = [0]
+    ops = {t: normalize_operations([{'type': t}])[0] for t in types}
+
+    def context(storage_class):
+        return {'iteration': 0, 'namespaces': namespaces, 'storage_class': storage_class,
+                'args': args, 'logger': logger, 'volumes': volumes}
+
+    # Initial pool, created like an iteration and not measured
+    if args.vms:
+        logger.info(f"\n{Colors.HEADER}Creating the initial pool of {args.vms} VMs{Colors.ENDC}")
+        create = normalize_operations([{'type': 'create-vm', 'retries': max(0, args.max_create_retries - 1)}])[0]
+        names = [f"{args.vm_name}-ol-{i}" for i in range(1, args.vms + 1)]
+        for i, storage_class in enumerate(storage_classes):
+            passed, _ = run_operation(create, names[i::len(storage_classes)], context(storage_class), [])
+            for vm in passed:
+                idle.append(vm)
+                storage_class_of[vm] = storage_class
+        created[0] = args.vms
+        logger.info(f"Initial pool: {len(idle)}/{args.vms} VMs running")
+
+    def execute(op, vm_name, storage_class):
+        record = run_on_vm(op, vm_name, context(storage_class))
+        with lock:
+            records.append(record)
+            in_flight[0] -= 1
+            if op['type'] != 'create-vm' or record['success']:
+                idle.append(vm_name)
+                storage_class_of[vm_name] = storage_class
+        if not record['success']:
+            logger.warning(f"[{op['type']}] {vm_name} failed after {record['duration_sec']:.1f}s: {record['error']}")
+
+    def arrive(op_type, seq, executor):
+        now = time.time()
+        with lock:
+            reason = None
+            if in_flight[0] >= args.max_in_flight:
+                reason = 'max_in_flight'
+            elif op_type == 'create-vm':
+                created[0] += 1
+                vm_name = f"{args.vm_name}-ol-{created[0]}"
+                storage_class = storage_classes[created[0] % len(storage_classes)]
+            elif not idle:
+                reason = 'no_idle_vm'
+            else:
+                vm_name = idle.pop(rng.randrange(len(idle)))
+                storage_class = storage_class_of[vm_name]
+            if reason:
+                rejected.append({'type': op_type, 'start': now, 'reason': reason})
+                return
+            in_flight[0] += 1
+        # Clone and snapshot names must be unique per arrival
+        op = dict(ops[op_type], params={'suffix': f"ol-{seq}"})
+        executor.submit(execute, op, vm_name, storage_class)
+
+    logger.info(f"\n{Colors.HEADER}Open loop: {args.arrival_rate:g} operations/min ({args.arrival_process}) "
+                f"for {args.open_loop}s, mix {', '.join(f'{t}={args.op_mix[t]:g}' for t in types)}{Colors.ENDC}")
+    interrupted = False
+    executor = ThreadPoolExecutor(max_workers=args.max_in_flight)
+    start = time.time()
+    next_at = start
+    seq = 0
     try:
-        if not namespace_exists(namespace, logger):
-            logger.info(f"Namespace {namespace} does not exist")
-            return True
+        while True:
+            gap = 60.0 / args.arrival_rate
+            next_at += rng.expovariate(1.0 / gap) if args.arrival_process == 'poisson' else gap
+            if next_at - start >= args.open_loop:
+                break
+            time.sleep(max(0.0, next_at - time.time()))
+            seq += 1
+            arrive(rng.choices(types, weights)[0], seq, executor)
+    except KeyboardInterrupt:
+        logger.info("\nOpen loop interrupted, draining in-flight operations")
+        interrupted = True
+    window_end = time.time()
+
+    logger.info(f"Arrival window closed after {window_end - start:.0f}s, "
+                f"waiting for {in_flight[0]} in-flight operations")
+    executor.shutdown(wait=True)
+
+    info = {
+        'start': start,
+        'window_sec': round(window_end - start, 2),
+        'drain_sec': round(time.time() - window_end, 2),
+        'arrivals': seq,
+        'interrupted': interrupted,
+        'pool_vms': len(storage_class_of),
+    }
+    return records, rejected, info
 
-        logger.info(f"Deleting namespace {namespace}...")
-        returncode, _, stderr = run_kubectl_command(
-            ['delete', 'namespace', namespace, '--wait=true', '--timeout=300s'],
-            check=False, logger=logger
-        )
-        if returncode == 0:
-            logger.info(f"Namespace {namespace} deleted successfully")
-            return True
-        logger.error(f"Failed to delete namespace {namespace}: {stderr}")
-        return False
+
+def print_operation_latency(operations: Dict[str, dict], logger):
+    """Print one line per operation with count, error rate and p50/p95/p99/max latency."""
+    logger.info(f"  {'Operation':<24} {'Count':>6} {'Errors':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'Max':>9}")
+    for name, s in operations.items():
+        lat = s['latency_sec']
+        cols = [f"{lat[k]:.2f}s" if lat['count'] else 'N/A' for k in ('p50', 'p95', 'p99', 'max')]
+        logger.info(f"  {name:<24} {s['count']:>6} {s['error_rate_pct']:>6.1f}% "
+                    + " ".join(f"{c:>9}" for c in cols))
+
+
+def print_open_loop_summary(operations: Dict[str, dict], rejected: List[dict], info: dict, logger):
+    """Print per-operation latency and error rates of an open-loop run."""
+    logger.info(f"\n{Colors.HEADER}Open Loop ({info['arrivals']} arrivals in {info['window_sec']:.0f}s, "
+                f"drained in {info['drain_sec']:.0f}s):{Colors.ENDC}")
+    print_operation_latency(operations, logger)
+    for reason in dict.fromkeys(r['reason'] for r in rejected):
+        logger.info(f"  Rejected ({reason}): {sum(1 for r in rejected if r['reason'] == reason)}")
+
+
+def save_operation_records(out_dir: str, records: List[dict], logger) -> None:
+    """Save one row per operation per VM to chaos_operations.csv."""
+    fieldnames = ['iteration', 'operation', 'type', 'vm', 'namespace', 'start', 'end', 'duration_sec',
+                  'attempts', 'success', 'error']
+    path = os.path.join(out_dir, "chaos_operations.csv")
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for r in records:
+            writer.writerow(dict(r, start=datetime.fromtimestamp(r['start']).isoformat(),
+                                 end=datetime.fromtimestamp(r['end']).isoformat()))
+    logger.info(f"Saved {len(records)} operation records to {path}")
+
+
+def new_volume_tracker(concurrency: int) -> dict:
+    """Per-PVC records of the resize/clone operations and the slots limiting them to concurrency PVCs."""
+    return {'records': [], 'slots': threading.Semaphore(concurrency), 'lock': threading.Lock()}
+
+
+def print_volume_latency(volume_records: List[dict], logger):
+    """Print per-PVC latency of the resize/clone operations, if any ran."""
+    if volume_records:
+        logger.info(f"\n{Colors.HEADER}Per-PVC Latency (resize/clone):{Colors.ENDC}")
+        print_operation_latency(summarize_operations(volume_records, 'operation'), logger)
+
+
+def save_volume_records(out_dir: str, volume_records: List[dict], logger) -> None:
+    """Save one row per PVC of the resize/clone operations to chaos_volume_operations.csv."""
+    if not volume_records:
+        return
+    fieldnames = ['iteration', 'operation', 'type', 'vm', 'namespace', 'pvc', 'start', 'end', 'duration_sec',
+                  'success', 'error']
+    path = os.path.join(out_dir, "chaos_volume_operations.csv")
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for r in volume_records:
+            writer.writerow(dict(r, start=datetime.fromtimestamp(r['start']).isoformat(),
+                                 end=datetime.fromtimestamp(r['end']).isoformat()))
+    logger.info(f"Saved {len(volume_records)} per-PVC records to {path}")
+
+
+def save_operation_latency(out_dir: str, rows: List[dict], operations: Dict[str, dict], logger) -> None:
+    """Save per-iteration latency percentiles of every operation and the run-wide summary."""
+    stat_keys = ('avg', 'p50', 'p95', 'p99', 'max')
+    fieldnames = ['iteration', 'cluster_vms', 'operation', 'count', 'succeeded', 'failed', 'error_rate_pct']
+    fieldnames += [f"{key}_sec" for key in stat_keys]
+    with open(os.path.join(out_dir, "chaos_operation_latency.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for row in rows:
+            latency = row['latency_sec']
+            writer.writerow(dict({k: row[k] for k in fieldnames[:7]},
+                                 **{f"{key}_sec": latency.get(key) for key in stat_keys}))
+
+    with open(os.path.join(out_dir, "summary_chaos_operations.json"), "w") as f:
+        json.dump({'operations': operations, 'per_iteration': rows}, f, indent=4)
+    logger.info(f"Saved operation latency percentiles to {os.path.join(out_dir, 'chaos_operation_latency.csv')}")
+
+
+def save_open_loop_results(out_dir: str, records: List[dict], rejected: List[dict], windows: List[dict],
+                           operations: Dict[str, dict], info: dict, volume_records: List[dict], args,
+                           logger) -> None:
+    """Save the operation records, the per-window error rates and the open-loop summary."""
+    save_operation_records(out_dir, records, logger)
+    save_volume_records(out_dir, volume_records, logger)
+
+    fieldnames = ['window', 'window_start_sec', 'type', 'arrivals', 'rejected', 'completed', 'failed',
+                  'error_rate_pct', 'p50_sec', 'p95_sec']
+    with open(os.path.join(out_dir, "chaos_open_loop_windows.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(windows)
+
+    summary = {
+        "duration_sec": args.open_loop,
+        "arrival_rate_per_min": args.arrival_rate,
+        "arrival_process": args.arrival_process,
+        "op_mix": args.op_mix,
+        "max_in_flight": args.max_in_flight,
+        "initial_pool_vms": args.vms,
+        "window_sec": info['window_sec'],
+        "drain_sec": info['drain_sec'],
+        "arrivals": info['arrivals'],
+        "rejected": {reason: sum(1 for r in rejected if r['reason'] == reason)
+                     for reason in dict.fromkeys(r['reason'] for r in rejected)},
+        "operations": operations,
+    }
+    with open(os.path.join(out_dir, "summary_chaos_open_loop.json"), "w") as f:
+        json.dump(summary, f, indent=4)
+    logger.info(f"Saved open-loop results to {out_dir}")
+
+
+def run_open_loop_mode(args, namespaces: List[str], storage_classes: List[str], logger, volumes: dict):
+    """Run the open-loop mode, report and save its results."""
+    start_time = time.time()
+    records, rejected, info = run_open_loop(namespaces, storage_classes, args, logger, volumes)
+    duration = time.time() - start_time
+
+    operations = summarize_operations(records)
+    windows = summarize_windows(records, rejected, info['start'], args.window)
+    results = {
+        'storage_classes': ', '.join(storage_classes),
+        'vms_per_iteration': args.vms,
+        'data_volumes_per_vm': args.data_volume_count,
+        'volume_size': args.min_vol_size,
+        'vm_memory': args.vm_memory,
+        'vm_cpu_cores': args.vm_cpu_cores,
+        'concurrency': args.concurrency,
+        'namespace_shards': len(namespaces),
+        'volume_concurrency': args.volume_concurrency,
+        'iterations_completed': 0,
+        'total_vms': info['pool_vms'],
+        'total_pvcs': info['pool_vms'] * (args.data_volume_count + 1),
+        'duration_str': f"{duration:.2f}s ({duration/60:.2f} minutes)",
+        'capacity_reached': any(r['error'] in CAPACITY_REASONS for r in records),
+        'end_reason': 'interrupted' if info['interrupted'] else 'duration',
+        'scenario': 'open-loop',
+        'phases_skipped': [],
+    }
+
+    print_test_summary(results, [], logger)
+    print_open_loop_summary(operations, rejected, info, logger)
+    print_volume_latency(volumes['records'], logger)
+
+    if args.save_results:
+        out_dir = save_capacity_results(results, args.results_dir, args.storage_driver, logger)
+        save_open_loop_results(out_dir, records, rejected, windows, operations, info, volumes['records'],
+                               args, logger)
+
+    if args.cleanup:
+        cleanup_namespaces(namespaces, logger)
+
+
+# ---------------- Capacity search ----------------
+def run_capacity_search(namespaces: List[str], storage_classes: List[str], args, logger,
+                        records: List[dict]) -> dict:
+    """
+    Search the maximum number of VMs the cluster can run at once.
+
+    Every probe brings the number of Running VMs to a target count: it creates
+    the missing VMs (--concurrency at a time) and deletes the ones that could
+    not be scheduled. The target starts at --vms and grows by --search-growth
+    until a probe hits capacity, then bisects between the largest count that
+    ran and the smallest that did not until the gap is at most
+    --search-precision VMs. A failed probe still proves that the VMs it left
+    Running fit, which tightens the lower bound.
+
+    Returns:
+        Dict with max_vms (largest count that ran), first_failure (smallest
+        count that did not, or None), end_reason, probes (one row per probe)
+        and kubectl_calls
+    """
+    create = normalize_operations([{'type': 'create-vm', 'retries': max(0, args.max_create_retries - 1)}])[0]
+    running: List[str] = []
+    probes: List[dict] = []
+    calls_at_start = get_kubectl_call_count()
+    state = {'next': 0, 'lo': 0, 'hi': None}
+
+    def probe(target, phase):
+        number = len(probes) + 1
+        probe_start = time.time()
+        calls_before = get_kubectl_call_count()
+        logger.info(f"\n{Colors.HEADER}Probe {number} ({phase}): {target} VMs "
+                    f"({len(running)} running, bounds {state['lo']}..{state['hi'] or '?'}){Colors.ENDC}")
+
+        names = []
+        for _ in range(target - len(running)):
+            state['next'] += 1
+            names.append(f"{args.vm_name}-cs-{state['next']}")
+        failed: Dict[str, str] = {}
+        for i, storage_class in enumerate(storage_classes):
+            ctx = {'iteration': number, 'namespaces': namespaces, 'storage_class': storage_class,
+                   'args': args, 'logger': logger}
+            passed, class_failed = run_operation(create, names[i::len(storage_classes)], ctx, records)
+            running.extend(passed)
+            failed.update(class_failed)
+
+        # VMs that did not make it would hold on to their volumes and pending pods
+        removed = list(failed)
+        if len(running) > target:
+            removed += running[target:]
+            del running[target:]
+        if removed:
+            logger.info(f"Deleting {len(removed)} VMs to get back to {len(running)} running")
+            with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+                list(executor.map(lambda vm: delete_vm(vm, vm_namespace(vm, namespaces), logger), removed))
+
+        capacity = any(error in CAPACITY_REASONS for error in failed.values())
+        probes.append({
+            'probe': number,
+            'phase': phase,
+            'target_vms': target,
+            'created': len(names) - len(failed),
+            'deleted': len(removed),
+            'running_vms': len(running),
+            'fits': not failed,
+            'capacity_reached': capacity,
+            'duration_sec': round(time.time() - probe_start, 2),
+            'kubectl_calls': get_kubectl_call_count() - calls_before,
+        })
+        state['lo'] = max(state['lo'], len(running))
+        if capacity:
+            state['hi'] = target if state['hi'] is None else min(state['hi'], target)
+            logger.warning(f"{Colors.WARNING}Probe {number}: {target} VMs do not fit, "
+                           f"{len(running)} running{Colors.ENDC}")
+        elif failed:
+            raise RuntimeError(f"{len(failed)} VMs failed for reasons other than capacity "
+                               f"({', '.join(sorted(set(failed.values())))})")
+        else:
+            logger.info(f"{Colors.OKGREEN}Probe {number}: {target} VMs fit "
+                        f"(took {probes[-1]['duration_sec']:.0f}s){Colors.ENDC}")
+        return not failed
+
+    end_reason = 'capacity'
+    try:
+        target = args.vms
+        while state['hi'] is None:
+            if args.search_max and target >= args.search_max:
+                target = args.search_max
+            if not probe(target, 'grow'):
+                break
+            if target == args.search_max:
+                end_reason = 'search_max'
+                break
+            target = max(target + 1, int(math.ceil(target * args.search_growth)))
+
+        while state['hi'] is not None and state['hi'] - state['lo'] > args.search_precision:
+            probe((state['lo'] + state['hi']) // 2, 'bisect')
+    except KeyboardInterrupt:
+        logger.info("\nCapacity search interrupted")
+        end_reason = 'interrupted'
     except Exception as e:
-        logger.error(f"Error cleaning up namespace {namespace}: {e}")
+        logger.error(f"Capacity search failed: {e}")
+        end_reason = 'error'
+
+    return {
+        'max_vms': state['lo'],
+        'first_failure': state['hi'],
+        'end_reason': end_reason,
+        'probes': probes,
+        'kubectl_calls': get_kubectl_call_count() - calls_at_start,
+    }
+
+
+def print_capacity_search_summary(search: dict, precision: int, duration: float, logger):
+    """Print the probes and the density the search converged to."""
+    logger.info(f"\n{Colors.HEADER}Capacity Search ({len(search['probes'])} probes):{Colors.ENDC}")
+    logger.info(f"  {'Probe':>5} {'Phase':<7} {'Target':>7} {'Running':>8} {'Fits':>5} {'Time':>9} {'kubectl':>8}")
+    for p in search['probes']:
+        logger.info(f"  {p['probe']:>5} {p['phase']:<7} {p['target_vms']:>7} {p['running_vms']:>8} "
+                    f"{'yes' if p['fits'] else 'no':>5} {p['duration_sec']:>8.0f}s {p['kubectl_calls']:>8}")
+    if search['first_failure'] is not None:
+        logger.info(f"  Maximum density:       {search['max_vms']} VMs "
+                    f"({search['first_failure']} do not fit, precision {precision} VMs)")
+    else:
+        logger.info(f"  Maximum density:       at least {search['max_vms']} VMs (no probe hit capacity)")
+    logger.info(f"  Search time:           {duration:.0f}s ({duration / 60:.2f} minutes)")
+    logger.info(f"  kubectl calls:         {search['kubectl_calls']}")
+
+
+def save_capacity_search_results(out_dir: str, search: dict, args, duration: float, logger) -> None:
+    """Save one row per probe to chaos_capacity_search.csv and the search summary."""
+    fieldnames = ['probe', 'phase', 'target_vms', 'created', 'deleted', 'running_vms', 'fits',
+                  'capacity_reached', 'duration_sec', 'kubectl_calls']
+    with open(os.path.join(out_dir, "chaos_capacity_search.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(search['probes'])
+
+    summary = {
+        "max_vms": search['max_vms'],
+        "first_failure_vms": search['first_failure'],
+        "precision_vms": args.search_precision,
+        "start_vms": args.vms,
+        "growth": args.search_growth,
+        "search_max_vms": args.search_max or None,
+        "end_reason": search['end_reason'],
+        "probes": len(search['probes']),
+        "search_time_sec": round(duration, 2),
+        "kubectl_calls": search['kubectl_calls'],
+    }
+    with open(os.path.join(out_dir, "summary_chaos_capacity_search.json"), "w") as f:
+        json.dump(summary, f, indent=4)
+    logger.info(f"Saved capacity search results to {out_dir}")
+
+
+def run_capacity_search_mode(args, namespaces: List[str], storage_classes: List[str], logger):
+    """Run the capacity search, report and save its results."""
+    start_time = time.time()
+    records: List[dict] = []
+    search = run_capacity_search(namespaces, storage_classes, args, logger, records)
+    duration = time.time() - start_time
+
+    # Create latency per probe, against the VMs already running before it
+    latency_rows = []
+    running_before = 0
+    for p in search['probes']:
+        latency_rows.extend(summarize_iteration_latency(p['probe'], records, running_before))
+        running_before = p['running_vms']
+
+    results = {
+        'storage_classes': ', '.join(storage_classes),
+        'vms_per_iteration': args.vms,
+        'data_volumes_per_vm': args.data_volume_count,
+        'volume_size': args.min_vol_size,
+        'vm_memory': args.vm_memory,
+        'vm_cpu_cores': args.vm_cpu_cores,
+        'concurrency': args.concurrency,
+        'namespace_shards': len(namespaces),
+        'volume_concurrency': args.volume_concurrency,
+        'iterations_completed': sum(1 for p in search['probes'] if p['fits']),
+        'total_vms': search['max_vms'],
+        'total_pvcs': search['max_vms'] * (args.data_volume_count + 1),
+        'duration_str': f"{duration:.2f}s ({duration/60:.2f} minutes)",
+        'capacity_reached': search['first_failure'] is not None,
+        'end_reason': search['end_reason'],
+        'scenario': 'capacity-search',
+        'phases_skipped': [],
+    }
+
+    print_test_summary(results, [], logger, records)
+    print_capacity_search_summary(search, args.search_precision, duration, logger)
+
+    if args.save_results:
+        out_dir = save_capacity_results(results, args.results_dir, args.storage_driver, logger)
+        save_operation_records(out_dir, records, logger)
+        save_operation_latency(out_dir, latency_rows, summarize_operations(records, 'operation'), logger)
+        save_capacity_search_results(out_dir, search, args, duration, logger)
+
+    if args.cleanup:
+        cleanup_namespaces(namespaces, logger)
+
+
+def cleanup_namespaces(namespaces: List[str], logger) -> bool:
+    """Delete the test namespaces and all their resources, all namespaces at once."""
+    existing = [ns for ns in namespaces if namespace_exists(ns, logger)]
+    if not existing:
+        logger.info(f"Namespace(s) {', '.join(namespaces)} do not exist")
+        return True
+
+    logger.info(f"Deleting {len(existing)} namespace(s): {', '.join(existing)}")
+    deleted, failed = delete_namespaces_parallel(existing, len(existing), logger)
+    if not wait_for_namespaces_deleted(deleted, logger=logger):
         return False
+    for ns in failed:
+        logger.error(f"Failed to delete namespace {ns}")
+    return not failed
 
 
-def print_test_summary(results: dict, phases_executed: List[str], logger):
+def print_test_summary(results: dict, phases_executed: List[str], logger, records: Optional[List[dict]] = None,
+                       latency_rows: Optional[List[dict]] = None, volume_records: Optional[List[dict]] = None):
     """Print comprehensive test summary report with only actually executed phases."""
     logger.info("\n" + "=" * 100)
     logger.info(f"{Colors.BOLD}CHAOS BENCHMARK REPORT{Colors.ENDC}")
@@ -696,12 +1747,26 @@ def print_test_summary(results: dict, phases_executed: List[str], logger):
     logger.info(f"  VM Memory:             {results.get('vm_memory', 'N/A')}")
     logger.info(f"  VM CPU Cores:          {results.get('vm_cpu_cores', 'N/A')}")
     logger.info(f"  Concurrency:           {results.get('concurrency', 'N/A')}")
+    logger.info(f"  Volume concurrency:    {results.get('volume_concurrency', 'N/A')}")
+    shards = results.get('namespace_shards', 1)
+    created = [r['namespace'] for r in records or [] if r['type'] == 'create-vm' and r['success']]
+    if shards > 1 and created:
+        per_shard = [created.count(ns) for ns in set(created)] + [0] * (shards - len(set(created)))
+        logger.info(f"  Namespaces:            {shards} (VMs per namespace: min {min(per_shard)}, "
+                    f"max {max(per_shard)})")
+    elif shards > 1:
+        logger.info(f"  Namespaces:            {shards}")
+    logger.info(f"  Scenario:              {results.get('scenario', 'default')}"
+                + (" (pipelined)" if results.get('pipelined') else ""))
 
     logger.info(f"\n{Colors.HEADER}Test Results:{Colors.ENDC}")
     logger.info(f"  Iterations completed:  {results.get('iterations_completed', 0)}")
     logger.info(f"  Total VMs created:     {results.get('total_vms', 0)}")
     logger.info(f"  Total PVCs created:    {results.get('total_pvcs', 0)}")
     logger.info(f"  Test duration:         {results.get('duration_str', 'N/A')}")
+    if results.get('time_to_capacity_sec') is not None:
+        logger.info(f"  Time to capacity:      {results['time_to_capacity_sec']:.2f}s "
+                    f"({results['time_to_capacity_sec'] / 60:.2f} minutes)")
 
     capacity_reached = results.get('capacity_reached', False)
     if capacity_reached:
@@ -713,6 +1778,10 @@ def print_test_summary(results: dict, phases_executed: List[str], logger):
             logger.info(f"\n{Colors.WARNING}⚠ MAX ITERATIONS REACHED{Colors.ENDC}")
         elif end_reason == 'interrupted':
             logger.info(f"\n{Colors.WARNING}⚠ TEST INTERRUPTED{Colors.ENDC}")
+        elif end_reason == 'duration':
+            logger.info(f"\n{Colors.OKGREEN}✓ OPEN-LOOP DURATION REACHED{Colors.ENDC}")
+        elif end_reason == 'search_max':
+            logger.info(f"\n{Colors.WARNING}⚠ SEARCH LIMIT REACHED{Colors.ENDC}")
         elif end_reason == 'error':
             logger.info(f"\n{Colors.FAIL}✗ TEST FAILED{Colors.ENDC}")
             logger.info(f"  Test encountered an error.")
@@ -720,13 +1789,33 @@ def print_test_summary(results: dict, phases_executed: List[str], logger):
             logger.info(f"\n{Colors.WARNING}⚠ TEST ENDED{Colors.ENDC}")
 
     # Only show phases that were ACTUALLY executed (not based on skip flags)
-    if phases_executed:
+    if results.get('scenario') in ('open-loop', 'capacity-search'):
+        pass
+    elif phases_executed:
         logger.info(f"\n{Colors.HEADER}Phases Executed:{Colors.ENDC}")
         for phase in phases_executed:
             logger.info(f"  ✓ {phase}")
     else:
         logger.info(f"\n{Colors.WARNING}No phases completed successfully{Colors.ENDC}")
 
+    if records:
+        logger.info(f"\n{Colors.HEADER}Operation Latency (all iterations):{Colors.ENDC}")
+        print_operation_latency(summarize_operations(records, 'operation'), logger)
+        print_volume_latency(volume_records or [], logger)
+
+    # p95 of the first and the last iteration, to spot slowdowns as the cluster fills
+    iterations = sorted({row['iteration'] for row in latency_rows or []})
+    if len(iterations) > 1:
+        logger.info(f"\n{Colors.HEADER}p95 Latency Trend (iteration {iterations[0]} → {iterations[-1]}):{Colors.ENDC}")
+        first = {r['operation']: r for r in latency_rows if r['iteration'] == iterations[0]}
+        for row in [r for r in latency_rows if r['iteration'] == iterations[-1]]:
+            before = (first.get(row['operation']) or {}).get('latency_sec')
+            after = row['latency_sec']
+            if before and before['count'] and after['count']:
+                change = (after['p95'] - before['p95']) * 100.0 / before['p95'] if before['p95'] else 0.0
+                logger.info(f"  {row['operation']:<24} {before['p95']:>8.2f}s → {after['p95']:>8.2f}s "
+                            f"({change:+.0f}%, {first[row['operation']]['cluster_vms']} → {row['cluster_vms']} VMs)")
+
     logger.info("\n" + "=" * 100)
 
 
@@ -737,9 +1826,10 @@ def main():
     logger = setup_logging(args.log_file, args.log_level)
 
     # Handle cleanup-only mode
+    namespaces = shard_namespaces(args.namespace, args.namespace_shards)
     if args.cleanup_only:
         logger.info("Running in cleanup-only mode")
-        cleanup_namespace(args.namespace, logger)
+        cleanup_namespaces(find_test_namespaces(args.namespace, logger) or namespaces, logger)
         return
 
     # Parse storage classes
@@ -747,11 +1837,13 @@ def main():
     logger.info(f"Starting Chaos Benchmark with storage classes: {storage_classes}")
     logger.info(f"Concurrency: {args.concurrency}")
 
-    # Create namespace
-    if not namespace_exists(args.namespace, logger):
-        if not create_namespace(args.namespace, logger):
-            logger.error(f"Failed to create namespace {args.namespace}")
-            sys.exit(1)
+    # Create namespaces
+    missing = [ns for ns in namespaces if not namespace_exists(ns, logger)]
+    if missing and len(create_namespaces_parallel(missing, len(missing), logger)) < len(missing):
+        logger.error(f"Failed to create namespaces {', '.join(missing)}")
+        sys.exit(1)
+    if len(namespaces) > 1:
+        logger.info(f"VMs are spread over {len(namespaces)} namespaces: {namespaces[0]} .. {namespaces[-1]}")
 
     # Initialize tracking
     start_time = time.time()
@@ -759,39 +1851,80 @@ def main():
     iterations_completed = 0
     capacity_reached = False
     end_reason = 'unknown'
+    time_to_capacity = None
     phases_executed = []  # Track ACTUALLY executed phases
+    records = []  # One record per operation per VM
+    latency_rows = []  # Latency percentiles per iteration and operation
+    volumes = new_volume_tracker(args.volume_concurrency)  # One record per PVC of the resize/clone operations
 
-    try:
-        iteration = 0
-        while True:
-            iteration += 1
+    if args.open_loop:
+        run_open_loop_mode(args, namespaces, storage_classes, logger, volumes)
+        return
+    if args.capacity_search:
+        run_capacity_search_mode(args, namespaces, storage_classes, logger)
+        return
 
-            # Check max iterations
-            if args.max_iterations > 0 and iteration > args.max_iterations:
-                logger.info(f"Reached maximum iterations ({args.max_iterations})")
-                end_reason = 'max_iterations'
-                break
+    skipped = [op for op in args.operations
+               if OPERATION_TYPES[op['type']]['skip'] and getattr(args, OPERATION_TYPES[op['type']]['skip'])]
+    operations = drop_operations(args.operations, [op['name'] for op in skipped])
+    if not operations:
+        logger.error("Every operation of the scenario is skipped")
+        sys.exit(1)
+    logger.info(f"Scenario: {args.scenario_name} ({', '.join(op['name'] for op in operations)})")
+    for op in skipped:
+        logger.info(f"{Colors.WARNING}{operation_label(op)}: SKIPPED (--{OPERATION_TYPES[op['type']]['skip'].replace('_', '-')}){Colors.ENDC}")
 
-            # Cycle through storage classes
-            storage_class = storage_classes[(iteration - 1) % len(storage_classes)]
+    try:
+        if args.pipelined:
+            pipeline = run_pipelined(namespaces, storage_classes, operations, args, logger, records, volumes)
+            end_reason = pipeline['end_reason']
+            capacity_reached = end_reason == 'capacity'
+            time_to_capacity = pipeline['time_to_capacity_sec']
+            total_vms = pipeline['total_vms']
+            iterations_completed = pipeline['iterations_completed']
+            phases_executed = pipeline['phases_executed']
+            for i, cluster_vms in sorted(pipeline['cluster_vms'].items()):
+                latency_rows.extend(summarize_iteration_latency(i, records, cluster_vms))
+        else:
+            iteration = 0
+            while True:
+                iteration += 1
+
+                # Check max iterations
+                if args.max_iterations > 0 and iteration > args.max_iterations:
+                    logger.info(f"Reached maximum iterations ({args.max_iterations})")
+                    end_reason = 'max_iterations'
+                    break
+
+                # Cycle through storage classes
+                storage_class = storage_classes[(iteration - 1) % len(storage_classes)]
+
+                # Run iteration
+                success, cap_reached, vms_created = run_iteration(
+                    iteration, namespaces, storage_class, args, logger, phases_executed, operations, records,
+                    volumes
+                )
+
+                # Latency percentiles of this iteration's operations
+                latency_rows.extend(summarize_iteration_latency(iteration, records, total_vms))
+                for row in [r for r in latency_rows if r['iteration'] == iteration and r['latency_sec']['count']]:
+                    latency = row['latency_sec']
+                    logger.info(f"  {row['operation']:<24} p50 {latency['p50']:.2f}s / p95 {latency['p95']:.2f}s / "
+                                f"p99 {latency['p99']:.2f}s ({row['succeeded']}/{row['count']} succeeded)")
+
+                if cap_reached:
+                    capacity_reached = True
+                    total_vms += vms_created
+                    end_reason = 'capacity'
+                    time_to_capacity = round(time.time() - start_time, 2)
+                    break
 
-            # Run iteration
-            success, cap_reached, vms_created = run_iteration(
-                iteration, args.namespace, storage_class, args, logger, phases_executed
-            )
+                if not success:
+                    end_reason = 'error'
+                    break
 
-            if cap_reached:
-                capacity_reached = True
                 total_vms += vms_created
-                end_reason = 'capacity'
-                break
-
-            if not success:
-                end_reason = 'error'
-                break
-
-            total_vms += vms_created
-            iterations_completed += 1
+                iterations_completed += 1
 
     except KeyboardInterrupt:
         logger.info("\nTest interrupted by user")
@@ -813,24 +1946,33 @@ def main():
         'vm_memory': args.vm_memory,
         'vm_cpu_cores': args.vm_cpu_cores,
         'concurrency': args.concurrency,
+        'namespace_shards': len(namespaces),
+        'volume_concurrency': args.volume_concurrency,
         'iterations_completed': iterations_completed,
         'total_vms': total_vms,
         'total_pvcs': total_vms * (args.data_volume_count + 1),
         'duration_str': duration_str,
         'capacity_reached': capacity_reached,
+        'time_to_capacity_sec': time_to_capacity,
         'end_reason': end_reason,
+        'scenario': args.scenario_name,
+        'pipelined': args.pipelined,
+        'phases_skipped': [operation_label(op) for op in skipped],
     }
 
     # Print summary with ONLY actually executed phases
-    print_test_summary(results, phases_executed, logger)
+    print_test_summary(results, phases_executed, logger, records, latency_rows, volumes['records'])
 
     # Save results if requested
     if args.save_results:
-        save_capacity_results(results, args.results_dir, args.storage_driver, logger)
+        out_dir = save_capacity_results(results, args.results_dir, args.storage_driver, logger)
+        save_operation_records(out_dir, records, logger)
+        save_operation_latency(out_dir, latency_rows, summarize_operations(records, 'operation'), logger)
+        save_volume_records(out_dir, volumes['records'], logger)
 
     # Cleanup if requested
     if args.cleanup:
-        cleanup_namespace(args.namespace, logger)
+        cleanup_namespaces(namespaces, logger)
 
 
 if __name__ == '__main__':
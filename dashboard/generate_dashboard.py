@@ -27,8 +27,25 @@ LABEL_MAP = {
     "running_time_sec": "Running Time",
     "ping_time_sec": "Ping Time",
     "clone_duration_sec": "Clone Duration",
+    "cloud_init_time_sec": "Cloud-init Finished",
+    "systemd_time_sec": "Systemd Boot Finished",
+    "guest_ready_time_sec": "Guest Ready",
     "observed_time_sec": "Observed Time",
     "vmim_time_sec": "VMIM Time",
+    "scheduling_sec": "Scheduling",
+    "target_prep_sec": "Target Prep",
+    "memory_transfer_sec": "Memory Transfer",
+    "switchover_sec": "Switchover",
+    "downtime_sec": "Network Downtime",
+    "packets_lost": "Packets Lost",
+    "data_processed_mib": "Data Transferred",
+    "data_total_mib": "Data Total",
+    "data_remaining_mib": "Data Remaining",
+    "memory_bandwidth_mibps": "Memory Bandwidth",
+    "peak_dirty_rate_mibps": "Peak Dirty Rate",
+    "iterations": "Iterations",
+    "postcopy_requests": "Post-copy Requests",
+    "effective_bandwidth_mibps": "Effective Bandwidth",
 }
 
 # FIO metric labels for display
@@ -160,13 +177,18 @@ def summary_to_df(summary_json):
             continue
 
         # Apply friendly names and rounding
-        rows.append({
+        row = {
             "Metric": LABEL_MAP.get(metric, metric),
             "Average (s)": round(m.get("avg", 0), 2) if m.get("avg") is not None else None,
             "Max (s)": round(m.get("max", 0), 2) if m.get("max") is not None else None,
             "Min (s)": round(m.get("min", 0), 2) if m.get("min") is not None else None,
             "Count": m.get("count", ""),
-        })
+        }
+        # Percentiles are only present in newer summaries
+        for key in ("p50", "p95", "p99"):
+            if key in m:
+                row[f"{key.upper()} (s)"] = round(m[key], 2) if m[key] is not None else None
+        rows.append(row)
 
     df = pd.DataFrame(rows)
     total_info = {
@@ -191,8 +213,26 @@ def df_to_html_table(df: pd.DataFrame, table_id: str) -> str:
         "running_time_sec": "Running Time (s)",
         "ping_time_sec": "Ping Time (s)",
         "clone_duration_sec": "Clone Duration (s)",
+        "cloud_init_time_sec": "Cloud-init Finished (s)",
+        "systemd_time_sec": "Systemd Boot Finished (s)",
+        "guest_ready_time_sec": "Guest Ready (s)",
         "observed_time_sec": "Observed Time (s)",
         "vmim_time_sec": "VMIM Time (s)",
+        "scheduling_sec": "Scheduling (s)",
+        "target_prep_sec": "Target Prep (s)",
+        "memory_transfer_sec": "Memory Transfer (s)",
+        "switchover_sec": "Switchover (s)",
+        "downtime_sec": "Network Downtime (s)",
+        "packets_lost": "Packets Lost",
+        "migration_mode": "Migration Mode",
+        "data_processed_mib": "Data Transferred (MiB)",
+        "data_total_mib": "Data Total (MiB)",
+        "data_remaining_mib": "Data Remaining (MiB)",
+        "memory_bandwidth_mibps": "Memory Bandwidth (MiB/s)",
+        "peak_dirty_rate_mibps": "Peak Dirty Rate (MiB/s)",
+        "iterations": "Iterations",
+        "postcopy_requests": "Post-copy Requests",
+        "effective_bandwidth_mibps": "Effective Bandwidth (MiB/s)",
         "success": "Success",
         "status": "Status",
         "source_node": "Source Node",
@@ -305,6 +345,60 @@ def build_bar_chart_mmss(records, title, color, chart_id):
     """
 
 
+def build_concurrency_sweep_chart(sweep, chart_id):
+    """Builds the migration throughput vs concurrency chart with the fitted USL curve."""
+    levels = sweep.get("levels") or []
+    fit = sweep.get("usl_fit")
+    traces = [{
+        "x": [s["concurrency"] for s in levels],
+        "y": [s["throughput_per_min"] for s in levels],
+        "mode": "markers", "type": "scatter", "name": "Measured", "marker": {"size": 10},
+        "hovertemplate": "In flight: %{x}<br>Migrations/min: %{y}<extra></extra>",
+    }]
+    if fit and fit.get("curve"):
+        traces.append({
+            "x": [p["concurrency"] for p in fit["curve"]],
+            "y": [p["throughput_per_min"] for p in fit["curve"]],
+            "mode": "lines", "type": "scatter", "name": "USL fit",
+        })
+
+    return f"""
+    <div id="{chart_id}" class="plotly-chart" style="height:400px; width:100%;"></div>
+    <script>
+      Plotly.newPlot('{chart_id}', {json.dumps(traces)}, {{
+        xaxis: {{title: 'Migrations in flight'}},
+        yaxis: {{title: 'Successful migrations / min', rangemode: 'tozero'}},
+        margin: {{t: 30, l: 60, r: 20, b: 50}}
+      }}, {{responsive: true,  displayModeBar: false}});
+    </script>
+    """
+
+
+def build_chaos_latency_chart(per_iteration, chart_id):
+    """Builds the chaos p95 operation latency vs VMs-in-cluster chart, one line per operation."""
+    traces = []
+    for name in dict.fromkeys(r["operation"] for r in per_iteration):
+        rows = [r for r in per_iteration if r["operation"] == name and (r.get("latency_sec") or {}).get("count")]
+        traces.append({
+            "x": [r["cluster_vms"] for r in rows],
+            "y": [r["latency_sec"]["p95"] for r in rows],
+            "text": [f"Iteration {r['iteration']}" for r in rows],
+            "mode": "lines+markers", "type": "scatter", "name": name,
+            "hovertemplate": "%{text}<br>VMs before: %{x}<br>p95: %{y}s<extra></extra>",
+        })
+
+    return f"""
+    <div id="{chart_id}" class="plotly-chart" style="height:400px; width:100%;"></div>
+    <script>
+      Plotly.newPlot('{chart_id}', {json.dumps(traces)}, {{
+        xaxis: {{title: 'VMs in cluster before the iteration'}},
+        yaxis: {{title: 'p95 latency (s)', rangemode: 'tozero'}},
+        margin: {{t: 30, l: 60, r: 20, b: 50}}
+      }}, {{responsive: true,  displayModeBar: false}});
+    </script>
+    """
+
+
 # ---------------- Folder Builders ----------------
 def build_creation_boot_content(folder: Path, uid: str) -> str:
     """Creation + Boot Storm section (original style)."""
@@ -392,6 +486,34 @@ def build_migration_content(folder: Path, uid: str) -> str:
         f"{migration_diff_row.get('avg', 'N/A')} s</p>" if migration_diff_row else ""
     )
 
+    bandwidth = next((m for m in (migration_summary or {}).get("metrics", [])
+                      if m.get("metric") == "effective_bandwidth_mibps"), None)
+    transfer_line = (
+        f"<p><strong>Effective Bandwidth:</strong> {bandwidth.get('avg', 'N/A')} MiB/s avg "
+        f"(p95 {bandwidth.get('p95', 'N/A')} MiB/s) | "
+        f"<strong>Post-copy Migrations:</strong> {migration_summary.get('postcopy_migrations', 0)} | "
+        f"<strong>Pre-copy Migrations:</strong> {migration_summary.get('precopy_migrations', 0)}</p>"
+        if bandwidth and bandwidth.get("count") else ""
+    )
+
+    sweep = load_json(folder / "concurrency_sweep.json")
+    sweep_html = ""
+    if sweep and sweep.get("levels"):
+        fit = sweep.get("usl_fit") or {}
+        fit_line = (
+            f"<p><strong>Optimal Concurrency (USL):</strong> {fit.get('optimal_concurrency') or 'not reached'} | "
+            f"<strong>Predicted Peak:</strong> {fit.get('peak_throughput', 'N/A')} migrations/min | "
+            f"<strong>&sigma; (contention):</strong> {fit.get('sigma')} | "
+            f"<strong>&kappa; (coherency):</strong> {fit.get('kappa')} | "
+            f"<strong>R&sup2;:</strong> {fit.get('r_squared', 'N/A')}</p>"
+            if fit else "<p>USL fit not available.</p>"
+        )
+        sweep_html = (
+            f'<h4 class="mt-5">Concurrency Sweep</h4>'
+            f'{build_concurrency_sweep_chart(sweep, f"chart_concurrency_sweep_{uid}")}'
+            f'{fit_line}'
+        )
+
     return f"""
     <div class="mb-4">
       {header_html}
@@ -402,6 +524,8 @@ def build_migration_content(folder: Path, uid: str) -> str:
          <strong>Successful:</strong> {migration_total_info.get("successful", "N/A")} |
          <strong>Failed:</strong> {migration_total_info.get("failed", "N/A")}</p>
       {diff_line}
+      {transfer_line}
+      {sweep_html}
 
       <h4 class="mt-5">Migration Results (Per VM)</h4>
       {migration_html}
@@ -459,6 +583,9 @@ def build_capacity_content(folder: Path, uid: str) -> str:
         ("Volume Size", config.get("volume_size", "N/A")),
         ("VM Memory", config.get("vm_memory", "N/A")),
         ("VM CPU Cores", config.get("vm_cpu_cores", "N/A")),
+        ("Scenario", config.get("scenario", "default") + (" (pipelined)" if config.get("pipelined") else "")),
+        ("Namespaces", config.get("namespace_shards", 1)),
+        ("Volume Concurrency", config.get("volume_concurrency", "N/A")),
     ]
     for label, value in config_items:
         config_rows += f"<tr><th>{label}</th><td>{value}</td></tr>"
@@ -476,6 +603,8 @@ def build_capacity_content(folder: Path, uid: str) -> str:
         ("Total VMs Created", total_vms),
         ("Total PVCs Created", total_pvcs),
         ("Capacity Reached", "Yes" if capacity_reached else "No"),
+        ("Time to Capacity", f"{results_data['time_to_capacity_sec']:.0f} s"
+                             if results_data.get("time_to_capacity_sec") is not None else "N/A"),
         ("End Reason", results_data.get("end_reason", "N/A")),
     ]
     for label, value in results_items:
@@ -491,6 +620,26 @@ def build_capacity_content(folder: Path, uid: str) -> str:
     phases_skipped = capacity_results.get("phases_skipped", []) if capacity_results else []
     phases_html = ", ".join(phases_skipped) if phases_skipped else "None"
 
+    # Per-operation latency (iterations or open loop)
+    operations_summary = load_json(folder / "summary_chaos_operations.json") or \
+        load_json(folder / "summary_chaos_open_loop.json")
+    latency_html = ""
+    if operations_summary and operations_summary.get("operations"):
+        latency_df = pd.DataFrame([
+            {"Operation": name, "Count": s["count"], "Error Rate (%)": s["error_rate_pct"],
+             **{f"{k.upper()} (s)": (s.get("latency_sec") or {}).get(k) for k in ("avg", "p50", "p95", "p99", "max")}}
+            for name, s in operations_summary["operations"].items()
+        ])
+        latency_html = (
+            f'<h4 class="mt-4">Operation Latency</h4>'
+            f'{df_to_html_table(latency_df, f"table_chaos_latency_{uid}")}'
+        )
+        if len({r["iteration"] for r in operations_summary.get("per_iteration", [])}) > 1:
+            latency_html += (
+                f'<h5 class="mt-3">p95 Latency as the Cluster Fills</h5>'
+                f'{build_chaos_latency_chart(operations_summary["per_iteration"], f"chart_chaos_latency_{uid}")}'
+            )
+
     return f"""
     <div class="mb-4">
       {header_html}
@@ -503,6 +652,7 @@ def build_capacity_content(folder: Path, uid: str) -> str:
       {results_table}
 
       <p><strong>Phases Skipped:</strong> {phases_html}</p>
+      {latency_html}
     </div>
     """
 
@@ -17,8 +17,8 @@ import yaml
 import os
 import sys
 import signal
-from datetime import datetime, timedelta
-import subprocess, json, time
+from datetime import datetime
+import subprocess, json, time, csv
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Tuple, List, Optional
 
@@ -30,7 +30,13 @@ from utils.common import (
     delete_namespace, get_vm_status, get_vmi_ip, ping_vm, print_summary_table,
     validate_prerequisites, stop_vm, start_vm, wait_for_vm_stopped,
     get_worker_nodes, select_random_node, add_node_selector_to_vm_yaml,
-    cleanup_test_namespaces, confirm_cleanup, print_cleanup_summary, save_results
+    cleanup_test_namespaces, confirm_cleanup, print_cleanup_summary, save_results,
+    DataVolumeCloneTracker, save_clone_tracking_results,
+    RunJournal, restore_args_from_journal, journal_config,
+    get_vm_creation_timestamp, get_vmi_phase_transition_time,
+    run_repeated_benchmark, wait_for_namespaces_deleted,
+    expand_vm_targets, split_vm_target, packed_resource_name, render_packed_vm_yaml,
+    namespace_lease_owner, lease_pool_namespaces, collect_guest_boot_times, strip_cli_options
 )
 
 # Default configuration
@@ -43,6 +49,10 @@ DEFAULT_CONCURRENCY = 50
 DEFAULT_PING_TIMEOUT = 600  # 10 minutes
 DEFAULT_NAMESPACE_PREFIX = 'kubevirt-perf-test'
 
+# Options taken from the resuming invocation instead of the interrupted run
+RESUME_KEEP_ARGS = ('resume', 'log_level', 'cleanup', 'cleanup_on_failure', 'dry_run_cleanup', 'yes',
+                    'vm_password')
+
 
 def parse_args():
     """Parse command line arguments."""
@@ -62,6 +72,18 @@ Examples:
 
   # Test with cleanup after completion
   %(prog)s --start 1 --end 20 --cleanup
+
+  # Lease namespaces (with their secret) from a pre-warmed pool
+  %(prog)s --start 1 --end 50 --namespace-pool perf --cleanup
+
+  # Pack 200 VMs into 10 namespaces (20 VMs each)
+  %(prog)s --start 1 --end 10 --vms-per-namespace 20
+
+  # Repeat the whole test 5 times and report run-to-run variance
+  %(prog)s --start 1 --end 50 --repeat 5 --settle-time 120
+
+  # Resume an interrupted run from its results directory
+  %(prog)s --resume results/portworx/1-disk/20240115-103000_kubevirt-perf-test_1-100
         """
     )
 
@@ -138,6 +160,24 @@ Examples:
         default=DEFAULT_SSH_POD_NS,
         help=f'Namespace of SSH pod (default: {DEFAULT_SSH_POD_NS})'
     )
+    parser.add_argument(
+        '--guest-boot-metrics',
+        action='store_true',
+        help='After ping succeeds, SSH into every VM (via the SSH pod, which needs sshpass) '
+             'and report time to guest-ready (cloud-init and systemd boot finished)'
+    )
+    parser.add_argument(
+        '--vm-user',
+        type=str,
+        default='cloud-user',
+        help='VM SSH user for --guest-boot-metrics (default: cloud-user)'
+    )
+    parser.add_argument(
+        '--vm-password',
+        type=str,
+        default='changeme',
+        help='VM SSH password for --guest-boot-metrics (default: changeme)'
+    )
     
     # Logging
     parser.add_argument(
@@ -179,6 +219,13 @@ Examples:
         action='store_true',
         help='Skip namespace creation (use existing namespaces)'
     )
+    parser.add_argument(
+        '--namespace-pool',
+        type=str,
+        default=None,
+        help='Lease pre-provisioned namespaces from this pool (see utils/namespace_pool.py) '
+             'instead of creating namespaces and secrets; cleanup returns them to the pool'
+    )
 
     # Boot storm testing
     parser.add_argument(
@@ -204,6 +251,14 @@ Examples:
         help='Number of namespaces to create in parallel (default: 20)'
     )
 
+    parser.add_argument(
+        '--vms-per-namespace',
+        type=int,
+        default=1,
+        help='Number of VMs to create in each namespace, named <vm-name>-1 .. <vm-name>-N '
+             '(default: 1, a single VM named <vm-name>)'
+    )
+
     # Single node testing
     parser.add_argument(
         '--single-node',
@@ -216,6 +271,23 @@ Examples:
         default=None,
         help='Specific node name to use (if not provided, a random worker node will be selected)'
     )
+    parser.add_argument(
+        '--node-names',
+        type=str,
+        nargs='+',
+        default=None,
+        help='Pin VMs round-robin across these nodes with a nodeSelector '
+             '(with --node-scaling: the ordered node pool to draw from)'
+    )
+    parser.add_argument(
+        '--node-scaling',
+        type=int,
+        nargs='+',
+        default=None,
+        metavar='NODES',
+        help='Run the same boot storm pinned to the first 1, 2, 4, ... worker nodes (one run per '
+             'node count) and report VMs/sec per node and scaling efficiency'
+    )
 
     # Save results
     parser.add_argument(
@@ -240,8 +312,51 @@ Examples:
         help='Storage driver label to include in results path (for example: portworx-3.6, ceph)'
     )
 
-    
+    # Resume an interrupted run
+    parser.add_argument(
+        '--resume',
+        type=str,
+        default=None,
+        metavar='RUN_DIR',
+        help='Resume an interrupted run from its results directory. Settings of the original run '
+             'are restored from its run journal; finished VMs are not measured again.'
+    )
+
+    # Statistical repetition
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=1,
+        help='Run the whole test K times with cleanup in between and report run-to-run '
+             'variance, warm-up effect and confidence intervals (default: 1)'
+    )
+    parser.add_argument(
+        '--settle-time',
+        type=int,
+        default=60,
+        help='Seconds to let the cluster settle between repetitions (default: 60)'
+    )
+    # Results directory of one repetition, set by --repeat
+    parser.add_argument('--output-dir', type=str, default=None, help=argparse.SUPPRESS)
+
     args = parser.parse_args()
+    args._resume_events = None
+
+    if args.repeat < 1:
+        parser.error("--repeat must be >= 1")
+    if args.repeat > 1 and args.resume:
+        parser.error("--repeat cannot be combined with --resume")
+
+    if args.resume:
+        if not RunJournal.exists(args.resume):
+            parser.error(f"No {RunJournal.FILENAME} found in {args.resume}")
+        args._resume_events = RunJournal.load(args.resume)
+        try:
+            restore_args_from_journal(args, args._resume_events, keep=RESUME_KEEP_ARGS)
+        except ValueError as e:
+            parser.error(f"Cannot resume from {args.resume}: {e}")
+        # The journal lives in the results directory, so a resumed run always saves results
+        args.save_results = True
 
     # Validation
     if args.start < 1:
@@ -250,10 +365,26 @@ Examples:
         parser.error("--end must be >= --start")
     if args.concurrency < 1:
         parser.error("--concurrency must be >= 1")
+    if args.vms_per_namespace < 1:
+        parser.error("--vms-per-namespace must be >= 1")
     if not os.path.exists(args.vm_template):
         parser.error(f"VM template file not found: {args.vm_template}")
     if args.secret_yaml and not os.path.exists(args.secret_yaml):
         parser.error(f"Secret YAML file not found: {args.secret_yaml}")
+    if args.namespace_pool and args.skip_namespace_creation:
+        parser.error("--namespace-pool cannot be combined with --skip-namespace-creation")
+    if args.node_names and args.single_node:
+        parser.error("--node-names cannot be combined with --single-node")
+    if args.node_scaling:
+        if args.repeat > 1 or args.resume or args.single_node or args.skip_vm_creation:
+            parser.error("--node-scaling cannot be combined with --repeat, --resume, --single-node "
+                         "or --skip-vm-creation")
+        if min(args.node_scaling) < 1:
+            parser.error("--node-scaling node counts must be >= 1")
+        if args.node_names and max(args.node_scaling) > len(args.node_names):
+            parser.error(f"--node-scaling needs {max(args.node_scaling)} nodes but --node-names "
+                         f"lists {len(args.node_names)}")
+        args.node_scaling = sorted(set(args.node_scaling))
 
     return args
 
@@ -393,7 +524,8 @@ def create_secret(ns: str, secret_yaml: str, logger,
 
 def create_vm(ns: str, vm_yaml: str, node_name: Optional[str], logger,
               secret_yaml: Optional[str] = None,
-              max_retries: int = 5, initial_delay: float = 2.0) -> Tuple[str, datetime]:
+              max_retries: int = 5, initial_delay: float = 2.0,
+              vm_name: Optional[str] = None) -> Tuple[str, datetime]:
     """
     Create a VM in the specified namespace with retry logic.
 
@@ -406,6 +538,8 @@ def create_vm(ns: str, vm_yaml: str, node_name: Optional[str], logger,
         max_retries: Maximum number of retry attempts (default: 5)
         initial_delay: Initial delay between retries in seconds (default: 2.0)
                       Uses exponential backoff: delay * 2^attempt
+        vm_name: Create the VM under this name instead of the template's
+                 (--vms-per-namespace packing)
 
     Returns:
         Tuple of (namespace, creation_timestamp)
@@ -416,7 +550,16 @@ def create_vm(ns: str, vm_yaml: str, node_name: Optional[str], logger,
             logger.error(f"[{ns}] Failed to create secret, aborting VM creation")
             raise RuntimeError(f"Failed to create secret in {ns}")
 
-    logger.info(f"[{ns}] Creating VM from {vm_yaml}")
+    packed_yaml = None
+    if vm_name:
+        packed_yaml = render_packed_vm_yaml(vm_yaml, vm_name, node_name, logger)
+        if not packed_yaml:
+            raise RuntimeError(f"Failed to render {vm_yaml} as VM {vm_name}")
+
+    if vm_name:
+        logger.info(f"[{ns}] Creating VM {vm_name} from {vm_yaml}")
+    else:
+        logger.info(f"[{ns}] Creating VM from {vm_yaml}")
     start_ts = datetime.now()
 
     # List of retryable error patterns
@@ -432,8 +575,19 @@ def create_vm(ns: str, vm_yaml: str, node_name: Optional[str], logger,
 
     for attempt in range(1, max_retries + 1):
         try:
+            if packed_yaml:
+                # Renamed copy of the template (nodeSelector already applied)
+                process = subprocess.Popen(
+                    ['kubectl', 'create', '-f', '-', '-n', ns],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True
+                )
+                stdout, stderr = process.communicate(input=packed_yaml)
+                returncode = process.returncode
             # If node_name is specified, modify YAML to add nodeSelector
-            if node_name:
+            elif node_name:
                 logger.debug(f"[{ns}] Adding nodeSelector for node: {node_name}")
                 modified_yaml = add_node_selector_to_vm_yaml(vm_yaml, node_name, logger)
 
@@ -638,8 +792,11 @@ def wait_for_ping(ns: str, ip: str, start_ts: datetime, ssh_pod: str, ssh_pod_ns
 
 
 def monitor_vm(ns: str, vm_name: str, start_ts: datetime, ssh_pod: str, ssh_pod_ns: str,
-               poll_interval: int, ping_timeout: int, logger, skip_dv_clone_tracking=False,
-               vm_template_path: Optional[str] = None) -> Tuple[str, float, float, float, bool]:
+               poll_interval: int, ping_timeout: int, logger,
+               clone_tracker: Optional[DataVolumeCloneTracker] = None,
+               journal: Optional[RunJournal] = None,
+               resumed: Optional[dict] = None,
+               target: Optional[str] = None) -> Tuple[str, float, float, float, bool]:
     """
     Monitor a single VM through its lifecycle and record clone timing.
 
@@ -652,35 +809,60 @@ def monitor_vm(ns: str, vm_name: str, start_ts: datetime, ssh_pod: str, ssh_pod_
         poll_interval: Polling interval
         ping_timeout: Ping timeout
         logger: Logger instance
-        skip_dv_clone_tracking: Flag to control DataVolume Clone
-        vm_template_path: Path to VM template YAML (optional, for DV name extraction)
+        clone_tracker: Shared clone tracker; clone timing is skipped when None
+        journal: Run journal to record each milestone in, or None
+        resumed: Milestones already journaled by an interrupted run, or None for a fresh run
+        target: VM target label for results and the journal (defaults to the namespace)
     Returns:
-        Tuple of (namespace, running_time, ping_time, clone_duration, success)
+        Tuple of (target, running_time, ping_time, clone_duration, success)
     """
+    target = target or ns
+    result = (target, None, None, None, False)
     try:
         # Track clone timing
-        if not skip_dv_clone_tracking:
-            clone_start, clone_end, clone_duration = track_clone_progress(
-                ns, vm_name, start_ts, poll_interval, logger, vm_template_path=vm_template_path
-            )
+        if resumed and 'clone_duration' in resumed:
+            clone_duration = resumed['clone_duration']
+        elif clone_tracker:
+            clone_start, clone_end, clone_duration = clone_tracker.wait_for_clone(target, start_ts)
+            if journal:
+                journal.record('clone_done', namespace=target, clone_duration=clone_duration)
         else:
             clone_duration = None
+
         # Wait for VM to become Running
-        _, running_time = wait_for_vm_running(ns, vm_name, start_ts, poll_interval, logger)
+        if resumed and 'running_time' in resumed:
+            running_time = resumed['running_time']
+        else:
+            running_at = get_vmi_phase_transition_time(vm_name, ns, 'Running', logger) if resumed is not None else None
+            if running_at:
+                # Reached Running while the driver was down: use the cluster's transition time
+                running_time = round((running_at - start_ts).total_seconds(), 2)
+                logger.info(f"[{ns}] VM reached Running after {running_time:.2f}s (from VMI phase transitions)")
+            else:
+                _, running_time = wait_for_vm_running(ns, vm_name, start_ts, poll_interval, logger)
+            if journal:
+                journal.record('vm_running', namespace=target, running_time=running_time)
 
         # Wait for VMI IP
         ip = wait_for_vmi_ip(ns, vm_name, poll_interval, logger)
 
         # Wait until ping works
+        if resumed is not None:
+            logger.info(f"[{ns}] Ping time after resume is an upper bound (includes the interruption)")
         _, ping_time, success = wait_for_ping(
             ns, ip, start_ts, ssh_pod, ssh_pod_ns, poll_interval, ping_timeout, logger
         )
 
-        return ns, running_time, ping_time, clone_duration, success
+        result = (target, running_time, ping_time, clone_duration, success)
 
     except Exception as e:
-        logger.error(f"[{ns}] Error monitoring VM: {e}")
-        return ns, None, None, None, False
+        logger.error(f"[{target}] Error monitoring VM: {e}")
+
+    if journal:
+        _, running_time, ping_time, clone_duration, success = result
+        journal.record('vm_result', namespace=target, running_time=running_time, ping_time=ping_time,
+                       clone_duration=clone_duration, success=success)
+    return result
 
 
 
@@ -750,141 +932,274 @@ def extract_datavolume_name_from_yaml(vm_template_path: str, logger) -> Optional
         return None
 
 
-def track_clone_progress(ns: str, vm_name: str, start_ts: datetime, poll_interval: int, logger,
-                        vm_template_path: Optional[str] = None, timeout: int = 1800):
+def resolve_boot_volume_name(vm_name: str, vm_template_path: Optional[str], logger) -> str:
     """
-    Track DataVolume/PVC clone timing for a given VM, including inferred clone start logic.
+    Resolve the name of the boot disk DataVolume/PVC whose clone is tracked.
 
     Args:
-        ns: Namespace
-        vm_name: VM name (used to derive DV name)
-        start_ts: Time when VM creation was initiated
-        poll_interval: Poll interval in seconds
-        logger: Logger instance
+        vm_name: VM name (used to derive the fallback DV name)
         vm_template_path: Path to VM template YAML (optional, for boot disk name extraction)
-        timeout: Timeout in seconds
+        logger: Logger instance
 
     Returns:
-        Tuple (clone_start_time, clone_end_time, clone_duration_seconds)
-        or (None, None, None) if not detected
+        Boot disk DataVolume/PVC name
     """
-
-    # Try to get boot disk name from the VM template YAML
     dv_name = None
     if vm_template_path:
         dv_name = extract_datavolume_name_from_yaml(vm_template_path, logger)
         if dv_name:
-            logger.info(f"[{ns}] Extracted boot disk name from template: {dv_name}")
+            logger.info(f"Extracted boot disk name from template: {dv_name}")
 
     # Fallback to standard naming pattern if not found in template
     if not dv_name:
         dv_name = f"{vm_name}-volume"
-        logger.debug(f"[{ns}] Using standard naming pattern: {dv_name}")
+        logger.debug(f"Using standard naming pattern: {dv_name}")
+
+    return dv_name
+
+
+def load_resume_state(events: List[dict]) -> dict:
+    """
+    Rebuild the progress of an interrupted run from its journal events.
+
+    Args:
+        events: Events loaded with RunJournal.load()
 
-    # Check if it's a DataVolume or PVC
-    # First try DataVolume, then fall back to PVC
-    result = subprocess.run(
-        ["kubectl", "get", "dv", dv_name, "-n", ns, "--no-headers"],
-        capture_output=True, text=True, check=False
+    Returns:
+        Dict with the creation start time, per-target VM creation times,
+        journaled milestones, finished results and whether creation completed
+    """
+    state = {
+        'create_start': None,
+        'start_times': {},
+        'milestones': {},
+        'results': {},
+        'creation_done': False,
+        'total_time': None,
+    }
+    for event in events:
+        kind = event.get('event')
+        ns = event.get('namespace')
+        if kind == 'phase_started' and event.get('phase') == 'creation':
+            state['create_start'] = datetime.fromisoformat(event['create_start'])
+        elif kind == 'vm_created':
+            state['start_times'][ns] = datetime.fromisoformat(event['start_ts'])
+        elif kind == 'clone_done':
+            state['milestones'].setdefault(ns, {})['clone_duration'] = event.get('clone_duration')
+        elif kind == 'vm_running':
+            state['milestones'].setdefault(ns, {})['running_time'] = event.get('running_time')
+        elif kind == 'vm_result':
+            state['results'][ns] = (ns, event.get('running_time'), event.get('ping_time'),
+                                    event.get('clone_duration'), event.get('success'))
+        elif kind == 'phase_complete' and event.get('phase') == 'creation':
+            state['creation_done'] = True
+            state['total_time'] = event.get('total_time')
+    return state
+
+
+def teardown_test_vms(args, logger):
+    """Delete the VMs of a finished run (and its namespaces unless they are kept or pooled)."""
+    delete_namespaces = not args.skip_namespace_creation and not args.namespace_pool
+    stats = cleanup_test_namespaces(
+        namespace_prefix=args.namespace_prefix,
+        start=args.start,
+        end=args.end,
+        vm_name=args.vm_name,
+        delete_namespaces=delete_namespaces,
+        dry_run=False,
+        batch_size=args.namespace_batch_size,
+        logger=logger,
+        vms_per_namespace=args.vms_per_namespace,
+        namespace_pool=args.namespace_pool
     )
-    is_datavolume = result.returncode == 0
+    print_cleanup_summary(stats, logger)
+    if delete_namespaces:
+        wait_for_namespaces_deleted(
+            [f"{args.namespace_prefix}-{i}" for i in range(args.start, args.end + 1)], logger=logger
+        )
 
-    if is_datavolume:
-        logger.info(f"[{ns}] Tracking DataVolume clone progress for {dv_name}")
-    else:
-        logger.info(f"[{ns}] Tracking PVC clone progress for {dv_name}")
 
-    clone_start = None
-    clone_end = None
-    clone_inferred = False
-    elapsed = 0
+def run_repeat_mode(args) -> int:
+    """
+    Run the whole test --repeat times and report run-to-run statistics.
 
-    # Use appropriate resource type for kubectl commands
-    resource_type = "dv" if is_datavolume else "pvc"
+    Created VMs are deleted between repetitions (their namespaces too, unless
+    --skip-namespace-creation is set; pool namespaces are released to the pool).
+    Boot-storm-only runs (--skip-vm-creation) keep their VMs.
 
-    while elapsed < timeout:
+    Returns:
+        Process exit code
+    """
+    disk_count = args.num_disks
+    if not disk_count:
         try:
-            result = subprocess.run(
-                ["kubectl", "get", resource_type, dv_name, "-n", ns, "-o", "json"],
-                capture_output=True, text=True, check=False
-            )
-            if result.returncode != 0 or not result.stdout:
-                time.sleep(poll_interval)
-                elapsed = (datetime.now() - start_ts).total_seconds()
-                continue
+            disk_count = detect_disk_count_from_template(args.vm_template)
+        except Exception:
+            disk_count = None
+
+    run_dir = build_results_dir(args, disk_count or 0)
+    os.makedirs(run_dir, exist_ok=True)
+    logger = setup_logging(os.path.join(run_dir, "repeat.log"), args.log_level)
+    logger.info(f"Running {args.repeat} repetitions (settle time {args.settle_time}s) under {run_dir}")
+
+    return run_repeated_benchmark(
+        os.path.abspath(__file__), args.repeat, run_dir, args.settle_time, logger,
+        teardown=None if args.skip_vm_creation else lambda: teardown_test_vms(args, logger)
+    )
 
-            data = json.loads(result.stdout)
 
-            # Get phase - DataVolume uses status.phase, PVC uses annotations
-            if is_datavolume:
-                phase = data.get("status", {}).get("phase", "").lower()
-            else:
-                # For PVC, check if it's bound (clone complete)
-                pvc_phase = data.get("status", {}).get("phase", "").lower()
-                if pvc_phase == "bound":
-                    phase = "succeeded"
-                else:
-                    phase = pvc_phase
-
-            # CloneScheduled observed
-            if phase == "clonescheduled" and not clone_start:
-                clone_start = datetime.now()
-                logger.info(f"[{ns}] {dv_name} entered CloneScheduled ({(clone_start - start_ts).total_seconds():.2f}s after VM creation)")
-
-            # Clone in progress but no CloneScheduled observed (inferred)
-            elif phase == "csicloneinprogress" and not clone_start:
-                # Infer clone started shortly after VM creation
-                current_time = datetime.now()
-                elapsed_now = (current_time - start_ts).total_seconds()
-                if elapsed_now > poll_interval:
-                    # Infer it started one poll interval ago
-                    clone_start = current_time - timedelta(seconds=poll_interval)
-                else:
-                    # Started right after VM creation
-                    clone_start = start_ts
-                clone_inferred = True
-                clone_start_delta = (clone_start - start_ts).total_seconds()
-                logger.info(f"[{ns}] {dv_name} in CSICloneInProgress (inferred clone start: {clone_start_delta:.2f}s after VM creation)")
-
-            # Clone succeeded (DataVolume) or Bound (PVC)
-            elif phase == "succeeded":
-                clone_end = datetime.now()
-                if not clone_start:
-                    # Infer clone started one poll interval ago, but not before VM creation
-                    inferred_start = clone_end - timedelta(seconds=poll_interval)
-                    if inferred_start < start_ts:
-                        clone_start = start_ts
-                    else:
-                        clone_start = inferred_start
-                    clone_inferred = True
-                    logger.info(f"[{ns}] {dv_name} clone was fast (inferred clone start: {(clone_start - start_ts).total_seconds():.2f}s after VM creation)")
-                logger.info(f"[{ns}] {dv_name} clone succeeded ({(clone_end - start_ts).total_seconds():.2f}s after VM creation)")
-                break
-
-            elif phase == "failed":
-                logger.error(f"[{ns}] {dv_name} entered Failed state")
-                return None, None, None
+def save_node_scaling_summary(run_dir: str, levels: List[Tuple[int, str]], logger) -> Optional[str]:
+    """
+    Compare the boot storms of a --node-scaling run.
 
-        except Exception as e:
-            logger.error(f"[{ns}] Error tracking clone progress: {e}")
-            return None, None, None
+    Throughput is successful VMs over the boot storm wall time. Scaling
+    efficiency compares throughput per node with the smallest node count, so
+    1.0 means linear scaling and falling values point at a cluster-wide limit.
 
-        time.sleep(poll_interval)
-        elapsed = (datetime.now() - start_ts).total_seconds()
+    Args:
+        run_dir: Run directory holding one sub-directory per node count
+        levels: (node count, results directory) of each boot storm, in run order
+        logger: Logger instance
 
-    if clone_start and clone_end:
-        duration = round((clone_end - clone_start).total_seconds(), 2)
-        inferred_text = " (inferred)" if clone_inferred else ""
-        logger.info(f"[{ns}] {dv_name} CloneScheduled to Succeeded duration: {duration} seconds{inferred_text}")
-        return clone_start, clone_end, duration
-    else:
-        logger.warning(f"[{ns}] Clone tracking incomplete or timed out")
-        return None, None, None
+    Returns:
+        Path of node_scaling_summary.json, or None if no level produced results
+    """
+    rows = []
+    for nodes, level_dir in levels:
+        try:
+            with open(os.path.join(level_dir, 'summary_boot_storm_results.json')) as f:
+                summary = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            logger.warning(f"No boot storm summary for {nodes} node(s) in {level_dir}")
+            continue
+
+        metrics = {m['metric']: m for m in summary.get('metrics', [])}
+        duration = summary.get('total_test_duration_sec')
+        successful = summary.get('successful', 0)
+        vms_per_sec = successful / duration if duration else None
+        rows.append({
+            'nodes': nodes,
+            'total_vms': summary.get('total_vms'),
+            'successful': successful,
+            'boot_storm_duration_sec': duration,
+            'vms_per_sec': round(vms_per_sec, 3) if vms_per_sec is not None else None,
+            'vms_per_sec_per_node': round(vms_per_sec / nodes, 3) if vms_per_sec is not None else None,
+            'running_time_p50_sec': metrics.get('running_time_sec', {}).get('p50'),
+            'ping_time_p50_sec': metrics.get('ping_time_sec', {}).get('p50'),
+            'ping_time_p95_sec': metrics.get('ping_time_sec', {}).get('p95'),
+            'results_dir': os.path.relpath(level_dir, run_dir),
+        })
+
+    if not rows:
+        logger.warning("No node scaling level produced boot storm results")
+        return None
+
+    base = next((r for r in rows if r['vms_per_sec_per_node']), None)
+    for row in rows:
+        row['scaling_efficiency'] = (
+            round(row['vms_per_sec_per_node'] / base['vms_per_sec_per_node'], 3)
+            if base and row['vms_per_sec_per_node'] is not None else None
+        )
+
+    json_path = os.path.join(run_dir, 'node_scaling_summary.json')
+    with open(json_path, 'w') as f:
+        json.dump({'baseline_nodes': base['nodes'] if base else None, 'levels': rows}, f, indent=4)
+    with open(os.path.join(run_dir, 'node_scaling_summary.csv'), 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    def fmt(value):
+        return f"{value:.2f}" if value is not None else "N/A"
+
+    logger.info("\n" + "=" * 95)
+    logger.info("BOOT STORM NODE SCALING")
+    logger.info("=" * 95)
+    logger.info(f"{'Nodes':>6} {'VMs':>8} {'Duration(s)':>12} {'VMs/s':>10} {'VMs/s/node':>12} "
+                f"{'Efficiency':>11} {'Ping P50(s)':>12} {'Ping P95(s)':>12}")
+    logger.info("-" * 95)
+    for r in rows:
+        logger.info(f"{r['nodes']:>6} {r['successful']:>8} {fmt(r['boot_storm_duration_sec']):>12} "
+                    f"{fmt(r['vms_per_sec']):>10} {fmt(r['vms_per_sec_per_node']):>12} "
+                    f"{fmt(r['scaling_efficiency']):>11} {fmt(r['ping_time_p50_sec']):>12} "
+                    f"{fmt(r['ping_time_p95_sec']):>12}")
+    logger.info("=" * 95)
+    logger.info(f"Efficiency is VMs/s per node relative to {base['nodes'] if base else '?'} node(s); "
+                f"1.00 = linear scaling")
+    logger.info(f"Saved node scaling summary to {json_path}")
+    return json_path
+
+
+def run_node_scaling_mode(args) -> int:
+    """
+    Run the same boot storm on a growing number of nodes (--node-scaling).
+
+    Every level creates the VMs pinned round-robin to the first K nodes of a
+    deterministic node list, runs the boot storm in a separate process, and
+    deletes the VMs before the next level.
+
+    Returns:
+        Process exit code
+    """
+    disk_count = args.num_disks
+    if not disk_count:
+        try:
+            disk_count = detect_disk_count_from_template(args.vm_template)
+        except Exception:
+            disk_count = None
+
+    run_dir = build_results_dir(args, disk_count or 0)
+    os.makedirs(run_dir, exist_ok=True)
+    logger = setup_logging(os.path.join(run_dir, "node-scaling.log"), args.log_level)
+
+    # Sorted so that the same K nodes are used for K in every run
+    node_pool = args.node_names or sorted(get_worker_nodes(logger))
+    if len(node_pool) < max(args.node_scaling):
+        logger.error(f"--node-scaling needs {max(args.node_scaling)} nodes, "
+                     f"only {len(node_pool)} worker nodes available")
+        return 1
+    logger.info(f"Boot storm node scaling over {args.node_scaling} node(s) under {run_dir}")
+    logger.info(f"Node order: {', '.join(node_pool[:max(args.node_scaling)])}")
+
+    base_argv = strip_cli_options(sys.argv[1:], ('--output-dir',),
+                                  list_options=('--node-scaling', '--node-names'))
+    levels = []
+    failures = 0
+    for i, nodes in enumerate(args.node_scaling):
+        level_dir = os.path.join(run_dir, f"nodes-{nodes:02d}")
+        cmd = ([sys.executable, os.path.abspath(__file__)] + base_argv +
+               ['--boot-storm', '--save-results', '--output-dir', level_dir,
+                '--node-names'] + node_pool[:nodes])
+        logger.info("\n" + "=" * 80)
+        logger.info(f"NODE SCALING LEVEL {i + 1}/{len(args.node_scaling)}: {nodes} node(s)")
+        logger.info("=" * 80)
+
+        returncode = subprocess.run(cmd).returncode
+        levels.append((nodes, level_dir))
+        if returncode != 0:
+            failures += 1
+            logger.warning(f"Level with {nodes} node(s) exited with code {returncode}")
+
+        if i < len(args.node_scaling) - 1:
+            try:
+                teardown_test_vms(args, logger)
+            except Exception as e:
+                logger.error(f"Teardown after {nodes} node(s) failed: {e}")
+            if args.settle_time > 0:
+                logger.info(f"Letting the cluster settle for {args.settle_time}s...")
+                time.sleep(args.settle_time)
+
+    save_node_scaling_summary(run_dir, levels, logger)
+    return 0 if failures == 0 else 1
 
 
 def main():
     """Main execution function."""
     args = parse_args()
+    if args.repeat > 1:
+        sys.exit(run_repeat_mode(args))
+    if args.node_scaling:
+        sys.exit(run_node_scaling_mode(args))
     args._results_dir = None
     args._precomputed_disk_count = None
 
@@ -897,7 +1212,8 @@ def main():
             except Exception:
                 args._precomputed_disk_count = None
 
-        args._results_dir = build_results_dir(args, args._precomputed_disk_count or 0)
+        args._results_dir = (args.output_dir or args.resume
+                             or build_results_dir(args, args._precomputed_disk_count or 0))
         os.makedirs(args._results_dir, exist_ok=True)
 
         if args.log_file:
@@ -909,6 +1225,12 @@ def main():
     # Setup logging
     logger = setup_logging(args.log_file, args.log_level)
 
+    # The run journal makes the results directory resumable after a crash
+    journal = RunJournal(args._results_dir, logger) if args.save_results else None
+    resume_state = load_resume_state(args._resume_events) if args.resume else None
+    if journal and not args.resume:
+        journal.record('run_started', config=journal_config(args))
+
     # Global variables for signal handler
     namespaces_created = []
     cleanup_on_interrupt = args.cleanup or args.cleanup_on_failure
@@ -927,11 +1249,15 @@ def main():
                     delete_namespaces=True,
                     dry_run=False,
                     batch_size=args.namespace_batch_size,
-                    logger=logger
+                    logger=logger,
+                    vms_per_namespace=args.vms_per_namespace,
+                    namespace_pool=args.namespace_pool
                 )
                 print_cleanup_summary(stats, logger)
             except Exception as e:
                 logger.error(f"Error during interrupt cleanup: {e}")
+        elif journal:
+            logger.info(f"Resume this run with: --resume {args._results_dir}")
         sys.exit(1)
 
     # Register signal handler
@@ -940,13 +1266,22 @@ def main():
     logger.info("=" * 80)
     logger.info("KubeVirt VM Creation Performance Test - DataSource Clone Method")
     logger.info("=" * 80)
-    logger.info(f"Test range: {args.start} to {args.end} ({args.end - args.start + 1} VMs)")
+    num_vms = (args.end - args.start + 1) * args.vms_per_namespace
+    logger.info(f"Test range: {args.start} to {args.end} ({num_vms} VMs)")
     logger.info(f"Namespace prefix: {args.namespace_prefix}")
+    if args.namespace_pool:
+        logger.info(f"Namespace pool: {args.namespace_pool}")
+    if args.vms_per_namespace > 1:
+        logger.info(f"VMs per namespace: {args.vms_per_namespace} "
+                    f"({args.vm_name}-1 .. {args.vm_name}-{args.vms_per_namespace})")
     logger.info(f"VM name: {args.vm_name}")
     logger.info(f"VM template: {args.vm_template}")
     logger.info(f"Concurrency: {args.concurrency}")
     logger.info(f"Poll interval: {args.poll_interval}s")
     logger.info(f"Ping timeout: {args.ping_timeout}s")
+    if args.resume:
+        logger.info(f"Resuming interrupted run: {args.resume} "
+                    f"({len(resume_state['results'])} VMs already finished)")
     logger.info("=" * 80)
     num_disks_per_vm = 1
 
@@ -1003,11 +1338,21 @@ def main():
 
         logger.info(f"All VMs will be scheduled on node: {target_node}")
         logger.info("=" * 80)
+    elif args.node_names:
+        logger.info(f"Pinned mode: VMs are spread round-robin across {len(args.node_names)} node(s): "
+                    f"{', '.join(args.node_names)}")
     else:
         logger.info("Multi-node mode: VMs will be distributed across all available nodes")
 
-    # Create namespaces
-    if not args.skip_namespace_creation:
+    # Create namespaces (or lease them, already provisioned, from the pool)
+    if args.namespace_pool:
+        namespaces = [f"{args.namespace_prefix}-{i}" for i in range(args.start, args.end + 1)]
+        owner = namespace_lease_owner(args._results_dir or f"datasource-clone-{os.getpid()}")
+        if not lease_pool_namespaces(args.namespace_pool, namespaces, owner, logger):
+            logger.error(f"Failed to lease namespaces from pool '{args.namespace_pool}'")
+            sys.exit(1)
+        namespaces_created.extend(namespaces)  # Released to the pool on interrupt
+    elif not args.skip_namespace_creation:
         try:
             namespaces = ensure_namespaces(
                 args.start, args.end, args.namespace_prefix,
@@ -1021,6 +1366,10 @@ def main():
         namespaces = [f"{args.namespace_prefix}-{i}" for i in range(args.start, args.end + 1)]
         logger.info(f"Using existing namespaces: {namespaces[0]} to {namespaces[-1]}")
 
+    # Each VM is measured as a target: the namespace itself, or 'namespace/vm' when packed
+    targets = expand_vm_targets(namespaces, args.vm_name, args.vms_per_namespace)
+    packed = args.vms_per_namespace > 1
+
     # Initialize variables for results
     results = []
     out_dir = None
@@ -1030,78 +1379,161 @@ def main():
         logger.info("\n" + "=" * 80)
         logger.info("SKIPPING VM CREATION (--skip-vm-creation)")
         logger.info("=" * 80)
-        logger.info(f"Assuming {len(namespaces)} VMs already exist")
+        logger.info(f"Assuming {len(targets)} VMs already exist")
 
         if not args.boot_storm:
             logger.warning("--skip-vm-creation is typically used with --boot-storm")
 
         # Detect disk count from existing VM if not provided
         if not args.num_disks:
-            first_ns = namespaces[0]
+            first_ns, first_vm = split_vm_target(targets[0], args.vm_name)
             logger.info(f"Detecting disk count from existing VM in {first_ns}...")
-            num_disks_per_vm = get_vm_disk_count(first_ns, args.vm_name, logger)
+            num_disks_per_vm = get_vm_disk_count(first_ns, first_vm, logger)
 
         # Create output directory for results if saving
         if args.save_results:
             out_dir = args._results_dir
             logger.info(f"Using results directory: {out_dir}")
     else:
-        # Phase 1: Create all VMs in parallel
-        logger.info(f"\nPhase 1: Creating {len(namespaces)} VMs in parallel...")
-        if target_node:
-            logger.info(f"Target node: {target_node}")
-        if args.secret_yaml:
-            logger.info(f"Using secret YAML: {args.secret_yaml}")
-        create_start = datetime.now()
-        start_times = {}
-
-        with ThreadPoolExecutor(max_workers=len(namespaces)) as executor:
-            futures = {
-                executor.submit(create_vm, ns, args.vm_template, target_node, logger, args.secret_yaml): ns
-                for ns in namespaces
-            }
-
-            for future in as_completed(futures):
-                try:
-                    ns, ts = future.result()
-                    start_times[ns] = ts
-                except Exception as e:
-                    ns = futures[future]
-                    logger.error(f"[{ns}] Failed to create VM: {e}")
-
-        create_elapsed = (datetime.now() - create_start).total_seconds()
-        logger.info(f"Phase 1 completed in {create_elapsed:.2f}s")
-
-        # Phase 2: Monitor VMs
-        logger.info(f"\nPhase 2: Monitoring {len(start_times)} VMs (concurrency={args.concurrency})...")
-        monitor_start = datetime.now()
-
-        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-            futures = {
-                executor.submit(
-                    monitor_vm, ns, args.vm_name, ts, args.ssh_pod, args.ssh_pod_ns,
-                    args.poll_interval, args.ping_timeout, logger, False, args.vm_template
-                ): ns
-                for ns, ts in start_times.items()
-            }
-
-            for future in as_completed(futures):
-                ns = futures[future]
-                try:
-                    result = future.result()  # now returns (ns, run_time, ping_time, clone_time, success)
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"[{ns}] Monitoring failed: {e}")
-                    results.append((ns, None, None, None, False))
-
-        monitor_elapsed = (datetime.now() - monitor_start).total_seconds()
-        total_elapsed = (datetime.now() - create_start).total_seconds()
-
-        logger.info(f"Phase 2 completed in {monitor_elapsed:.2f}s")
+        if args.resume:
+            start_times = dict(resume_state['start_times'])
+            results = [resume_state['results'][t] for t in targets if t in resume_state['results']]
+            create_start = resume_state['create_start'] or datetime.now()
+        else:
+            start_times = {}
+            create_start = datetime.now()
+        if journal and not (args.resume and resume_state['create_start']):
+            journal.record('phase_started', phase='creation', create_start=create_start)
+
+        clone_tracker = None
+        if args.resume and resume_state['creation_done']:
+            logger.info("VM creation and monitoring already completed in the interrupted run")
+            total_elapsed = resume_state['total_time']
+        else:
+            # Phase 1: Create all VMs in parallel
+            to_create = [t for t in targets if t not in start_times]
+            if args.resume and to_create:
+                # VMs created after the last journal write keep their cluster creation time
+                for target in list(to_create):
+                    ns, vm = split_vm_target(target, args.vm_name)
+                    ts = get_vm_creation_timestamp(vm, ns, logger)
+                    if ts:
+                        start_times[target] = ts
+                        to_create.remove(target)
+                        journal.record('vm_created', namespace=target, start_ts=ts)
+
+            pending = [t for t in targets if t not in resume_state['results']] if args.resume else targets
+
+            # One shared tracker follows every boot disk clone for the whole run
+            boot_volume = resolve_boot_volume_name(args.vm_name, args.vm_template, logger)
+            volumes = {}
+            for target in pending:
+                ns, vm = split_vm_target(target, args.vm_name)
+                volumes[target] = (ns, packed_resource_name(boot_volume, args.vm_name, vm))
+            clone_tracker = DataVolumeCloneTracker(volumes, args.poll_interval, logger)
+            clone_tracker.start()
+
+            logger.info(f"\nPhase 1: Creating {len(to_create)} VMs in parallel...")
+            if target_node:
+                logger.info(f"Target node: {target_node}")
+            secret_yaml = args.secret_yaml
+            if args.namespace_pool and secret_yaml:
+                logger.info(f"Secret supplied by namespace pool '{args.namespace_pool}', "
+                            f"not applying {secret_yaml}")
+                secret_yaml = None
+            elif secret_yaml:
+                logger.info(f"Using secret YAML: {secret_yaml}")
+            phase1_start = datetime.now()
+
+            if packed and secret_yaml and to_create:
+                # The VMs of a namespace share one secret: create it once up front
+                secret_namespaces = sorted({split_vm_target(t, args.vm_name)[0] for t in to_create})
+                with ThreadPoolExecutor(max_workers=args.namespace_batch_size) as executor:
+                    futures = {
+                        executor.submit(create_secret, ns, secret_yaml, logger): ns
+                        for ns in secret_namespaces
+                    }
+                    failed_ns = {futures[f] for f in as_completed(futures) if not f.result()}
+                if failed_ns:
+                    logger.error(f"Failed to create secret in {len(failed_ns)} namespaces, "
+                                 f"skipping their VMs: {sorted(failed_ns)}")
+                    to_create = [t for t in to_create if split_vm_target(t, args.vm_name)[0] not in failed_ns]
+                secret_yaml = None
+
+            # --node-names pins VMs round-robin in target order, so placement is reproducible
+            placement = {t: target_node for t in targets}
+            if args.node_names:
+                placement = {t: args.node_names[i % len(args.node_names)] for i, t in enumerate(targets)}
+
+            if to_create:
+                with ThreadPoolExecutor(max_workers=len(to_create)) as executor:
+                    futures = {}
+                    for target in to_create:
+                        ns, vm = split_vm_target(target, args.vm_name)
+                        future = executor.submit(create_vm, ns, args.vm_template, placement[target], logger,
+                                                 secret_yaml, vm_name=vm if packed else None)
+                        futures[future] = target
+
+                    for future in as_completed(futures):
+                        target = futures[future]
+                        try:
+                            _, ts = future.result()
+                            start_times[target] = ts
+                            if journal:
+                                journal.record('vm_created', namespace=target, start_ts=ts)
+                        except Exception as e:
+                            logger.error(f"[{target}] Failed to create VM: {e}")
+
+            create_elapsed = (datetime.now() - phase1_start).total_seconds()
+            logger.info(f"Phase 1 completed in {create_elapsed:.2f}s")
+
+            # Phase 2: Monitor VMs
+            to_monitor = {t: ts for t, ts in start_times.items() if t in pending}
+            logger.info(f"\nPhase 2: Monitoring {len(to_monitor)} VMs (concurrency={args.concurrency})...")
+            monitor_start = datetime.now()
+
+            with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+                futures = {
+                    executor.submit(
+                        monitor_vm, *split_vm_target(target, args.vm_name), ts, args.ssh_pod, args.ssh_pod_ns,
+                        args.poll_interval, args.ping_timeout, logger, clone_tracker, journal,
+                        resume_state['milestones'].get(target, {}) if args.resume else None,
+                        target
+                    ): target
+                    for target, ts in to_monitor.items()
+                }
+
+                for future in as_completed(futures):
+                    target = futures[future]
+                    try:
+                        result = future.result()  # now returns (target, run_time, ping_time, clone_time, success)
+                        results.append(result)
+                    except Exception as e:
+                        logger.error(f"[{target}] Monitoring failed: {e}")
+                        results.append((target, None, None, None, False))
+
+            monitor_elapsed = (datetime.now() - monitor_start).total_seconds()
+            total_elapsed = (datetime.now() - create_start).total_seconds()
+            clone_tracker.stop()
+            if journal:
+                journal.record('phase_complete', phase='creation', total_time=total_elapsed)
+
+            logger.info(f"Phase 2 completed in {monitor_elapsed:.2f}s")
+            if args.resume:
+                logger.info("Total test duration below is wall-clock time and includes the interruption")
         logger.info(f"Total test duration: {total_elapsed:.2f}s")
 
+        # Guest boot completion is read in one pass once every VM answers ping
+        guest_boot = None
+        if args.guest_boot_metrics:
+            guest_boot = collect_guest_boot_times(
+                {r[0]: split_vm_target(r[0], args.vm_name) for r in results if r[4]}, start_times,
+                args.ssh_pod, args.ssh_pod_ns, args.vm_user, args.vm_password, args.concurrency, logger
+            )
+
         # Print summary
-        print_summary_table(results, "VM Creation Performance Test Results", logger=logger)
+        print_summary_table(results, "VM Creation Performance Test Results", logger=logger,
+                            guest_boot=guest_boot)
 
         # Save structured results if requested
         if args.save_results:
@@ -1115,8 +1547,11 @@ def main():
                 base_dir=out_dir,
                 prefix="vm_creation_results",
                 logger=logger,
-                total_time=total_elapsed
+                total_time=total_elapsed,
+                guest_boot=guest_boot
             )
+            if clone_tracker:
+                save_clone_tracking_results(clone_tracker, out_dir, logger)
             logger.info(f"Detailed and summary results saved under: {out_dir}")
         else:
             logger.info("VM Creation Performance Test Results not saved (use --save-results to enable).")
@@ -1134,16 +1569,17 @@ def main():
 
         with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
             stop_futures = {
-                executor.submit(stop_vm, args.vm_name, ns, logger): ns
-                for ns in namespaces
+                executor.submit(stop_vm, vm, ns, logger): target
+                for target in targets
+                for ns, vm in [split_vm_target(target, args.vm_name)]
             }
 
             for future in as_completed(stop_futures):
-                ns = stop_futures[future]
+                target = stop_futures[future]
                 try:
                     future.result()
                 except Exception as e:
-                    logger.error(f"[{ns}] Failed to stop VM: {e}")
+                    logger.error(f"[{target}] Failed to stop VM: {e}")
 
         stop_elapsed = (datetime.now() - stop_start).total_seconds()
         logger.info(f"Stop commands issued in {stop_elapsed:.2f}s")
@@ -1154,23 +1590,24 @@ def main():
 
         with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
             wait_futures = {
-                executor.submit(wait_for_vm_stopped, args.vm_name, ns, 300, logger): ns
-                for ns in namespaces
+                executor.submit(wait_for_vm_stopped, vm, ns, 300, logger): target
+                for target in targets
+                for ns, vm in [split_vm_target(target, args.vm_name)]
             }
 
             stopped_count = 0
             for future in as_completed(wait_futures):
-                ns = wait_futures[future]
+                target = wait_futures[future]
                 try:
                     if future.result():
                         stopped_count += 1
-                        logger.debug(f"[{ns}] VM stopped ({stopped_count}/{len(namespaces)})")
+                        logger.debug(f"[{target}] VM stopped ({stopped_count}/{len(targets)})")
                 except Exception as e:
-                    logger.error(f"[{ns}] Error waiting for VM to stop: {e}")
+                    logger.error(f"[{target}] Error waiting for VM to stop: {e}")
 
         wait_elapsed = (datetime.now() - wait_start).total_seconds()
         logger.info(f"All VMs stopped in {wait_elapsed:.2f}s")
-        logger.info(f"Successfully stopped: {stopped_count}/{len(namespaces)} VMs")
+        logger.info(f"Successfully stopped: {stopped_count}/{len(targets)} VMs")
 
         # Phase 3: Start all VMs simultaneously (BOOT STORM)
         logger.info("\nPhase 3: Starting all VMs simultaneously (BOOT STORM)...")
@@ -1179,17 +1616,18 @@ def main():
 
         with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
             start_futures = {
-                executor.submit(start_vm, args.vm_name, ns, logger): ns
-                for ns in namespaces
+                executor.submit(start_vm, vm, ns, logger): target
+                for target in targets
+                for ns, vm in [split_vm_target(target, args.vm_name)]
             }
 
             for future in as_completed(start_futures):
-                ns = start_futures[future]
+                target = start_futures[future]
                 try:
                     future.result()
-                    boot_start_times[ns] = datetime.now()
+                    boot_start_times[target] = datetime.now()
                 except Exception as e:
-                    logger.error(f"[{ns}] Failed to start VM: {e}")
+                    logger.error(f"[{target}] Failed to start VM: {e}")
 
         boot_issue_elapsed = (datetime.now() - boot_start).total_seconds()
         logger.info(f"All start commands issued in {boot_issue_elapsed:.2f}s")
@@ -1201,11 +1639,10 @@ def main():
         with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
             boot_futures = {
                 executor.submit(
-                    monitor_vm, ns, args.vm_name, ts, args.ssh_pod, args.ssh_pod_ns,
-                    args.poll_interval, args.ping_timeout, logger, skip_dv_clone_tracking=True,
-                    vm_template_path=args.vm_template
-                ): ns
-                for ns, ts in boot_start_times.items()
+                    monitor_vm, *split_vm_target(target, args.vm_name), ts, args.ssh_pod, args.ssh_pod_ns,
+                    args.poll_interval, args.ping_timeout, logger, target=target
+                ): target
+                for target, ts in boot_start_times.items()
             }
 
             for future in as_completed(boot_futures):
@@ -1213,9 +1650,9 @@ def main():
                     result = future.result()
                     boot_storm_results.append(result)
                 except Exception as e:
-                    ns = boot_futures[future]
-                    logger.error(f"[{ns}] Boot storm monitoring failed: {e}")
-                    boot_storm_results.append((ns, None, None, False))
+                    target = boot_futures[future]
+                    logger.error(f"[{target}] Boot storm monitoring failed: {e}")
+                    boot_storm_results.append((target, None, None, None, False))
 
         boot_monitor_elapsed = (datetime.now() - monitor_start).total_seconds()
         boot_total_elapsed = (datetime.now() - boot_start).total_seconds()
@@ -1223,11 +1660,20 @@ def main():
         logger.info(f"Boot storm monitoring completed in {boot_monitor_elapsed:.2f}s")
         logger.info(f"Total boot storm duration: {boot_total_elapsed:.2f}s")
 
+        boot_guest_boot = None
+        if args.guest_boot_metrics:
+            boot_guest_boot = collect_guest_boot_times(
+                {r[0]: split_vm_target(r[0], args.vm_name) for r in boot_storm_results if r[4]},
+                boot_start_times, args.ssh_pod, args.ssh_pod_ns, args.vm_user, args.vm_password,
+                args.concurrency, logger
+            )
+
         # Print boot storm summary
-        print_summary_table(boot_storm_results, "Boot Storm Performance Test Results", skip_clone=True, logger=logger)
+        print_summary_table(boot_storm_results, "Boot Storm Performance Test Results", skip_clone=True, logger=logger,
+                            guest_boot=boot_guest_boot)
         if args.save_results:
             save_results(args, boot_storm_results, base_dir=out_dir, prefix="boot_storm_results", logger=logger,
-                         skip_clone=True, total_time=boot_total_elapsed)
+                         skip_clone=True, total_time=boot_total_elapsed, guest_boot=boot_guest_boot)
 
     failed_count = sum(1 for r in results if len(r) > 4 and not r[4]) if results else 0
     should_cleanup = args.cleanup or (args.cleanup_on_failure and failed_count > 0)
@@ -1253,7 +1699,9 @@ def main():
                     delete_namespaces=True,
                     dry_run=args.dry_run_cleanup,
                     batch_size=args.namespace_batch_size,
-                    logger=logger
+                    logger=logger,
+                    vms_per_namespace=args.vms_per_namespace,
+                    namespace_pool=args.namespace_pool
                 )
 
                 print_cleanup_summary(stats, logger)
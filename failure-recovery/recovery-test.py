@@ -60,6 +60,7 @@ from utils.common import (
     delete_far_resource,
     uncordon_node,
     save_results,
+    VMPlacementIndex,
 )
 
 # Default values
@@ -90,34 +91,14 @@ def get_vmis_on_node(node_name: str, vm_name: str, namespace_prefix: str,
     Get list of namespaces with VMIs running on the specified node.
     Must be called BEFORE node failure to capture which VMIs are on the node.
     """
-    returncode, output, stderr = run_kubectl(
-        ['get', 'vmi', '--all-namespaces', '-o', 'json'], logger=logger
-    )
-
-    if returncode != 0:
-        logger.error(f"Failed to get VMIs: {stderr}")
-        return []
-
-    try:
-        vmis_data = json.loads(output)
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse VMI JSON: {e}")
-        return []
-
     namespaces = []
-    for vmi in vmis_data.get('items', []):
-        vmi_n = vmi.get('metadata', {}).get('name', '')
-        namespace = vmi.get('metadata', {}).get('namespace', '')
-        scheduled_node = vmi.get('status', {}).get('nodeName', '')
-        phase = vmi.get('status', {}).get('phase', '')
-
+    for namespace, vmi_n in VMPlacementIndex(logger).vms_on_node(node_name):
         if vmi_n != vm_name:
             continue
         if namespace_prefix and not namespace.startswith(namespace_prefix):
             continue
-        if scheduled_node == node_name:
-            namespaces.append(namespace)
-            logger.debug(f"Found VMI {vmi_n} in {namespace} on {node_name} (phase: {phase})")
+        namespaces.append(namespace)
+        logger.debug(f"Found VMI {vmi_n} in {namespace} on {node_name}")
 
     return namespaces
 
@@ -78,6 +78,8 @@ from utils.common import (
     get_vm_disk_count,
     get_vmi_ip,
     ssh_exec_command,
+    expand_vm_targets,
+    split_vm_target,
 )
 
 
@@ -749,6 +751,8 @@ def main():
                         help="End namespace index")
     parser.add_argument("--vm-name", required=True,
                         help="VM name in each namespace")
+    parser.add_argument("--vms-per-namespace", type=int, default=1,
+                        help="VMs per namespace, named <vm-name>-1 .. <vm-name>-N (default: 1)")
     parser.add_argument("--action", required=True,
                         choices=["run-all", "deploy", "start", "stop", "restart", "status", "stop-all", "change-workload", "gather-results", "cleanup"],
                         help="Action to perform (run-all: full workflow - deploy, workload, wait, gather, cleanup)")
@@ -815,7 +819,8 @@ def main():
 
     # Build list of namespaces early so saved runs can log into their result directory.
     namespaces = [f"{args.namespace_prefix}-{i}" for i in range(args.start, args.end + 1)]
-    vm_targets = [(ns, args.vm_name) for ns in namespaces]
+    vm_targets = [split_vm_target(t, args.vm_name)
+                  for t in expand_vm_targets(namespaces, args.vm_name, args.vms_per_namespace)]
 
     if args.save_results and args.action in ("gather-results", "run-all") and not args.log_file:
         output_dir = build_elbencho_output_dir(args, vm_targets)
@@ -1015,6 +1020,7 @@ def main():
             '--ssh-pod', args.ssh_pod,
             '--ssh-pod-ns', args.ssh_pod_ns,
             '--log-level', args.log_level,
+            '--vms-per-namespace', str(args.vms_per_namespace),
         ]
 
         if args.secret_yaml:
@@ -1063,7 +1069,8 @@ def main():
             vm_name=args.vm_name,
             delete_namespaces=True,
             batch_size=20,
-            logger=logger
+            logger=logger,
+            vms_per_namespace=args.vms_per_namespace
         )
 
         elapsed = (datetime.now() - start_time).total_seconds()
@@ -1114,6 +1121,7 @@ def main():
             '--ssh-pod', args.ssh_pod,
             '--ssh-pod-ns', args.ssh_pod_ns,
             '--log-level', args.log_level,
+            '--vms-per-namespace', str(args.vms_per_namespace),
         ]
 
         if args.secret_yaml:
@@ -44,7 +44,8 @@ from utils.common import (
     setup_logging, run_kubectl_command, create_namespace, create_namespaces_parallel,
     delete_namespace, cleanup_test_namespaces, confirm_cleanup,
     print_cleanup_summary, get_vm_disk_count, get_vmi_ip, get_pvc_status,
-    ssh_exec_command,
+    ssh_exec_command, run_repeated_benchmark, wait_for_namespaces_deleted,
+    expand_vm_targets, split_vm_target, namespace_lease_owner, lease_pool_namespaces,
 )
 
 # Defaults
@@ -82,6 +83,12 @@ Examples:
   %(prog)s --action gather-results --start 1 --end 10 --storage-driver portworx-3.6
   %(prog)s --action cleanup --start 1 --end 10
 
+  # 100 FIO VMs packed 10 per namespace
+  %(prog)s --action run-all --start 1 --end 10 --vms-per-namespace 10 --storage-class px-csi --save-results
+
+  # Repeat the full workflow 5 times and report run-to-run variance
+  %(prog)s --action run-all --start 1 --end 10 --storage-class px-csi --repeat 5 --settle-time 120
+
   # Custom FIO parameters (for deploy or run-all)
   %(prog)s --action deploy --start 1 --end 50 --storage-class px-csi \\
       --fio-runtime 600 --fio-rw randrw --fio-bs 8k
@@ -100,8 +107,13 @@ Examples:
 
     # VM config
     parser.add_argument('--vm-name', type=str, default=DEFAULT_VM_NAME)
+    parser.add_argument('--vms-per-namespace', type=int, default=1,
+                        help='VMs per namespace, named <vm-name>-1 .. <vm-name>-N (default: 1)')
     parser.add_argument('--vm-template', type=str, default=DEFAULT_VM_TEMPLATE)
     parser.add_argument('--namespace-prefix', type=str, default=DEFAULT_NAMESPACE_PREFIX)
+    parser.add_argument('--namespace-pool', type=str, default=None,
+                        help='Lease pre-provisioned namespaces from this pool (see utils/namespace_pool.py) '
+                             'instead of creating them; cleanup returns them to the pool')
     parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
 
     # FIO config
@@ -121,6 +133,13 @@ Examples:
                         help='Disks per VM for results folder name (default: auto-detect from first VM, fallback: 1-disk)')
     parser.add_argument('--save-results', action='store_true', help='Save results to JSON/CSV')
     parser.add_argument('--cleanup', action='store_true', help='Delete VMs after test (for run-all action)')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Repeat run-all K times, deleting the VMs in between, and report run-to-run '
+                             'variance, warm-up effect and confidence intervals (default: 1)')
+    parser.add_argument('--settle-time', type=int, default=60,
+                        help='Seconds to let the cluster settle between repetitions (default: 60)')
+    # Results directory of one repetition, set by --repeat
+    parser.add_argument('--output-dir', type=str, default=None, help=argparse.SUPPRESS)
 
     # Collection settings
     parser.add_argument('--collect-retries', type=int, default=8, help='Max retries for collecting results')
@@ -143,6 +162,12 @@ Examples:
     # Validate required args based on action
     if args.action in ['deploy', 'run-all'] and not args.storage_class:
         parser.error(f"--storage-class is required for action '{args.action}'")
+    if args.repeat < 1:
+        parser.error("--repeat must be >= 1")
+    if args.vms_per_namespace < 1:
+        parser.error("--vms-per-namespace must be >= 1")
+    if args.repeat > 1 and args.action != 'run-all':
+        parser.error("--repeat requires --action run-all")
 
     return args
 
@@ -302,9 +327,10 @@ def extract_json_object(text: str) -> Optional[str]:
 
 def collect_fio_results(namespace: str, vm_name: str, ssh_config: Dict,
                         output_dir: str, logger,
-                        max_retries: int = 8, retry_delay: int = 20) -> Optional[Dict]:
-    """Collect FIO results from VM via SSH with retries."""
-    vm_results_dir = os.path.join(output_dir, "per-vm-results", namespace)
+                        max_retries: int = 8, retry_delay: int = 20,
+                        target: Optional[str] = None) -> Optional[Dict]:
+    """Collect FIO results from VM via SSH with retries (stored under per-vm-results/<target>)."""
+    vm_results_dir = os.path.join(output_dir, "per-vm-results", target or namespace)
     os.makedirs(vm_results_dir, exist_ok=True)
     local_path = os.path.join(vm_results_dir, "fio_raw.json")
 
@@ -453,22 +479,27 @@ def get_output_dir(args, namespaces, logger) -> str:
     """Determine and create output directory."""
     if getattr(args, '_output_dir', None):
         return args._output_dir
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+        args._output_dir = args.output_dir
+        return args._output_dir
 
+    targets = expand_vm_targets(namespaces, args.vm_name, args.vms_per_namespace)
     disks_per_vm = args.disks_per_vm
     if disks_per_vm == "auto":
-        first_ns = namespaces[0]
-        disk_count = get_vm_disk_count(args.vm_name, first_ns, logger)
+        first_ns, first_vm = split_vm_target(targets[0], args.vm_name)
+        disk_count = get_vm_disk_count(first_vm, first_ns, logger)
         if disk_count > 0:
             disks_per_vm = f"{disk_count}-disk"
             if logger:
-                logger.info(f"Auto-detected {disk_count} disks from {first_ns}/{args.vm_name} spec")
+                logger.info(f"Auto-detected {disk_count} disks from {first_ns}/{first_vm} spec")
         else:
             disks_per_vm = "1-disk"
             if logger:
-                logger.warning(f"Could not detect disks from {first_ns}/{args.vm_name}, using default: 1-disk")
+                logger.warning(f"Could not detect disks from {first_ns}/{first_vm}, using default: 1-disk")
 
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    num_vms = len(namespaces)
+    num_vms = len(targets)
     run_name = f"{timestamp}_fio_benchmark_{num_vms}vms"
 
     output_dir = os.path.join(
@@ -482,40 +513,61 @@ def get_output_dir(args, namespaces, logger) -> str:
     return output_dir
 
 
+def prepare_namespaces(args, namespaces, logger) -> bool:
+    """Create the test namespaces, or lease them from --namespace-pool."""
+    if not args.namespace_pool:
+        create_namespaces_parallel(namespaces, batch_size=20, logger=logger)
+        return True
+    # A fixed owner lets the deploy, run-all and cleanup actions of one range share the lease
+    owner = namespace_lease_owner(f"fio-{args.namespace_prefix}-{args.start}-{args.end}")
+    return lease_pool_namespaces(args.namespace_pool, namespaces, owner, logger)
+
+
+def deploy_fio_vms(args, namespaces, fio_config, vm_password, logger):
+    """Deploy the FIO VM(s) of every namespace in parallel."""
+    template_path = os.path.join(os.path.dirname(__file__), args.vm_template)
+    targets = expand_vm_targets(namespaces, args.vm_name, args.vms_per_namespace)
+    vm_yamls = {}
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        futures = {}
+        for target in targets:
+            ns, vm = split_vm_target(target, args.vm_name)
+            if vm not in vm_yamls:
+                vm_yamls[vm] = prepare_vm_yaml(
+                    template_path, vm, args.storage_class,
+                    fio_config, vm_password, logger
+                )
+            futures[executor.submit(deploy_vm, ns, vm_yamls[vm], logger)] = target
+        for future in as_completed(futures):
+            target = futures[future]
+            try:
+                future.result()
+                print(f"  ✓ {target}")
+            except Exception as e:
+                print(f"  ✗ {target}: {e}")
+
+
 def action_deploy(args, namespaces, fio_config, logger):
     """Deploy VMs with FIO pre-configured."""
     print("\n" + "=" * 60)
     print("FIO BENCHMARK - DEPLOY")
     print("=" * 60)
-    print(f"Namespaces: {namespaces[0]} to {namespaces[-1]} ({len(namespaces)} VMs)")
+    print(f"Namespaces: {namespaces[0]} to {namespaces[-1]} "
+          f"({len(namespaces) * args.vms_per_namespace} VMs)")
     print(f"Storage Class: {args.storage_class}")
     print(f"FIO Config: {fio_config['rw']} | bs={fio_config['bs']} | iodepth={fio_config['iodepth']}")
     print("=" * 60 + "\n")
 
     # Create namespaces
     print("[1/2] Creating namespaces...")
-    create_namespaces_parallel(namespaces, batch_size=20, logger=logger)
+    if not prepare_namespaces(args, namespaces, logger):
+        print(f"Failed to lease namespaces from pool '{args.namespace_pool}'")
+        sys.exit(1)
 
     # Deploy VMs
     print("[2/2] Deploying FIO VMs...")
-    template_path = os.path.join(os.path.dirname(__file__), args.vm_template)
-    vm_yaml = prepare_vm_yaml(
-        template_path, args.vm_name, args.storage_class,
-        fio_config, args.vm_password, logger
-    )
-
-    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-        futures = {
-            executor.submit(deploy_vm, ns, vm_yaml, logger): ns
-            for ns in namespaces
-        }
-        for future in as_completed(futures):
-            ns = futures[future]
-            try:
-                future.result()
-                print(f"  ✓ {ns}")
-            except Exception as e:
-                print(f"  ✗ {ns}: {e}")
+    deploy_fio_vms(args, namespaces, fio_config, args.vm_password, logger)
 
     print(f"\nDeployment complete.")
     print("VMs will start FIO automatically on boot.")
@@ -572,16 +624,18 @@ def action_status(args, namespaces, ssh_config, logger):
     print("\n" + "=" * 70)
     print("FIO BENCHMARK - STATUS")
     print("=" * 70)
-    print(f"Checking {len(namespaces)} VMs...")
+    targets = expand_vm_targets(namespaces, args.vm_name, args.vms_per_namespace)
+    print(f"Checking {len(targets)} VMs...")
     print("-" * 70)
     print(f"{'Namespace':<25} {'VM Status':<12} {'VMI Phase':<10} {'VM IP':<16} {'FIO Status':<12}")
     print("-" * 70)
 
     summary = {'running': 0, 'completed': 0, 'not-started': 0, 'not-running': 0, 'unknown': 0}
 
-    for ns in namespaces:
-        vm_status, vmi_phase = get_vm_and_vmi_status(ns, args.vm_name)
-        vm_ip = get_vmi_ip(args.vm_name, ns, logger) if vmi_phase == "Running" else None
+    for target in targets:
+        ns, vm = split_vm_target(target, args.vm_name)
+        vm_status, vmi_phase = get_vm_and_vmi_status(ns, vm)
+        vm_ip = get_vmi_ip(vm, ns, logger) if vmi_phase == "Running" else None
 
         if vmi_phase == "Running" and vm_ip:
             fio_status = check_fio_status_in_vm(vm_ip, ssh_config, logger)
@@ -598,7 +652,7 @@ def action_status(args, namespaces, ssh_config, logger):
 
         # Color coding for display
         ip_display = vm_ip if vm_ip else "-"
-        print(f"{ns:<25} {vm_status:<12} {vmi_phase:<10} {ip_display:<16} {fio_status:<12}")
+        print(f"{target:<25} {vm_status:<12} {vmi_phase:<10} {ip_display:<16} {fio_status:<12}")
 
     print("-" * 70)
     print(f"Summary: {summary['completed']} completed, {summary['running']} running, "
@@ -611,7 +665,8 @@ def action_gather_results(args, namespaces, fio_config, ssh_config, logger):
     print("\n" + "=" * 60)
     print("FIO BENCHMARK - GATHER RESULTS")
     print("=" * 60)
-    print(f"Collecting from {len(namespaces)} VMs...")
+    targets = expand_vm_targets(namespaces, args.vm_name, args.vms_per_namespace)
+    print(f"Collecting from {len(targets)} VMs...")
     print("=" * 60 + "\n")
 
     test_start = time.time()
@@ -625,9 +680,9 @@ def action_gather_results(args, namespaces, fio_config, ssh_config, logger):
     with ThreadPoolExecutor(max_workers=max(1, args.collect_concurrency)) as executor:
         futures = {
             executor.submit(
-                collect_fio_results, ns, args.vm_name, ssh_config, output_dir, logger,
-                args.collect_retries, args.collect_retry_delay
-            ): ns for ns in namespaces
+                collect_fio_results, *split_vm_target(target, args.vm_name), ssh_config, output_dir, logger,
+                args.collect_retries, args.collect_retry_delay, target
+            ): target for target in targets
         }
         for future in as_completed(futures):
             ns = futures[future]
@@ -667,7 +722,9 @@ def action_cleanup(args, namespaces, logger):
         vm_name=args.vm_name,
         delete_namespaces=True,
         batch_size=20,
-        logger=logger
+        logger=logger,
+        vms_per_namespace=args.vms_per_namespace,
+        namespace_pool=args.namespace_pool
     )
     print(f"Cleaned up {len(namespaces)} namespaces")
 
@@ -677,7 +734,8 @@ def action_run_all(args, namespaces, fio_config, ssh_config, logger):
     print("\n" + "=" * 60)
     print("FIO BENCHMARK - FULL RUN")
     print("=" * 60)
-    print(f"Namespaces: {namespaces[0]} to {namespaces[-1]} ({len(namespaces)} VMs)")
+    print(f"Namespaces: {namespaces[0]} to {namespaces[-1]} "
+          f"({len(namespaces) * args.vms_per_namespace} VMs)")
     print(f"Storage Class: {args.storage_class}")
     print(f"FIO Config: {fio_config['rw']} | bs={fio_config['bs']} | iodepth={fio_config['iodepth']} | "
           f"numjobs={fio_config['numjobs']} | runtime={fio_config['runtime']}s")
@@ -687,39 +745,25 @@ def action_run_all(args, namespaces, fio_config, ssh_config, logger):
 
     # Step 1: Create namespaces
     print("[1/4] Creating namespaces...")
-    create_namespaces_parallel(namespaces, batch_size=20, logger=logger)
+    if not prepare_namespaces(args, namespaces, logger):
+        print(f"Failed to lease namespaces from pool '{args.namespace_pool}'")
+        sys.exit(1)
 
     # Step 2: Deploy VMs
     print("[2/4] Deploying FIO VMs...")
-    template_path = os.path.join(os.path.dirname(__file__), args.vm_template)
-    vm_yaml = prepare_vm_yaml(
-        template_path, args.vm_name, args.storage_class,
-        fio_config, ssh_config['password'], logger
-    )
-
-    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-        futures = {
-            executor.submit(deploy_vm, ns, vm_yaml, logger): ns
-            for ns in namespaces
-        }
-        for future in as_completed(futures):
-            ns = futures[future]
-            try:
-                future.result()
-                print(f"  ✓ {ns}")
-            except Exception as e:
-                print(f"  ✗ {ns}: {e}")
+    deploy_fio_vms(args, namespaces, fio_config, ssh_config['password'], logger)
 
     # Step 3: Wait for VMs and FIO to complete
     print(f"[3/4] Waiting for VMs to boot and FIO to complete (polling every 30s)...")
     fio_timeout = fio_config['runtime'] + 600  # FIO runtime + boot time + buffer
 
+    targets = expand_vm_targets(namespaces, args.vm_name, args.vms_per_namespace)
     completed = []
     with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
         futures = {
             executor.submit(
-                wait_for_fio_complete, ns, args.vm_name, ssh_config, fio_timeout, logger
-            ): ns for ns in namespaces
+                wait_for_fio_complete, *split_vm_target(target, args.vm_name), ssh_config, fio_timeout, logger
+            ): target for target in targets
         }
         for future in as_completed(futures):
             ns = futures[future]
@@ -737,9 +781,9 @@ def action_run_all(args, namespaces, fio_config, ssh_config, logger):
     with ThreadPoolExecutor(max_workers=args.collect_concurrency) as executor:
         futures = {
             executor.submit(
-                collect_fio_results, ns, args.vm_name, ssh_config, output_dir, logger,
-                args.collect_retries, args.collect_retry_delay
-            ): ns for ns in namespaces
+                collect_fio_results, *split_vm_target(target, args.vm_name), ssh_config, output_dir, logger,
+                args.collect_retries, args.collect_retry_delay, target
+            ): target for target in targets
         }
         for future in as_completed(futures):
             ns = futures[future]
@@ -774,13 +818,44 @@ def action_run_all(args, namespaces, fio_config, ssh_config, logger):
                 vm_name=args.vm_name,
                 delete_namespaces=True,
                 batch_size=20,
-                logger=logger
+                logger=logger,
+                vms_per_namespace=args.vms_per_namespace,
+                namespace_pool=args.namespace_pool
             )
             print(f"Cleaned up {len(namespaces)} namespaces")
 
 
+def run_repeat_mode(args) -> int:
+    """Repeat run-all --repeat times, deleting the VMs in between, and report run-to-run statistics."""
+    namespaces = [f"{args.namespace_prefix}-{i}" for i in range(args.start, args.end + 1)]
+    run_dir = get_output_dir(args, namespaces, logger=None)
+    logger = setup_logging(os.path.join(run_dir, "repeat.log"), args.log_level)
+    logger.info(f"Running {args.repeat} repetitions (settle time {args.settle_time}s) under {run_dir}")
+
+    def teardown():
+        cleanup_test_namespaces(
+            namespace_prefix=args.namespace_prefix,
+            start=args.start,
+            end=args.end,
+            vm_name=args.vm_name,
+            delete_namespaces=True,
+            batch_size=20,
+            logger=logger,
+            vms_per_namespace=args.vms_per_namespace,
+            namespace_pool=args.namespace_pool
+        )
+        if not args.namespace_pool:
+            wait_for_namespaces_deleted(namespaces, logger=logger)
+
+    return run_repeated_benchmark(
+        os.path.abspath(__file__), args.repeat, run_dir, args.settle_time, logger, teardown=teardown
+    )
+
+
 def main():
     args = parse_args()
+    if args.repeat > 1:
+        sys.exit(run_repeat_mode(args))
     namespaces = [f"{args.namespace_prefix}-{i}" for i in range(args.start, args.end + 1)]
 
     if args.save_results and args.action in ['gather-results', 'run-all'] and not args.log_file:
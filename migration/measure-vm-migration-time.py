@@ -34,6 +34,8 @@ License: Apache 2.0
 """
 
 import argparse
+import csv
+import functools
 import json
 import logging
 import os
@@ -43,7 +45,6 @@ import time
 import random
 import yaml
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Tuple, Dict, List, Optional
 
 # Add parent directory to path for imports
@@ -58,7 +59,17 @@ from utils.common import (
     find_busiest_node, get_vms_on_node, remove_node_selectors,
     cleanup_test_namespaces, confirm_cleanup, print_cleanup_summary,
     list_resources_in_namespace, delete_vmim, save_migration_results,
-    get_command_for_logging,
+    get_command_for_logging, get_vmim_timestamps, calculate_vmim_duration,
+    RunJournal, restore_args_from_journal, journal_config,
+    run_repeated_benchmark, wait_for_namespaces_deleted,
+    expand_vm_targets, split_vm_target, render_packed_vm_yaml,
+    namespace_lease_owner, lease_pool_namespaces,
+    MigrationScheduler, save_migration_schedule,
+    collect_vmim_phase_breakdowns, MIGRATION_STAGES, calculate_percentile, summarize_distribution,
+    PingDowntimeProbe, get_pod_ip, vmim_supports_added_node_selector,
+    MigrationTransferSampler, get_launcher_pod, VMPlacementIndex,
+    start_dirty_workload, stop_dirty_workload, get_vmi_migration_mode, get_migration_config,
+    fit_usl, usl_throughput,
 )
 
 # Default configuration
@@ -66,6 +77,10 @@ DEFAULT_VM_NAME = 'rhel-9-vm'
 DEFAULT_NAMESPACE_PREFIX = 'kubevirt-perf-test'
 DEFAULT_VM_YAML = '../examples/vm-templates/rhel9-vm-datasource.yaml'
 
+# Options taken from the resuming invocation instead of the interrupted run
+RESUME_KEEP_ARGS = ('resume', 'log_file', 'log_level', 'cleanup', 'cleanup_on_failure', 'dry_run_cleanup', 'yes',
+                    'vm_password')
+
 
 def parse_arguments():
     """Parse command-line arguments."""
@@ -89,6 +104,9 @@ Examples:
   # Create VMs first, then migrate
   python3 measure-vm-migration-time.py --start 1 --end 10 --create-vms --source-node worker-1 --target-node worker-2
 
+  # Pack 5 VMs into each of 20 namespaces and migrate all 100 in parallel
+  python3 measure-vm-migration-time.py --start 1 --end 20 --vms-per-namespace 5 --create-vms --parallel --concurrency 10
+
   # Multi-source-node migration: discover VMs on listed nodes and migrate them
   # in an interleaved order (VM1 from node1, VM1 from node2, VM1 from node3,
   # VM2 from node1, VM2 from node2, ...). Useful when VM numbering may have
@@ -97,6 +115,12 @@ Examples:
 
   # Multi-source-node with all migrations pinned to a single target node
   python3 measure-vm-migration-time.py --source-nodes worker-1 worker-2 --target-node worker-5 --concurrency 15
+
+  # Repeat the test 5 times and report run-to-run variance and warm-up effect
+  python3 measure-vm-migration-time.py --start 1 --end 50 --parallel --concurrency 10 --repeat 5
+
+  # Resume an interrupted run; finished migrations are kept, the rest are migrated
+  python3 measure-vm-migration-time.py --resume ../results/portworx/1-disk/20240115-103000_live_migration_kubevirt-perf-test_1-100
         """
     )
     
@@ -107,10 +131,17 @@ Examples:
                        help='End index for test namespaces (default: 10)')
     parser.add_argument('-n', '--vm-name', type=str, default=DEFAULT_VM_NAME,
                        help=f'VM name (default: {DEFAULT_VM_NAME})')
+    parser.add_argument('--vms-per-namespace', type=int, default=1,
+                       help='Number of VMs in each namespace, named <vm-name>-1 .. <vm-name>-N '
+                            '(default: 1, a single VM named <vm-name>)')
     
     # Namespace configuration
     parser.add_argument('--namespace-prefix', type=str, default=DEFAULT_NAMESPACE_PREFIX,
                        help=f'Prefix for test namespaces (default: {DEFAULT_NAMESPACE_PREFIX})')
+    parser.add_argument('--namespace-pool', type=str, default=None,
+                       help='With --create-vms, lease pre-provisioned namespaces from this pool '
+                            '(see utils/namespace_pool.py) instead of creating them; cleanup '
+                            'returns them to the pool')
     
     # VM creation
     parser.add_argument('--create-vms', action='store_true',
@@ -133,7 +164,8 @@ Examples:
                             'VM2 from node2, ...). Pass "all" as the sole value to target every '
                             'worker node in the cluster.')
     parser.add_argument('--target-node', type=str, default=None,
-                       help='Target node name (optional, auto-select if not specified)')
+                       help='Target node name, requested with VMIM addedNodeSelector (KubeVirt v1.3+; '
+                            'ignored on older versions) (optional, auto-select if not specified)')
     parser.add_argument('--parallel', action='store_true',
                        help='Migrate VMs in parallel (default: sequential)')
     parser.add_argument('--evacuate', action='store_true',
@@ -146,6 +178,11 @@ Examples:
     # Performance options
     parser.add_argument('-c', '--concurrency', type=int, default=50,
                        help='Number of concurrent migrations (default: 10)')
+    parser.add_argument('--max-per-source-node', type=int, default=0,
+                       help='Maximum concurrent migrations leaving one node (default: 0 = unlimited)')
+    parser.add_argument('--max-per-target-node', type=int, default=0,
+                       help='Maximum concurrent migrations into one node; applies when target nodes are '
+                            'chosen by the harness (--target-node, --round-robin) (default: 0 = unlimited)')
     parser.add_argument('--poll-interval', type=int, default=2,
                        help='Seconds between status checks (default: 5)')
     parser.add_argument('--migration-timeout', type=int, default=600,
@@ -164,6 +201,22 @@ Examples:
                        help='Timeout for ping validation in seconds (default: 3600 = 1 hour)')
     parser.add_argument('--skip-ping', action='store_true',
                        help='Skip ping validation after migration')
+    parser.add_argument('--downtime-probe', type=str, default=None, choices=['pod', 'guest'],
+                       help='Ping continuously during each migration to measure the network blackout: '
+                            '"pod" pings the VM from the SSH pod (needs a VM address that survives '
+                            'migration), "guest" pings the SSH pod from inside the VM over SSH')
+    parser.add_argument('--downtime-probe-interval', type=float, default=0.01,
+                       help='Seconds between downtime probe pings (default: 0.01)')
+    parser.add_argument('--vm-user', type=str, default='cloud-user',
+                       help='VM SSH user for --downtime-probe guest and --dirty-rates (default: cloud-user)')
+    parser.add_argument('--vm-password', type=str, default='changeme',
+                       help='VM SSH password for --downtime-probe guest and --dirty-rates (default: changeme)')
+    parser.add_argument('--transfer-stats', action='store_true',
+                       help='Sample libvirt migration statistics (data transferred, memory bandwidth, dirty rate, '
+                            'iterations, pre-copy/post-copy) from the source virt-launcher pod during each '
+                            'migration; needs exec access to virt-launcher pods')
+    parser.add_argument('--transfer-stats-interval', type=float, default=2,
+                       help='Seconds between transfer statistics samples (default: 2)')
     
     # Logging options
     parser.add_argument('--log-file', type=str, default=None,
@@ -213,7 +266,88 @@ Examples:
              'hotspots and improving overall migration performance.'
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        '--resume',
+        type=str,
+        default=None,
+        metavar='RUN_DIR',
+        help='Resume an interrupted run from its results directory. Settings of the original run '
+             'are restored from its run journal; finished migrations are not repeated.'
+    )
+
+    parser.add_argument('--soak-rounds', type=int, default=0,
+                       help='Soak mode: migrate the same VMs back and forth for this many rounds, '
+                            'with a new VMIM per migration (default: 0 = off)')
+    parser.add_argument('--soak-duration', type=int, default=0,
+                       help='Soak mode: keep starting new rounds until this many seconds have passed '
+                            '(default: 0 = off)')
+    parser.add_argument('--soak-drift-threshold', type=float, default=20.0,
+                       help='Flag a slowdown when the median migration time of the last third of the '
+                            'soak rounds exceeds the first third by this percentage (default: 20)')
+
+    parser.add_argument('--dirty-rates', type=float, nargs='+', default=None, metavar='MIBPS',
+                       help='Dirty-rate sweep: migrate the VMs once per rate (MiB/s) while a process in '
+                            'every guest dirties memory at that rate; 0 migrates idle guests '
+                            '(needs SSH access to the VMs, see --vm-user/--vm-password)')
+    parser.add_argument('--dirty-wss', type=int, default=1024,
+                       help='Working-set size of the dirty-page workload in MiB (default: 1024)')
+    parser.add_argument('--dirty-warmup', type=int, default=30,
+                       help='Seconds the dirty-page workload runs before the migrations start (default: 30)')
+
+    parser.add_argument('--concurrency-sweep', type=int, default=0, metavar='MAX',
+                       help='Concurrency sweep: migrate the VMs once per in-flight limit 1, 2, 4, ... MAX, '
+                            'fit the Universal Scalability Law to the throughput and report the optimal '
+                            'concurrency (default: 0 = off)')
+
+    parser.add_argument('--repeat', type=int, default=1,
+                       help='Run the whole test K times and report run-to-run variance, warm-up effect '
+                            'and confidence intervals; VMs created with --create-vms are deleted '
+                            'between repetitions (default: 1)')
+    parser.add_argument('--settle-time', type=int, default=60,
+                       help='Seconds to let the cluster settle between repetitions (default: 60)')
+    # Results directory of one repetition, set by --repeat
+    parser.add_argument('--output-dir', type=str, default=None, help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+    args._resume_events = None
+
+    if args.repeat < 1:
+        parser.error("--repeat must be >= 1")
+    if args.vms_per_namespace < 1:
+        parser.error("--vms-per-namespace must be >= 1")
+    if args.max_per_source_node < 0 or args.max_per_target_node < 0:
+        parser.error("--max-per-source-node and --max-per-target-node must be >= 0")
+    if args.downtime_probe_interval <= 0:
+        parser.error("--downtime-probe-interval must be > 0")
+    if args.transfer_stats_interval <= 0:
+        parser.error("--transfer-stats-interval must be > 0")
+    if args.soak_rounds < 0 or args.soak_duration < 0:
+        parser.error("--soak-rounds and --soak-duration must be >= 0")
+    if args.dirty_rates and (min(args.dirty_rates) < 0 or args.dirty_wss < 1 or args.dirty_warmup < 0):
+        parser.error("--dirty-rates and --dirty-warmup must be >= 0 and --dirty-wss >= 1")
+    if args.concurrency_sweep < 0 or args.concurrency_sweep == 1:
+        parser.error("--concurrency-sweep must be >= 2")
+    if args.repeat > 1 and args.resume:
+        parser.error("--repeat cannot be combined with --resume")
+
+    if args.resume:
+        if not RunJournal.exists(args.resume):
+            parser.error(f"No {RunJournal.FILENAME} found in {args.resume}")
+        args._resume_events = RunJournal.load(args.resume)
+        try:
+            restore_args_from_journal(args, args._resume_events, keep=RESUME_KEEP_ARGS)
+        except ValueError as e:
+            parser.error(f"Cannot resume from {args.resume}: {e}")
+        if args.soak_rounds or args.soak_duration:
+            parser.error("Soak runs cannot be resumed")
+        if args.dirty_rates:
+            parser.error("Dirty-rate sweeps cannot be resumed")
+        if args.concurrency_sweep:
+            parser.error("Concurrency sweeps cannot be resumed")
+        # The journal lives in the results directory, so a resumed run always saves results
+        args.save_results = True
+
+    return args
 
 
 def validate_migration_args(args, logger):
@@ -223,10 +357,42 @@ def validate_migration_args(args, logger):
         logger.error("--single-node requires --create-vms")
         return False
 
+    if args.namespace_pool and not args.create_vms:
+        logger.error("--namespace-pool requires --create-vms")
+        return False
+
     if args.node_name and not args.single_node:
         logger.error("--node-name requires --single-node")
         return False
 
+    if args.soak_rounds or args.soak_duration:
+        if args.source_nodes or args.evacuate or args.round_robin:
+            logger.error("--soak-rounds/--soak-duration cannot be combined with --source-nodes, "
+                         "--evacuate or --round-robin")
+            return False
+        logger.info("Soak mode: will migrate the VMs back and forth "
+                    + (f"for {args.soak_rounds} rounds" if args.soak_rounds else f"for {args.soak_duration}s"))
+        return True
+
+    if args.dirty_rates:
+        if args.source_nodes or args.evacuate or args.round_robin or args.soak_rounds or args.soak_duration:
+            logger.error("--dirty-rates cannot be combined with --source-nodes, --evacuate, --round-robin "
+                         "or soak mode")
+            return False
+        logger.info(f"Dirty-rate sweep: will migrate the VMs at {', '.join(f'{r:g}' for r in args.dirty_rates)} "
+                    f"MiB/s over a {args.dirty_wss} MiB working set")
+        return True
+
+    if args.concurrency_sweep:
+        if args.source_nodes or args.evacuate or args.round_robin or args.soak_rounds or args.soak_duration \
+                or args.dirty_rates:
+            logger.error("--concurrency-sweep cannot be combined with --source-nodes, --evacuate, --round-robin, "
+                         "soak mode or --dirty-rates")
+            return False
+        logger.info(f"Concurrency sweep: will migrate the VMs at in-flight limits "
+                    f"{', '.join(str(n) for n in concurrency_levels(args.concurrency_sweep))}")
+        return True
+
     # --source-nodes: multi-node parallel evacuation (new scenario)
     if args.source_nodes:
         if args.source_node:
@@ -273,7 +439,7 @@ def create_vms_on_node(namespaces: List[str], vm_yaml: str, node_name: str,
     Create VMs on a specific node with retry logic.
 
     Args:
-        namespaces: List of namespaces to create VMs in
+        namespaces: List of namespaces or VM targets (see expand_vm_targets) to create VMs in
         vm_yaml: Path to VM YAML template
         node_name: Node to create VMs on (can be None for no node selector)
         vm_name: VM resource name
@@ -283,7 +449,7 @@ def create_vms_on_node(namespaces: List[str], vm_yaml: str, node_name: str,
                       Uses exponential backoff: delay * 2^attempt
 
     Returns:
-        Dictionary mapping namespace to success status
+        Dictionary mapping namespace (or VM target) to success status
     """
     if node_name:
         logger.info(f"\nCreating {len(namespaces)} VMs on node {node_name}...")
@@ -295,14 +461,22 @@ def create_vms_on_node(namespaces: List[str], vm_yaml: str, node_name: str,
 
     results = {}
 
-    for ns in namespaces:
+    for target in namespaces:
+        ns, name = split_vm_target(target, vm_name)
         success = False
         last_error = None
 
         for attempt in range(1, max_retries + 1):
             try:
+                if name != vm_name:
+                    # Packed VM: renamed copy of the template (plus nodeSelector)
+                    modified_yaml = render_packed_vm_yaml(vm_yaml, name, node_name, logger)
+                    if not modified_yaml:
+                        logger.error(f"[{target}] Failed to render VM YAML")
+                        last_error = "Failed to render VM YAML"
+                        break
                 # Modify VM YAML to add nodeSelector if node_name is specified
-                if node_name:
+                elif node_name:
                     modified_yaml = add_node_selector_to_vm_yaml(vm_yaml, node_name, logger)
                     if not modified_yaml:
                         logger.error(f"[{ns}] Failed to modify VM YAML")
@@ -320,7 +494,7 @@ def create_vms_on_node(namespaces: List[str], vm_yaml: str, node_name: str,
                 )
 
                 if result.returncode == 0:
-                    logger.info(f"[{ns}] VM created successfully")
+                    logger.info(f"[{target}] VM created successfully")
                     success = True
                     break
                 else:
@@ -362,9 +536,9 @@ def create_vms_on_node(namespaces: List[str], vm_yaml: str, node_name: str,
                 else:
                     logger.error(f"[{ns}] Exception after {max_retries} attempts: {e}")
 
-        results[ns] = success
+        results[target] = success
         if not success and last_error:
-            logger.debug(f"[{ns}] Final error: {last_error}")
+            logger.debug(f"[{target}] Final error: {last_error}")
 
     # Log summary
     successful = sum(1 for v in results.values() if v)
@@ -380,14 +554,14 @@ def wait_for_vms_running(namespaces: List[str], vm_name: str, timeout: int, logg
     Wait for all VMs to reach Running state with polling.
 
     Args:
-        namespaces: List of namespaces containing VMs
+        namespaces: List of namespaces or VM targets (see expand_vm_targets) containing VMs
         vm_name: VM resource name
         timeout: Maximum time to wait in seconds (default should be 3600 = 1 hour)
         logger: Logger instance
         poll_interval: Seconds between status checks (default: 10)
 
     Returns:
-        Dictionary mapping namespace to success status (True if Running)
+        Dictionary mapping namespace (or VM target) to success status (True if Running)
     """
     logger.info(f"\nWaiting for {len(namespaces)} VMs to reach Running state (timeout: {timeout}s)...")
 
@@ -402,7 +576,8 @@ def wait_for_vms_running(namespaces: List[str], vm_name: str, timeout: int, logg
         # Check status of all pending VMs
         still_pending = set()
         for ns in pending:
-            status = get_vm_status(vm_name, ns, logger)
+            vm_ns, name = split_vm_target(ns, vm_name)
+            status = get_vm_status(name, vm_ns, logger)
 
             if status == "Running":
                 logger.info(f"[{ns}] VM is now Running")
@@ -429,7 +604,8 @@ def wait_for_vms_running(namespaces: List[str], vm_name: str, timeout: int, logg
             # Log which VMs are still pending (only first few to avoid spam)
             if len(pending) <= 5:
                 for ns in pending:
-                    status = get_vm_status(vm_name, ns, logger)
+                    vm_ns, name = split_vm_target(ns, vm_name)
+                    status = get_vm_status(name, vm_ns, logger)
                     logger.debug(f"  [{ns}] status: {status}")
 
             time.sleep(poll_interval)
@@ -438,7 +614,8 @@ def wait_for_vms_running(namespaces: List[str], vm_name: str, timeout: int, logg
     if pending:
         logger.warning(f"\nTimeout reached. {len(pending)} VMs did not reach Running state:")
         for ns in pending:
-            status = get_vm_status(vm_name, ns, logger)
+            vm_ns, name = split_vm_target(ns, vm_name)
+            status = get_vm_status(name, vm_ns, logger)
             logger.warning(f"  [{ns}] final status: {status}")
             results[ns] = False
 
@@ -449,6 +626,44 @@ def wait_for_vms_running(namespaces: List[str], vm_name: str, timeout: int, logg
     return results
 
 
+def recover_inflight_migration(
+    ns: str,
+    vm_name: str,
+    source_node: Optional[str],
+    migration_timeout: int,
+    logger,
+    poll_interval: int = 2
+) -> Optional[Tuple[str, bool, float, Optional[str], Optional[str], Optional[float]]]:
+    """
+    Settle a migration that was in flight when the previous run was interrupted.
+
+    The observed (node change) time of such a migration is lost with the driver,
+    so the VMIM duration is reported for both columns.
+
+    Returns:
+        The migration result tuple, or None if the VM has to be migrated again
+    """
+    start_ts, end_ts, phase = get_vmim_timestamps(vm_name, ns, logger)
+    if not phase or phase.lower() == 'failed':
+        logger.info(f"[{ns}] Interrupted migration did not complete (VMIM phase: {phase}), migrating again")
+        return None
+
+    if phase.lower() != 'succeeded':
+        logger.info(f"[{ns}] Interrupted migration still {phase}, waiting for it to finish")
+        success, observed_duration, _, _ = wait_for_migration_complete(
+            vm_name, ns, migration_timeout, poll_interval, logger
+        )
+        if not success:
+            return None
+        start_ts, end_ts, phase = get_vmim_timestamps(vm_name, ns, logger)
+
+    vmim_duration = calculate_vmim_duration(start_ts, end_ts) if start_ts and end_ts else None
+    target_node = get_vm_node(vm_name, ns, logger)
+    logger.info(f"[{ns}] Recovered interrupted migration {source_node} -> {target_node} "
+                f"(VMIM time: {vmim_duration if vmim_duration is not None else 'N/A'}s)")
+    return ns, True, vmim_duration or 0.0, source_node, target_node, vmim_duration
+
+
 def migrate_vm_sequential(
     ns: str,
     vm_name: str,
@@ -458,14 +673,66 @@ def migrate_vm_sequential(
     poll_interval: int = 2,
     max_vmim_retries: int = 10,
     max_migration_retries: int = 3,
-    retry_delay: int = 2
+    retry_delay: int = 2,
+    journal: Optional[RunJournal] = None,
+    resumed_source: Optional[str] = None,
+    downtime_probe=None,
+    vmim_suffix: Optional[str] = None,
+    transfer_sampler=None
 ) -> Tuple[str, bool, float, Optional[str], Optional[str], Optional[float]]:
     """
     Migrate a single VM and measure time.
 
     Retries VMIM creation up to `max_vmim_retries` times if webhook/internal errors occur.
     Retries the entire migration up to `max_migration_retries` times if migration fails.
+    When `journal` is given the start and result of the migration are recorded in it;
+    `resumed_source` marks a migration that was in flight when a previous run was interrupted.
+    `downtime_probe`, a callable(target, ip) returning a PingDowntimeProbe, measures the
+    network blackout of every migration attempt.
+    `transfer_sampler`, a callable(target, vm_name, ns, source_node) returning a started
+    MigrationTransferSampler, records the libvirt transfer statistics of every attempt.
+    With `vmim_suffix` every attempt creates a new VMIM named
+    'migration-<vm>-<suffix>[-<attempt>]' and existing VMIMs are kept (soak mode).
+    `ns` may also be a 'namespace/vm' target (see expand_vm_targets); results and
+    journal entries are reported under it.
     """
+    target = ns
+    ns, vm_name = split_vm_target(target, vm_name)
+
+    result = None
+    if resumed_source:
+        result = recover_inflight_migration(ns, vm_name, resumed_source, migration_timeout, logger, poll_interval)
+
+    if result is None:
+        result = _run_migration(
+            ns, vm_name, target_node, migration_timeout, logger, poll_interval,
+            max_vmim_retries, max_migration_retries, retry_delay, journal, target,
+            downtime_probe, vmim_suffix, transfer_sampler
+        )
+
+    result = (target,) + tuple(result[1:])
+    if journal:
+        journal.record('migration_result', namespace=target, result=list(result))
+    return result
+
+
+def _run_migration(
+    ns: str,
+    vm_name: str,
+    target_node: Optional[str],
+    migration_timeout: int,
+    logger,
+    poll_interval: int,
+    max_vmim_retries: int,
+    max_migration_retries: int,
+    retry_delay: int,
+    journal: Optional[RunJournal],
+    target: str,
+    downtime_probe=None,
+    vmim_suffix: Optional[str] = None,
+    transfer_sampler=None
+) -> Tuple[str, bool, float, Optional[str], Optional[str], Optional[float]]:
+    """Trigger the migration of one VM with retries and wait for it (see migrate_vm_sequential)."""
 
     try:
         # Get source node
@@ -475,16 +742,30 @@ def migrate_vm_sequential(
             return ns, False, 0.0, None, None, None
 
         logger.info(f"[{ns}] Starting migration from {source_node}")
+        if journal:
+            journal.record('migration_started', namespace=target, source_node=source_node)
 
         # Retry the entire migration process if it fails
         for migration_attempt in range(1, max_migration_retries + 1):
             vmim_name = f"migration-{vm_name}"
+            if vmim_suffix:
+                vmim_name += f"-{vmim_suffix}" + (f"-{migration_attempt}" if migration_attempt > 1 else "")
+
+            # Start pinging before the VMIM exists so the whole migration is covered
+            probe = None
+            if downtime_probe:
+                vm_ip = get_vmi_ip(vm_name, ns, logger)
+                probe = downtime_probe(target, vm_ip) if vm_ip else None
+                if probe and not probe.start():
+                    probe = None
+            sampler = transfer_sampler(target, vm_name, ns, source_node) if transfer_sampler else None
 
             # --- Retry VMIM creation only ---
             vmim_created = False
             for attempt in range(1, max_vmim_retries + 1):
                 try:
-                    if migrate_vm(vm_name, ns, target_node, logger):
+                    if migrate_vm(vm_name, ns, target_node, logger, migration_name=vmim_name,
+                                  replace_existing=not vmim_suffix):
                         vmim_created = True
                         break
                     else:
@@ -500,12 +781,23 @@ def migrate_vm_sequential(
 
             if not vmim_created:
                 logger.error(f"[{ns}] Failed to create VMIM after {max_vmim_retries} attempts")
+                if probe:
+                    probe.stop()
+                if sampler:
+                    sampler.stop()
                 return ns, False, 0.0, source_node, None, None
 
             # Wait for migration to complete
             success, observed_duration, actual_target, vmim_duration = wait_for_migration_complete(
-                vm_name, ns, migration_timeout, poll_interval, logger
+                vm_name, ns, migration_timeout, poll_interval, logger, migration_name=vmim_name
             )
+            if probe:
+                probe.stop(lambda: get_vmi_ip(vm_name, ns, logger))
+            if sampler:
+                sampler.finish(vmim_duration or observed_duration)
+            if success and target_node and actual_target != target_node \
+                    and vmim_supports_added_node_selector(logger):
+                logger.warning(f"[{ns}] Migrated to {actual_target} instead of requested {target_node}")
 
             if success:
                 return ns, success, observed_duration, source_node, actual_target, vmim_duration
@@ -514,9 +806,10 @@ def migrate_vm_sequential(
             if migration_attempt < max_migration_retries:
                 logger.warning(f"[{ns}] Migration failed (attempt {migration_attempt}/{max_migration_retries})")
 
-                # Delete the failed VMIM before retrying
-                logger.info(f"[{ns}] Deleting failed VMIM '{vmim_name}' before retry...")
-                delete_vmim(vmim_name, ns, logger)
+                # Delete the failed VMIM before retrying (soak runs keep it and retry under a new name)
+                if not vmim_suffix:
+                    logger.info(f"[{ns}] Deleting failed VMIM '{vmim_name}' before retry...")
+                    delete_vmim(vmim_name, ns, logger)
 
                 # Wait a bit for cleanup
                 time.sleep(retry_delay)
@@ -540,73 +833,48 @@ def migrate_vm_sequential(
         return ns, False, 0.0, None, None, None
 
 
-_ALL_VMIS_CACHE: dict = {}  # node-independent cache so we fetch only once per run
+_PLACEMENT_INDEX: Dict[str, VMPlacementIndex] = {}  # one cluster-wide VMI snapshot shared by the run
 
 
-def _fetch_all_vmis(logger) -> list:
+def placement_index(logger) -> VMPlacementIndex:
     """
-    Fetch all VMIs across all namespaces once and cache the result.
+    Return the run's VMPlacementIndex.
 
-    Uses ``kubectl get vmi -A -o json`` and returns the list of item dicts.
-    ``spec.nodeName`` field selectors are not supported by the KubeVirt CRD,
-    so we retrieve everything and filter in Python.
+    The snapshot is taken on first use. Call ``invalidate()`` on it once VMs
+    have moved so the next lookup lists the VMIs again.
     """
-    if 'items' in _ALL_VMIS_CACHE:
-        return _ALL_VMIS_CACHE['items']
-
-    returncode, stdout, stderr = run_kubectl_command(
-        ['get', 'vmi', '-A', '-o', 'json'],
-        check=False,
-        logger=logger,
-    )
-    if returncode != 0:
-        logger.error(f"Failed to list all VMIs: {stderr}")
-        _ALL_VMIS_CACHE['items'] = []
-        return []
-
-    try:
-        data = json.loads(stdout)
-        items = data.get('items', [])
-        _ALL_VMIS_CACHE['items'] = items
-        logger.info(f"Fetched {len(items)} total VMI(s) from cluster.")
-        return items
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse VMI JSON: {e}")
-        _ALL_VMIS_CACHE['items'] = []
-        return []
+    if 'index' not in _PLACEMENT_INDEX:
+        _PLACEMENT_INDEX['index'] = VMPlacementIndex(logger)
+    return _PLACEMENT_INDEX['index']
 
 
 def discover_vms_on_node(node_name: str, vm_name: str, namespace_prefix: str,
-                         logger) -> List[str]:
+                         logger, vms_per_namespace: int = 1) -> List[str]:
     """
     Discover all namespaces that have a VMI named *vm_name* running on *node_name*.
 
-    Fetches all VMIs cluster-wide (cached) and filters by ``.status.nodeName`` in
-    Python — ``spec.nodeName`` is not a supported field selector for the KubeVirt
-    VMI CRD.
+    Reads the run's VMPlacementIndex, a cluster-wide VMI snapshot filtered by
+    ``.status.nodeName`` in Python — ``spec.nodeName`` is not a supported field
+    selector for the KubeVirt VMI CRD.
 
     Returns a sorted list of namespace names whose VMI matches *vm_name* on
-    *node_name*.
+    *node_name*. With ``vms_per_namespace`` > 1 the packed VMIs
+    ``<vm_name>-<n>`` are matched instead and 'namespace/vm' targets are returned.
     """
+    packed = vms_per_namespace > 1
     logger.info(f"Discovering VMIs named '{vm_name}' on node '{node_name}' "
                 f"(prefix filter: '{namespace_prefix or '<none>'}')...")
     try:
-        all_items = _fetch_all_vmis(logger)
         namespaces: List[str] = []
-        for item in all_items:
-            meta = item.get('metadata', {})
-            status = item.get('status', {})
-            ns = meta.get('namespace', '')
-            name = meta.get('name', '')
-            node = status.get('nodeName', '')
-
-            if name != vm_name:
-                continue
-            if node != node_name:
+        for ns, name in placement_index(logger).vms_on_node(node_name):
+            if packed:
+                if not (name.startswith(f"{vm_name}-") and name[len(vm_name) + 1:].isdigit()):
+                    continue
+            elif name != vm_name:
                 continue
             if namespace_prefix and not ns.startswith(namespace_prefix):
                 continue
-            namespaces.append(ns)
+            namespaces.append(f"{ns}/{name}" if packed else ns)
 
         namespaces.sort()
         logger.info(f"  Found {len(namespaces)} VMI(s) on {node_name}")
@@ -644,6 +912,685 @@ def interleave_vms_across_nodes(per_node_vms: Dict[str, List[str]],
     return ordered
 
 
+def get_vm_source_nodes(targets: List[str], vm_name: str, logger) -> Dict[str, Optional[str]]:
+    """
+    Map every target to the node its VMI runs on, from the run's VMPlacementIndex.
+
+    Targets whose VMI is not found map to None.
+    """
+    return placement_index(logger).nodes_of(targets, vm_name)
+
+
+def start_transfer_sampler(target: str, vm_name: str, ns: str, source_node: str, poll_interval: float,
+                           results: Dict[str, dict], logger) -> Optional[MigrationTransferSampler]:
+    """Start a MigrationTransferSampler on the VM's virt-launcher pod on `source_node`."""
+    source_pod = get_launcher_pod(vm_name, ns, source_node, logger)
+    if not source_pod:
+        logger.warning(f"[{target}] No running virt-launcher pod on {source_node}, transfer statistics skipped")
+        return None
+    sampler = MigrationTransferSampler(target, vm_name, ns, source_pod, poll_interval, results, logger)
+    sampler.start()
+    return sampler
+
+
+def run_scheduled_migrations(args, jobs: List[Tuple[str, Optional[str], Optional[str]]],
+                             journal: Optional[RunJournal], inflight: Dict[str, str], logger,
+                             log_progress: bool = False,
+                             downtime_probe=None,
+                             vmim_suffix: Optional[str] = None,
+                             transfer_sampler=None,
+                             max_in_flight: Optional[int] = None) -> Tuple[list, MigrationScheduler]:
+    """
+    Run migrations through a MigrationScheduler honouring the in-flight limits.
+
+    Args:
+        args: Parsed CLI args (concurrency and per-node limits, migration settings)
+        jobs: List of (target, source_node, target_node) in queue order
+        journal: Run journal, if any
+        inflight: Migrations that were in flight when a previous run was interrupted
+        logger: Logger instance
+        log_progress: Log a line for every finished migration
+        downtime_probe: Optional PingDowntimeProbe factory (see migrate_vm_sequential)
+        vmim_suffix: Optional unique VMIM name suffix (see migrate_vm_sequential)
+        transfer_sampler: Optional MigrationTransferSampler factory (see migrate_vm_sequential)
+        max_in_flight: Overrides args.concurrency as the cluster-wide in-flight limit
+
+    Returns:
+        Tuple of (migration result tuples, scheduler)
+    """
+    finished = []
+
+    def run_migration(target, target_node):
+        return migrate_vm_sequential(
+            target, args.vm_name, target_node, args.migration_timeout, logger,
+            args.poll_interval,
+            10,  # max_vmim_retries
+            args.max_migration_retries,
+            journal=journal,
+            resumed_source=inflight.get(target),
+            downtime_probe=downtime_probe,
+            vmim_suffix=vmim_suffix,
+            transfer_sampler=transfer_sampler
+        )
+
+    def on_result(target, result, error):
+        if error is not None:
+            logger.error(f"[{target}] Exception during migration: {error}")
+            result = (target, False, 0.0, None, None, None)
+        finished.append(result)
+        if log_progress:
+            _, success, duration, src, tgt, _ = result
+            if success:
+                logger.info(f"[{len(finished)}/{len(jobs)}] ✓ {target}: {src} → {tgt or 'unknown'} ({duration:.1f}s)")
+            else:
+                logger.info(f"[{len(finished)}/{len(jobs)}] ✗ {target}: FAILED")
+
+    scheduler = MigrationScheduler(
+        run_migration,
+        max_in_flight=max_in_flight or args.concurrency,
+        max_per_source=args.max_per_source_node,
+        max_per_target=args.max_per_target_node,
+        on_result=on_result,
+        logger=logger
+    )
+    scheduler.run(jobs)
+
+    waits = [r['queue_wait_sec'] for r in scheduler.get_records() if r['queue_wait_sec'] is not None]
+    if waits:
+        logger.info(f"Scheduler: peak {scheduler.peak_in_flight} migrations in flight, "
+                    f"queue wait avg {sum(waits) / len(waits):.1f}s / max {max(waits):.1f}s")
+    return finished, scheduler
+
+
+def count_launcher_pods(namespaces: List[str], logger) -> Dict[str, int]:
+    """Count virt-launcher pods per phase in the test namespaces from one cluster-wide pod list."""
+    returncode, stdout, stderr = run_kubectl_command(
+        ['get', 'pods', '-A', '-l', 'kubevirt.io=virt-launcher', '-o', 'json'],
+        check=False,
+        logger=logger
+    )
+    counts: Dict[str, int] = {}
+    if returncode != 0:
+        logger.warning(f"Failed to list virt-launcher pods: {stderr}")
+        return counts
+    try:
+        items = json.loads(stdout).get('items', [])
+    except json.JSONDecodeError:
+        return counts
+
+    wanted = set(namespaces)
+    for item in items:
+        if item.get('metadata', {}).get('namespace') in wanted:
+            phase = item.get('status', {}).get('phase', 'Unknown')
+            counts[phase] = counts.get(phase, 0) + 1
+    return counts
+
+
+def summarize_soak_round(round_no: int, results: list, round_sec: float, pods: Dict[str, int],
+                         num_vms: int, downtime: Dict[str, dict], requested: Dict[str, str]) -> dict:
+    """
+    Build the statistics of one soak round.
+
+    Active virt-launcher pods beyond one per VM are counted as leaked target pods;
+    placement accuracy covers the migrations sent back to a requested node.
+    """
+    successful = [r for r in results if r[1]]
+    targeted = [r for r in successful if requested.get(r[0])]
+    matches = sum(1 for r in targeted if r[4] == requested[r[0]])
+    failed = len(results) - len(successful)
+    active_pods = pods.get('Running', 0) + pods.get('Pending', 0)
+    return {
+        'round': round_no,
+        'migrations': len(results),
+        'successful': len(successful),
+        'failed': failed,
+        'failure_rate_pct': round(failed * 100.0 / len(results), 2) if results else None,
+        'round_duration_sec': round(round_sec, 2),
+        'migrations_per_min': round(len(successful) * 60 / round_sec, 2) if round_sec > 0 else None,
+        'observed_time_sec': summarize_distribution([r[2] for r in successful], 3),
+        'vmim_time_sec': summarize_distribution([r[5] for r in successful if r[5]], 3),
+        'downtime_sec': summarize_distribution([d['downtime_sec'] for d in downtime.values()], 3),
+        'placement_accuracy_pct': round(matches * 100.0 / len(targeted), 2) if targeted else None,
+        'launcher_pods_active': active_pods,
+        'launcher_pods_failed': pods.get('Failed', 0),
+        'leaked_target_pods': max(0, active_pods - num_vms),
+    }
+
+
+def detect_soak_drift(rounds: List[dict], threshold_pct: float) -> dict:
+    """
+    Look for drift across soak rounds.
+
+    Compares the median observed migration time (round p50) of the first and
+    last third of the rounds and fits a least-squares slope through the
+    round p50s. Rising failure rates, leaked target pods and a growing number
+    of failed virt-launcher pods are flagged as well.
+
+    Args:
+        rounds: Round statistics from summarize_soak_round
+        threshold_pct: Slowdown (percent) from which drift is flagged
+
+    Returns:
+        Dict with slowdown_pct, p50_slope_sec_per_round and a list of flag messages
+    """
+    drift = {'slowdown_pct': None, 'p50_slope_sec_per_round': None, 'flags': []}
+    flags = drift['flags']
+
+    points = [(r['round'], r['observed_time_sec']['p50']) for r in rounds if r['observed_time_sec']['count']]
+    if len(points) >= 2:
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+        var_x = sum((x - mean_x) ** 2 for x in xs)
+        if var_x:
+            drift['p50_slope_sec_per_round'] = round(
+                sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x, 3)
+    if len(points) >= 3:
+        third = max(1, len(points) // 3)
+        first = calculate_percentile([y for _, y in points[:third]], 50)
+        last = calculate_percentile([y for _, y in points[-third:]], 50)
+        if first:
+            drift['slowdown_pct'] = round((last - first) * 100.0 / first, 2)
+            if drift['slowdown_pct'] > threshold_pct:
+                flags.append(f"Slowdown: median migration time rose {drift['slowdown_pct']}% "
+                             f"({first:.2f}s -> {last:.2f}s) from the first to the last third of the rounds")
+
+    rates = [r['failure_rate_pct'] or 0 for r in rounds]
+    if len(rates) >= 3:
+        third = max(1, len(rates) // 3)
+        early = sum(rates[:third]) / third
+        late = sum(rates[-third:]) / third
+        if late > early:
+            flags.append(f"Failure rate rose from {early:.1f}% to {late:.1f}% over the soak")
+
+    leaked = [r['round'] for r in rounds if r['leaked_target_pods']]
+    if leaked:
+        flags.append(f"Leaked target pods (active virt-launcher pods beyond one per VM) after rounds {leaked}")
+
+    if len(rounds) >= 2 and rounds[-1]['launcher_pods_failed'] > rounds[0]['launcher_pods_failed']:
+        flags.append(f"Failed virt-launcher pods grew from {rounds[0]['launcher_pods_failed']} "
+                     f"to {rounds[-1]['launcher_pods_failed']}")
+    return drift
+
+
+def run_soak_mode(args, targets: List[str], logger, downtime_probe=None,
+                  downtime_results: Optional[Dict[str, dict]] = None) -> Tuple[list, List[dict]]:
+    """
+    Migrate the same fleet back and forth for --soak-rounds rounds or --soak-duration seconds.
+
+    Every round migrates every VM once through the scheduler. From the second
+    round on each VM is sent back to the node it left in the previous round.
+    Each migration gets its own VMIM name (migration-<vm>-r<round>) and no
+    VMIM is deleted, so the rounds do not interfere with each other.
+
+    Returns:
+        Tuple of (migration result tuples of all rounds, round statistics)
+    """
+    namespaces = sorted({split_vm_target(t, args.vm_name)[0] for t in targets})
+    all_results = []
+    rounds: List[dict] = []
+    previous_source: Dict[str, str] = {}
+    soak_start = time.time()
+    round_no = 0
+
+    while True:
+        round_no += 1
+        if args.soak_rounds and round_no > args.soak_rounds:
+            break
+        if args.soak_duration and round_no > 1 and time.time() - soak_start >= args.soak_duration:
+            break
+
+        logger.info("\n" + "=" * 80)
+        logger.info(f"SOAK ROUND {round_no}" + (f"/{args.soak_rounds}" if args.soak_rounds else
+                                                 f" ({time.time() - soak_start:.0f}s/{args.soak_duration}s)"))
+        logger.info("=" * 80)
+
+        # VMs moved in the previous round
+        placement_index(logger).invalidate()
+        source_nodes = get_vm_source_nodes(targets, args.vm_name, logger)
+        jobs = [(t, source_nodes[t], previous_source.get(t)) for t in targets]
+        if downtime_results is not None:
+            downtime_results.clear()
+
+        round_start = time.time()
+        results, _ = run_scheduled_migrations(args, jobs, None, {}, logger, downtime_probe=downtime_probe,
+                                              vmim_suffix=f"r{round_no}")
+        round_sec = time.time() - round_start
+
+        previous_source = {r[0]: r[3] for r in results if r[1] and r[3]}
+        pods = count_launcher_pods(namespaces, logger)
+        stats = summarize_soak_round(round_no, results, round_sec, pods, len(targets),
+                                     dict(downtime_results or {}),
+                                     {t: node for t, _, node in jobs
+                                      if node and vmim_supports_added_node_selector(logger)})
+        rounds.append(stats)
+        all_results.extend(results)
+
+        observed = stats['observed_time_sec']
+        logger.info(f"Round {round_no}: {stats['successful']}/{stats['migrations']} succeeded "
+                    f"in {stats['round_duration_sec']:.1f}s"
+                    + (f", observed p50 {observed['p50']:.2f}s / p95 {observed['p95']:.2f}s" if observed['count'] else "")
+                    + f", {stats['launcher_pods_active']} active launcher pods"
+                    + (f" ({stats['leaked_target_pods']} leaked)" if stats['leaked_target_pods'] else ""))
+
+    return all_results, rounds
+
+
+def save_soak_results(out_dir: str, rounds: List[dict], drift: dict, results: list,
+                      threshold_pct: float, logger) -> None:
+    """Save soak round statistics, per-migration results with their round, and the drift summary."""
+    os.makedirs(out_dir, exist_ok=True)
+
+    with open(os.path.join(out_dir, "soak_rounds.json"), "w") as f:
+        json.dump(rounds, f, indent=4)
+
+    fieldnames = ['round', 'migrations', 'successful', 'failed', 'failure_rate_pct', 'round_duration_sec',
+                  'migrations_per_min', 'placement_accuracy_pct', 'launcher_pods_active', 'launcher_pods_failed',
+                  'leaked_target_pods']
+    metrics = ('observed_time_sec', 'vmim_time_sec', 'downtime_sec')
+    stat_keys = ('avg', 'p50', 'p95', 'max')
+    fieldnames += [f"{m}_{s}" for m in metrics for s in stat_keys]
+    with open(os.path.join(out_dir, "soak_rounds.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for r in rounds:
+            row = {k: r[k] for k in fieldnames if k in r}
+            for m in metrics:
+                for s in stat_keys:
+                    row[f"{m}_{s}"] = r[m][s]
+            writer.writerow(row)
+
+    # Per-migration rows; results hold the rounds back to back
+    round_of = [r['round'] for r in rounds for _ in range(r['migrations'])]
+    with open(os.path.join(out_dir, "soak_migrations.csv"), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(['round', 'namespace', 'status', 'source_node', 'target_node',
+                         'observed_time_sec', 'vmim_time_sec'])
+        for round_no, (ns, success, observed, source, target, vmim) in zip(round_of, results):
+            writer.writerow([round_no, ns, 'Success' if success else 'Failed',
+                             source or 'Unknown', target or 'Unknown',
+                             round(observed, 2) if success else None, round(vmim, 2) if vmim else None])
+
+    total = sum(r['migrations'] for r in rounds)
+    failed = sum(r['failed'] for r in rounds)
+    summary = {
+        "rounds": len(rounds),
+        "total_migrations": total,
+        "failed_migrations": failed,
+        "failure_rate_pct": round(failed * 100.0 / total, 2) if total else None,
+        "slowdown_pct": drift['slowdown_pct'],
+        "p50_slope_sec_per_round": drift['p50_slope_sec_per_round'],
+        "drift_threshold_pct": threshold_pct,
+        "max_leaked_target_pods": max((r['leaked_target_pods'] for r in rounds), default=0),
+        "flags": drift['flags'],
+    }
+    with open(os.path.join(out_dir, "summary_migration_soak.json"), "w") as f:
+        json.dump(summary, f, indent=4)
+
+    logger.info(f"Saved soak round statistics to {os.path.join(out_dir, 'soak_rounds.json')}")
+
+
+def _run_per_vm(targets: List[str], func, workers: int) -> Dict[str, object]:
+    """Run func(target) for every target on a thread pool and return {target: result}."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(targets)))) as executor:
+        return dict(zip(targets, executor.map(func, targets)))
+
+
+def summarize_dirty_step(rate: float, wss: int, results: list, step_sec: float, workloads: Dict[str, bool],
+                         modes: Dict[str, Optional[str]], transfer: Dict[str, dict]) -> dict:
+    """
+    Build the statistics of one dirty-rate step.
+
+    Convergence time is the VMIM time of each successful migration (observed
+    time when the VMIM timestamps are missing). A post-copy fallback is a
+    migration whose VMI reports mode PostCopy.
+    """
+    successful = [r for r in results if r[1]]
+    dirty_rates = [t['peak_dirty_rate_mibps'] for t in transfer.values() if t.get('peak_dirty_rate_mibps')]
+    iterations = [t['iterations'] for t in transfer.values() if t.get('iterations') is not None]
+    return {
+        'dirty_rate_mibps': rate,
+        'working_set_mib': wss,
+        'migrations': len(results),
+        'successful': len(successful),
+        'failed': len(results) - len(successful),
+        'success_rate_pct': round(len(successful) * 100.0 / len(results), 2) if results else None,
+        'workloads_started': sum(1 for ok in workloads.values() if ok),
+        'postcopy_fallbacks': sum(1 for mode in modes.values() if mode == 'PostCopy'),
+        'step_duration_sec': round(step_sec, 2),
+        'convergence_time_sec': summarize_distribution([r[5] or r[2] for r in successful], 3),
+        'observed_time_sec': summarize_distribution([r[2] for r in successful], 3),
+        'measured_dirty_rate_mibps': round(sum(dirty_rates) / len(dirty_rates), 2) if dirty_rates else None,
+        'avg_iterations': round(sum(iterations) / len(iterations), 2) if iterations else None,
+    }
+
+
+def run_dirty_sweep(args, targets: List[str], logger, downtime_probe=None,
+                    downtime_results: Optional[Dict[str, dict]] = None, transfer_sampler=None,
+                    transfer_results: Optional[Dict[str, dict]] = None) -> Tuple[list, List[dict]]:
+    """
+    Migrate the fleet once per --dirty-rates value with a memory-dirtying workload in every guest.
+
+    Each step starts the workload (rate MiB/s over a --dirty-wss MiB working
+    set) in all VMs, lets it run for --dirty-warmup seconds, migrates every VM
+    through the scheduler and stops the workload again. A rate of 0 migrates
+    idle guests as the baseline. From the second step on each VM is sent back
+    to the node it left, and every migration gets its own VMIM name
+    (migration-<vm>-d<step>).
+
+    Returns:
+        Tuple of (migration result tuples of all steps, step statistics)
+    """
+    all_results = []
+    steps: List[dict] = []
+    previous_source: Dict[str, str] = {}
+    waves = -(-len(targets) // args.concurrency)
+    max_duration = args.dirty_warmup + args.migration_timeout * waves * args.max_migration_retries + 300
+
+    def vm_ip(target):
+        ns, vm = split_vm_target(target, args.vm_name)
+        return get_vmi_ip(vm, ns, logger)
+
+    def start_workload(target):
+        ip = vm_ip(target)
+        return bool(ip) and start_dirty_workload(ip, rate, args.dirty_wss, args.ssh_pod, args.ssh_pod_ns,
+                                                 args.vm_user, args.vm_password, max_duration, logger)
+
+    def finish_workload(target):
+        ns, vm = split_vm_target(target, args.vm_name)
+        mode = (transfer_results or {}).get(target, {}).get('migration_mode') or \
+            get_vmi_migration_mode(vm, ns, logger)
+        ip = vm_ip(target) if workloads.get(target) else None
+        if ip and not stop_dirty_workload(ip, args.ssh_pod, args.ssh_pod_ns, args.vm_user, args.vm_password,
+                                          logger):
+            logger.warning(f"[{target}] Could not stop the dirty-page workload; it exits after {max_duration}s")
+        return mode
+
+    for step, rate in enumerate(args.dirty_rates, 1):
+        logger.info("\n" + "=" * 80)
+        logger.info(f"DIRTY RATE STEP {step}/{len(args.dirty_rates)}: {rate:g} MiB/s "
+                    f"over a {args.dirty_wss} MiB working set")
+        logger.info("=" * 80)
+
+        # VMs moved in the previous step
+        placement_index(logger).invalidate()
+        source_nodes = get_vm_source_nodes(targets, args.vm_name, logger)
+        jobs = [(t, source_nodes[t], previous_source.get(t, args.target_node)) for t in targets]
+        for collected in (downtime_results, transfer_results):
+            if collected is not None:
+                collected.clear()
+
+        workloads = {}
+        if rate > 0:
+            workloads = _run_per_vm(targets, start_workload, args.concurrency)
+            started = sum(1 for ok in workloads.values() if ok)
+            logger.info(f"Dirty-page workload running in {started}/{len(targets)} VMs, "
+                        f"warming up for {args.dirty_warmup}s")
+            if started < len(targets):
+                logger.warning(f"{len(targets) - started} VMs run this step without the workload")
+            time.sleep(args.dirty_warmup)
+
+        step_start = time.time()
+        results, _ = run_scheduled_migrations(args, jobs, None, {}, logger, downtime_probe=downtime_probe,
+                                              vmim_suffix=f"d{step}", transfer_sampler=transfer_sampler)
+        step_sec = time.time() - step_start
+
+        placement_index(logger).invalidate()
+        modes = _run_per_vm([r[0] for r in results if r[1]], finish_workload, args.concurrency) \
+            if any(r[1] for r in results) else {}
+        if rate > 0:
+            failed_targets = [r[0] for r in results if not r[1] and workloads.get(r[0])]
+            if failed_targets:
+                _run_per_vm(failed_targets, finish_workload, args.concurrency)
+
+        previous_source = {r[0]: r[3] for r in results if r[1] and r[3]}
+        stats = summarize_dirty_step(rate, args.dirty_wss, results, step_sec, workloads, modes,
+                                     dict(transfer_results or {}))
+        steps.append(stats)
+        all_results.extend(results)
+
+        convergence = stats['convergence_time_sec']
+        logger.info(f"Step {step} ({rate:g} MiB/s): {stats['successful']}/{stats['migrations']} succeeded"
+                    + (f", convergence p50 {convergence['p50']:.2f}s / p95 {convergence['p95']:.2f}s"
+                       if convergence['count'] else "")
+                    + f", {stats['postcopy_fallbacks']} post-copy fallbacks")
+
+    return all_results, steps
+
+
+def save_dirty_sweep_results(out_dir: str, steps: List[dict], results: list, migration_config: dict,
+                             logger) -> None:
+    """Save the migratability curve (one row per dirty rate), per-migration rows and the sweep summary."""
+    os.makedirs(out_dir, exist_ok=True)
+
+    with open(os.path.join(out_dir, "dirty_sweep.json"), "w") as f:
+        json.dump(steps, f, indent=4)
+
+    fieldnames = ['dirty_rate_mibps', 'working_set_mib', 'migrations', 'successful', 'failed',
+                  'success_rate_pct', 'workloads_started', 'postcopy_fallbacks', 'step_duration_sec',
+                  'measured_dirty_rate_mibps', 'avg_iterations']
+    metrics = ('convergence_time_sec', 'observed_time_sec')
+    stat_keys = ('avg', 'p50', 'p95', 'max')
+    fieldnames += [f"{m}_{s}" for m in metrics for s in stat_keys]
+    with open(os.path.join(out_dir, "dirty_sweep.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for s in steps:
+            row = {k: s[k] for k in fieldnames if k in s}
+            for m in metrics:
+                for key in stat_keys:
+                    row[f"{m}_{key}"] = s[m][key]
+            writer.writerow(row)
+
+    # Per-migration rows; results hold the steps back to back
+    rate_of = [s['dirty_rate_mibps'] for s in steps for _ in range(s['migrations'])]
+    with open(os.path.join(out_dir, "dirty_sweep_migrations.csv"), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(['dirty_rate_mibps', 'namespace', 'status', 'source_node', 'target_node',
+                         'observed_time_sec', 'vmim_time_sec'])
+        for rate, (ns, success, observed, source, target, vmim) in zip(rate_of, results):
+            writer.writerow([rate, ns, 'Success' if success else 'Failed',
+                             source or 'Unknown', target or 'Unknown',
+                             round(observed, 2) if success else None, round(vmim, 2) if vmim else None])
+
+    clean = [s['dirty_rate_mibps'] for s in steps
+             if s['migrations'] and s['failed'] == 0 and s['postcopy_fallbacks'] == 0]
+    summary = {
+        "steps": len(steps),
+        "working_set_mib": steps[0]['working_set_mib'] if steps else None,
+        "dirty_rates_mibps": [s['dirty_rate_mibps'] for s in steps],
+        "max_clean_dirty_rate_mibps": max(clean) if clean else None,
+        "total_migrations": sum(s['migrations'] for s in steps),
+        "failed_migrations": sum(s['failed'] for s in steps),
+        "postcopy_fallbacks": sum(s['postcopy_fallbacks'] for s in steps),
+        "migration_config": migration_config,
+    }
+    with open(os.path.join(out_dir, "summary_migration_dirty_sweep.json"), "w") as f:
+        json.dump(summary, f, indent=4)
+
+    logger.info(f"Saved migratability curve to {os.path.join(out_dir, 'dirty_sweep.csv')}")
+
+
+def concurrency_levels(maximum: int) -> List[int]:
+    """In-flight limits of a concurrency sweep: powers of two below `maximum`, then `maximum`."""
+    levels = []
+    level = 1
+    while level < maximum:
+        levels.append(level)
+        level *= 2
+    return levels + [maximum]
+
+
+def summarize_concurrency_level(level: int, results: list, level_sec: float,
+                                scheduler: MigrationScheduler) -> dict:
+    """
+    Build the statistics of one concurrency level.
+
+    Throughput is successful migrations per minute of level wall time, so the
+    level's latency includes the queueing its in-flight limit causes.
+    """
+    successful = [r for r in results if r[1]]
+    waits = [r['queue_wait_sec'] for r in scheduler.get_records() if r['queue_wait_sec'] is not None]
+    return {
+        'concurrency': level,
+        'migrations': len(results),
+        'successful': len(successful),
+        'failed': len(results) - len(successful),
+        'peak_in_flight': scheduler.peak_in_flight,
+        'level_duration_sec': round(level_sec, 2),
+        'throughput_per_min': round(len(successful) * 60.0 / level_sec, 3) if level_sec > 0 else None,
+        'observed_time_sec': summarize_distribution([r[2] for r in successful], 3),
+        'vmim_time_sec': summarize_distribution([r[5] for r in successful if r[5]], 3),
+        'queue_wait_sec': summarize_distribution(waits, 3),
+    }
+
+
+def run_concurrency_sweep(args, targets: List[str], logger, downtime_probe=None,
+                          downtime_results: Optional[Dict[str, dict]] = None, transfer_sampler=None,
+                          transfer_results: Optional[Dict[str, dict]] = None) -> Tuple[list, List[dict], Optional[dict]]:
+    """
+    Migrate the fleet once per in-flight limit and fit the Universal Scalability Law.
+
+    Levels are 1, 2, 4, ... --concurrency-sweep. Every level migrates all VMs
+    through the scheduler with that in-flight limit (the per-node limits still
+    apply); from the second level on each VM is sent back to the node it left,
+    and every migration gets its own VMIM name (migration-<vm>-c<level>).
+
+    Returns:
+        Tuple of (migration result tuples of all levels, level statistics, USL fit or None)
+    """
+    all_results = []
+    levels: List[dict] = []
+    previous_source: Dict[str, str] = {}
+    sweep_levels = concurrency_levels(args.concurrency_sweep)
+
+    for step, level in enumerate(sweep_levels, 1):
+        logger.info("\n" + "=" * 80)
+        logger.info(f"CONCURRENCY LEVEL {step}/{len(sweep_levels)}: {level} migrations in flight")
+        logger.info("=" * 80)
+
+        # VMs moved in the previous level
+        placement_index(logger).invalidate()
+        source_nodes = get_vm_source_nodes(targets, args.vm_name, logger)
+        jobs = [(t, source_nodes[t], previous_source.get(t, args.target_node)) for t in targets]
+        for collected in (downtime_results, transfer_results):
+            if collected is not None:
+                collected.clear()
+
+        level_start = time.time()
+        results, scheduler = run_scheduled_migrations(args, jobs, None, {}, logger, downtime_probe=downtime_probe,
+                                                      vmim_suffix=f"c{level}", transfer_sampler=transfer_sampler,
+                                                      max_in_flight=level)
+        level_sec = time.time() - level_start
+
+        previous_source = {r[0]: r[3] for r in results if r[1] and r[3]}
+        stats = summarize_concurrency_level(level, results, level_sec, scheduler)
+        levels.append(stats)
+        all_results.extend(results)
+
+        observed = stats['observed_time_sec']
+        logger.info(f"Level {level}: {stats['successful']}/{stats['migrations']} succeeded in {level_sec:.1f}s, "
+                    f"{stats['throughput_per_min'] or 0:.2f} migrations/min"
+                    + (f", p50 {observed['p50']:.2f}s / p95 {observed['p95']:.2f}s" if observed['count'] else ""))
+
+    measured = [s for s in levels if s['throughput_per_min']]
+    fit = fit_usl([s['concurrency'] for s in measured], [s['throughput_per_min'] for s in measured])
+    if fit:
+        top = max(sweep_levels[-1], fit['optimal_concurrency'] or 0) * 2
+        fit['curve'] = [{'concurrency': n, 'throughput_per_min': round(usl_throughput(n, fit), 3)}
+                        for n in range(1, top + 1)]
+    return all_results, levels, fit
+
+
+CONCURRENCY_SWEEP_CHART = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Migration Concurrency Sweep</title>
+<script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
+</head>
+<body>
+<div id="chart" style="width:100%;height:600px;"></div>
+<script>
+Plotly.newPlot('chart', {traces}, {layout});
+</script>
+</body>
+</html>
+"""
+
+
+def save_concurrency_sweep_results(out_dir: str, levels: List[dict], results: list, fit: Optional[dict],
+                                   logger) -> None:
+    """Save the scalability curve (one row per level), per-migration rows, the USL fit and a chart."""
+    os.makedirs(out_dir, exist_ok=True)
+
+    with open(os.path.join(out_dir, "concurrency_sweep.json"), "w") as f:
+        json.dump({'levels': levels, 'usl_fit': fit}, f, indent=4)
+
+    fieldnames = ['concurrency', 'migrations', 'successful', 'failed', 'peak_in_flight',
+                  'level_duration_sec', 'throughput_per_min', 'usl_throughput_per_min']
+    metrics = ('observed_time_sec', 'vmim_time_sec', 'queue_wait_sec')
+    stat_keys = ('avg', 'p50', 'p95', 'max')
+    fieldnames += [f"{m}_{s}" for m in metrics for s in stat_keys]
+    with open(os.path.join(out_dir, "concurrency_sweep.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for s in levels:
+            row = {k: s[k] for k in fieldnames if k in s}
+            row['usl_throughput_per_min'] = round(usl_throughput(s['concurrency'], fit), 3) if fit else None
+            for m in metrics:
+                for key in stat_keys:
+                    row[f"{m}_{key}"] = s[m][key]
+            writer.writerow(row)
+
+    # Per-migration rows; results hold the levels back to back
+    level_of = [s['concurrency'] for s in levels for _ in range(s['migrations'])]
+    with open(os.path.join(out_dir, "concurrency_sweep_migrations.csv"), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(['concurrency', 'namespace', 'status', 'source_node', 'target_node',
+                         'observed_time_sec', 'vmim_time_sec'])
+        for level, (ns, success, observed, source, target, vmim) in zip(level_of, results):
+            writer.writerow([level, ns, 'Success' if success else 'Failed',
+                             source or 'Unknown', target or 'Unknown',
+                             round(observed, 2) if success else None, round(vmim, 2) if vmim else None])
+
+    best = max(levels, key=lambda s: s['throughput_per_min'] or 0) if levels else None
+    summary = {
+        "levels": [s['concurrency'] for s in levels],
+        "total_migrations": sum(s['migrations'] for s in levels),
+        "failed_migrations": sum(s['failed'] for s in levels),
+        "best_measured_concurrency": best['concurrency'] if best else None,
+        "best_measured_throughput_per_min": best['throughput_per_min'] if best else None,
+        "usl_fit": {k: v for k, v in fit.items() if k != 'curve'} if fit else None,
+    }
+    with open(os.path.join(out_dir, "summary_migration_concurrency_sweep.json"), "w") as f:
+        json.dump(summary, f, indent=4)
+
+    traces = [{
+        'x': [s['concurrency'] for s in levels],
+        'y': [s['throughput_per_min'] for s in levels],
+        'mode': 'markers', 'type': 'scatter', 'name': 'Measured', 'marker': {'size': 10},
+    }]
+    title = 'Migration Throughput vs Concurrency'
+    if fit:
+        traces.append({
+            'x': [p['concurrency'] for p in fit['curve']],
+            'y': [p['throughput_per_min'] for p in fit['curve']],
+            'mode': 'lines', 'type': 'scatter', 'name': 'USL fit',
+        })
+        title += (f" (USL: sigma={fit['sigma']:g}, kappa={fit['kappa']:g}, "
+                  f"optimal concurrency={fit['optimal_concurrency'] or 'unbounded'})")
+    layout = {'title': title, 'xaxis': {'title': 'Migrations in flight'},
+              'yaxis': {'title': 'Successful migrations / min', 'rangemode': 'tozero'}}
+    with open(os.path.join(out_dir, "concurrency_sweep.html"), "w") as f:
+        f.write(CONCURRENCY_SWEEP_CHART.replace('{traces}', json.dumps(traces)).replace('{layout}', json.dumps(layout)))
+
+    logger.info(f"Saved scalability curve to {os.path.join(out_dir, 'concurrency_sweep.csv')} "
+                f"and chart to {os.path.join(out_dir, 'concurrency_sweep.html')}")
+
+
 def build_results_dir(args, num_disks: int, timestamp: Optional[str] = None) -> str:
     """Build the canonical migration results directory."""
     timestamp = timestamp or datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -673,9 +1620,135 @@ def attach_file_logging(logger, log_file: str) -> None:
     logger.info(f"Command: {get_command_for_logging()}")
 
 
+def load_resume_state(events: List[dict]) -> dict:
+    """
+    Rebuild the progress of an interrupted migration run from its journal events.
+
+    Args:
+        events: Events loaded with RunJournal.load()
+
+    Returns:
+        Dict with the migration phase start time, the evacuation source node,
+        finished results by namespace and the source node of in-flight migrations
+    """
+    state = {'migration_start': None, 'source_node': None, 'completed': {}, 'inflight': {}}
+    for event in events:
+        kind = event.get('event')
+        ns = event.get('namespace')
+        if kind == 'phase_started' and event.get('phase') == 'migration':
+            state['migration_start'] = datetime.fromisoformat(event['ts'])
+        elif kind == 'source_selected':
+            state['source_node'] = event.get('node')
+        elif kind == 'migration_started':
+            state['inflight'][ns] = event.get('source_node')
+        elif kind == 'migration_result':
+            state['completed'][ns] = tuple(event['result'])
+            state['inflight'].pop(ns, None)
+    return state
+
+
+def detect_num_disks(args, logger) -> int:
+    """Detect the number of non-cloud-init disks per VM from an existing test VM (default: 1)."""
+    logger.info("Detecting disk count from existing VM spec...")
+    try:
+        # For --source-nodes mode `namespaces` is empty here; pick any namespace
+        # that currently exists by probing the first source node.
+        if args.source_nodes:
+            _probe_ns_list = discover_vms_on_node(
+                args.source_nodes[0], args.vm_name, args.namespace_prefix, logger,
+                args.vms_per_namespace
+            )
+            sample_target = _probe_ns_list[0] if _probe_ns_list else None
+        else:
+            sample_target = expand_vm_targets(
+                [f"{args.namespace_prefix}-{args.start}"], args.vm_name, args.vms_per_namespace
+            )[0]
+
+        if not sample_target:
+            logger.warning("No sample namespace available for disk detection; defaulting to 1 disk")
+            return 1
+
+        sample_ns, sample_vm = split_vm_target(sample_target, args.vm_name)
+        vm_yaml_cmd = [
+            "kubectl", "get", "vm", sample_vm, "-n", sample_ns, "-o", "yaml"
+        ]
+        result = subprocess.run(vm_yaml_cmd, capture_output=True, text=True, check=False)
+        if result.returncode == 0 and result.stdout:
+            vm_spec = yaml.safe_load(result.stdout)
+        elif args.create_vms and os.path.exists(args.vm_template):
+            # VMs are not created yet (e.g. --repeat): fall back to the template
+            with open(args.vm_template) as f:
+                vm_spec = next((d for d in yaml.safe_load_all(f) if d and d.get("kind") == "VirtualMachine"), {})
+        else:
+            logger.warning("Could not retrieve VM spec; defaulting to 1 disk")
+            return 1
+
+        volumes = (
+            vm_spec.get("spec", {})
+            .get("template", {})
+            .get("spec", {})
+            .get("volumes", [])
+        )
+        non_cloudinit = [
+            v for v in volumes
+            if not any(k in v for k in ["cloudInitNoCloud", "cloudInitConfigDrive"])
+        ]
+        num_disks = len(non_cloudinit)
+        logger.info(f"Detected {num_disks} disks (excluding cloud-init volumes)")
+        return num_disks
+    except Exception as e:
+        logger.error(f"Error detecting disks: {e}")
+        return 1
+
+
+def run_repeat_mode(args) -> int:
+    """
+    Run the whole migration test --repeat times and report run-to-run statistics.
+
+    VMs created with --create-vms are deleted between repetitions (pool
+    namespaces are released to the pool and leased again) so every
+    repetition starts from the same placement; existing VMs are migrated again
+    from wherever the previous repetition left them.
+
+    Returns:
+        Process exit code
+    """
+    logger = setup_logging(None, args.log_level)
+    run_dir = build_results_dir(args, detect_num_disks(args, logger))
+    os.makedirs(run_dir, exist_ok=True)
+    attach_file_logging(logger, os.path.join(run_dir, "repeat.log"))
+    logger.info(f"Running {args.repeat} repetitions (settle time {args.settle_time}s) under {run_dir}")
+
+    def teardown():
+        stats = cleanup_test_namespaces(
+            namespace_prefix=args.namespace_prefix,
+            start=args.start,
+            end=args.end,
+            vm_name=args.vm_name,
+            delete_namespaces=True,
+            dry_run=False,
+            batch_size=args.concurrency,
+            logger=logger,
+            vms_per_namespace=args.vms_per_namespace,
+            namespace_pool=args.namespace_pool
+        )
+        print_cleanup_summary(stats, logger)
+        if not args.namespace_pool:
+            wait_for_namespaces_deleted(
+                [f"{args.namespace_prefix}-{i}" for i in range(args.start, args.end + 1)], logger=logger
+            )
+
+    return run_repeated_benchmark(
+        os.path.abspath(__file__), args.repeat, run_dir, args.settle_time, logger,
+        teardown=teardown if args.create_vms else None
+    )
+
+
 def main():
     """Main function."""
     args = parse_arguments()
+    if args.repeat > 1:
+        sys.exit(run_repeat_mode(args))
     
     # Setup logging
     logger = setup_logging(args.log_file, args.log_level)
@@ -710,13 +1783,33 @@ def main():
     if not args.source_nodes:
         logger.info(f"VM range: {args.start} to {args.end}")
     logger.info(f"VM name: {args.vm_name}")
+    if args.vms_per_namespace > 1:
+        logger.info(f"VMs per namespace: {args.vms_per_namespace} "
+                    f"({args.vm_name}-1 .. {args.vm_name}-{args.vms_per_namespace})")
     logger.info(f"Namespace prefix: {args.namespace_prefix}")
     logger.info(f"Create VMs: {args.create_vms}")
+    if args.namespace_pool:
+        logger.info(f"Namespace pool: {args.namespace_pool}")
+    if args.resume:
+        logger.info(f"Resuming interrupted run: {args.resume}")
 
     if args.storage_driver:
         logger.info(f"Using provided storage driver: {args.storage_driver}")
 
-    if args.source_nodes:
+    soak = bool(args.soak_rounds or args.soak_duration)
+    sweep = bool(args.dirty_rates)
+    scaling = bool(args.concurrency_sweep)
+    # Soak and sweep runs migrate the fleet several times and report per round/step
+    stepped = soak or sweep or scaling
+    if soak:
+        logger.info(f"Migration mode: Soak ({f'{args.soak_rounds} rounds' if args.soak_rounds else f'{args.soak_duration}s'}, "
+                    f"concurrency: {args.concurrency})")
+    elif sweep:
+        logger.info(f"Migration mode: Dirty-rate sweep ({len(args.dirty_rates)} steps, "
+                    f"concurrency: {args.concurrency})")
+    elif scaling:
+        logger.info(f"Migration mode: Concurrency sweep (in-flight limits up to {args.concurrency_sweep})")
+    elif args.source_nodes:
         logger.info(f"Migration mode: Multi-node evacuation from {len(args.source_nodes)} nodes")
         logger.info(f"  Source nodes: {', '.join(args.source_nodes)}")
     elif args.round_robin:
@@ -748,6 +1841,52 @@ def main():
             logger.warning("SSH pod not available, will skip ping tests")
             args.skip_ping = True
 
+    # The dirty-page workload is started over SSH through the SSH pod
+    migration_config = {}
+    if sweep:
+        if not validate_prerequisites(args.ssh_pod, args.ssh_pod_ns, logger):
+            logger.error("--dirty-rates needs the SSH pod to start the workload in the VMs")
+            sys.exit(1)
+        migration_config = get_migration_config(logger)
+        settings = migration_config['migrations']
+        logger.info(f"Migration settings: allowPostCopy={settings.get('allowPostCopy', False)}, "
+                    f"bandwidthPerMigration={settings.get('bandwidthPerMigration', 'unlimited')}, "
+                    f"completionTimeoutPerGiB={settings.get('completionTimeoutPerGiB', 'default')}, "
+                    f"MigrationPolicies: {', '.join(migration_config['migration_policies']) or 'none'}")
+
+    # Downtime probe: a PingDowntimeProbe per migration attempt, results keyed by target
+    downtime_results: Dict[str, dict] = {}
+    downtime_probe = None
+    if args.downtime_probe:
+        helper_ip = get_pod_ip(args.ssh_pod, args.ssh_pod_ns, logger)
+        if not helper_ip:
+            logger.warning(f"SSH pod {args.ssh_pod_ns}/{args.ssh_pod} not available, downtime probe disabled")
+        else:
+            downtime_probe = functools.partial(
+                PingDowntimeProbe,
+                mode=args.downtime_probe,
+                ssh_pod=args.ssh_pod,
+                ssh_pod_ns=args.ssh_pod_ns,
+                interval=args.downtime_probe_interval,
+                max_duration=args.migration_timeout + 60,
+                helper_ip=helper_ip,
+                vm_user=args.vm_user,
+                vm_password=args.vm_password,
+                results=downtime_results,
+                logger=logger
+            )
+            logger.info(f"Downtime probe: {args.downtime_probe} mode, "
+                        f"one ping every {args.downtime_probe_interval}s during each migration")
+
+    # Transfer statistics: a MigrationTransferSampler per migration attempt, results keyed by target
+    transfer_results: Dict[str, dict] = {}
+    transfer_sampler = None
+    if args.transfer_stats:
+        transfer_sampler = functools.partial(start_transfer_sampler, poll_interval=args.transfer_stats_interval,
+                                             results=transfer_results, logger=logger)
+        logger.info(f"Transfer statistics: libvirt domjobinfo every {args.transfer_stats_interval}s "
+                    f"during each migration")
+
     # Prepare namespaces
     if args.source_nodes:
         # Namespaces are discovered per-node in Scenario 5; nothing to build here.
@@ -756,9 +1895,11 @@ def main():
     else:
         namespaces = [f"{args.namespace_prefix}-{i}" for i in range(args.start, args.end + 1)]
         logger.info(f"\nTarget namespaces: {namespaces[0]} to {namespaces[-1]} ({len(namespaces)} total)")
+    # VM-level phases work on targets: the namespace itself, or 'namespace/vm' when packed
+    targets = expand_vm_targets(namespaces, args.vm_name, args.vms_per_namespace)
 
-    # Phase 1: Create VMs if requested
-    if args.create_vms:
+    # Phase 1: Create VMs if requested (a journal exists only once the VMs were ready)
+    if args.create_vms and not args.resume:
         logger.info("\n" + "=" * 80)
         logger.info("PHASE 1: Creating VMs")
         logger.info("=" * 80)
@@ -793,26 +1934,32 @@ def main():
                 sys.exit(1)
             logger.info(f"Auto-selected source node: {creation_node}")
 
-        # Create namespaces
-        logger.info(f"\nCreating {len(namespaces)} namespaces...")
-        successful_ns = create_namespaces_parallel(namespaces, 20, logger)
+        # Create namespaces (or lease them, already provisioned, from the pool)
+        if args.namespace_pool:
+            owner = namespace_lease_owner(args.output_dir or f"migration-{os.getpid()}")
+            if not lease_pool_namespaces(args.namespace_pool, namespaces, owner, logger):
+                logger.error(f"Failed to lease namespaces from pool '{args.namespace_pool}'")
+                sys.exit(1)
+        else:
+            logger.info(f"\nCreating {len(namespaces)} namespaces...")
+            successful_ns = create_namespaces_parallel(namespaces, 20, logger)
 
-        if len(successful_ns) < len(namespaces):
-            logger.error(f"Failed to create all namespaces. Created: {len(successful_ns)}/{len(namespaces)}")
-            sys.exit(1)
+            if len(successful_ns) < len(namespaces):
+                logger.error(f"Failed to create all namespaces. Created: {len(successful_ns)}/{len(namespaces)}")
+                sys.exit(1)
 
         # Create VMs
         if creation_node:
-            create_results = create_vms_on_node(namespaces, args.vm_template, creation_node, args.vm_name, logger)
+            create_results = create_vms_on_node(targets, args.vm_template, creation_node, args.vm_name, logger)
         else:
             # For round-robin, create VMs without node selector
             logger.info("Creating VMs without node selector (will be distributed)")
-            create_results = create_vms_on_node(namespaces, args.vm_template, None, args.vm_name, logger)
+            create_results = create_vms_on_node(targets, args.vm_template, None, args.vm_name, logger)
 
         # Wait for VMs to be running (default: 1 hour timeout)
         logger.info("\nWaiting for VMs to reach Running state...")
         running_results = wait_for_vms_running(
-            namespaces, args.vm_name, args.vm_startup_timeout, logger,
+            targets, args.vm_name, args.vm_startup_timeout, logger,
             poll_interval=args.poll_interval
         )
 
@@ -821,8 +1968,8 @@ def main():
         if successful_vms == 0:
             logger.error("No VMs are running. Cannot proceed with migration.")
             sys.exit(1)
-        elif successful_vms < len(namespaces):
-            logger.warning(f"Only {successful_vms}/{len(namespaces)} VMs are running. Proceeding with available VMs.")
+        elif successful_vms < len(targets):
+            logger.warning(f"Only {successful_vms}/{len(targets)} VMs are running. Proceeding with available VMs.")
 
         # Remove nodeSelectors to allow migration
         if creation_node:
@@ -835,13 +1982,14 @@ def main():
             removal_success = 0
             removal_failed = 0
 
-            for ns in namespaces:
-                if remove_node_selectors(args.vm_name, ns, logger):
+            for target in targets:
+                ns, vm = split_vm_target(target, args.vm_name)
+                if remove_node_selectors(vm, ns, logger):
                     removal_success += 1
-                    logger.info(f"[{ns}] Removed nodeSelector")
+                    logger.info(f"[{target}] Removed nodeSelector")
                 else:
                     removal_failed += 1
-                    logger.warning(f"[{ns}] Failed to remove nodeSelector")
+                    logger.warning(f"[{target}] Failed to remove nodeSelector")
 
             logger.info(f"\nNodeSelector removal: {removal_success} successful, {removal_failed} failed")
 
@@ -863,17 +2011,18 @@ def main():
             logger.info("Skipping pre-flight VM check for --source-nodes mode; "
                         "VMs will be discovered per node during migration.")
         elif not args.skip_checks:
-            logger.info(f"\nChecking {len(namespaces)} VMs...")
+            logger.info(f"\nChecking {len(targets)} VMs...")
             running_count = 0
 
-            for ns in namespaces:
-                status = get_vm_status(args.vm_name, ns, logger)
+            for target in targets:
+                ns, vm = split_vm_target(target, args.vm_name)
+                status = get_vm_status(vm, ns, logger)
                 if status == "Running":
                     running_count += 1
                 else:
-                    logger.warning(f"[{ns}] VM not running (status: {status})")
+                    logger.warning(f"[{target}] VM not running (status: {status})")
 
-            logger.info(f"\nFound {running_count}/{len(namespaces)} running VMs")
+            logger.info(f"\nFound {running_count}/{len(targets)} running VMs")
 
             if running_count == 0:
                 logger.error("No running VMs found. Use --create-vms to create VMs first.")
@@ -889,8 +2038,9 @@ def main():
             removal_success = 0
             removal_failed = 0
 
-            for ns in namespaces:
-                if remove_node_selectors(args.vm_name, ns, logger):
+            for target in targets:
+                ns, vm = split_vm_target(target, args.vm_name)
+                if remove_node_selectors(vm, ns, logger):
                     removal_success += 1
                 else:
                     removal_failed += 1
@@ -904,72 +2054,71 @@ def main():
         logger.info("VMs are ready for live migration!")
         logger.info("=" * 80)
 
-    logger.info("Detecting disk count from existing VM spec...")
-    try:
-        # For --source-nodes mode `namespaces` is empty here; pick any namespace
-        # that currently exists by probing the first source node.
-        if args.source_nodes:
-            _probe_ns_list = discover_vms_on_node(
-                args.source_nodes[0], args.vm_name, args.namespace_prefix, logger
-            )
-            sample_ns = _probe_ns_list[0] if _probe_ns_list else None
-        else:
-            sample_ns = f"{args.namespace_prefix}-{args.start}"
-
-        if not sample_ns:
-            logger.warning("No sample namespace available for disk detection; defaulting to 1 disk")
-            num_disks = 1
-        else:
-            vm_yaml_cmd = [
-                "kubectl", "get", "vm", args.vm_name, "-n", sample_ns, "-o", "yaml"
-            ]
-            result = subprocess.run(vm_yaml_cmd, capture_output=True, text=True, check=False)
-            if result.returncode == 0 and result.stdout:
-                vm_spec = yaml.safe_load(result.stdout)
-                volumes = (
-                    vm_spec.get("spec", {})
-                    .get("template", {})
-                    .get("spec", {})
-                    .get("volumes", [])
-                )
-                non_cloudinit = [
-                    v for v in volumes
-                    if not any(k in v for k in ["cloudInitNoCloud", "cloudInitConfigDrive"])
-                ]
-                num_disks = len(non_cloudinit)
-                logger.info(f"Detected {num_disks} disks (excluding cloud-init volumes)")
-            else:
-                logger.warning("Could not retrieve VM spec; defaulting to 1 disk")
-                num_disks = 1
-    except Exception as e:
-        logger.error(f"Error detecting disks: {e}")
-        num_disks = 1
+    num_disks = detect_num_disks(args, logger)
 
     out_dir = None
+    journal = None
     if args.save_results:
-        out_dir = build_results_dir(args, num_disks)
+        out_dir = args.output_dir or args.resume or build_results_dir(args, num_disks)
         os.makedirs(out_dir, exist_ok=True)
         logger.info(f"Results and log files will be saved under: {out_dir}")
         if not args.log_file:
             attach_file_logging(logger, os.path.join(out_dir, "migration.log"))
 
+        # The run journal makes the results directory resumable after a crash; soak and sweep runs are not
+        if not stepped:
+            journal = RunJournal(out_dir, logger)
+            if not args.resume:
+                journal.record('run_started', config=journal_config(args))
+            logger.info(f"If interrupted, resume this run with: --resume {out_dir}")
+
+    resume_state = load_resume_state(args._resume_events) if args.resume else None
+    completed = resume_state['completed'] if resume_state else {}
+    inflight = resume_state['inflight'] if resume_state else {}
+    if resume_state:
+        logger.info(f"{len(completed)} migrations already finished, {len(inflight)} were in flight")
+
     # Phase 2: Perform Migration
     logger.info("\n" + "=" * 80)
     logger.info("PHASE 2: Live Migration")
     logger.info("=" * 80)
 
-    migration_results = []
-    migration_phase_start = datetime.now()
+    migration_results = list(completed.values())
+    scheduler = None
+    if resume_state and resume_state['migration_start']:
+        migration_phase_start = resume_state['migration_start']
+    else:
+        migration_phase_start = datetime.now()
+        if journal:
+            journal.record('phase_started', phase='migration')
+
+    # Soak: migrate the same fleet back and forth round after round
+    if soak:
+        migration_results, soak_rounds = run_soak_mode(args, targets, logger, downtime_probe, downtime_results)
+        soak_drift = detect_soak_drift(soak_rounds, args.soak_drift_threshold)
+
+    # Dirty-rate sweep: migrate the fleet once per dirty rate
+    elif sweep:
+        migration_results, dirty_steps = run_dirty_sweep(args, targets, logger, downtime_probe, downtime_results,
+                                                         transfer_sampler, transfer_results)
+
+    # Concurrency sweep: migrate the fleet once per in-flight limit
+    elif scaling:
+        migration_results, concurrency_steps, usl_fit = run_concurrency_sweep(
+            args, targets, logger, downtime_probe, downtime_results, transfer_sampler, transfer_results)
 
     # Scenario 1: Sequential Migration
-    if not args.parallel and not args.evacuate and not args.round_robin and not args.source_nodes:
+    elif not args.parallel and not args.evacuate and not args.round_robin and not args.source_nodes:
         logger.info(f"\nSequential migration from {args.source_node or 'auto-selected node'} to {args.target_node or 'auto-selected node'}")
 
-        for ns in namespaces:
+        for ns in [t for t in targets if t not in completed]:
             result = migrate_vm_sequential(
                 ns, args.vm_name, args.target_node, args.migration_timeout, logger,
                 poll_interval=args.poll_interval,
-                max_migration_retries=args.max_migration_retries
+                max_migration_retries=args.max_migration_retries,
+                journal=journal, resumed_source=inflight.get(ns),
+                downtime_probe=downtime_probe,
+                transfer_sampler=transfer_sampler
             )
             migration_results.append(result)
 
@@ -988,17 +2137,17 @@ def main():
         logger.info(f"Found {num_nodes} worker nodes: {', '.join(available_nodes) if available_nodes else 'N/A'}")
 
         # Default: sequential namespace order
-        reordered_namespaces = namespaces
+        reordered_namespaces = targets
 
         # --- Interleaved scheduling ---
         if args.interleaved_scheduling:
-            total_namespaces = len(namespaces)
+            total_namespaces = len(targets)
             group_size = total_namespaces // num_nodes or 1
 
             reordered_namespaces = []
             for offset in range(group_size):
                 for i in range(offset, total_namespaces, group_size):
-                    reordered_namespaces.append(namespaces[i])
+                    reordered_namespaces.append(targets[i])
 
             logger.info(f"Detected {num_nodes} available nodes for interleaved scheduling")
             logger.info(f"Reordered namespaces for interleaved scheduling (stride={group_size}). "
@@ -1007,39 +2156,26 @@ def main():
             logger.info("Using default sequential namespace order for parallel scheduling")
 
         # --- Parallel migration execution ---
-        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-            futures = {
-                executor.submit(
-                    migrate_vm_sequential,
-                    ns,
-                    args.vm_name,
-                    args.target_node,
-                    args.migration_timeout,
-                    logger,
-                    args.poll_interval,
-                    10,  # max_vmim_retries
-                    args.max_migration_retries
-                ): ns for ns in reordered_namespaces
-            }
-
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    migration_results.append(result)
-                except Exception as e:
-                    ns = futures[future]
-                    logger.error(f"[{ns}] Exception during migration: {e}")
-                    migration_results.append((ns, False, 0.0, None, None, None))
+        pending_targets = [ns for ns in reordered_namespaces if ns not in completed]
+        source_nodes = get_vm_source_nodes(pending_targets, args.vm_name, logger)
+        jobs = [(ns, source_nodes[ns], args.target_node) for ns in pending_targets]
+        results, scheduler = run_scheduled_migrations(args, jobs, journal, inflight, logger,
+                                                      downtime_probe=downtime_probe,
+                                                      transfer_sampler=transfer_sampler)
+        migration_results.extend(results)
 
     # Scenario 3: Evacuation
     elif args.evacuate:
         # Determine source node
-        if args.auto_select_busiest and not args.source_node:
+        if resume_state and resume_state['source_node']:
+            source_node = resume_state['source_node']
+            logger.info(f"\nResuming evacuation of {source_node}")
+        elif args.auto_select_busiest and not args.source_node:
             logger.info("\n" + "=" * 80)
             logger.info("AUTO-SELECTING BUSIEST NODE")
             logger.info("=" * 80)
 
-            source_node = find_busiest_node(namespaces, args.vm_name, logger)
+            source_node = find_busiest_node(targets, args.vm_name, logger, placement_index(logger))
 
             if not source_node:
                 logger.error("Could not find any VMs to determine busiest node")
@@ -1049,6 +2185,8 @@ def main():
             logger.info("=" * 80)
         else:
             source_node = args.source_node
+        if journal:
+            journal.record('source_selected', node=source_node)
 
         logger.info(f"\nEvacuation: migrating all VMs from {source_node}")
         logger.info(f"Concurrency: {args.concurrency}")
@@ -1058,9 +2196,14 @@ def main():
         logger.info("IDENTIFYING VMs ON SOURCE NODE")
         logger.info("=" * 80)
 
-        vms_to_evacuate = get_vms_on_node(namespaces, args.vm_name, source_node, logger)
+        vms_to_evacuate = get_vms_on_node(targets, args.vm_name, source_node, logger, placement_index(logger))
+        # Interrupted migrations may already have left the source node
+        vms_to_evacuate = [ns for ns in vms_to_evacuate if ns not in completed]
+        vms_to_evacuate += [ns for ns in inflight if ns not in vms_to_evacuate]
 
-        if not vms_to_evacuate:
+        if not vms_to_evacuate and completed:
+            logger.info(f"All VMs on {source_node} were already evacuated by the interrupted run")
+        elif not vms_to_evacuate:
             logger.error(f"No VMs found on {source_node} within the specified namespace range")
             logger.info(f"Checked namespaces: {namespaces[0]} to {namespaces[-1]}")
             sys.exit(1)
@@ -1082,24 +2225,12 @@ def main():
         # Migrate only the VMs that are on the source node
         logger.info(f"\nStarting evacuation of {len(vms_to_evacuate)} VMs...")
 
-        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-            futures = {
-                executor.submit(
-                    migrate_vm_sequential, ns, args.vm_name, None,
-                    args.migration_timeout, logger, args.poll_interval,
-                    10, args.max_migration_retries
-                ): ns
-                for ns in vms_to_evacuate  # Only migrate VMs on source node
-            }
-
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    migration_results.append(result)
-                except Exception as e:
-                    ns = futures[future]
-                    logger.error(f"[{ns}] Exception during migration: {e}")
-                    migration_results.append((ns, False, 0.0, None, None, None))
+        # Only migrate VMs on source node; KubeVirt picks the target nodes
+        jobs = [(ns, source_node, None) for ns in vms_to_evacuate]
+        results, scheduler = run_scheduled_migrations(args, jobs, journal, inflight, logger,
+                                                      downtime_probe=downtime_probe,
+                                                      transfer_sampler=transfer_sampler)
+        migration_results.extend(results)
 
     # Scenario 4: Round-Robin
     elif args.round_robin:
@@ -1116,35 +2247,23 @@ def main():
         logger.info(f"Available nodes: {all_nodes}")
 
         # For each VM, select a target node different from current node
-        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-            futures = {}
-
-            for ns in namespaces:
-                # Get current node
-                current_node = get_vm_node(args.vm_name, ns, logger)
-
-                if current_node:
-                    # Select a different node
-                    available = [n for n in all_nodes if n != current_node]
-                    target = random.choice(available) if available else None
-                else:
-                    target = None
-
-                future = executor.submit(
-                    migrate_vm_sequential, ns, args.vm_name, target,
-                    args.migration_timeout, logger, args.poll_interval,
-                    10, args.max_migration_retries
-                )
-                futures[future] = ns
+        pending_targets = [t for t in targets if t not in completed]
+        source_nodes = get_vm_source_nodes(pending_targets, args.vm_name, logger)
+        jobs = []
+        for ns in pending_targets:
+            current_node = source_nodes[ns]
+            if current_node:
+                # Select a different node
+                available = [n for n in all_nodes if n != current_node]
+                target = random.choice(available) if available else None
+            else:
+                target = None
+            jobs.append((ns, current_node, target))
 
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    migration_results.append(result)
-                except Exception as e:
-                    ns = futures[future]
-                    logger.error(f"[{ns}] Exception during migration: {e}")
-                    migration_results.append((ns, False, 0.0, None, None, None))
+        results, scheduler = run_scheduled_migrations(args, jobs, journal, inflight, logger,
+                                                      downtime_probe=downtime_probe,
+                                                      transfer_sampler=transfer_sampler)
+        migration_results.extend(results)
 
     # Scenario 5: Multi-source-node parallel migration (interleaved across nodes)
     elif args.source_nodes:
@@ -1158,7 +2277,7 @@ def main():
         per_node_vms: Dict[str, List[str]] = {}
         for source_node in args.source_nodes:
             vms_on_node = discover_vms_on_node(
-                source_node, args.vm_name, args.namespace_prefix, logger
+                source_node, args.vm_name, args.namespace_prefix, logger, args.vms_per_namespace
             )
             per_node_vms[source_node] = vms_on_node
             if vms_on_node:
@@ -1169,8 +2288,13 @@ def main():
         # Interleave across nodes so the migration order is:
         # VM1 from node1, VM1 from node2, VM1 from node3, VM2 from node1, ...
         all_vms_to_migrate = interleave_vms_across_nodes(per_node_vms, args.source_nodes)
+        # Interrupted migrations may already have left their source node
+        all_vms_to_migrate = [ns for ns in all_vms_to_migrate if ns not in completed]
+        all_vms_to_migrate += [ns for ns in inflight if ns not in all_vms_to_migrate]
 
-        if not all_vms_to_migrate:
+        if not all_vms_to_migrate and completed:
+            logger.info("All VMs on the source nodes were already migrated by the interrupted run")
+        elif not all_vms_to_migrate:
             logger.error("No VMs found on any of the specified source nodes. "
                          "Check node names and --namespace-prefix.")
             sys.exit(1)
@@ -1189,12 +2313,13 @@ def main():
         removal_success = 0
         removal_failed = 0
 
-        for ns in all_vms_to_migrate:
-            if remove_node_selectors(args.vm_name, ns, logger):
+        for target in all_vms_to_migrate:
+            ns, vm = split_vm_target(target, args.vm_name)
+            if remove_node_selectors(vm, ns, logger):
                 removal_success += 1
             else:
                 removal_failed += 1
-                logger.warning(f"[{ns}] Failed to remove nodeSelector")
+                logger.warning(f"[{target}] Failed to remove nodeSelector")
 
         logger.info(f"\nNodeSelector removal: {removal_success} successful, {removal_failed} failed")
 
@@ -1229,61 +2354,52 @@ def main():
 
         logger.info(f"\nStarting parallel migration of {len(all_vms_to_migrate)} VMs...")
 
-        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
-            futures = {
-                executor.submit(
-                    migrate_vm_sequential,
-                    ns,
-                    args.vm_name,
-                    args.target_node,   # None -> KubeVirt auto-selects from available nodes
-                    args.migration_timeout,
-                    logger,
-                    args.poll_interval,
-                    10,                 # max_vmim_retries
-                    args.max_migration_retries,
-                ): ns
-                for ns in all_vms_to_migrate
-            }
-
-            completed = 0
-            for future in as_completed(futures):
-                ns = futures[future]
-                try:
-                    result = future.result()
-                    migration_results.append(result)
-                    completed += 1
-                    _, success, duration, src, tgt, _ = result
-                    status_str = "✓" if success else "✗"
-                    if success:
-                        logger.info(
-                            f"[{completed}/{len(all_vms_to_migrate)}] {status_str} "
-                            f"{ns}: {src} → {tgt or 'unknown'} ({duration:.1f}s)"
-                        )
-                    else:
-                        logger.info(
-                            f"[{completed}/{len(all_vms_to_migrate)}] {status_str} {ns}: FAILED"
-                        )
-                except Exception as e:
-                    completed += 1
-                    logger.error(f"[{ns}] Exception during migration: {e}")
-                    migration_results.append((ns, False, 0.0, None, None, None))
-
-        # Expose discovered namespaces to the ping / cleanup phases below.
-        namespaces = all_vms_to_migrate
+        # Discovered source node per VM; resumed in-flight VMs may have left it already
+        discovered_on = {ns: node for node, vms in per_node_vms.items() for ns in vms}
+        jobs = [
+            (ns, discovered_on.get(ns, inflight.get(ns)), args.target_node)  # None -> KubeVirt auto-selects
+            for ns in all_vms_to_migrate
+        ]
+        results, scheduler = run_scheduled_migrations(args, jobs, journal, inflight, logger,
+                                                      log_progress=True, downtime_probe=downtime_probe,
+                                                      transfer_sampler=transfer_sampler)
+        migration_results.extend(results)
+
+        # Expose discovered VMs and their namespaces to the ping / cleanup phases below.
+        targets = list(completed) + all_vms_to_migrate
+        namespaces = sorted({split_vm_target(t, args.vm_name)[0] for t in targets})
 
     total_migration_time = (datetime.now() - migration_phase_start).total_seconds()
+    if resume_state:
+        logger.info("Total migration time is wall-clock time and includes the interruption")
+
+    # VMIM phase transitions are read after the wave so the API reads stay out of the measured window
+    # Target node each migration asked for, to report placement accuracy
+    if scheduler:
+        requested_targets = {r['target']: r['target_node'] for r in scheduler.get_records() if r['target_node']}
+    elif not stepped and args.target_node:
+        requested_targets = {r[0]: args.target_node for r in migration_results}
+    else:
+        requested_targets = {}
+    # Without VMIM addedNodeSelector no target was requested, so there is no placement to check
+    if requested_targets and not vmim_supports_added_node_selector(logger):
+        requested_targets = {}
+
+    # Soak and sweep runs leave one VMIM per round/step and report per-round/step statistics instead
+    migrated = {r[0]: split_vm_target(r[0], args.vm_name) for r in migration_results if r[1]}
+    phases = collect_vmim_phase_breakdowns(migrated, args.concurrency, logger) if migrated and not stepped else {}
     # Phase 4: Validation (Ping Test)
     if not args.skip_ping:
         logger.info("\n" + "=" * 80)
         logger.info("PHASE 3: Network Validation")
         logger.info("=" * 80)
 
-        logger.info(f"\nTesting network connectivity for {len(namespaces)} VMs...")
+        logger.info(f"\nTesting network connectivity for {len(targets)} VMs...")
         logger.info(f"Timeout: {args.ping_timeout}s (will poll until all VMs respond or timeout)")
 
         # Track which VMs still need ping validation
-        pending = set(namespaces)
-        ping_results = {ns: False for ns in namespaces}
+        pending = set(targets)
+        ping_results = {ns: False for ns in targets}
         vm_ips = {}  # Cache VM IPs
         start_time = time.time()
         poll_interval = 10  # Check every 10 seconds
@@ -1295,7 +2411,8 @@ def main():
             for ns in pending:
                 # Get VM IP (may not be available immediately after migration)
                 if ns not in vm_ips or vm_ips[ns] is None:
-                    vm_ips[ns] = get_vmi_ip(args.vm_name, ns, logger)
+                    vm_ns, vm = split_vm_target(ns, args.vm_name)
+                    vm_ips[ns] = get_vmi_ip(vm, vm_ns, logger)
 
                 vm_ip = vm_ips[ns]
                 if vm_ip:
@@ -1315,7 +2432,7 @@ def main():
             if pending:
                 successful_count = sum(1 for v in ping_results.values() if v)
                 remaining_time = args.ping_timeout - elapsed
-                logger.info(f"Ping status: {successful_count}/{len(namespaces)} successful | "
+                logger.info(f"Ping status: {successful_count}/{len(targets)} successful | "
                            f"Pending: {len(pending)} | "
                            f"Elapsed: {elapsed:.0f}s | "
                            f"Remaining: {remaining_time:.0f}s")
@@ -1329,7 +2446,7 @@ def main():
                 logger.warning(f"  [{ns}] IP: {vm_ip}")
 
         successful_pings = sum(1 for success in ping_results.values() if success)
-        logger.info(f"\nNetwork validation complete: {successful_pings}/{len(namespaces)} VMs reachable")
+        logger.info(f"\nNetwork validation complete: {successful_pings}/{len(targets)} VMs reachable")
 
     # Phase 5: Display Results
     logger.info("\n" + "=" * 80)
@@ -1407,6 +2524,108 @@ def main():
         else:
             logger.info(f"\n  VMIM Time: Not available (timestamps not found)")
 
+        targeted = [r for r in migration_results if r[1] and requested_targets.get(r[0])]
+        if targeted:
+            matches = sum(1 for r in targeted if r[4] == requested_targets[r[0]])
+            logger.info(f"\n  Placement Accuracy:     {matches}/{len(targeted)} targeted migrations "
+                        f"landed on the requested node ({matches * 100.0 / len(targeted):.1f}%)")
+
+        downtimes = [downtime_results[r[0]]['downtime_sec'] for r in migration_results
+                     if r[1] and r[0] in downtime_results]
+        if downtimes:
+            lost = sum(downtime_results[r[0]]['packets_lost'] for r in migration_results
+                       if r[1] and r[0] in downtime_results)
+            logger.info(f"\n  Network Downtime (Ping Probe, {len(downtimes)} VMs):")
+            logger.info(f"    Average:              {sum(downtimes) / len(downtimes):.3f}s")
+            logger.info(f"    P50 / P95 / P99:      {calculate_percentile(downtimes, 50):.3f}s / "
+                        f"{calculate_percentile(downtimes, 95):.3f}s / {calculate_percentile(downtimes, 99):.3f}s")
+            logger.info(f"    Maximum:              {max(downtimes):.3f}s")
+            logger.info(f"    Packets Lost:         {lost}")
+        elif args.downtime_probe:
+            logger.info(f"\n  Network Downtime: Not available (no probe results)")
+
+        transfers = [transfer_results[r[0]] for r in migration_results
+                     if r[1] and r[0] in transfer_results] if not stepped else []
+        if transfers:
+            bandwidths = [t['effective_bandwidth_mibps'] for t in transfers if t['effective_bandwidth_mibps']]
+            processed = [t['data_processed_mib'] for t in transfers if t['data_processed_mib']]
+            iterations = [t['iterations'] for t in transfers if t['iterations'] is not None]
+            postcopy = sum(1 for t in transfers if t['migration_mode'] == 'PostCopy')
+            logger.info(f"\n  Transfer Statistics (libvirt, {len(transfers)} VMs):")
+            if processed:
+                logger.info(f"    Data Transferred:     {sum(processed) / len(processed):.1f} MiB avg / "
+                            f"{sum(processed):.1f} MiB total")
+            if bandwidths:
+                logger.info(f"    Effective Bandwidth:  {sum(bandwidths) / len(bandwidths):.1f} MiB/s avg, "
+                            f"P50 / P95: {calculate_percentile(bandwidths, 50):.1f} / "
+                            f"{calculate_percentile(bandwidths, 95):.1f} MiB/s")
+            if iterations:
+                logger.info(f"    Iterations:           {sum(iterations) / len(iterations):.1f} avg / "
+                            f"{max(iterations)} max")
+            logger.info(f"    Post-copy:            {postcopy}/{len(transfers)} migrations")
+        elif args.transfer_stats and not stepped:
+            logger.info(f"\n  Transfer Statistics: Not available (no samples)")
+
+        if soak:
+            logger.info(f"\n  Soak Rounds:            {len(soak_rounds)}")
+            logger.info(f"    {'Round':<6} {'OK':>5} {'Failed':>7} {'p50':>8} {'p95':>8} {'Duration':>10} {'Leaked':>7}")
+            for r in soak_rounds:
+                observed = r['observed_time_sec']
+                p50 = f"{observed['p50']:.2f}s" if observed['count'] else 'N/A'
+                p95 = f"{observed['p95']:.2f}s" if observed['count'] else 'N/A'
+                logger.info(f"    {r['round']:<6} {r['successful']:>5} {r['failed']:>7} {p50:>8} {p95:>8} "
+                            f"{r['round_duration_sec']:>9.1f}s {r['leaked_target_pods']:>7}")
+            if soak_drift['slowdown_pct'] is not None:
+                logger.info(f"    Slowdown (last vs first third): {soak_drift['slowdown_pct']}% | "
+                            f"p50 slope: {soak_drift['p50_slope_sec_per_round']}s/round")
+            for flag in soak_drift['flags']:
+                logger.warning(f"    DRIFT: {flag}")
+
+        if sweep:
+            logger.info(f"\n  Migratability Curve ({args.dirty_wss} MiB working set):")
+            logger.info(f"    {'MiB/s':>8} {'Success':>8} {'p50':>8} {'p95':>8} {'Post-copy':>10} {'Measured':>9}")
+            for s in dirty_steps:
+                convergence = s['convergence_time_sec']
+                p50 = f"{convergence['p50']:.2f}s" if convergence['count'] else 'N/A'
+                p95 = f"{convergence['p95']:.2f}s" if convergence['count'] else 'N/A'
+                measured = f"{s['measured_dirty_rate_mibps']:g}" if s['measured_dirty_rate_mibps'] is not None else 'N/A'
+                logger.info(f"    {s['dirty_rate_mibps']:>8g} {s['success_rate_pct']:>7.1f}% {p50:>8} {p95:>8} "
+                            f"{s['postcopy_fallbacks']:>10} {measured:>9}")
+
+        if scaling:
+            logger.info(f"\n  Scalability Curve:")
+            logger.info(f"    {'Level':>6} {'OK':>5} {'Failed':>7} {'Mig/min':>8} {'USL':>8} {'p50':>8} {'p95':>8}")
+            for s in concurrency_steps:
+                observed = s['observed_time_sec']
+                p50 = f"{observed['p50']:.2f}s" if observed['count'] else 'N/A'
+                p95 = f"{observed['p95']:.2f}s" if observed['count'] else 'N/A'
+                fitted = f"{usl_throughput(s['concurrency'], usl_fit):.2f}" if usl_fit else 'N/A'
+                logger.info(f"    {s['concurrency']:>6} {s['successful']:>5} {s['failed']:>7} "
+                            f"{s['throughput_per_min'] or 0:>8.2f} {fitted:>8} {p50:>8} {p95:>8}")
+            if usl_fit:
+                logger.info(f"    USL fit: sigma (contention) = {usl_fit['sigma']:g}, "
+                            f"kappa (coherency) = {usl_fit['kappa']:g}, R² = {usl_fit['r_squared']}")
+                if usl_fit['optimal_concurrency']:
+                    logger.info(f"    Optimal concurrency: {usl_fit['optimal_concurrency']} "
+                                f"({usl_fit['peak_throughput']:.2f} migrations/min predicted)")
+                else:
+                    logger.info("    Optimal concurrency: not reached (no coherency penalty measured)")
+            else:
+                logger.info("    USL fit: not available (needs successful migrations at level 1 and one more level)")
+
+        if phases:
+            logger.info(f"\n  VMIM Phase Breakdown:   {'Avg':>8} {'P50':>8} {'P95':>8} {'P99':>8} {'Count':>6}")
+            for stage, _, _ in MIGRATION_STAGES:
+                values = [b[stage] for b in phases.values() if b.get(stage) is not None]
+                label = stage[:-len('_sec')].replace('_', ' ').title() + ':'
+                if values:
+                    logger.info(f"    {label:<21} {sum(values) / len(values):>7.2f}s "
+                                f"{calculate_percentile(values, 50):>7.2f}s "
+                                f"{calculate_percentile(values, 95):>7.2f}s "
+                                f"{calculate_percentile(values, 99):>7.2f}s {len(values):>6}")
+                else:
+                    logger.info(f"    {label:<21} {'N/A':>8}")
+
         logger.info("=" * 80)
 
     # --- Save structured migration results if requested ---
@@ -1419,8 +2638,22 @@ def main():
             migration_results,
             base_dir=out_dir,
             logger=logger,
-            total_time=total_migration_time
+            total_time=total_migration_time,
+            schedule=scheduler.get_records() if scheduler else None,
+            phases=None if stepped else phases,
+            downtime=downtime_results if args.downtime_probe and not stepped else None,
+            transfer=transfer_results if args.transfer_stats and not stepped else None,
+            requested_targets=requested_targets or None
         )
+        if scheduler:
+            save_migration_schedule(scheduler, out_dir, logger)
+        if soak:
+            save_soak_results(out_dir, soak_rounds, soak_drift, migration_results,
+                              args.soak_drift_threshold, logger)
+        if sweep:
+            save_dirty_sweep_results(out_dir, dirty_steps, migration_results, migration_config, logger)
+        if scaling:
+            save_concurrency_sweep_results(out_dir, concurrency_steps, migration_results, usl_fit, logger)
 
         logger.info(f"Migration results saved under: {out_dir}")
     else:
@@ -1467,7 +2700,9 @@ def main():
                         delete_namespaces=True,
                         dry_run=args.dry_run_cleanup,
                         batch_size=args.concurrency,
-                        logger=logger
+                        logger=logger,
+                        vms_per_namespace=args.vms_per_namespace,
+                        namespace_pool=args.namespace_pool
                     )
                     print_cleanup_summary(stats, logger)
                 else:
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+KubeVirt Snapshot Restore Benchmark
+
+Measures how long VMs take to come back from a VirtualMachineSnapshot, the
+number backup and disaster-recovery SLAs are written against.
+
+For every VM (one per namespace, <namespace-prefix>-<start> .. <namespace-prefix>-<end>):
+1. Write a file of random data in the guest and record its checksum
+2. Snapshot the VM and wait until the snapshot is ready to use
+3. Delete the file again, so only a real restore can bring it back
+4. Stop the VM and create a VirtualMachineRestore, --concurrency VMs at a time
+5. Time the restore through its phases: restore created, volumes restored,
+   VM Running, guest answering ping
+6. Verify the checksum of the restored file
+
+Latency percentiles are reported per storage class and disk count.
+
+Usage:
+    python3 measure-snapshot-restore.py --start 1 --end 50 --concurrency 10 --save-results
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.common import (
+    setup_logging, run_kubectl_command, get_vm_status, get_vmi_ip, get_vm_disk_count, get_vm_volume_names,
+    ping_vm, ssh_exec_command, validate_prerequisites, stop_vm, start_vm, wait_for_vm_stopped,
+    create_vm_snapshot, wait_for_snapshot_ready, delete_vm_snapshot,
+    create_vm_restore, wait_for_restore_complete, delete_vm_restore, summarize_distribution
+)
+
+# Default configuration
+DEFAULT_VM_NAME = 'rhel-9-vm'
+DEFAULT_NAMESPACE_PREFIX = 'kubevirt-perf-test'
+DEFAULT_CONCURRENCY = 10
+
+# Guest file whose checksum proves the restore brought back the snapshot data
+CHECKSUM_FILE = '/var/tmp/virtbench-restore.dat'
+
+# Restore phases, in seconds since the restore was requested
+RESTORE_PHASES = ('restore_created_sec', 'volumes_restored_sec', 'running_sec', 'ping_sec')
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description='KubeVirt Snapshot Restore Benchmark',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Snapshot and restore the VMs of kubevirt-perf-test-1..50, 10 restores at a time
+  python3 measure-snapshot-restore.py --start 1 --end 50 --concurrency 10 --save-results
+
+  # Restore everything at once, without guest checks
+  python3 measure-snapshot-restore.py --start 1 --end 50 --concurrency 50 --skip-ping --skip-checksum
+
+  # Delete the snapshots and restore objects afterwards
+  python3 measure-snapshot-restore.py --start 1 --end 10 --cleanup
+        """
+    )
+
+    # Targets
+    parser.add_argument('-s', '--start', type=int, default=1,
+                        help='Starting namespace index (default: 1)')
+    parser.add_argument('-e', '--end', type=int, default=10,
+                        help='Ending namespace index (default: 10)')
+    parser.add_argument('-n', '--vm-name', type=str, default=DEFAULT_VM_NAME,
+                        help=f'VM name in every namespace (default: {DEFAULT_VM_NAME})')
+    parser.add_argument('--namespace-prefix', type=str, default=DEFAULT_NAMESPACE_PREFIX,
+                        help=f'Namespace prefix (default: {DEFAULT_NAMESPACE_PREFIX})')
+
+    # Execution
+    parser.add_argument('-c', '--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'VMs snapshotted and restored at a time (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--poll-interval', type=int, default=2,
+                        help='Seconds between status checks (default: 2)')
+    parser.add_argument('--snapshot-timeout', type=int, default=600,
+                        help='Timeout for a snapshot to become ready in seconds (default: 600)')
+    parser.add_argument('--restore-timeout', type=int, default=1800,
+                        help='Timeout for a restore to complete in seconds (default: 1800)')
+    parser.add_argument('--vm-timeout', type=int, default=900,
+                        help='Timeout for a VM to stop or to reach Running in seconds (default: 900)')
+    parser.add_argument('--ping-timeout', type=int, default=600,
+                        help='Timeout for the guest to answer ping and SSH in seconds (default: 600)')
+
+    # Guest checks
+    parser.add_argument('--skip-ping', action='store_true',
+                        help='Do not wait for the restored guest to answer ping')
+    parser.add_argument('--skip-checksum', action='store_true',
+                        help='Do not write and verify the checksum file in the guest')
+    parser.add_argument('--checksum-size-mb', type=int, default=64,
+                        help='Size of the random data file written before the snapshot in MiB (default: 64)')
+    parser.add_argument('--ssh-pod', type=str, default='ssh-test-pod',
+                        help='Pod used to ping and SSH into the VMs (default: ssh-test-pod)')
+    parser.add_argument('--ssh-pod-ns', type=str, default='default',
+                        help='Namespace of the SSH pod (default: default)')
+    parser.add_argument('--vm-user', type=str, default='cloud-user',
+                        help='Guest SSH user for the checksum (default: cloud-user)')
+    parser.add_argument('--vm-password', type=str, default='changeme',
+                        help='Guest SSH password for the checksum (default: changeme)')
+
+    # Cleanup
+    parser.add_argument('--cleanup', action='store_true',
+                        help='Delete the snapshots and restore objects after the test')
+
+    # Results
+    parser.add_argument('--save-results', action='store_true',
+                        help='Save results to JSON/CSV files in the results folder')
+    parser.add_argument('--storage-driver', type=str, default=None,
+                        help='Storage driver for results folder hierarchy (e.g., portworx-3.6)')
+    parser.add_argument('--results-folder', type=str, default='results',
+                        help='Base directory to store test results (default: results)')
+
+    # Logging
+    parser.add_argument('--log-file', type=str, default=None,
+                        help='Log file path')
+    parser.add_argument('--log-level', type=str, default='INFO',
+                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help='Logging level (default: INFO)')
+
+    args = parser.parse_args()
+
+    if args.end < args.start:
+        parser.error('--end must be >= --start')
+    if args.concurrency < 1 or args.checksum_size_mb < 1:
+        parser.error('--concurrency and --checksum-size-mb must be >= 1')
+
+    return args
+
+
+def _wait_for(condition, timeout: int, poll_interval: int) -> bool:
+    """Poll condition() until it returns True or timeout seconds have passed."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(poll_interval)
+    return False
+
+
+def get_vm_storage_class(vm_name: str, namespace: str, logger) -> str:
+    """Storage class of the VM's first volume, or 'unknown'."""
+    for pvc_name in get_vm_volume_names(vm_name, namespace, logger)[:1]:
+        returncode, stdout, _ = run_kubectl_command(
+            ['get', 'pvc', pvc_name, '-n', namespace, '-o', 'jsonpath={.spec.storageClassName}'],
+            check=False, logger=logger
+        )
+        if returncode == 0 and stdout.strip():
+            return stdout.strip()
+    return 'unknown'
+
+
+def guest_command(ip: str, command: str, args, logger, timeout: int = 120) -> Tuple[int, str]:
+    """Run a command in the guest over SSH. Returns (return code, stdout)."""
+    try:
+        returncode, stdout, _ = ssh_exec_command(ip, command, args.ssh_pod, args.ssh_pod_ns,
+                                                 args.vm_user, args.vm_password, logger, timeout)
+        return returncode, stdout
+    except Exception as e:
+        logger.debug(f"SSH to {ip} failed: {e}")
+        return -1, ''
+
+
+def write_checksum_file(ip: str, args, logger) -> Optional[str]:
+    """Write --checksum-size-mb of random data to CHECKSUM_FILE and return its sha256."""
+    returncode, stdout = guest_command(
+        ip, f"dd if=/dev/urandom of={CHECKSUM_FILE} bs=1M count={args.checksum_size_mb} status=none "
+            f"&& sync && sha256sum {CHECKSUM_FILE}", args, logger)
+    if returncode == 0 and stdout.split():
+        return stdout.split()[0]
+    return None
+
+
+def read_checksum_file(ip: str, args, logger) -> Optional[str]:
+    """sha256 of CHECKSUM_FILE, 'missing' if it does not exist, or None if SSH failed."""
+    returncode, stdout = guest_command(
+        ip, f"if [ -f {CHECKSUM_FILE} ]; then sha256sum {CHECKSUM_FILE}; else echo missing; fi", args, logger)
+    if returncode == 0 and stdout.split():
+        return stdout.split()[0]
+    return None
+
+
+def prepare_vm(namespace: str, run_id: str, args, logger) -> dict:
+    """
+    Write the checksum file, snapshot the VM, then delete the file.
+
+    Returns:
+        Per-VM entry; 'error' is set if the VM cannot be restored
+    """
+    vm_name = args.vm_name
+    entry = {
+        'namespace': namespace,
+        'vm_name': vm_name,
+        'storage_class': get_vm_storage_class(vm_name, namespace, logger),
+        'num_disks': get_vm_disk_count(vm_name, namespace, logger),
+        'snapshot_name': f"{vm_name}-restore-{run_id}",
+        'restore_name': f"{vm_name}-restore-{run_id}",
+        'checksum': None,
+        'snapshot_sec': None,
+        'stop_sec': None,
+        'checksum_status': None,
+        'success': False,
+        'error': None,
+    }
+    for phase in RESTORE_PHASES:
+        entry[phase] = None
+
+    status = get_vm_status(vm_name, namespace, logger)
+    if status != 'Running':
+        entry['error'] = f"VM is {status or 'not found'}, not Running"
+        return entry
+
+    if not args.skip_checksum:
+        ip = get_vmi_ip(vm_name, namespace, logger)
+        entry['checksum'] = write_checksum_file(ip, args, logger) if ip else None
+        if not entry['checksum']:
+            entry['error'] = 'Failed to write the checksum file in the guest'
+            return entry
+
+    start = time.time()
+    if not create_vm_snapshot(vm_name, entry['snapshot_name'], namespace, logger):
+        entry['error'] = 'Failed to create snapshot'
+        return entry
+    if not wait_for_snapshot_ready(entry['snapshot_name'], namespace, args.snapshot_timeout,
+                                   args.poll_interval, logger):
+        entry['error'] = 'Snapshot did not become ready'
+        return entry
+    entry['snapshot_sec'] = round(time.time() - start, 2)
+
+    # Only a restore from the snapshot can bring the file back
+    if not args.skip_checksum:
+        returncode, _ = guest_command(get_vmi_ip(vm_name, namespace, logger) or '',
+                                      f"rm -f {CHECKSUM_FILE} && sync", args, logger)
+        if returncode != 0:
+            entry['error'] = 'Failed to delete the checksum file after the snapshot'
+    return entry
+
+
+def restore_vm(entry: dict, args, logger) -> dict:
+    """
+    Stop the VM, restore it from its snapshot, start it and verify the checksum.
+
+    Phase times are seconds since the restore was requested; stopping the VM
+    beforehand is timed separately as stop_sec.
+    """
+    namespace, vm_name = entry['namespace'], entry['vm_name']
+    tag = f"[{namespace}/{vm_name}]"
+
+    start = time.time()
+    if not stop_vm(vm_name, namespace, logger) or not wait_for_vm_stopped(vm_name, namespace,
+                                                                         args.vm_timeout, logger):
+        entry['error'] = 'VM did not stop'
+        return entry
+    entry['stop_sec'] = round(time.time() - start, 2)
+
+    start = time.time()
+    if not create_vm_restore(vm_name, entry['snapshot_name'], entry['restore_name'], namespace, logger):
+        entry['error'] = 'Failed to create restore'
+        return entry
+    entry['restore_created_sec'] = round(time.time() - start, 2)
+
+    if not wait_for_restore_complete(entry['restore_name'], namespace, args.restore_timeout,
+                                     args.poll_interval, logger):
+        entry['error'] = 'Restore did not complete'
+        return entry
+    entry['volumes_restored_sec'] = round(time.time() - start, 2)
+
+    if not start_vm(vm_name, namespace, logger) or not _wait_for(
+            lambda: get_vm_status(vm_name, namespace, logger) == 'Running', args.vm_timeout, args.poll_interval):
+        entry['error'] = 'Restored VM did not reach Running'
+        return entry
+    entry['running_sec'] = round(time.time() - start, 2)
+    logger.info(f"{tag} Running {entry['running_sec']:.1f}s after the restore was requested")
+
+    ip = {}
+
+    def guest_ip():
+        ip['value'] = get_vmi_ip(vm_name, namespace, logger)
+        return bool(ip['value'])
+
+    if not args.skip_ping:
+        if not _wait_for(lambda: guest_ip() and ping_vm(ip['value'], args.ssh_pod, args.ssh_pod_ns, logger),
+                         args.ping_timeout, 1):
+            entry['error'] = 'Restored VM did not answer ping'
+            return entry
+        entry['ping_sec'] = round(time.time() - start, 2)
+
+    if not args.skip_checksum:
+        checksum = {}
+
+        def read():
+            checksum['value'] = read_checksum_file(ip['value'], args, logger) if guest_ip() else None
+            return checksum['value'] is not None
+
+        if not _wait_for(read, args.ping_timeout, args.poll_interval):
+            entry['checksum_status'] = 'unreachable'
+        elif checksum['value'] == 'missing':
+            entry['checksum_status'] = 'missing'
+        else:
+            entry['checksum_status'] = 'match' if checksum['value'] == entry['checksum'] else 'mismatch'
+        if entry['checksum_status'] != 'match':
+            entry['error'] = f"Checksum verification failed: {entry['checksum_status']}"
+            return entry
+
+    entry['success'] = True
+    logger.info(f"{tag} Restored in {(entry['ping_sec'] or entry['running_sec']):.1f}s"
+                + (", checksum verified" if entry['checksum_status'] == 'match' else ""))
+    return entry
+
+
+def summarize_entries(entries: List[dict]) -> List[dict]:
+    """Snapshot and restore phase statistics of the successful restores."""
+    ok = [e for e in entries if e['success']]
+    return [dict(metric=name, **summarize_distribution([e[name] for e in ok if e[name] is not None]))
+            for name in ('snapshot_sec', 'stop_sec') + RESTORE_PHASES]
+
+
+def summarize_groups(entries: List[dict]) -> List[dict]:
+    """Phase statistics per storage class and disk count."""
+    groups = []
+    for storage_class, num_disks in sorted({(e['storage_class'], e['num_disks']) for e in entries}):
+        members = [e for e in entries if e['storage_class'] == storage_class and e['num_disks'] == num_disks]
+        groups.append({
+            'storage_class': storage_class,
+            'num_disks': num_disks,
+            'vms': len(members),
+            'successful': sum(1 for e in members if e['success']),
+            'metrics': summarize_entries(members),
+        })
+    return groups
+
+
+def print_summary(entries: List[dict], groups: List[dict], duration: float, args, logger):
+    """Print the per-phase percentiles overall and per storage class and disk count."""
+    successful = sum(1 for e in entries if e['success'])
+    logger.info("\n" + "=" * 100)
+    logger.info("SNAPSHOT RESTORE BENCHMARK REPORT")
+    logger.info("=" * 100)
+    logger.info(f"  VMs:                   {len(entries)} ({successful} restored, {len(entries) - successful} failed)")
+    logger.info(f"  Concurrency:           {args.concurrency}")
+    logger.info(f"  Test duration:         {duration:.2f}s ({duration / 60:.2f} minutes)")
+    if not args.skip_checksum:
+        statuses = [e['checksum_status'] for e in entries if e['checksum_status']]
+        logger.info(f"  Checksum verified:     {statuses.count('match')}/{len(statuses)}"
+                    + "".join(f", {statuses.count(s)} {s}" for s in ('mismatch', 'missing', 'unreachable')
+                              if statuses.count(s)))
+
+    logger.info(f"\n  {'Phase':<24} {'Count':>6} {'Avg':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'Max':>9}")
+    for m in summarize_entries(entries):
+        if m['count']:
+            logger.info(f"  {m['metric']:<24} {m['count']:>6} "
+                        + " ".join(f"{m[k]:>8.2f}s" for k in ('avg', 'p50', 'p95', 'p99', 'max')))
+
+    # End-to-end restore time per storage class and disk count
+    final = 'running_sec' if args.skip_ping else 'ping_sec'
+    logger.info(f"\n  Restore time ({final}) per storage class and disk count:")
+    for g in groups:
+        m = next(m for m in g['metrics'] if m['metric'] == final)
+        stats = (f"p50 {m['p50']:.2f}s / p95 {m['p95']:.2f}s / p99 {m['p99']:.2f}s" if m['count'] else 'N/A')
+        logger.info(f"    {g['storage_class']:<30} {g['num_disks']}-disk  {g['successful']}/{g['vms']} VMs  {stats}")
+
+    for e in entries:
+        if e['error']:
+            logger.error(f"  [{e['namespace']}/{e['vm_name']}] {e['error']}")
+    logger.info("=" * 100)
+
+
+def build_results_dir(args, num_disks: int, timestamp: Optional[str] = None) -> str:
+    """Build the canonical snapshot restore results directory."""
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d-%H%M%S")
+    disk_dir = f"{num_disks}-disk"
+    run_dir = f"{timestamp}_snapshot_restore_{args.namespace_prefix}_{args.start}-{args.end}"
+    if args.storage_driver:
+        return os.path.join(args.results_folder, args.storage_driver, disk_dir, run_dir)
+    return os.path.join(args.results_folder, disk_dir, run_dir)
+
+
+def save_restore_results(entries: List[dict], groups: List[dict], duration: float, args, logger) -> str:
+    """
+    Save per-VM results and the per-phase percentiles.
+
+    The run folder follows the standard layout,
+    results/{storage_driver}/{num_disks}-disk/{timestamp}_snapshot_restore_{prefix}_{start}-{end}/,
+    with the disk count most of the VMs have.
+
+    Returns:
+        Path to the output directory
+    """
+    disk_counts = [e['num_disks'] for e in entries]
+    out_dir = build_results_dir(args, max(set(disk_counts), key=disk_counts.count) if disk_counts else 0)
+    os.makedirs(out_dir, exist_ok=True)
+
+    fieldnames = ['namespace', 'vm_name', 'storage_class', 'num_disks', 'snapshot_name', 'restore_name',
+                  'snapshot_sec', 'stop_sec'] + list(RESTORE_PHASES) + ['checksum_status', 'success', 'error']
+    with open(os.path.join(out_dir, "snapshot_restore_results.json"), "w") as f:
+        json.dump([{k: e[k] for k in fieldnames} for e in entries], f, indent=4)
+    with open(os.path.join(out_dir, "snapshot_restore_results.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows({k: e[k] for k in fieldnames} for e in entries)
+
+    statuses = [e['checksum_status'] for e in entries if e['checksum_status']]
+    summary = {
+        "test_type": "snapshot_restore",
+        "total_vms": len(entries),
+        "successful": sum(1 for e in entries if e['success']),
+        "failed": sum(1 for e in entries if not e['success']),
+        "concurrency": args.concurrency,
+        "checksum": {s: statuses.count(s) for s in ('match', 'mismatch', 'missing', 'unreachable')}
+        if not args.skip_checksum else None,
+        "total_test_duration_sec": round(duration, 2),
+        "metrics": summarize_entries(entries),
+        "groups": groups,
+    }
+    with open(os.path.join(out_dir, "summary_snapshot_restore.json"), "w") as f:
+        json.dump(summary, f, indent=4)
+
+    stat_fields = ["metric", "avg", "max", "min", "count", "p50", "p95", "p99"]
+    with open(os.path.join(out_dir, "summary_snapshot_restore.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["storage_class", "num_disks"] + stat_fields)
+        writer.writeheader()
+        for m in summary['metrics']:
+            writer.writerow(dict(m, storage_class='all', num_disks='all'))
+        for g in groups:
+            for m in g['metrics']:
+                writer.writerow(dict(m, storage_class=g['storage_class'], num_disks=g['num_disks']))
+
+    logger.info(f"Saved snapshot restore results to {out_dir}")
+    return out_dir
+
+
+def cleanup(entries: List[dict], args, logger):
+    """Delete the restore objects and snapshots; the VMs keep running on the restored volumes."""
+    def delete(entry):
+        delete_vm_restore(entry['restore_name'], entry['namespace'], logger)
+        delete_vm_snapshot(entry['snapshot_name'], entry['namespace'], logger)
+
+    logger.info(f"Deleting {len(entries)} restores and snapshots")
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(delete, entries))
+
+
+def main():
+    """Main function."""
+    args = parse_args()
+    logger = setup_logging(args.log_file, args.log_level)
+
+    if not (args.skip_ping and args.skip_checksum):
+        if not validate_prerequisites(args.ssh_pod, args.ssh_pod_ns, logger):
+            sys.exit(1)
+
+    namespaces = [f"{args.namespace_prefix}-{i}" for i in range(args.start, args.end + 1)]
+    run_id = datetime.now().strftime("%Y%m%d%H%M%S")
+    start_time = time.time()
+
+    logger.info(f"Snapshotting {len(namespaces)} VMs ({args.concurrency} at a time)")
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        entries = list(executor.map(lambda ns: prepare_vm(ns, run_id, args, logger), namespaces))
+    ready = [e for e in entries if not e['error']]
+    for e in entries:
+        if e['error']:
+            logger.error(f"[{e['namespace']}/{e['vm_name']}] {e['error']}, not restored")
+
+    logger.info(f"Restoring {len(ready)} VMs ({args.concurrency} at a time)")
+    restore_start = time.time()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(lambda e: restore_vm(e, args, logger), ready))
+    logger.info(f"Restore phase finished in {time.time() - restore_start:.1f}s")
+
+    duration = time.time() - start_time
+    groups = summarize_groups(entries)
+    print_summary(entries, groups, duration, args, logger)
+
+    if args.save_results:
+        save_restore_results(entries, groups, duration, args, logger)
+
+    if args.cleanup:
+        cleanup([e for e in entries if e['snapshot_sec'] is not None], args, logger)
+
+    sys.exit(0 if all(e['success'] for e in entries) else 1)
+
+
+if __name__ == '__main__':
+    main()
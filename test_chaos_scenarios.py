@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for chaos benchmark scenario validation and --skip-* dependency handling.
+"""
+
+import importlib.util
+import logging
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'chaos-benchmark', 'measure-chaos.py')
+_spec = importlib.util.spec_from_file_location('measure_chaos', _SCRIPT)
+chaos = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(chaos)
+
+
+def test_defaults_chain_operations():
+    """Without depends_on every operation depends on the one before it."""
+    ops = chaos.normalize_operations([
+        {'type': 'create-vm'},
+        {'type': 'resize-volumes'},
+        {'type': 'snapshot-vm', 'name': 'snap', 'depends_on': 'create-vm', 'count': 2},
+        {'type': 'restart-vm', 'depends_on': []},
+    ])
+    assert [op['depends_on'] for op in ops] == [[], ['create-vm'], ['create-vm'], []]
+    assert ops[2]['name'] == 'snap'
+    assert ops[2]['count'] == 2
+    assert ops[0]['on_failure'] == 'abort'
+    assert ops[0]['retries'] == 0
+    assert ops[0]['params'] == {}
+
+
+@pytest.mark.parametrize('operations, message', [
+    ([], 'no operations'),
+    ([{'name': 'x'}], 'needs a type'),
+    ([{'type': 'migrate-vm'}], "unknown type 'migrate-vm'"),
+    ([{'type': 'create-vm'}, {'type': 'create-vm'}], "duplicate operation name 'create-vm'"),
+    ([{'type': 'create-vm', 'depends_on': ['snapshot-vm']}, {'type': 'snapshot-vm'}], 'must be listed before it'),
+    ([{'type': 'create-vm', 'on_failure': 'ignore'}], 'on_failure must be one of'),
+    ([{'type': 'create-vm', 'count': 0}], 'count must be a positive integer'),
+    ([{'type': 'create-vm', 'concurrency': '4'}], 'concurrency must be a positive integer'),
+    ([{'type': 'create-vm', 'retries': -1}], 'retries must be >= 0'),
+    ([{'type': 'create-vm', 'count': 2}], 'count is not supported on create-vm'),
+])
+def test_invalid_scenarios(operations, message):
+    """Invalid scenarios are rejected with a message naming the problem."""
+    with pytest.raises(ValueError, match=message):
+        chaos.normalize_operations(operations)
+
+
+def test_skip_inherits_dependencies():
+    """Skipping resize and clone makes restart depend on create directly."""
+    ops = chaos.default_scenario(SimpleNamespace(max_create_retries=5))
+    assert ops[0]['retries'] == 4
+    kept = chaos.drop_operations(ops, ['resize-volumes', 'clone-volumes'])
+    assert [(op['name'], op['depends_on']) for op in kept] == [
+        ('create-vm', []),
+        ('restart-vm', ['create-vm']),
+        ('snapshot-vm', ['restart-vm']),
+    ]
+
+
+def test_skip_fan_in_deduplicates_dependencies():
+    """A join over two dropped branches depends on their common parent once."""
+    ops = chaos.normalize_operations([
+        {'type': 'create-vm'},
+        {'type': 'resize-volumes', 'depends_on': ['create-vm']},
+        {'type': 'clone-volumes', 'depends_on': ['create-vm']},
+        {'type': 'snapshot-vm', 'depends_on': ['resize-volumes', 'clone-volumes']},
+    ])
+    kept = chaos.drop_operations(ops, ['resize-volumes', 'clone-volumes'])
+    assert kept[-1]['depends_on'] == ['create-vm']
+
+
+def test_run_operation_records_own_end_times(monkeypatch):
+    """Each VM's duration ends when its own operation ends, not when a slower VM listed before it does."""
+    delays = {'vm-1': 0.3, 'vm-2': 0.02}
+
+    def slow_start(vm_name, op, ctx):
+        time.sleep(delays[vm_name])
+        return True, None
+
+    monkeypatch.setitem(chaos.OPERATION_TYPES, 'restart-vm',
+                        dict(chaos.OPERATION_TYPES['restart-vm'], start=slow_start, wait=None))
+    op = chaos.normalize_operations([{'type': 'restart-vm'}])[0]
+    ctx = {'iteration': 1, 'namespaces': ['ns'], 'storage_class': 'sc',
+           'args': SimpleNamespace(concurrency=2), 'logger': logging.getLogger(__name__)}
+    records = []
+    passed, failed = chaos.run_operation(op, ['vm-1', 'vm-2'], ctx, records)
+    assert passed == ['vm-1', 'vm-2'] and not failed
+    durations = {r['vm']: r['duration_sec'] for r in records}
+    assert durations['vm-1'] >= 0.3
+    assert durations['vm-2'] < 0.2
+
+
+def test_count_passes_untouched_vms(monkeypatch):
+    """count: N runs the operation on the first N VMs; the others pass it unchanged."""
+    ran = []
+
+    def start(vm_name, op, ctx):
+        ran.append(vm_name)
+        return vm_name != 'vm-2', 'failed'
+
+    monkeypatch.setitem(chaos.OPERATION_TYPES, 'snapshot-vm',
+                        dict(chaos.OPERATION_TYPES['snapshot-vm'], start=start, wait=None))
+    op = chaos.normalize_operations([{'type': 'snapshot-vm', 'count': 2, 'on_failure': 'continue'}])[0]
+    ctx = {'iteration': 1, 'namespaces': ['ns'], 'storage_class': 'sc',
+           'args': SimpleNamespace(concurrency=2), 'logger': logging.getLogger(__name__)}
+    records = []
+    passed, failed = chaos.run_operation(op, ['vm-1', 'vm-2', 'vm-3', 'vm-4'], ctx, records)
+    assert sorted(ran) == ['vm-1', 'vm-2']
+    assert passed == ['vm-1', 'vm-3', 'vm-4']
+    assert list(failed) == ['vm-2']
+    assert [r['vm'] for r in records] == ['vm-1', 'vm-2']
+
+
+def test_volume_operations_share_ctx_slots(monkeypatch):
+    """PVCs run in parallel up to the tracker's slots and each leaves a record in ctx['volumes']."""
+    monkeypatch.setattr(chaos, 'get_vm_volume_names', lambda vm_name, namespace, logger: ['pvc-a', 'pvc-b', 'pvc-c'])
+    lock = threading.Lock()
+    running, peak = [0], [0]
+
+    def resize(pvc_name, namespace):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return pvc_name != 'pvc-b', 'too small'
+
+    op = chaos.normalize_operations([{'type': 'resize-volumes'}])[0]
+    ctx = {'iteration': 1, 'namespaces': ['ns'], 'storage_class': 'sc', 'args': SimpleNamespace(),
+           'logger': logging.getLogger(__name__), 'volumes': chaos.new_volume_tracker(2)}
+    assert chaos.run_volume_operations('vm-1', op, ctx, resize) == (False, 'too small')
+    assert peak[0] == 2
+    records = sorted(ctx['volumes']['records'], key=lambda r: r['pvc'])
+    assert [(r['pvc'], r['success']) for r in records] == [('pvc-a', True), ('pvc-b', False), ('pvc-c', True)]
+
+
+def test_find_test_namespaces_matches_every_shard(monkeypatch):
+    """Cleanup finds the namespace and its numbered shards, not namespaces that only share the prefix."""
+    names = 'default bench-10 bench bench-2 bench-x benchmark bench-1 other-bench-1'
+    monkeypatch.setattr(chaos, 'run_kubectl_command', lambda *a, **kw: (0, names, ''))
+    assert chaos.find_test_namespaces('bench', logging.getLogger(__name__)) == \
+        ['bench', 'bench-1', 'bench-2', 'bench-10']
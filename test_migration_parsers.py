@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tests for the migration benchmark's pure helpers: the USL fit of the
+concurrency sweep, ping downtime parsing, virsh domjobinfo parsing and the
+shared distribution summary.
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from utils.common import (
+    fit_usl, usl_throughput, parse_ping_downtime, parse_domjobinfo, summarize_distribution
+)
+
+
+def _usl(levels, lam, sigma, kappa):
+    """Throughputs the USL gives for the given coefficients."""
+    return [lam * n / (1 + sigma * (n - 1) + kappa * n * (n - 1)) for n in levels]
+
+
+def test_fit_usl_round_trip():
+    """Exact USL data gives back its coefficients and the throughput peak."""
+    levels = [1, 2, 4, 8, 16, 32]
+    fit = fit_usl(levels, _usl(levels, 10.0, 0.1, 0.01))
+    assert abs(fit['sigma'] - 0.1) < 1e-4
+    assert abs(fit['kappa'] - 0.01) < 1e-4
+    assert fit['lambda'] == 10.0
+    # N* = sqrt((1 - sigma) / kappa) = sqrt(90) ~ 9.5
+    assert fit['optimal_concurrency'] in (9, 10)
+    assert fit['peak_throughput'] == round(usl_throughput(fit['optimal_concurrency'], fit), 4)
+    assert fit['r_squared'] == 1.0
+
+
+def test_fit_usl_clamps_negative_kappa():
+    """Super-linear tails clamp kappa to 0: no optimum, peak is the Amdahl limit."""
+    levels = [1, 2, 4, 8, 16]
+    fit = fit_usl(levels, _usl(levels, 5.0, 0.2, -0.001))
+    assert fit['kappa'] == 0.0
+    assert 0.0 < fit['sigma'] <= 1.0
+    assert fit['optimal_concurrency'] is None
+    assert fit['peak_throughput'] == round(5.0 / fit['sigma'], 4)
+
+
+def test_fit_usl_needs_level_one():
+    """Without a level-1 measurement (or with too few levels) there is no fit."""
+    assert fit_usl([2, 4, 8], [1.8, 3.0, 4.2]) is None
+    assert fit_usl([1, 2], [0.0, 1.5]) is None
+    assert fit_usl([1], [1.0]) is None
+
+
+PING_HEADER = "PING 10.0.0.5 (10.0.0.5) 56(84) bytes of data.\n"
+
+
+def _ping_output(seqs, sent, interval=0.1, start=1700000000.0):
+    """ping -D output with replies for the given sequence numbers."""
+    lines = [f"[{start + (seq - 1) * interval:.6f}] 64 bytes from 10.0.0.5: icmp_seq={seq % 65536} ttl=64 time=0.321 ms"
+             for seq in seqs]
+    summary = (f"\n--- 10.0.0.5 ping statistics ---\n"
+               f"{sent} packets transmitted, {len(seqs)} received, "
+               f"{(sent - len(seqs)) * 100 // sent}% packet loss, time 1900ms\n")
+    return PING_HEADER + "\n".join(lines) + summary
+
+
+def test_parse_ping_downtime_gap():
+    """The blackout is the longest gap between replies."""
+    seqs = list(range(1, 6)) + list(range(11, 21))
+    result = parse_ping_downtime(_ping_output(seqs, 20), 0.1)
+    assert result['packets_sent'] == 20
+    assert result['packets_received'] == 15
+    assert result['packets_lost'] == 5
+    assert result['packet_loss_pct'] == 25.0
+    assert result['downtime_sec'] == 0.6
+    assert result['lost_time_sec'] == 0.5
+
+
+def test_parse_ping_downtime_tail_and_duplicates():
+    """Unanswered packets after the last reply count; duplicate replies do not."""
+    output = _ping_output(list(range(1, 11)), 20)
+    output = output.replace("icmp_seq=3 ttl=64 time=0.321 ms",
+                            "icmp_seq=3 ttl=64 time=0.321 ms\n"
+                            "[1700000000.250000] 64 bytes from 10.0.0.5: icmp_seq=3 ttl=64 time=0.4 ms (DUP!)")
+    result = parse_ping_downtime(output, 0.1)
+    assert result['packets_received'] == 10
+    assert result['downtime_sec'] == 1.0
+
+
+def test_parse_ping_downtime_seq_wrap():
+    """icmp_seq wraps at 65536; gaps across the wrap, even long ones, are measured from the real packets."""
+    seqs = list(range(1, 65530)) + list(range(65541, 70001))
+    result = parse_ping_downtime(_ping_output(seqs, 70000, 0.01), 0.01)
+    assert result['packets_received'] == len(seqs)
+    assert result['downtime_sec'] == 0.12
+    assert result['lost_time_sec'] == 0.11
+
+    seqs = list(range(1, 101)) + list(range(40101, 70001))
+    result = parse_ping_downtime(_ping_output(seqs, 70000, 0.01), 0.01)
+    assert result['downtime_sec'] == 400.01
+
+
+def test_parse_ping_downtime_no_reply():
+    """No reply at all means no measurement."""
+    assert parse_ping_downtime(PING_HEADER + "\n--- 10.0.0.5 ping statistics ---\n"
+                               "10 packets transmitted, 0 received, 100% packet loss, time 900ms\n", 0.1) is None
+
+
+DOMJOBINFO_RUNNING = """Job type:         Unbounded
+Operation:        Outgoing migration
+Time elapsed:     12057        ms
+Data processed:   1.203 GiB
+Data remaining:   512.000 MiB
+Data total:       4.016 GiB
+Memory processed: 1.203 GiB
+Memory remaining: 512.000 MiB
+Memory total:     4.016 GiB
+Memory bandwidth: 102.142 MiB/s
+Dirty rate:       2500         pages/s
+Page size:        4096         bytes
+Iteration:        3
+Postcopy requests: 0
+Constant pages:   500000
+Normal pages:     300000
+Normal data:      1.144 GiB
+Expected downtime: 300          ms
+Setup time:       12           ms
+"""
+
+DOMJOBINFO_COMPLETED = """Job type:         Completed
+Operation:        Outgoing migration
+Time elapsed:     18412        ms
+Time elapsed w/o network: 18405        ms
+Data processed:   4.221 GiB
+Data remaining:   0.000 B
+Data total:       4.016 GiB
+Memory bandwidth: 98.500 MiB/s
+Iteration:        6
+Total downtime:   87           ms
+Downtime w/o network: 80           ms
+"""
+
+
+def test_parse_domjobinfo_running():
+    """Sizes are converted to MiB and the dirty rate from pages/s to MiB/s."""
+    stats = parse_domjobinfo(DOMJOBINFO_RUNNING)
+    assert stats['data_processed_mib'] == 1231.87
+    assert stats['data_remaining_mib'] == 512.0
+    assert stats['data_total_mib'] == 4112.38
+    assert stats['memory_bandwidth_mibps'] == 102.14
+    assert stats['dirty_rate_mibps'] == 9.77
+    assert stats['iterations'] == 3
+    assert stats['postcopy_requests'] == 0
+    assert 'downtime_ms' not in stats
+
+
+def test_parse_domjobinfo_completed():
+    """A completed job reports its total downtime; missing fields are left out."""
+    stats = parse_domjobinfo(DOMJOBINFO_COMPLETED)
+    assert stats['data_remaining_mib'] == 0.0
+    assert stats['iterations'] == 6
+    assert stats['downtime_ms'] == 87.0
+    assert 'dirty_rate_mibps' not in stats
+    assert 'postcopy_requests' not in stats
+    assert parse_domjobinfo("") == {}
+
+
+def test_summarize_distribution():
+    """Statistics are rounded to the requested digits; an empty list keeps only the count."""
+    summary = summarize_distribution([1.0, 2.0, 4.0], 3)
+    assert summary == {'avg': 2.333, 'min': 1.0, 'max': 4.0, 'count': 3,
+                       'p50': 2.0, 'p95': summary['p95'], 'p99': summary['p99']}
+    assert 2.0 < summary['p95'] <= summary['p99'] <= 4.0
+    assert summarize_distribution([]) == {'avg': None, 'min': None, 'max': None, 'count': 0,
+                                          'p50': None, 'p95': None, 'p99': None}
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for rendering VM templates under packed VM names (--vms-per-namespace).
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from utils.common import render_packed_vm_yaml
+
+TEMPLATES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'examples', 'vm-templates')
+
+
+def test_render_placeholder_template():
+    """{{VM_NAME}} templates are renamed, other placeholders are left alone."""
+    content = render_packed_vm_yaml(os.path.join(TEMPLATES, 'vm-template.yaml'), 'rhel-9-vm-3')
+    assert content is not None
+    assert '  name: rhel-9-vm-3\n' in content
+    assert 'name: rhel-9-vm-3-volume' in content
+    assert 'name: {{VM_NAME}}' not in content
+    assert '{{DATASOURCE_NAME}}' in content
+
+
+def test_render_placeholder_fio_template():
+    """Every dataVolumeTemplate of the FIO template follows the VM rename."""
+    content = render_packed_vm_yaml(os.path.join(TEMPLATES, 'fio-vm-template.yaml'), 'fio-vm-2')
+    assert content is not None
+    assert 'name: fio-vm-2-rootdisk' in content
+    assert 'name: fio-vm-2-scratch' in content
+    assert 'name: {{VM_NAME}}' not in content
+
+
+def test_render_literal_template():
+    """The default template's literal VM name is renamed; unrelated names are kept."""
+    content = render_packed_vm_yaml(os.path.join(TEMPLATES, 'rhel9-vm-datasource.yaml'), 'rhel-9-vm-2')
+    assert content is not None
+    assert '  name: rhel-9-vm-2\n' in content
+    assert 'name: rhel-9-vm-2-volume' in content
+    assert 'name: rhel9\n' in content
+    assert 'name: rootdisk' in content
+
+
+def test_render_with_node_selector():
+    """Pinning to a node adds the hostname nodeSelector to the renamed VM."""
+    content = render_packed_vm_yaml(os.path.join(TEMPLATES, 'rhel9-vm-datasource.yaml'), 'rhel-9-vm-2',
+                                    node_name='worker-1')
+    assert content is not None
+    assert 'kubernetes.io/hostname: worker-1' in content
+    assert '  name: rhel-9-vm-2\n' in content
+
+
+if __name__ == "__main__":
+    test_render_placeholder_template()
+    test_render_placeholder_fio_template()
+    test_render_literal_template()
+    test_render_with_node_selector()
+    print("All packed VM YAML tests passed")
@@ -8,13 +8,15 @@ kubectl command execution, and common helper functions.
 
 import json
 import logging
+import math
 import shlex
 import subprocess
 import sys
+import threading
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict
 import csv
 
 # Minimum required Python version
@@ -179,6 +181,21 @@ def setup_logging(log_file: Optional[str] = None, log_level: str = 'INFO') -> lo
     return logger
 
 
+_kubectl_calls = {'count': 0}
+_kubectl_calls_lock = threading.Lock()
+
+
+def count_kubectl_call() -> None:
+    """Count one kubectl invocation; for commands run without run_kubectl_command."""
+    with _kubectl_calls_lock:
+        _kubectl_calls['count'] += 1
+
+
+def get_kubectl_call_count() -> int:
+    """Number of kubectl commands this process has run so far."""
+    return _kubectl_calls['count']
+
+
 def run_kubectl_command(
     args: List[str],
     check: bool = True,
@@ -204,6 +221,7 @@ def run_kubectl_command(
         subprocess.TimeoutExpired: If command exceeds timeout
     """
     cmd = ['kubectl'] + args
+    count_kubectl_call()
 
     if logger:
         logger.debug(f"Executing: {' '.join(cmd)}")
@@ -604,10 +622,222 @@ def cleanup_namespace_resources(namespace: str, vm_name: Optional[str] = None,
     return stats
 
 
+# Labels of the pre-warmed namespace pool (see utils/namespace_pool.py)
+NAMESPACE_POOL_LABEL = 'virtbench.io/namespace-pool'
+NAMESPACE_LEASE_LABEL = 'virtbench.io/leased-by'
+
+
+def _chunks(items: List[str], size: int) -> List[List[str]]:
+    """Split a list into consecutive chunks of at most *size* items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def namespace_lease_owner(name: str) -> str:
+    """
+    Turn a run name (e.g. its results folder) into a valid label value for leasing.
+
+    Args:
+        name: Run name
+
+    Returns:
+        Label value of at most 63 characters
+    """
+    import re
+
+    value = re.sub(r'[^A-Za-z0-9_.-]', '-', os.path.basename(os.path.normpath(name)))
+    value = value[-63:].strip('-_.')
+    return value or 'virtbench'
+
+
+def list_namespace_pool(pool: str, logger: Optional[logging.Logger] = None) -> Optional[Dict[str, Optional[str]]]:
+    """
+    List the namespaces of a pool with one kubectl call.
+
+    Args:
+        pool: Pool name
+        logger: Logger instance
+
+    Returns:
+        Dict mapping namespace to its lease owner (None when free), or None on error
+    """
+    returncode, stdout, stderr = run_kubectl_command(
+        ['get', 'namespace', '-l', f'{NAMESPACE_POOL_LABEL}={pool}', '-o', 'json'],
+        check=False,
+        logger=logger
+    )
+    if returncode != 0:
+        if logger:
+            logger.error(f"Failed to list namespace pool '{pool}': {stderr.strip()}")
+        return None
+
+    members = {}
+    for item in json.loads(stdout).get('items', []):
+        metadata = item.get('metadata', {})
+        if item.get('status', {}).get('phase') == 'Terminating':
+            continue
+        members[metadata['name']] = metadata.get('labels', {}).get(NAMESPACE_LEASE_LABEL)
+    return members
+
+
+def fill_namespace_pool(pool: str, namespaces: List[str], secret_yaml: Optional[str] = None,
+                        manifests: Optional[List[str]] = None, batch_size: int = 20,
+                        logger: Optional[logging.Logger] = None) -> List[str]:
+    """
+    Create and provision pool namespaces ahead of (and outside) any measured run.
+
+    Each namespace is created if missing, gets the cloud-init secret and any extra
+    manifests (RBAC, quotas, ...) applied, and only then joins the pool.
+
+    Args:
+        pool: Pool name
+        namespaces: Namespace names
+        secret_yaml: Optional secret YAML applied into every namespace
+        manifests: Optional extra YAML files applied into every namespace
+        batch_size: Number of namespaces to provision in parallel
+        logger: Logger instance
+
+    Returns:
+        List of namespaces that are ready in the pool
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    files = ([secret_yaml] if secret_yaml else []) + list(manifests or [])
+
+    def provision(ns: str) -> bool:
+        if not create_namespace(ns, logger):
+            return False
+        for path in files:
+            returncode, _, stderr = run_kubectl_command(['apply', '-f', path, '-n', ns], check=False, logger=logger)
+            if returncode != 0:
+                if logger:
+                    logger.error(f"[{ns}] Failed to apply {path}: {stderr.strip()}")
+                return False
+        return True
+
+    if logger:
+        logger.info(f"Provisioning {len(namespaces)} namespaces for pool '{pool}' "
+                    f"({len(files)} manifest(s) each)...")
+
+    ready = []
+    with ThreadPoolExecutor(max_workers=batch_size) as executor:
+        futures = {executor.submit(provision, ns): ns for ns in namespaces}
+        for future in as_completed(futures):
+            ns = futures[future]
+            try:
+                if future.result():
+                    ready.append(ns)
+            except Exception as e:
+                if logger:
+                    logger.error(f"[{ns}] Exception provisioning pool namespace: {e}")
+
+    # Join the pool only once fully provisioned
+    ready.sort()
+    joined = []
+    for chunk in _chunks(ready, 100):
+        returncode, _, stderr = run_kubectl_command(
+            ['label', 'namespace'] + chunk + [f'{NAMESPACE_POOL_LABEL}={pool}', '--overwrite'],
+            check=False,
+            logger=logger
+        )
+        if returncode == 0:
+            joined.extend(chunk)
+        elif logger:
+            logger.error(f"Failed to label pool namespaces: {stderr.strip()}")
+
+    if logger:
+        logger.info(f"Namespace pool '{pool}': {len(joined)}/{len(namespaces)} namespaces ready")
+    return joined
+
+
+def lease_pool_namespaces(pool: str, namespaces: List[str], owner: str,
+                          logger: Optional[logging.Logger] = None) -> bool:
+    """
+    Lease namespaces from a pool for one run.
+
+    Leasing labels each namespace with its owner. The label is set without
+    --overwrite, so two runs can never lease the same namespace; namespaces
+    already leased by the same owner (e.g. a resumed run) are kept.
+
+    Args:
+        pool: Pool name
+        namespaces: Namespaces the run needs
+        owner: Lease owner (see namespace_lease_owner)
+        logger: Logger instance
+
+    Returns:
+        True if every namespace is leased by *owner*, False otherwise (nothing stays leased)
+    """
+    members = list_namespace_pool(pool, logger)
+    if members is None:
+        return False
+
+    missing = [ns for ns in namespaces if ns not in members]
+    busy = [ns for ns in namespaces if members.get(ns) not in (None, owner)]
+    if missing or busy:
+        if logger:
+            if missing:
+                logger.error(f"{len(missing)} namespaces are not in pool '{pool}' (first: {missing[0]}). "
+                             f"Fill the pool with: virtbench namespace-pool fill --pool {pool}")
+            if busy:
+                logger.error(f"{len(busy)} namespaces are leased by another run "
+                             f"(first: {busy[0]} by {members[busy[0]]})")
+        return False
+
+    free = [ns for ns in namespaces if members[ns] is None]
+    for chunk in _chunks(free, 100):
+        run_kubectl_command(
+            ['label', 'namespace'] + chunk + [f'{NAMESPACE_LEASE_LABEL}={owner}'],
+            check=False,
+            logger=logger
+        )
+
+    # Labelling without --overwrite only loses races; check who won
+    members = list_namespace_pool(pool, logger) or {}
+    lost = [ns for ns in namespaces if members.get(ns) != owner]
+    if lost:
+        if logger:
+            logger.error(f"Lost the lease on {len(lost)} namespaces to a concurrent run")
+        release_pool_namespaces(pool, [ns for ns in free if ns not in lost], logger=logger)
+        return False
+
+    if logger:
+        logger.info(f"Leased {len(namespaces)} namespaces from pool '{pool}' as {owner}")
+    return True
+
+
+def release_pool_namespaces(pool: str, namespaces: List[str], logger: Optional[logging.Logger] = None) -> List[str]:
+    """
+    Return leased namespaces to their pool (their resources must already be wiped).
+
+    Args:
+        pool: Pool name
+        namespaces: Namespace names
+        logger: Logger instance
+
+    Returns:
+        List of namespaces released
+    """
+    released = []
+    for chunk in _chunks(sorted(namespaces), 100):
+        returncode, _, stderr = run_kubectl_command(
+            ['label', 'namespace'] + chunk + [f'{NAMESPACE_LEASE_LABEL}-'],
+            check=False,
+            logger=logger
+        )
+        if returncode == 0:
+            released.extend(chunk)
+        elif logger:
+            logger.error(f"Failed to release namespaces to pool '{pool}': {stderr.strip()}")
+    if logger:
+        logger.info(f"Released {len(released)} namespaces to pool '{pool}'")
+    return released
+
+
 def cleanup_test_namespaces(namespace_prefix: str, start: int, end: int,
                            vm_name: Optional[str] = None, delete_namespaces: bool = True,
                            dry_run: bool = False, batch_size: int = 20,
-                           logger: Optional[logging.Logger] = None) -> dict:
+                           logger: Optional[logging.Logger] = None,
+                           vms_per_namespace: int = 1, namespace_pool: Optional[str] = None) -> dict:
     """
     Clean up all test resources across multiple namespaces.
 
@@ -620,6 +850,8 @@ def cleanup_test_namespaces(namespace_prefix: str, start: int, end: int,
         dry_run: If True, only show what would be deleted
         batch_size: Number of namespaces to process in parallel
         logger: Logger instance
+        vms_per_namespace: VMs per namespace; packed namespaces have every VM deleted
+        namespace_pool: If set, namespaces are wiped and released to this pool instead of deleted
 
     Returns:
         Dictionary with overall cleanup statistics
@@ -627,6 +859,9 @@ def cleanup_test_namespaces(namespace_prefix: str, start: int, end: int,
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
     namespaces = [f"{namespace_prefix}-{i}" for i in range(start, end + 1)]
+    if vms_per_namespace > 1:
+        # Packed namespaces hold {vm_name}-1 .. {vm_name}-M
+        vm_name = None
 
     if logger:
         logger.info(f"{'[DRY RUN] ' if dry_run else ''}Cleaning up {len(namespaces)} namespaces...")
@@ -634,6 +869,7 @@ def cleanup_test_namespaces(namespace_prefix: str, start: int, end: int,
     overall_stats = {
         'namespaces_processed': 0,
         'namespaces_deleted': 0,
+        'namespaces_released': 0,
         'total_vms_deleted': 0,
         'total_dvs_deleted': 0,
         'total_pvcs_deleted': 0,
@@ -663,6 +899,16 @@ def cleanup_test_namespaces(namespace_prefix: str, start: int, end: int,
                     logger.error(f"Exception cleaning namespace {ns}: {e}")
                 overall_stats['total_errors'] += 1
 
+    # Pool namespaces are kept (with their secrets) and handed back to the pool
+    if namespace_pool:
+        if dry_run:
+            if logger:
+                logger.info(f"[DRY RUN] Would release {len(namespaces)} namespaces to pool '{namespace_pool}'")
+        else:
+            overall_stats['namespaces_released'] = len(
+                release_pool_namespaces(namespace_pool, namespaces, logger=logger))
+        return overall_stats
+
     # Delete namespaces if requested
     if delete_namespaces and not dry_run:
         if logger:
@@ -678,6 +924,34 @@ def cleanup_test_namespaces(namespace_prefix: str, start: int, end: int,
     return overall_stats
 
 
+def wait_for_namespaces_deleted(namespaces: List[str], timeout: int = 600, poll_interval: int = 5,
+                                logger: Optional[logging.Logger] = None) -> bool:
+    """
+    Wait until a set of namespaces has been fully deleted.
+
+    Args:
+        namespaces: Namespace names
+        timeout: Maximum time to wait in seconds
+        poll_interval: Seconds between checks
+        logger: Logger instance
+
+    Returns:
+        True if all namespaces are gone, False on timeout
+    """
+    pending = set(namespaces)
+    deadline = time.time() + timeout
+    while pending and time.time() < deadline:
+        pending = {ns for ns in pending if namespace_exists(ns, logger)}
+        if pending:
+            if logger:
+                logger.info(f"Waiting for {len(pending)} namespaces to finish terminating...")
+            time.sleep(poll_interval)
+
+    if pending and logger:
+        logger.warning(f"Timeout waiting for {len(pending)} namespaces to be deleted")
+    return not pending
+
+
 def remove_far_annotation(vm_name: str, namespace: str, logger: Optional[logging.Logger] = None) -> bool:
     """
     Remove FAR (Fence Agents Remediation) annotation from a VM.
@@ -802,6 +1076,7 @@ CLEANUP SUMMARY
 {'=' * 80}
   Namespaces Processed:        {stats.get('namespaces_processed', 0)}
   Namespaces Deleted:          {stats.get('namespaces_deleted', 0)}
+  Namespaces Released to Pool: {stats.get('namespaces_released', 0)}
   VMs Deleted:                 {stats.get('total_vms_deleted', 0)}
   DataVolumes Deleted:         {stats.get('total_dvs_deleted', 0)}
   PVCs Deleted:                {stats.get('total_pvcs_deleted', 0)}
@@ -816,6 +1091,86 @@ CLEANUP SUMMARY
         print(message)
 
 
+def parse_k8s_timestamp(timestamp: Optional[str]) -> Optional[datetime]:
+    """
+    Convert a Kubernetes RFC 3339 timestamp into a naive local datetime.
+
+    The benchmarks measure elapsed time against datetime.now(), so cluster
+    timestamps are converted to the same local, timezone-naive representation.
+
+    Args:
+        timestamp: Timestamp string such as '2024-01-15T10:30:00Z'
+
+    Returns:
+        Local naive datetime, or None if the timestamp is missing or invalid
+    """
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).astimezone().replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def get_vm_creation_timestamp(vm_name: str, namespace: str,
+                              logger: Optional[logging.Logger] = None) -> Optional[datetime]:
+    """
+    Get the creation time of a VM from the cluster.
+
+    Args:
+        vm_name: VM name
+        namespace: Namespace
+        logger: Logger instance
+
+    Returns:
+        Local naive datetime of metadata.creationTimestamp, or None if the VM does not exist
+    """
+    try:
+        returncode, stdout, _ = run_kubectl_command(
+            ['get', 'vm', vm_name, '-n', namespace, '-o', 'jsonpath={.metadata.creationTimestamp}'],
+            check=False,
+            logger=logger
+        )
+        if returncode == 0:
+            return parse_k8s_timestamp(stdout.strip())
+        return None
+    except Exception as e:
+        if logger:
+            logger.debug(f"Error getting creation time for VM {vm_name} in {namespace}: {e}")
+        return None
+
+
+def get_vmi_phase_transition_time(vmi_name: str, namespace: str, phase: str,
+                                  logger: Optional[logging.Logger] = None) -> Optional[datetime]:
+    """
+    Get the time a VMI entered a phase from status.phaseTransitionTimestamps.
+
+    Args:
+        vmi_name: VMI name
+        namespace: Namespace
+        phase: VMI phase (e.g., 'Running')
+        logger: Logger instance
+
+    Returns:
+        Local naive datetime of the transition, or None if not recorded
+    """
+    try:
+        returncode, stdout, _ = run_kubectl_command(
+            ['get', 'vmi', vmi_name, '-n', namespace, '-o', 'jsonpath={.status.phaseTransitionTimestamps}'],
+            check=False,
+            logger=logger
+        )
+        if returncode != 0 or not stdout.strip():
+            return None
+        transitions = json.loads(stdout.strip())
+        matches = [t.get('phaseTransitionTimestamp') for t in transitions if t.get('phase') == phase]
+        return parse_k8s_timestamp(matches[-1]) if matches else None
+    except Exception as e:
+        if logger:
+            logger.debug(f"Error getting {phase} transition time for VMI {vmi_name} in {namespace}: {e}")
+        return None
+
+
 def get_vm_status(vm_name: str, namespace: str, logger: Optional[logging.Logger] = None) -> Optional[str]:
     """
     Get the status of a VM.
@@ -935,99 +1290,1061 @@ def get_pvc_status(namespace: str, logger: Optional[logging.Logger] = None) -> s
         return "Error"
 
 
-def ssh_exec_command(ip: str, command: str, ssh_pod: str, ssh_pod_ns: str,
-                     vm_user: str, vm_password: str,
-                     logger: Optional[logging.Logger] = None,
-                     timeout: int = 30) -> Tuple[int, str, str]:
+def parse_storage_quantity_gib(quantity: Optional[str]) -> Optional[float]:
     """
-    Execute a command on a VM via SSH through an existing helper pod.
-
-    Uses sshpass for password authentication. Disables strict host-key checking
-    and pubkey auth so it works against freshly-deployed VMs.
+    Convert a Kubernetes storage quantity (e.g. '30Gi', '500Mi', '32212254720') to GiB.
 
     Args:
-        ip: VM IP address
-        command: Shell command to run on the VM
-        ssh_pod: SSH helper pod name
-        ssh_pod_ns: SSH helper pod namespace
-        vm_user: VM SSH user
-        vm_password: VM SSH password
-        logger: Logger instance
-        timeout: Command timeout in seconds
+        quantity: Quantity string as found in a PVC or DataVolume spec
 
     Returns:
-        Tuple of (return_code, stdout, stderr)
+        Size in GiB, or None if the quantity cannot be parsed
     """
-    ssh_cmd = (
-        f"sshpass -p '{vm_password}' ssh -o StrictHostKeyChecking=no "
-        f"-o UserKnownHostsFile=/dev/null -o ConnectTimeout=10 "
-        f"-o PreferredAuthentications=password -o PubkeyAuthentication=no "
-        f"{vm_user}@{ip} '{command}'"
-    )
-    return run_kubectl_command(
-        ['exec', '-n', ssh_pod_ns, ssh_pod, '--', 'sh', '-c', ssh_cmd],
-        check=False,
-        timeout=timeout,
-        logger=logger
-    )
+    if not quantity:
+        return None
 
+    units = {
+        'Ki': 1024, 'Mi': 1024 ** 2, 'Gi': 1024 ** 3, 'Ti': 1024 ** 4, 'Pi': 1024 ** 5,
+        'K': 1000, 'k': 1000, 'M': 1000 ** 2, 'G': 1000 ** 3, 'T': 1000 ** 4, 'P': 1000 ** 5,
+    }
+    quantity = quantity.strip()
+    try:
+        for suffix in sorted(units, key=len, reverse=True):
+            if quantity.endswith(suffix):
+                return float(quantity[:-len(suffix)]) * units[suffix] / (1024 ** 3)
+        return float(quantity) / (1024 ** 3)
+    except ValueError:
+        return None
 
-def ping_vm(ip: str, ssh_pod: str, ssh_pod_ns: str, logger: Optional[logging.Logger] = None) -> bool:
+
+def calculate_percentile(values: List[float], percentile: float) -> Optional[float]:
     """
-    Ping a VM from an SSH pod.
+    Calculate a percentile using linear interpolation between closest ranks.
 
     Args:
-        ip: VM IP address
-        ssh_pod: SSH pod name
-        ssh_pod_ns: SSH pod namespace
-        logger: Logger instance
+        values: List of numeric values
+        percentile: Percentile to calculate (0-100)
 
     Returns:
-        True if ping successful, False otherwise
+        Percentile value, or None if values is empty
     """
-    try:
-        returncode, _, _ = run_kubectl_command(
-            ['exec', '-n', ssh_pod_ns, ssh_pod, '--', 'ping', '-c', '1', '-W', '2', ip],
-            check=False,
-            capture_output=True,
-            timeout=5,
-            logger=logger
-        )
-        return returncode == 0
-    except Exception as e:
-        if logger:
-            logger.debug(f"Ping failed for {ip}: {e}")
-        return False
+    if not values:
+        return None
 
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
 
-def stop_vm(vm_name: str, namespace: str, logger: Optional[logging.Logger] = None) -> bool:
+    rank = (len(ordered) - 1) * (percentile / 100.0)
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize_distribution(values: List[float], digits: int = 2) -> dict:
     """
-    Stop a VM by setting runStrategy to Halted.
+    Summarize a list of measurements: avg, min, max, count and p50/p95/p99.
 
     Args:
-        vm_name: VM name
-        namespace: Namespace
-        logger: Logger instance
+        values: List of numeric values
+        digits: Decimal places the statistics are rounded to
 
     Returns:
-        True if successful, False otherwise
+        Dict with avg, min, max, count, p50, p95 and p99; every statistic but
+        count is None if values is empty
     """
-    try:
-        run_kubectl_command(
-            ['patch', 'vm', vm_name, '-n', namespace, '--type', 'merge',
-             '-p', '{"spec":{"runStrategy":"Halted"}}'],
-            logger=logger
-        )
-        if logger:
-            logger.info(f"Stopped VM {vm_name} in namespace {namespace}")
-        return True
-    except Exception as e:
-        if logger:
-            logger.error(f"Failed to stop VM {vm_name} in {namespace}: {e}")
-        return False
+    if not values:
+        return {"avg": None, "min": None, "max": None, "count": 0, "p50": None, "p95": None, "p99": None}
+    return {
+        "avg": round(sum(values) / len(values), digits),
+        "min": round(min(values), digits),
+        "max": round(max(values), digits),
+        "count": len(values),
+        "p50": round(calculate_percentile(values, 50), digits),
+        "p95": round(calculate_percentile(values, 95), digits),
+        "p99": round(calculate_percentile(values, 99), digits),
+    }
 
 
-def start_vm(vm_name: str, namespace: str, logger: Optional[logging.Logger] = None) -> bool:
+def usl_throughput(concurrency: float, fit: dict) -> float:
+    """
+    Throughput the Universal Scalability Law predicts at a concurrency level.
+
+    X(N) = lambda * N / (1 + sigma * (N - 1) + kappa * N * (N - 1))
+
+    Args:
+        concurrency: Concurrency level N
+        fit: Result of fit_usl
+
+    Returns:
+        Predicted throughput, in the unit of the fitted throughputs
+    """
+    n = concurrency
+    return fit['lambda'] * n / (1 + fit['sigma'] * (n - 1) + fit['kappa'] * n * (n - 1))
+
+
+def fit_usl(levels: List[int], throughputs: List[float]) -> Optional[dict]:
+    """
+    Fit the Universal Scalability Law to throughput measured at several concurrency levels.
+
+    Uses the usual linearisation: with C(N) = X(N) / X(1),
+    N / C(N) - 1 = (sigma + kappa) * (N - 1) + kappa * (N - 1)^2, solved by least
+    squares without intercept. Coefficients are clamped to sigma in [0, 1] and
+    kappa >= 0; with kappa = 0 throughput never peaks and no optimum is reported.
+
+    Args:
+        levels: Concurrency levels, must include 1
+        throughputs: Throughput measured at each level
+
+    Returns:
+        Dict with sigma (contention), kappa (coherency), lambda (throughput at N=1),
+        optimal_concurrency, peak_throughput and r_squared, or None if the data
+        cannot be fitted (no level 1, zero throughput, fewer than two levels)
+    """
+    points = dict(zip(levels, throughputs))
+    if len(points) < 2 or not points.get(1):
+        return None
+
+    base = points[1]
+    xs, ys = [], []
+    for n, x in points.items():
+        if n > 1 and x > 0:
+            xs.append(n - 1)
+            ys.append(n / (x / base) - 1)
+    if not xs:
+        return None
+
+    sxx = sum(x * x for x in xs)
+    sx3 = sum(x ** 3 for x in xs)
+    sx4 = sum(x ** 4 for x in xs)
+    sxy = sum(x * y for x, y in zip(xs, ys))
+    sx2y = sum(x * x * y for x, y in zip(xs, ys))
+    det = sxx * sx4 - sx3 * sx3
+    kappa = (sxx * sx2y - sx3 * sxy) / det if len(xs) > 1 and abs(det) > 1e-12 else 0.0
+    if kappa <= 0:
+        kappa = 0.0
+        sigma = sxy / sxx
+    else:
+        sigma = (sxy * sx4 - sx3 * sx2y) / det - kappa
+    sigma = min(max(sigma, 0.0), 1.0)
+
+    fit = {'sigma': round(sigma, 6), 'kappa': round(kappa, 6), 'lambda': round(base, 4)}
+    if kappa > 0:
+        optimum = math.sqrt((1 - sigma) / kappa)
+        # Throughput is unimodal, so the best integer level is one of the two neighbours
+        best = max({max(1, math.floor(optimum)), max(1, math.ceil(optimum))},
+                   key=lambda n: usl_throughput(n, fit))
+        fit['optimal_concurrency'] = best
+        fit['peak_throughput'] = round(usl_throughput(best, fit), 4)
+    else:
+        fit['optimal_concurrency'] = None
+        fit['peak_throughput'] = round(base / sigma, 4) if sigma > 0 else None
+
+    mean = sum(points.values()) / len(points)
+    ss_tot = sum((x - mean) ** 2 for x in points.values())
+    ss_res = sum((x - usl_throughput(n, fit)) ** 2 for n, x in points.items())
+    fit['r_squared'] = round(1 - ss_res / ss_tot, 4) if ss_tot > 0 else None
+    return fit
+
+
+class DataVolumeCloneTracker:
+    """
+    Track the clone phase and progress of every test DataVolume from one shared list.
+
+    A single background thread lists DataVolumes and PVCs across all namespaces on
+    every poll and updates the record of each tracked boot disk. Monitor threads
+    block in wait_for_clone() instead of running their own kubectl calls.
+
+    Volumes are keyed by VM target (see expand_vm_targets), so several VMs can
+    share a namespace.
+    """
+
+    # Phases that mean the volume is not being populated yet
+    WAITING_PHASES = ('', 'pending', 'pendingpopulation', 'waitforfirstconsumer')
+
+    _LIST_JSONPATH = (
+        '{range .items[*]}{.kind}{"\\t"}{.metadata.namespace}{"\\t"}{.metadata.name}{"\\t"}'
+        '{.status.phase}{"\\t"}{.status.progress}{"\\t"}'
+        '{.spec.storage.resources.requests.storage}{.spec.pvc.resources.requests.storage}'
+        '{.spec.resources.requests.storage}{"\\n"}{end}'
+    )
+
+    def __init__(self, volumes: Dict[str, Tuple[str, str]], poll_interval: float = 1,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            volumes: Maps each VM target to the (namespace, volume name) of its boot disk
+            poll_interval: Seconds between list calls
+            logger: Logger instance
+        """
+        import threading
+
+        self.poll_interval = poll_interval
+        self.logger = logger
+        self._keys = {volume: key for key, volume in volumes.items()}
+        self.records = {
+            key: {
+                'namespace': ns,
+                'name': name,
+                'kind': None,
+                'size_gib': None,
+                'phase': None,
+                'phase_timestamps': {},
+                'progress': [],
+                'clone_start': None,
+                'clone_end': None,
+                'clone_start_inferred': False,
+                'completed_before_tracking': False,
+                'failed': False,
+            }
+            for key, (ns, name) in volumes.items()
+        }
+        self.timeline = []
+        self._last_sample = None
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='dv-clone-tracker', daemon=True)
+
+    def start(self):
+        """Start the background list loop."""
+        if self.logger:
+            names = sorted({r['name'] for r in self.records.values()})
+            label = f"'{names[0]}'" if len(names) == 1 else "boot"
+            self.logger.info(f"Tracking clone progress of {len(self.records)} {label} "
+                             f"volumes with one shared list every {self.poll_interval}s")
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background list loop and release any waiting monitor threads."""
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread.is_alive():
+            self._thread.join(timeout=self.poll_interval * 5 + 30)
+
+    def _all_done(self) -> bool:
+        return all(r['clone_end'] or r['failed'] for r in self.records.values())
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                returncode, stdout, stderr = run_kubectl_command(
+                    ['get', 'dv,pvc', '-A', '-o', f'jsonpath={self._LIST_JSONPATH}'],
+                    check=False,
+                    logger=self.logger
+                )
+                if returncode == 0:
+                    self._apply_sample(datetime.now(), stdout)
+                elif self.logger:
+                    self.logger.debug(f"Clone tracker list failed: {stderr.strip()}")
+            except Exception as e:
+                if self.logger:
+                    self.logger.debug(f"Clone tracker list error: {e}")
+
+            with self._cond:
+                if self._all_done():
+                    break
+            self._stop.wait(self.poll_interval)
+
+    def _apply_sample(self, now: datetime, output: str):
+        """Fold one list result into the per-volume records and the aggregate timeline."""
+        observed = {}
+        for line in output.splitlines():
+            fields = line.split('\t')
+            if len(fields) < 6:
+                continue
+            kind, ns, name, phase, progress, size = fields[:6]
+            key = self._keys.get((ns, name))
+            if key is None:
+                continue
+            # A DataVolume and its PVC share a name; the DataVolume is authoritative
+            if key in observed and observed[key][0] == 'DataVolume':
+                continue
+            observed[key] = (kind, phase, progress, size)
+
+        with self._cond:
+            previous_sample = self._last_sample
+            for key, (kind, phase, progress, size) in observed.items():
+                record = self.records[key]
+                if record['clone_end'] or record['failed']:
+                    continue
+
+                record['kind'] = kind
+                if record['size_gib'] is None:
+                    record['size_gib'] = parse_storage_quantity_gib(size)
+
+                if kind != 'DataVolume':
+                    # Plain PVC boot disk: the clone is complete once it is Bound
+                    phase = 'Succeeded' if phase == 'Bound' else phase
+
+                if phase and phase not in record['phase_timestamps']:
+                    record['phase_timestamps'][phase] = now
+                    if self.logger:
+                        self.logger.debug(f"[{key}] {record['name']} entered {phase}")
+                record['phase'] = phase
+
+                pct = None
+                if progress and progress.endswith('%'):
+                    try:
+                        pct = float(progress.rstrip('%'))
+                    except ValueError:
+                        pct = None
+                if pct is not None and (not record['progress'] or record['progress'][-1][1] != pct):
+                    record['progress'].append((now, pct))
+
+                phase_lower = phase.lower()
+                if not record['clone_start'] and (phase_lower not in self.WAITING_PHASES or (pct or 0) > 0):
+                    if phase_lower == 'succeeded':
+                        # Finished between two samples: the previous sample bounds the start
+                        record['clone_start'] = previous_sample or now
+                        record['clone_start_inferred'] = True
+                        # Already complete on the first sample (e.g. a resumed run): no timing
+                        record['completed_before_tracking'] = previous_sample is None
+                    else:
+                        record['clone_start'] = now
+
+                if phase_lower == 'succeeded':
+                    record['clone_end'] = now
+                    if not record['progress'] or record['progress'][-1][1] != 100.0:
+                        record['progress'].append((now, 100.0))
+                elif phase_lower == 'failed':
+                    record['failed'] = True
+                    if self.logger:
+                        self.logger.error(f"[{key}] {record['name']} entered Failed state")
+
+            self._record_timeline(now)
+            self._last_sample = now
+            self._cond.notify_all()
+
+    def _cloned_gib(self, record: dict) -> float:
+        if not record['size_gib']:
+            return 0.0
+        if record['clone_end']:
+            return record['size_gib']
+        if record['progress']:
+            return record['size_gib'] * record['progress'][-1][1] / 100.0
+        return 0.0
+
+    def _record_timeline(self, now: datetime):
+        cloned = sum(self._cloned_gib(r) for r in self.records.values())
+        active = sum(1 for r in self.records.values()
+                     if r['clone_start'] and not r['clone_end'] and not r['failed'])
+        completed = sum(1 for r in self.records.values() if r['clone_end'])
+
+        throughput = None
+        if self.timeline:
+            prev = self.timeline[-1]
+            dt = (now - prev['timestamp']).total_seconds()
+            if dt > 0:
+                throughput = max(cloned - prev['cloned_gib'], 0.0) / dt
+
+        self.timeline.append({
+            'timestamp': now,
+            'active_clones': active,
+            'completed_clones': completed,
+            'cloned_gib': cloned,
+            'throughput_gib_per_sec': throughput,
+        })
+
+    def wait_for_clone(self, target: str, start_ts: datetime, timeout: int = 1800):
+        """
+        Block until the tracked volume of a VM target finishes cloning.
+
+        Args:
+            target: VM target the volume was registered under
+            start_ts: Time when VM creation was initiated (lower bound for clone start)
+            timeout: Timeout in seconds
+
+        Returns:
+            Tuple (clone_start_time, clone_end_time, clone_duration_seconds)
+            or (None, None, None) if the clone failed or timed out
+        """
+        record = self.records.get(target)
+        if record is None:
+            return None, None, None
+
+        deadline = time.time() + timeout
+        with self._cond:
+            while not (record['clone_end'] or record['failed'] or self._stop.is_set()):
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._cond.wait(min(remaining, self.poll_interval * 5))
+
+            if not record['clone_end']:
+                if self.logger and not record['failed']:
+                    self.logger.warning(f"[{target}] Clone tracking incomplete or timed out")
+                return None, None, None
+
+            if record['completed_before_tracking']:
+                if self.logger:
+                    self.logger.info(f"[{target}] {record['name']} clone finished before tracking started")
+                return None, None, None
+
+            clone_start = max(record['clone_start'], start_ts)
+            clone_end = record['clone_end']
+
+        duration = round((clone_end - clone_start).total_seconds(), 2)
+        if self.logger:
+            inferred_text = " (inferred start)" if record['clone_start_inferred'] else ""
+            self.logger.info(f"[{target}] {record['name']} clone duration: {duration} seconds{inferred_text}")
+        return clone_start, clone_end, duration
+
+    def get_clone_records(self) -> List[dict]:
+        """
+        Return one serializable record per tracked volume.
+
+        Each record holds the phase timestamps, the progress curve and the per-clone
+        throughput in GiB/s, with times given as seconds since the tracker started
+        its first sample.
+        """
+        with self._cond:
+            origin = self.timeline[0]['timestamp'] if self.timeline else None
+            records = []
+            for key in sorted(self.records):
+                r = self.records[key]
+
+                def offset(ts):
+                    return round((ts - origin).total_seconds(), 2) if ts and origin else None
+
+                duration = None
+                throughput = None
+                if r['clone_start'] and r['clone_end'] and not r['completed_before_tracking']:
+                    duration = (r['clone_end'] - r['clone_start']).total_seconds()
+                    if r['size_gib'] and duration > 0:
+                        throughput = r['size_gib'] / duration
+
+                records.append({
+                    'namespace': r['namespace'],
+                    'name': r['name'],
+                    'kind': r['kind'],
+                    'size_gib': round(r['size_gib'], 2) if r['size_gib'] else None,
+                    'final_phase': r['phase'],
+                    'phase_timestamps_sec': {p: offset(ts) for p, ts in r['phase_timestamps'].items()},
+                    'clone_start_sec': offset(r['clone_start']),
+                    'clone_end_sec': offset(r['clone_end']),
+                    'clone_start_inferred': r['clone_start_inferred'],
+                    'clone_duration_sec': round(duration, 2) if duration is not None else None,
+                    'clone_throughput_gib_per_sec': round(throughput, 4) if throughput else None,
+                    'progress_curve': [[offset(ts), pct] for ts, pct in r['progress']],
+                })
+            return records
+
+    def get_throughput_timeline(self) -> List[dict]:
+        """Return the aggregate clone throughput samples as serializable dicts."""
+        with self._cond:
+            if not self.timeline:
+                return []
+            origin = self.timeline[0]['timestamp']
+            return [
+                {
+                    'elapsed_sec': round((s['timestamp'] - origin).total_seconds(), 2),
+                    'active_clones': s['active_clones'],
+                    'completed_clones': s['completed_clones'],
+                    'cloned_gib': round(s['cloned_gib'], 3),
+                    'throughput_gib_per_sec': round(s['throughput_gib_per_sec'], 4)
+                    if s['throughput_gib_per_sec'] is not None else None,
+                }
+                for s in self.timeline
+            ]
+
+
+def save_clone_tracking_results(tracker: DataVolumeCloneTracker, base_dir: str,
+                                logger: Optional[logging.Logger] = None) -> Tuple[str, str, str]:
+    """
+    Save per-clone progress and aggregate clone throughput from a DataVolumeCloneTracker.
+
+    Args:
+        tracker: Tracker that followed the run
+        base_dir: Results directory of the run
+        logger: Logger instance
+
+    Returns:
+        Tuple of (clone_progress_json, throughput_timeline_csv, summary_json)
+    """
+    os.makedirs(base_dir, exist_ok=True)
+    records = tracker.get_clone_records()
+    timeline = tracker.get_throughput_timeline()
+
+    progress_path = os.path.join(base_dir, "clone_progress.json")
+    timeline_path = os.path.join(base_dir, "clone_throughput_timeline.csv")
+    summary_path = os.path.join(base_dir, "summary_clone_throughput.json")
+
+    with open(progress_path, "w") as f:
+        json.dump(records, f, indent=4)
+
+    with open(timeline_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["elapsed_sec", "active_clones", "completed_clones",
+                                               "cloned_gib", "throughput_gib_per_sec"])
+        writer.writeheader()
+        writer.writerows(timeline)
+
+    per_clone = [r['clone_throughput_gib_per_sec'] for r in records if r['clone_throughput_gib_per_sec']]
+    aggregate = [s['throughput_gib_per_sec'] for s in timeline if s['throughput_gib_per_sec']]
+    total_cloned = timeline[-1]['cloned_gib'] if timeline else 0
+    completed = [r for r in records if r['clone_end_sec'] is not None]
+    starts = [r['clone_start_sec'] for r in completed if r['clone_start_sec'] is not None]
+    window = (max(r['clone_end_sec'] for r in completed) - min(starts)) if completed and starts else None
+
+    summary = {
+        "tracked_volumes": len(records),
+        "completed_clones": len(completed),
+        "total_cloned_gib": total_cloned,
+        "clone_window_sec": round(window, 2) if window else None,
+        "overall_throughput_gib_per_sec": round(total_cloned / window, 4) if window else None,
+        "peak_aggregate_throughput_gib_per_sec": round(max(aggregate), 4) if aggregate else None,
+        "peak_active_clones": max((s['active_clones'] for s in timeline), default=0),
+        "per_clone_throughput_gib_per_sec": summarize_distribution(per_clone, 4),
+    }
+    with open(summary_path, "w") as f:
+        json.dump(summary, f, indent=4)
+
+    if logger:
+        logger.info(f"Saved clone progress to {progress_path}")
+        logger.info(f"Saved clone throughput timeline to {timeline_path}")
+        if summary["overall_throughput_gib_per_sec"]:
+            logger.info(f"Aggregate clone throughput: {summary['overall_throughput_gib_per_sec']} GiB/s "
+                        f"over {summary['clone_window_sec']}s "
+                        f"(peak {summary['peak_aggregate_throughput_gib_per_sec']} GiB/s)")
+
+    return progress_path, timeline_path, summary_path
+
+
+def ssh_exec_command(ip: str, command: str, ssh_pod: str, ssh_pod_ns: str,
+                     vm_user: str, vm_password: str,
+                     logger: Optional[logging.Logger] = None,
+                     timeout: int = 30) -> Tuple[int, str, str]:
+    """
+    Execute a command on a VM via SSH through an existing helper pod.
+
+    Uses sshpass for password authentication. Disables strict host-key checking
+    and pubkey auth so it works against freshly-deployed VMs.
+
+    Args:
+        ip: VM IP address
+        command: Shell command to run on the VM
+        ssh_pod: SSH helper pod name
+        ssh_pod_ns: SSH helper pod namespace
+        vm_user: VM SSH user
+        vm_password: VM SSH password
+        logger: Logger instance
+        timeout: Command timeout in seconds
+
+    Returns:
+        Tuple of (return_code, stdout, stderr)
+    """
+    ssh_cmd = (
+        f"sshpass -p '{vm_password}' ssh -o StrictHostKeyChecking=no "
+        f"-o UserKnownHostsFile=/dev/null -o ConnectTimeout=10 "
+        f"-o PreferredAuthentications=password -o PubkeyAuthentication=no "
+        f"{vm_user}@{ip} '{command}'"
+    )
+    return run_kubectl_command(
+        ['exec', '-n', ssh_pod_ns, ssh_pod, '--', 'sh', '-c', ssh_cmd],
+        check=False,
+        timeout=timeout,
+        logger=logger
+    )
+
+
+def ping_vm(ip: str, ssh_pod: str, ssh_pod_ns: str, logger: Optional[logging.Logger] = None) -> bool:
+    """
+    Ping a VM from an SSH pod.
+
+    Args:
+        ip: VM IP address
+        ssh_pod: SSH pod name
+        ssh_pod_ns: SSH pod namespace
+        logger: Logger instance
+
+    Returns:
+        True if ping successful, False otherwise
+    """
+    try:
+        returncode, _, _ = run_kubectl_command(
+            ['exec', '-n', ssh_pod_ns, ssh_pod, '--', 'ping', '-c', '1', '-W', '2', ip],
+            check=False,
+            capture_output=True,
+            timeout=5,
+            logger=logger
+        )
+        return returncode == 0
+    except Exception as e:
+        if logger:
+            logger.debug(f"Ping failed for {ip}: {e}")
+        return False
+
+
+# Per-VM metrics returned by PingDowntimeProbe.stop
+DOWNTIME_METRICS = ('downtime_sec', 'packets_lost')
+
+
+# ping's icmp_seq is a 16-bit counter
+ICMP_SEQ_RANGE = 65536
+
+
+def parse_ping_downtime(output: str, interval: float) -> Optional[dict]:
+    """
+    Compute the network blackout from the output of ``ping -D``.
+
+    Args:
+        output: ping output with one "[epoch] ... icmp_seq=N ..." line per reply
+            and the final "N packets transmitted, M received" summary
+        interval: Ping interval in seconds
+
+    Returns:
+        Dict with packets_sent, packets_received, packets_lost, packet_loss_pct,
+        downtime_sec (longest gap between consecutive replies, or the unanswered
+        tail after the last reply if longer) and lost_time_sec (lost packets
+        times the interval), or None if no reply was seen
+
+    icmp_seq is 16 bits and wraps after 65536 packets (about 11 minutes at
+    0.01s), so each reply's sequence number is unwrapped to the one closest
+    to what its timestamp predicts from the previous reply.
+    """
+    replies = {}
+    sent = None
+    last = None
+    for line in output.splitlines():
+        if line.startswith('[') and 'icmp_seq=' in line:
+            try:
+                ts = float(line[1:line.index(']')])
+                seq = int(line.split('icmp_seq=')[1].split()[0])
+            except (ValueError, IndexError):
+                continue
+            if last:
+                expected = last[0] + (ts - last[1]) / interval
+                seq += ICMP_SEQ_RANGE * round((expected - seq) / ICMP_SEQ_RANGE)
+            last = (seq, ts)
+            replies.setdefault(seq, ts)
+        elif 'packets transmitted' in line:
+            try:
+                sent = int(line.split()[0])
+            except (ValueError, IndexError):
+                pass
+
+    if not replies:
+        return None
+    times = [replies[seq] for seq in sorted(replies)]
+    sent = sent if sent is not None else max(replies)
+    gaps = [b - a for a, b in zip(times, times[1:])] + [(sent - max(replies)) * interval]
+    lost = max(0, sent - len(replies))
+    return {
+        'packets_sent': sent,
+        'packets_received': len(replies),
+        'packets_lost': lost,
+        'packet_loss_pct': round(lost * 100.0 / sent, 3) if sent else None,
+        'downtime_sec': round(max(gaps), 3),
+        'lost_time_sec': round(lost * interval, 3),
+    }
+
+
+class PingDowntimeProbe:
+    """
+    High-frequency ping across one live migration, to measure the network blackout.
+
+    Modes:
+        pod: the SSH helper pod pings the VM. Needs a VM address that survives
+            migration (e.g. bridge binding on a secondary network); masquerade
+            pod-network addresses change with the virt-launcher pod.
+        guest: the guest pings the helper pod, started and read back over SSH.
+            Works with masquerade; intervals below 0.2s need passwordless sudo.
+
+    The ping runs detached with per-reply timestamps and stops itself after
+    ``max_duration`` seconds if the harness never stops it. Stopping sends
+    SIGINT so ping prints its loss summary, then the result is parsed and
+    stored in ``results`` under the target label.
+    """
+
+    def __init__(self, target: str, ip: str, mode: str, ssh_pod: str, ssh_pod_ns: str,
+                 interval: float = 0.01, max_duration: int = 900, helper_ip: Optional[str] = None,
+                 vm_user: Optional[str] = None, vm_password: Optional[str] = None,
+                 results: Optional[Dict[str, dict]] = None, logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            target: Target label the result is stored under
+            ip: Current VM IP address
+            mode: 'pod' or 'guest'
+            ssh_pod: SSH helper pod name
+            ssh_pod_ns: SSH helper pod namespace
+            interval: Ping interval in seconds
+            max_duration: Seconds after which the ping stops on its own
+            helper_ip: Helper pod IP pinged by the guest (guest mode)
+            vm_user: VM SSH user (guest mode)
+            vm_password: VM SSH password (guest mode)
+            results: Dict collecting the result of every probe
+            logger: Logger instance
+        """
+        self.target = target
+        self.ip = ip
+        self.mode = mode
+        self.ssh_pod = ssh_pod
+        self.ssh_pod_ns = ssh_pod_ns
+        self.interval = interval
+        self.max_duration = max_duration
+        self.helper_ip = helper_ip
+        self.vm_user = vm_user
+        self.vm_password = vm_password
+        self.results = results if results is not None else {}
+        self.logger = logger
+        base = f"/tmp/virtbench-downtime-{target.replace('/', '_')}"
+        self.pid_file = f"{base}.pid"
+        self.log_file = f"{base}.log"
+
+    def _exec(self, command: str, ip: Optional[str] = None) -> Tuple[int, str, str]:
+        if self.mode == 'guest':
+            return ssh_exec_command(ip or self.ip, command, self.ssh_pod, self.ssh_pod_ns,
+                                    self.vm_user, self.vm_password, self.logger)
+        return run_kubectl_command(
+            ['exec', '-n', self.ssh_pod_ns, self.ssh_pod, '--', 'sh', '-c', command],
+            check=False, timeout=30, logger=self.logger
+        )
+
+    def start(self) -> bool:
+        """
+        Start the ping in the background.
+
+        Returns:
+            True if the ping was started, False otherwise
+        """
+        destination = self.helper_ip if self.mode == 'guest' else self.ip
+        sudo = 'sudo -n ' if self.mode == 'guest' and self.interval < 0.2 else ''
+        command = (
+            f'rm -f {self.pid_file} {self.log_file}; '
+            f'nohup {sudo}sh -c "echo \\$\\$ > {self.pid_file}; '
+            f'exec ping -D -i {self.interval} -w {self.max_duration} {destination}" '
+            f'> {self.log_file} 2>&1 < /dev/null & '
+            f'sleep 1; test -s {self.pid_file}'
+        )
+        returncode, _, stderr = self._exec(command)
+        if returncode != 0:
+            if self.logger:
+                self.logger.warning(f"[{self.target}] Could not start downtime probe ({self.mode}): {stderr.strip()}")
+            return False
+        return True
+
+    def stop(self, resolve_ip=None, retries: int = 3) -> Optional[dict]:
+        """
+        Stop the ping and record the blackout it observed.
+
+        Args:
+            resolve_ip: Optional callable returning the current VM IP address; the VMI
+                reports the address of the new virt-launcher pod shortly after migration
+            retries: Attempts to read the probe output before giving up
+
+        Returns:
+            Result of parse_ping_downtime, or None if the probe output could not be read
+        """
+        sudo = 'sudo -n ' if self.mode == 'guest' and self.interval < 0.2 else ''
+        command = (
+            f'{sudo}kill -INT $(cat {self.pid_file}) 2>/dev/null; sleep 1; '
+            f'cat {self.log_file}; {sudo}rm -f {self.pid_file} {self.log_file}'
+        )
+        stdout = ''
+        ip = self.ip
+        for attempt in range(1, retries + 1):
+            ip = (resolve_ip() if resolve_ip else None) or ip
+            returncode, stdout, stderr = self._exec(command, ip)
+            if returncode == 0 and stdout:
+                break
+            if attempt < retries:
+                time.sleep(5)
+
+        if self.mode == 'pod' and ip != self.ip:
+            if self.logger:
+                self.logger.warning(f"[{self.target}] VM address changed from {self.ip} to {ip}; "
+                                    f"pod downtime probe result discarded (use --downtime-probe guest)")
+            return None
+
+        result = parse_ping_downtime(stdout, self.interval)
+        if result is None:
+            if self.logger:
+                self.logger.warning(f"[{self.target}] Downtime probe saw no replies")
+            return None
+
+        self.results[self.target] = result
+        if self.logger:
+            self.logger.info(f"[{self.target}] Network downtime: {result['downtime_sec']:.3f}s, "
+                             f"{result['packets_lost']}/{result['packets_sent']} packets lost")
+        return result
+
+
+def get_pod_ip(pod_name: str, namespace: str, logger: Optional[logging.Logger] = None) -> Optional[str]:
+    """
+    Get the IP address of a pod.
+
+    Args:
+        pod_name: Pod name
+        namespace: Namespace
+        logger: Logger instance
+
+    Returns:
+        IP address or None if not available
+    """
+    returncode, stdout, _ = run_kubectl_command(
+        ['get', 'pod', pod_name, '-n', namespace, '-o', 'jsonpath={.status.podIP}'],
+        check=False,
+        logger=logger
+    )
+    if returncode == 0 and stdout.strip():
+        return stdout.strip()
+    return None
+
+
+# Per-VM guest boot metrics returned by collect_guest_boot_times
+GUEST_BOOT_METRICS = ('cloud_init_time_sec', 'systemd_time_sec', 'guest_ready_time_sec')
+
+# Reads, in seconds since guest boot: now, cloud-init completion and systemd boot completion.
+# Uptime-based values avoid any dependency on the guest wall clock.
+GUEST_BOOT_PROBE = (
+    'echo uptime $(cut -d" " -f1 /proc/uptime); '
+    'echo cloud_init $(cut -d" " -f1 /var/lib/cloud/instance/boot-finished 2>/dev/null); '
+    'echo systemd $(systemctl show -p FinishTimestampMonotonic --value 2>/dev/null)'
+)
+
+
+# Guest-side memory dirtier: keeps writing one byte per page of a working set at a fixed rate
+DIRTY_WORKLOAD_SCRIPT = '''\
+import mmap, sys, time
+rate, wss, duration = float(sys.argv[1]), int(sys.argv[2]), float(sys.argv[3])
+page = mmap.PAGESIZE
+pages = wss * 1048576 // page
+buf = bytearray(pages * page)
+buf[::page] = b"\\x01" * pages
+per_tick = rate * 1048576 / page / 100.0
+carry, pos, value = 0.0, 0, 1
+tick = time.monotonic()
+deadline = tick + duration
+while tick < deadline:
+    carry += per_tick
+    n = int(carry)
+    carry -= n
+    value = value % 255 + 1
+    while n:
+        k = min(n, pages - pos)
+        buf[pos * page:(pos + k) * page:page] = bytes([value]) * k
+        pos, n = (pos + k) % pages, n - k
+    tick += 0.01
+    time.sleep(max(0.0, tick - time.monotonic()))
+'''
+DIRTY_WORKLOAD_PATH = '/tmp/virtbench-dirty.py'
+# pkill/pgrep pattern anchored to the python process so it does not match the shell running the command
+_DIRTY_WORKLOAD_PATTERN = f'"^python3 {DIRTY_WORKLOAD_PATH}"'
+
+
+def start_dirty_workload(ip: str, rate_mibps: float, wss_mib: int, ssh_pod: str, ssh_pod_ns: str,
+                         vm_user: str, vm_password: str, max_duration: int = 3600,
+                         logger: Optional[logging.Logger] = None) -> bool:
+    """
+    Start a memory-dirtying process in a VM.
+
+    The process allocates a working set of ``wss_mib`` MiB and rewrites
+    ``rate_mibps`` MiB of it per second, page by page in 10 ms slices, until it
+    is stopped or ``max_duration`` seconds have passed. It needs python3 in the
+    guest (cloud images ship it for cloud-init).
+
+    Args:
+        ip: VM IP address
+        rate_mibps: Target dirty rate in MiB/s
+        wss_mib: Working-set size in MiB
+        ssh_pod: SSH helper pod name
+        ssh_pod_ns: SSH helper pod namespace
+        vm_user: VM SSH user
+        vm_password: VM SSH password
+        max_duration: Seconds after which the process exits on its own
+        logger: Logger instance
+
+    Returns:
+        True if the process is running, False otherwise
+    """
+    import base64
+
+    script = base64.b64encode(DIRTY_WORKLOAD_SCRIPT.encode()).decode()
+    command = (
+        f'pkill -f {_DIRTY_WORKLOAD_PATTERN}; '
+        f'echo {script} | base64 -d > {DIRTY_WORKLOAD_PATH} && '
+        f'(nohup python3 {DIRTY_WORKLOAD_PATH} {rate_mibps} {wss_mib} {max_duration} '
+        f'> /tmp/virtbench-dirty.log 2>&1 < /dev/null &); '
+        f'sleep 2; pgrep -f {_DIRTY_WORKLOAD_PATTERN} > /dev/null || cat /tmp/virtbench-dirty.log'
+    )
+    returncode, stdout, stderr = ssh_exec_command(ip, command, ssh_pod, ssh_pod_ns, vm_user, vm_password,
+                                                  logger, timeout=60)
+    if returncode != 0 or stdout.strip():
+        if logger:
+            logger.warning(f"Could not start dirty-page workload on {ip}: {(stdout or stderr).strip()}")
+        return False
+    return True
+
+
+def stop_dirty_workload(ip: str, ssh_pod: str, ssh_pod_ns: str, vm_user: str, vm_password: str,
+                        logger: Optional[logging.Logger] = None) -> bool:
+    """
+    Stop the memory-dirtying process started by start_dirty_workload.
+
+    Args:
+        ip: VM IP address
+        ssh_pod: SSH helper pod name
+        ssh_pod_ns: SSH helper pod namespace
+        vm_user: VM SSH user
+        vm_password: VM SSH password
+        logger: Logger instance
+
+    Returns:
+        True if no workload is left running, False otherwise
+    """
+    returncode, _, _ = ssh_exec_command(
+        ip, f'pkill -f {_DIRTY_WORKLOAD_PATTERN}; sleep 1; ! pgrep -f {_DIRTY_WORKLOAD_PATTERN} > /dev/null',
+        ssh_pod, ssh_pod_ns, vm_user, vm_password, logger
+    )
+    return returncode == 0
+
+
+def get_guest_boot_times(ip: str, ssh_pod: str, ssh_pod_ns: str, vm_user: str, vm_password: str,
+                         logger: Optional[logging.Logger] = None) -> Optional[dict]:
+    """
+    Read guest-side boot completion times from a VM over SSH.
+
+    Args:
+        ip: VM IP address
+        ssh_pod: SSH helper pod name
+        ssh_pod_ns: SSH helper pod namespace
+        vm_user: VM SSH user
+        vm_password: VM SSH password
+        logger: Logger instance
+
+    Returns:
+        Dict with 'probed_at' (local datetime of the probe), 'uptime', 'cloud_init'
+        and 'systemd' (seconds since guest boot, None when not finished), or None on error
+    """
+    returncode, stdout, stderr = ssh_exec_command(
+        ip, GUEST_BOOT_PROBE, ssh_pod, ssh_pod_ns, vm_user, vm_password, logger=logger
+    )
+    probed_at = datetime.now()
+    if returncode != 0:
+        if logger:
+            logger.debug(f"Guest boot probe failed for {ip}: {stderr.strip()}")
+        return None
+
+    values = {}
+    for line in stdout.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[0] in ('uptime', 'cloud_init', 'systemd'):
+            try:
+                values[parts[0]] = float(parts[1])
+            except ValueError:
+                pass
+    if 'uptime' not in values:
+        return None
+
+    # FinishTimestampMonotonic is in microseconds and stays 0 until boot has finished
+    systemd = values.get('systemd')
+    return {
+        'probed_at': probed_at,
+        'uptime': values['uptime'],
+        'cloud_init': values.get('cloud_init'),
+        'systemd': systemd / 1e6 if systemd else None,
+    }
+
+
+def collect_guest_boot_times(vms: Dict[str, Tuple[str, str]], start_times: Dict[str, datetime],
+                             ssh_pod: str, ssh_pod_ns: str, vm_user: str, vm_password: str,
+                             concurrency: int = 20, logger: Optional[logging.Logger] = None) -> Dict[str, dict]:
+    """
+    Measure time from start to guest-ready for many VMs in one batched pass.
+
+    Meant to run once every VM answers ping, so probing stays out of the
+    measured window. Guest boot time is placed on the local clock as
+    probe time minus guest uptime, so the result is accurate to the SSH round trip.
+
+    Args:
+        vms: Dict mapping target label to (namespace, vm_name)
+        start_times: Dict mapping target label to the local datetime the VM was created or started
+        ssh_pod: SSH helper pod name
+        ssh_pod_ns: SSH helper pod namespace
+        vm_user: VM SSH user
+        vm_password: VM SSH password
+        concurrency: Number of VMs to probe in parallel
+        logger: Logger instance
+
+    Returns:
+        Dict mapping target label to {'cloud_init_time_sec', 'systemd_time_sec',
+        'guest_ready_time_sec'}; targets that could not be probed are omitted
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    def probe(target: str) -> Optional[dict]:
+        ns, vm = vms[target]
+        ip = get_vmi_ip(vm, ns, logger)
+        if not ip:
+            return None
+        times = get_guest_boot_times(ip, ssh_pod, ssh_pod_ns, vm_user, vm_password, logger)
+        if not times:
+            return None
+
+        booted_at = times['probed_at'] - timedelta(seconds=times['uptime'])
+        offset = (booted_at - start_times[target]).total_seconds()
+        cloud_init = round(offset + times['cloud_init'], 2) if times['cloud_init'] is not None else None
+        systemd = round(offset + times['systemd'], 2) if times['systemd'] is not None else None
+        finished = [t for t in (cloud_init, systemd) if t is not None]
+        return {
+            'cloud_init_time_sec': cloud_init,
+            'systemd_time_sec': systemd,
+            'guest_ready_time_sec': max(finished) if finished else None,
+        }
+
+    targets = [t for t in vms if t in start_times]
+    if logger:
+        logger.info(f"Collecting guest boot completion from {len(targets)} VMs (concurrency={concurrency})...")
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {executor.submit(probe, target): target for target in targets}
+        for future in as_completed(futures):
+            target = futures[future]
+            try:
+                times = future.result()
+            except Exception as e:
+                times = None
+                if logger:
+                    logger.debug(f"[{target}] Guest boot probe error: {e}")
+            if times:
+                results[target] = times
+            elif logger:
+                logger.warning(f"[{target}] Could not read guest boot completion")
+
+    if logger:
+        logger.info(f"Guest boot completion collected from {len(results)}/{len(targets)} VMs")
+    return results
+
+
+def stop_vm(vm_name: str, namespace: str, logger: Optional[logging.Logger] = None) -> bool:
+    """
+    Stop a VM by setting runStrategy to Halted.
+
+    Args:
+        vm_name: VM name
+        namespace: Namespace
+        logger: Logger instance
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        run_kubectl_command(
+            ['patch', 'vm', vm_name, '-n', namespace, '--type', 'merge',
+             '-p', '{"spec":{"runStrategy":"Halted"}}'],
+            logger=logger
+        )
+        if logger:
+            logger.info(f"Stopped VM {vm_name} in namespace {namespace}")
+        return True
+    except Exception as e:
+        if logger:
+            logger.error(f"Failed to stop VM {vm_name} in {namespace}: {e}")
+        return False
+
+
+def start_vm(vm_name: str, namespace: str, logger: Optional[logging.Logger] = None) -> bool:
     """
     Start a VM by setting runStrategy to Always.
 
@@ -1403,47 +2720,114 @@ def remove_node_selectors(vm_name: str, namespace: str,
     return vm_success and vmi_success
 
 
+_VMIM_CAPABILITIES: dict = {}  # cached once per run
+
+
+def vmim_supports_added_node_selector(logger: Optional[logging.Logger] = None) -> bool:
+    """
+    Check whether the cluster's VirtualMachineInstanceMigration API has spec.addedNodeSelector.
+
+    The field lets a single migration target specific nodes (KubeVirt v1.3+).
+    The answer is cached for the rest of the run.
+
+    Args:
+        logger: Logger instance
+
+    Returns:
+        True if addedNodeSelector is supported, False otherwise
+    """
+    if 'added_node_selector' not in _VMIM_CAPABILITIES:
+        returncode, _, _ = run_kubectl_command(
+            ['explain', 'virtualmachineinstancemigration.spec.addedNodeSelector'],
+            check=False,
+            logger=logger
+        )
+        _VMIM_CAPABILITIES['added_node_selector'] = returncode == 0
+        if logger:
+            if returncode == 0:
+                logger.info("Targeted migrations use VMIM spec.addedNodeSelector")
+            else:
+                logger.warning("VMIM spec.addedNodeSelector not supported; requested target nodes are "
+                               "ignored and the scheduler picks the target of every migration")
+    return _VMIM_CAPABILITIES['added_node_selector']
+
+
+def get_vmi_migration_mode(vm_name: str, namespace: str,
+                           logger: Optional[logging.Logger] = None) -> Optional[str]:
+    """
+    Get the mode of the VMI's latest migration.
+
+    Args:
+        vm_name: Name of the VMI
+        namespace: Namespace
+        logger: Logger instance
+
+    Returns:
+        'PreCopy' or 'PostCopy', or None if not reported
+    """
+    returncode, stdout, _ = run_kubectl_command(
+        ['get', 'vmi', vm_name, '-n', namespace, '-o', 'jsonpath={.status.migrationState.mode}'],
+        check=False,
+        logger=logger
+    )
+    return (stdout.strip() or None) if returncode == 0 else None
+
+
+def get_migration_config(logger: Optional[logging.Logger] = None) -> dict:
+    """
+    Get the cluster-wide live migration settings and MigrationPolicies.
+
+    Args:
+        logger: Logger instance
+
+    Returns:
+        Dict with 'migrations' (KubeVirt CR spec.configuration.migrations) and
+        'migration_policies' (name -> spec), empty where not readable
+    """
+    config = {'migrations': {}, 'migration_policies': {}}
+    returncode, stdout, _ = run_kubectl_command(['get', 'kubevirt', '-A', '-o', 'json'], check=False, logger=logger)
+    if returncode == 0:
+        try:
+            items = json.loads(stdout).get('items', [])
+            if items:
+                config['migrations'] = items[0].get('spec', {}).get('configuration', {}).get('migrations', {})
+        except json.JSONDecodeError:
+            pass
+    returncode, stdout, _ = run_kubectl_command(['get', 'migrationpolicies', '-o', 'json'], check=False, logger=logger)
+    if returncode == 0:
+        try:
+            for item in json.loads(stdout).get('items', []):
+                config['migration_policies'][item['metadata']['name']] = item.get('spec', {})
+        except (json.JSONDecodeError, KeyError):
+            pass
+    return config
+
+
 def migrate_vm(vm_name: str, namespace: str, target_node: Optional[str] = None,
-               logger: Optional[logging.Logger] = None) -> bool:
+               logger: Optional[logging.Logger] = None, migration_name: Optional[str] = None,
+               replace_existing: bool = True) -> bool:
     """
     Trigger live migration of a VM.
 
+    A target node is requested with the VMIM's spec.addedNodeSelector. On
+    KubeVirt versions without it the VMIM is created without a target and the
+    scheduler picks the node.
+
     Args:
         vm_name: Name of the VM to migrate
         namespace: Namespace of the VM
         target_node: Target node name (optional, let Kubernetes choose if None)
         logger: Logger instance
+        migration_name: VMIM name (default: migration-<vm_name>)
+        replace_existing: Delete an existing VMIM of the same name first; soak runs
+            use unique names and keep every VMIM
 
     Returns:
         True if migration was triggered successfully, False otherwise
     """
     try:
-        if target_node:
-            # Create VirtualMachineInstanceMigration with target node
-            migration_yaml = f"""
-apiVersion: kubevirt.io/v1
-kind: VirtualMachineInstanceMigration
-metadata:
-  name: {vm_name}-migration
-  namespace: {namespace}
-spec:
-  vmiName: {vm_name}
-"""
-            # Note: KubeVirt doesn't support direct target node selection in migration
-            # The scheduler will choose the target node based on available resources
-            # We'll use nodeSelector on the VM spec if target node is needed
-            if logger:
-                logger.warning(f"Target node specified ({target_node}), but KubeVirt migration uses scheduler")
-
-        # Trigger migration using virtctl or kubectl
-        cmd = f"kubectl create -f - <<EOF\napiVersion: kubevirt.io/v1\nkind: VirtualMachineInstanceMigration\nmetadata:\n  name: migration-{vm_name}-$(date +%s)\n  namespace: {namespace}\nspec:\n  vmiName: {vm_name}\nEOF"
-
-        # Simpler approach: use kubectl patch to trigger migration
-        cmd = f"kubectl patch vmi {vm_name} -n {namespace} --type merge -p '{{\"spec\":{{\"evictionStrategy\":\"LiveMigrate\"}}}}'"
-
-        # Actually, the best way is to create a VirtualMachineInstanceMigration object
         import subprocess
-        migration_name = f"migration-{vm_name}"
+        migration_name = migration_name or f"migration-{vm_name}"
         migration_yaml = f"""apiVersion: kubevirt.io/v1
 kind: VirtualMachineInstanceMigration
 metadata:
@@ -1452,12 +2836,23 @@ metadata:
 spec:
   vmiName: {vm_name}
 """
+        if target_node:
+            if vmim_supports_added_node_selector(logger):
+                migration_yaml += f"""  addedNodeSelector:
+    kubernetes.io/hostname: {target_node}
+"""
+            else:
+                if logger:
+                    logger.debug(f"[{namespace}] Cannot request target node {target_node} for VM {vm_name}; "
+                                 f"migrating to a node the scheduler picks")
+                target_node = None
 
         # Delete any existing migration object first
-        subprocess.run(
-            f"kubectl delete virtualmachineinstancemigration {migration_name} -n {namespace} 2>/dev/null || true",
-            shell=True, capture_output=True
-        )
+        if replace_existing:
+            subprocess.run(
+                f"kubectl delete virtualmachineinstancemigration {migration_name} -n {namespace} 2>/dev/null || true",
+                shell=True, capture_output=True
+            )
 
         # Create migration object
         result = subprocess.run(
@@ -1467,7 +2862,8 @@ spec:
 
         if result.returncode == 0:
             if logger:
-                logger.info(f"[{namespace}] Migration triggered for VM {vm_name}")
+                logger.info(f"[{namespace}] Migration triggered for VM {vm_name}"
+                            + (f" to {target_node}" if target_node else ""))
             return True
         else:
             if logger:
@@ -1511,7 +2907,8 @@ def get_migration_status(vm_name: str, namespace: str,
 
 
 def get_vmim_timestamps(vm_name: str, namespace: str,
-                       logger: Optional[logging.Logger] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+                       logger: Optional[logging.Logger] = None,
+                       migration_name: Optional[str] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     Get migration timestamps from VirtualMachineInstanceMigration object.
 
@@ -1519,12 +2916,13 @@ def get_vmim_timestamps(vm_name: str, namespace: str,
         vm_name: Name of the VM
         namespace: Namespace
         logger: Logger instance
+        migration_name: VMIM name (default: migration-<vm_name>)
 
     Returns:
         Tuple of (startTimestamp, endTimestamp, phase)
     """
     try:
-        migration_name = f"migration-{vm_name}"
+        migration_name = migration_name or f"migration-{vm_name}"
 
         # Get VMIM object
         args = ['get', 'virtualmachineinstancemigration', migration_name, '-n', namespace,
@@ -1576,9 +2974,358 @@ def calculate_vmim_duration(start_timestamp: str, end_timestamp: str) -> Optiona
         return None
 
 
+# Stages a migration is split into, each between two VMIM / migrationState events
+MIGRATION_STAGES = (
+    ('scheduling_sec', 'created', 'Scheduled'),
+    ('target_prep_sec', 'Scheduled', 'TargetReady'),
+    ('memory_transfer_sec', 'Running', 'target_domain_ready'),
+    ('switchover_sec', 'target_domain_ready', 'Succeeded'),
+)
+
+
+def get_vmim_phase_breakdown(vm_name: str, namespace: str,
+                             logger: Optional[logging.Logger] = None,
+                             migration_name: Optional[str] = None) -> Optional[dict]:
+    """
+    Split the last migration of a VM into scheduling, target prep, memory transfer and switchover.
+
+    Reads the phase transition timestamps of the VMIM, the target pod and
+    domain-ready timestamps of its migrationState (falling back to the VMI's
+    migrationState on KubeVirt versions that do not mirror it into the VMIM)
+    and the creation time of the target pod. Kubernetes timestamps have
+    one-second resolution, so short stages may report 0.
+
+    Stages:
+        scheduling_sec: VMIM created -> Scheduled (target pod scheduled)
+        target_prep_sec: Scheduled -> TargetReady (target virt-launcher prepared)
+        memory_transfer_sec: Running -> target domain ready (pre-copy and stop-and-copy)
+        switchover_sec: target domain ready -> Succeeded (handover to the target)
+
+    Args:
+        vm_name: Name of the VM
+        namespace: Namespace of the VM
+        logger: Logger instance
+        migration_name: VMIM name (default: migration-<vm_name>)
+
+    Returns:
+        Dict with 'events' (event -> ISO timestamp) and one value per stage
+        (None when an event is missing), or None if the VMIM cannot be read
+    """
+    migration_name = migration_name or f"migration-{vm_name}"
+    returncode, stdout, stderr = run_kubectl_command(
+        ['get', 'virtualmachineinstancemigration', migration_name, '-n', namespace, '-o', 'json'],
+        check=False, logger=logger
+    )
+    if returncode != 0:
+        if logger:
+            logger.debug(f"[{namespace}] Could not read VMIM {migration_name}: {stderr}")
+        return None
+
+    try:
+        vmim = json.loads(stdout)
+    except json.JSONDecodeError:
+        return None
+
+    status = vmim.get('status', {})
+    events = {'created': vmim.get('metadata', {}).get('creationTimestamp')}
+    for transition in status.get('phaseTransitionTimestamps', []) or []:
+        if transition.get('phase'):
+            events[transition['phase']] = transition.get('phaseTransitionTimestamp')
+
+    state = status.get('migrationState')
+    if not state:
+        returncode, stdout, _ = run_kubectl_command(
+            ['get', 'vmi', vm_name, '-n', namespace, '-o', 'jsonpath={.status.migrationState}'],
+            check=False, logger=logger
+        )
+        try:
+            state = json.loads(stdout) if returncode == 0 and stdout.strip() else {}
+        except json.JSONDecodeError:
+            state = {}
+        # The VMI only holds the state of its latest migration
+        if state.get('migrationUid') and state['migrationUid'] != vmim.get('metadata', {}).get('uid'):
+            state = {}
+
+    events['migration_start'] = state.get('startTimestamp')
+    events['target_domain_ready'] = state.get('targetNodeDomainReadyTimestamp')
+    events['migration_end'] = state.get('endTimestamp')
+
+    target_pod = state.get('targetPod')
+    if target_pod:
+        returncode, stdout, _ = run_kubectl_command(
+            ['get', 'pod', target_pod, '-n', namespace, '-o', 'jsonpath={.metadata.creationTimestamp}'],
+            check=False, logger=logger
+        )
+        if returncode == 0 and stdout.strip():
+            events['target_pod_created'] = stdout.strip()
+
+    # Older KubeVirt versions lack phase transition timestamps; use migrationState instead
+    events.setdefault('Running', events.get('migration_start'))
+    events.setdefault('Succeeded', events.get('migration_end'))
+
+    parsed = {name: parse_k8s_timestamp(ts) for name, ts in events.items()}
+    breakdown = {'events': {name: ts for name, ts in events.items() if ts}, 'target_pod': target_pod}
+    for stage, start, end in MIGRATION_STAGES:
+        if parsed.get(start) and parsed.get(end):
+            breakdown[stage] = max(0.0, round((parsed[end] - parsed[start]).total_seconds(), 2))
+        else:
+            breakdown[stage] = None
+    return breakdown
+
+
+def collect_vmim_phase_breakdowns(vms: Dict[str, Tuple[str, str]], concurrency: int = 20,
+                                  logger: Optional[logging.Logger] = None) -> Dict[str, dict]:
+    """
+    Read the phase breakdown of many finished migrations in one batched pass.
+
+    Meant to run after the migration wave, so the extra API reads stay out
+    of the measured window.
+
+    Args:
+        vms: Dict mapping target label to (namespace, vm_name)
+        concurrency: Number of VMIMs to read in parallel
+        logger: Logger instance
+
+    Returns:
+        Dict mapping target label to the result of get_vmim_phase_breakdown;
+        targets whose VMIM could not be read are omitted
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    if logger:
+        logger.info(f"Collecting VMIM phase breakdown for {len(vms)} migrations (concurrency={concurrency})...")
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {executor.submit(get_vmim_phase_breakdown, vm, ns, logger): target
+                   for target, (ns, vm) in vms.items()}
+        for future in as_completed(futures):
+            target = futures[future]
+            try:
+                breakdown = future.result()
+            except Exception as e:
+                breakdown = None
+                if logger:
+                    logger.debug(f"[{target}] VMIM phase breakdown error: {e}")
+            if breakdown:
+                results[target] = breakdown
+            elif logger:
+                logger.warning(f"[{target}] Could not read VMIM phase breakdown")
+
+    if logger:
+        logger.info(f"VMIM phase breakdown collected for {len(results)}/{len(vms)} migrations")
+    return results
+
+
+# Per-VM metrics returned by MigrationTransferSampler.stop
+TRANSFER_METRICS = ('migration_mode', 'data_processed_mib', 'data_total_mib', 'data_remaining_mib',
+                    'memory_bandwidth_mibps', 'peak_dirty_rate_mibps', 'iterations', 'postcopy_requests',
+                    'effective_bandwidth_mibps')
+
+_SIZE_UNITS = {'B': 1.0 / 1048576, 'KiB': 1.0 / 1024, 'MiB': 1.0, 'GiB': 1024.0, 'TiB': 1048576.0}
+
+
+def parse_domjobinfo(output: str) -> dict:
+    """
+    Parse the output of ``virsh domjobinfo`` into numbers.
+
+    Sizes are returned in MiB, bandwidths in MiB/s and the dirty rate in MiB/s
+    (pages/s times the page size).
+
+    Args:
+        output: domjobinfo output ("Key:   value unit" lines)
+
+    Returns:
+        Dict with data_processed_mib, data_remaining_mib, data_total_mib,
+        memory_bandwidth_mibps, dirty_rate_mibps, iterations, postcopy_requests
+        and downtime_ms where present
+    """
+    raw = {}
+    for line in output.splitlines():
+        if ':' not in line:
+            continue
+        key, value = line.split(':', 1)
+        parts = value.split()
+        if not parts:
+            continue
+        try:
+            raw[key.strip().lower()] = (float(parts[0]), parts[1] if len(parts) > 1 else '')
+        except ValueError:
+            continue
+
+    def size_mib(key):
+        if key not in raw:
+            return None
+        number, unit = raw[key]
+        return round(number * _SIZE_UNITS.get(unit.split('/')[0], 1.0), 2)
+
+    stats = {
+        'data_processed_mib': size_mib('data processed'),
+        'data_remaining_mib': size_mib('data remaining'),
+        'data_total_mib': size_mib('data total'),
+        'memory_bandwidth_mibps': size_mib('memory bandwidth'),
+        'iterations': int(raw['iteration'][0]) if 'iteration' in raw else None,
+        'postcopy_requests': int(raw['postcopy requests'][0]) if 'postcopy requests' in raw else None,
+        'downtime_ms': raw['total downtime'][0] if 'total downtime' in raw else None,
+        'dirty_rate_mibps': None,
+    }
+    if 'dirty rate' in raw:
+        page_size = raw['page size'][0] if 'page size' in raw else 4096
+        stats['dirty_rate_mibps'] = round(raw['dirty rate'][0] * page_size / 1048576, 2)
+    return {k: v for k, v in stats.items() if v is not None}
+
+
+def get_launcher_pod(vm_name: str, namespace: str, node_name: Optional[str] = None,
+                     logger: Optional[logging.Logger] = None) -> Optional[str]:
+    """
+    Get the running virt-launcher pod of a VM, optionally the one on a given node.
+
+    Args:
+        vm_name: Name of the VM
+        namespace: Namespace of the VM
+        node_name: Only consider the pod on this node
+        logger: Logger instance
+
+    Returns:
+        Pod name, or None if not found
+    """
+    returncode, stdout, _ = run_kubectl_command(
+        ['get', 'pods', '-n', namespace, '-l', f'kubevirt.io=virt-launcher,vm.kubevirt.io/name={vm_name}',
+         '-o', 'jsonpath={range .items[*]}{.metadata.name}{"\\t"}{.spec.nodeName}{"\\t"}{.status.phase}{"\\n"}{end}'],
+        check=False,
+        logger=logger
+    )
+    if returncode != 0:
+        return None
+    for line in stdout.splitlines():
+        fields = line.split('\t')
+        if len(fields) == 3 and fields[2] == 'Running' and (not node_name or fields[1] == node_name):
+            return fields[0]
+    return None
+
+
+class MigrationTransferSampler:
+    """
+    Sample the libvirt migration job of one VM while it migrates.
+
+    A background thread runs ``virsh domjobinfo`` in the compute container of
+    the source virt-launcher pod every ``poll_interval`` seconds and keeps the
+    latest data processed/remaining/total, memory bandwidth, iteration count
+    and post-copy requests plus the peak dirty rate. KubeVirt only exposes
+    these through libvirt, so the sampler needs exec access to virt-launcher
+    pods. When stopped, the migration mode (PreCopy/PostCopy) is read from the
+    VMI's migrationState, the completed job of the target pod fills in any
+    missing totals, and the effective bandwidth (data processed over the VMIM
+    duration) is derived by the caller through ``finish``.
+    """
+
+    def __init__(self, target: str, vm_name: str, namespace: str, source_pod: str,
+                 poll_interval: float = 2, results: Optional[Dict[str, dict]] = None,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            target: Target label the result is stored under
+            vm_name: Name of the VM
+            namespace: Namespace of the VM
+            source_pod: virt-launcher pod on the source node
+            poll_interval: Seconds between samples
+            results: Dict collecting the result of every sampler
+            logger: Logger instance
+        """
+        import threading
+
+        self.target = target
+        self.vm_name = vm_name
+        self.namespace = namespace
+        self.source_pod = source_pod
+        self.poll_interval = poll_interval
+        self.results = results if results is not None else {}
+        self.logger = logger
+        self.last = {}
+        self.samples = 0
+        self.peak_dirty_rate = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f'transfer-{target}', daemon=True)
+
+    def _domjobinfo(self, pod: str, completed: bool = False) -> dict:
+        command = ['exec', '-n', self.namespace, pod, '-c', 'compute', '--',
+                   'virsh', 'domjobinfo', f"{self.namespace}_{self.vm_name}"]
+        if completed:
+            command.append('--completed')
+        returncode, stdout, _ = run_kubectl_command(command, check=False, timeout=15, logger=self.logger)
+        return parse_domjobinfo(stdout) if returncode == 0 else {}
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                stats = self._domjobinfo(self.source_pod)
+                if stats.get('data_total_mib'):
+                    self.last = stats
+                    self.samples += 1
+                    if stats.get('dirty_rate_mibps') is not None:
+                        self.peak_dirty_rate = max(self.peak_dirty_rate or 0, stats['dirty_rate_mibps'])
+            except Exception as e:
+                if self.logger:
+                    self.logger.debug(f"[{self.target}] domjobinfo sample error: {e}")
+            self._stop.wait(self.poll_interval)
+
+    def start(self):
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=self.poll_interval + 20)
+
+    def finish(self, duration_sec: Optional[float]) -> dict:
+        """
+        Stop sampling and record the transfer statistics of the migration.
+
+        Args:
+            duration_sec: Migration duration used for the effective bandwidth (VMIM time preferred)
+
+        Returns:
+            Dict with the TRANSFER_METRICS values that could be determined
+        """
+        self.stop()
+
+        mode = get_vmi_migration_mode(self.vm_name, self.namespace, self.logger)
+
+        stats = dict(self.last)
+        target_pod = get_launcher_pod(self.vm_name, self.namespace, logger=self.logger)
+        if target_pod and target_pod != self.source_pod:
+            for key, value in self._domjobinfo(target_pod, completed=True).items():
+                if key not in stats or key in ('data_processed_mib', 'data_total_mib'):
+                    stats[key] = value
+
+        processed = stats.get('data_processed_mib')
+        result = {
+            'migration_mode': mode,
+            'data_processed_mib': processed,
+            'data_total_mib': stats.get('data_total_mib'),
+            'data_remaining_mib': stats.get('data_remaining_mib'),
+            'memory_bandwidth_mibps': stats.get('memory_bandwidth_mibps'),
+            'peak_dirty_rate_mibps': self.peak_dirty_rate,
+            'iterations': stats.get('iterations'),
+            'postcopy_requests': stats.get('postcopy_requests'),
+            'effective_bandwidth_mibps': round(processed / duration_sec, 2)
+            if processed and duration_sec else None,
+            'samples': self.samples,
+        }
+        self.results[self.target] = result
+        if self.logger:
+            self.logger.info(f"[{self.target}] Transferred {processed or 'N/A'} MiB"
+                             + (f" at {result['effective_bandwidth_mibps']} MiB/s" if result['effective_bandwidth_mibps'] else "")
+                             + f" ({mode or 'mode unknown'}, {result['iterations'] or 'N/A'} iterations)")
+        return result
+
+
 def wait_for_migration_complete(vm_name: str, namespace: str, timeout: int = 600,
                                 poll_interval: int = 2,
-                                logger: Optional[logging.Logger] = None) -> Tuple[bool, float, Optional[str], Optional[float]]:
+                                logger: Optional[logging.Logger] = None,
+                                migration_name: Optional[str] = None) -> Tuple[bool, float, Optional[str], Optional[float]]:
     """
     Wait for VM migration to complete.
 
@@ -1588,6 +3335,7 @@ def wait_for_migration_complete(vm_name: str, namespace: str, timeout: int = 600
         timeout: Maximum time to wait in seconds
         poll_interval: Seconds between status checks (default: 2)
         logger: Logger instance
+        migration_name: VMIM name (default: migration-<vm_name>)
 
     Returns:
         Tuple of (success, observed_duration, target_node, vmim_duration)
@@ -1609,7 +3357,7 @@ def wait_for_migration_complete(vm_name: str, namespace: str, timeout: int = 600
             observed_duration = time.time() - start_time
 
             # Get VMIM timestamps for accurate measurement
-            start_ts, end_ts, phase = get_vmim_timestamps(vm_name, namespace, logger)
+            start_ts, end_ts, phase = get_vmim_timestamps(vm_name, namespace, logger, migration_name)
             vmim_duration = None
 
             if start_ts and end_ts:
@@ -1624,7 +3372,7 @@ def wait_for_migration_complete(vm_name: str, namespace: str, timeout: int = 600
             return True, observed_duration, current_node, vmim_duration
 
         # Check VMIM phase directly (more reliable than VMI migration state)
-        start_ts, end_ts, vmim_phase = get_vmim_timestamps(vm_name, namespace, logger)
+        start_ts, end_ts, vmim_phase = get_vmim_timestamps(vm_name, namespace, logger, migration_name)
         if vmim_phase and vmim_phase.lower() == "failed":
             if logger:
                 logger.error(f"[{namespace}] VMIM phase is Failed for VM {vm_name}")
@@ -1670,27 +3418,25 @@ def get_available_nodes(exclude_nodes: List[str] = None,
 
 
 def find_busiest_node(namespaces: List[str], vm_name: str,
-                     logger: Optional[logging.Logger] = None) -> Optional[str]:
+                     logger: Optional[logging.Logger] = None,
+                     index: Optional['VMPlacementIndex'] = None) -> Optional[str]:
     """
     Find the node with the most VMs from the given namespaces.
 
     Args:
-        namespaces: List of namespace names to check
+        namespaces: List of namespace names or VM targets (see expand_vm_targets) to check
         vm_name: VM name to look for
         logger: Logger instance
+        index: VMPlacementIndex to read placements from (a new snapshot if None)
 
     Returns:
         Node name with the most VMs, or None if no VMs found
     """
-    node_counts = {}
-
     if logger:
         logger.info(f"Scanning {len(namespaces)} namespaces to find busiest node...")
 
-    for ns in namespaces:
-        node = get_vm_node(vm_name, ns, logger)
-        if node:
-            node_counts[node] = node_counts.get(node, 0) + 1
+    index = index or VMPlacementIndex(logger)
+    node_counts = index.node_counts(namespaces, vm_name)
 
     if not node_counts:
         if logger:
@@ -1709,35 +3455,259 @@ def find_busiest_node(namespaces: List[str], vm_name: str,
 
 
 def get_vms_on_node(namespaces: List[str], vm_name: str, target_node: str,
-                   logger: Optional[logging.Logger] = None) -> List[str]:
+                   logger: Optional[logging.Logger] = None,
+                   index: Optional['VMPlacementIndex'] = None) -> List[str]:
     """
     Get list of namespaces where VMs are running on a specific node.
 
     Args:
-        namespaces: List of namespace names to check
+        namespaces: List of namespace names or VM targets (see expand_vm_targets) to check
         vm_name: VM name to look for
         target_node: Node name to filter by
         logger: Logger instance
+        index: VMPlacementIndex to read placements from (a new snapshot if None)
 
     Returns:
-        List of namespace names where VMs are on the target node
+        List of the namespaces (or VM targets) whose VMs are on the target node
     """
     vms_on_node = []
 
     if logger:
         logger.info(f"Scanning {len(namespaces)} namespaces for VMs on {target_node}...")
 
-    for ns in namespaces:
-        current_node = get_vm_node(vm_name, ns, logger)
+    index = index or VMPlacementIndex(logger)
+    for target, current_node in index.nodes_of(namespaces, vm_name).items():
         if current_node == target_node:
-            vms_on_node.append(ns)
+            vms_on_node.append(target)
             if logger:
-                logger.debug(f"[{ns}] VM is on {target_node}")
+                logger.debug(f"[{target}] VM is on {target_node}")
 
     if logger:
         logger.info(f"Found {len(vms_on_node)} VMs on {target_node}")
 
-    return vms_on_node
+    return vms_on_node
+
+
+class VMPlacementIndex:
+    """
+    Snapshot of where every VMI in the cluster runs.
+
+    One cluster-wide ``kubectl get vmi -A`` (paginated with ``--chunk-size``)
+    replaces a ``get vmi`` per VM. The snapshot is taken on first use and is
+    only replaced by ``refresh()``, or lazily after ``invalidate()``; callers
+    decide when placements may have changed, e.g. after a migration wave.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, chunk_size: int = 500):
+        """
+        Args:
+            logger: Logger instance
+            chunk_size: VMIs per list page
+        """
+        self.logger = logger
+        self.chunk_size = chunk_size
+        self.refreshed_at: Optional[float] = None
+        self._vmis: Optional[Dict[Tuple[str, str], dict]] = None
+
+    def refresh(self) -> bool:
+        """
+        Take a new snapshot of all VMIs.
+
+        Returns:
+            True if the VMIs were listed, False otherwise (the index is then empty)
+        """
+        returncode, stdout, stderr = run_kubectl_command(
+            ['get', 'vmi', '-A', f'--chunk-size={self.chunk_size}', '-o',
+             'jsonpath={range .items[*]}{.metadata.namespace}{"\\t"}{.metadata.name}{"\\t"}'
+             '{.status.nodeName}{"\\t"}{.status.phase}{"\\n"}{end}'],
+            check=False,
+            logger=self.logger
+        )
+        self._vmis = {}
+        self.refreshed_at = time.time()
+        if returncode != 0:
+            if self.logger:
+                self.logger.error(f"Failed to list all VMIs: {stderr}")
+            return False
+
+        for line in stdout.splitlines():
+            fields = line.split('\t')
+            if len(fields) != 4:
+                continue
+            namespace, name, node, phase = fields
+            self._vmis[(namespace, name)] = {'node': node or None, 'phase': phase or None}
+        if self.logger:
+            self.logger.info(f"Indexed {len(self._vmis)} VMI(s) on {len(self.node_counts())} node(s)")
+        return True
+
+    def invalidate(self) -> None:
+        """Drop the snapshot; the next lookup takes a new one."""
+        self._vmis = None
+
+    def _snapshot(self) -> Dict[Tuple[str, str], dict]:
+        if self._vmis is None:
+            self.refresh()
+        return self._vmis
+
+    def node_of(self, namespace: str, vm_name: str) -> Optional[str]:
+        """Node a VMI runs on, or None if the VMI is unknown or not scheduled."""
+        return self._snapshot().get((namespace, vm_name), {}).get('node')
+
+    def nodes_of(self, targets: List[str], vm_name: str) -> Dict[str, Optional[str]]:
+        """
+        Map VM targets to their nodes.
+
+        Args:
+            targets: Namespaces or 'namespace/vm' targets (see expand_vm_targets)
+            vm_name: VM name for plain namespace targets
+
+        Returns:
+            Dict mapping each target to its node (None if not found)
+        """
+        return {t: self.node_of(*split_vm_target(t, vm_name)) for t in targets}
+
+    def vms_on_node(self, node_name: str) -> List[Tuple[str, str]]:
+        """Sorted (namespace, name) of the VMIs on a node."""
+        return sorted(key for key, vmi in self._snapshot().items() if vmi['node'] == node_name)
+
+    def node_counts(self, targets: Optional[List[str]] = None, vm_name: Optional[str] = None) -> Dict[str, int]:
+        """
+        Count VMIs per node.
+
+        Args:
+            targets: Only count these targets (all VMIs if None)
+            vm_name: VM name for plain namespace targets
+
+        Returns:
+            Dict mapping node name to its VMI count
+        """
+        if targets is None:
+            nodes = [vmi['node'] for vmi in self._snapshot().values()]
+        else:
+            nodes = list(self.nodes_of(targets, vm_name).values())
+        counts: Dict[str, int] = {}
+        for node in nodes:
+            if node:
+                counts[node] = counts.get(node, 0) + 1
+        return counts
+
+
+def expand_vm_targets(namespaces: List[str], vm_name: str, vms_per_namespace: int = 1) -> List[str]:
+    """
+    Expand test namespaces into VM targets.
+
+    With one VM per namespace a target is just the namespace name. In packing
+    mode each namespace holds VMs named {vm_name}-1 .. {vm_name}-M and a target
+    is 'namespace/vm'.
+
+    Args:
+        namespaces: Namespace names
+        vm_name: Base VM name
+        vms_per_namespace: Number of VMs in each namespace
+
+    Returns:
+        List of VM targets, grouped by namespace
+    """
+    if vms_per_namespace <= 1:
+        return list(namespaces)
+    return [f"{ns}/{vm_name}-{j}" for ns in namespaces for j in range(1, vms_per_namespace + 1)]
+
+
+def split_vm_target(target: str, vm_name: str) -> Tuple[str, str]:
+    """
+    Split a VM target into its namespace and VM name.
+
+    Args:
+        target: 'namespace' or 'namespace/vm' (see expand_vm_targets)
+        vm_name: VM name used when the target is a bare namespace
+
+    Returns:
+        Tuple of (namespace, vm_name)
+    """
+    if '/' in target:
+        ns, name = target.split('/', 1)
+        return ns, name
+    return target, vm_name
+
+
+def packed_resource_name(name: str, vm_name: str, packed_vm_name: str) -> str:
+    """
+    Derive the per-VM name of a resource defined in a VM template.
+
+    Resources named after the template VM (e.g. 'rhel-9-vm-volume') follow the
+    VM rename ('rhel-9-vm-3-volume'); other names are left unchanged.
+
+    Args:
+        name: Resource name in the template
+        vm_name: VM name in the template
+        packed_vm_name: Name of the packed VM
+
+    Returns:
+        Resource name for the packed VM
+    """
+    if name == vm_name or name.startswith(f"{vm_name}-"):
+        return packed_vm_name + name[len(vm_name):]
+    return name
+
+
+def render_packed_vm_yaml(yaml_file: str, packed_vm_name: str, node_name: Optional[str] = None,
+                          logger: Optional[logging.Logger] = None) -> Optional[str]:
+    """
+    Render a VM template under a new VM name so several copies fit in one namespace.
+
+    Every name/claimName value derived from the template's VM name (the VM itself,
+    its dataVolumeTemplates and the volumes that reference them) is renamed with
+    packed_resource_name(). Works on the raw text, so templates that still contain
+    {{PLACEHOLDERS}} are supported. Optionally pins the VM to a node.
+
+    Args:
+        yaml_file: Path to VM YAML file
+        packed_vm_name: New VM name
+        node_name: Optional node name for a kubernetes.io/hostname nodeSelector
+        logger: Logger instance
+
+    Returns:
+        Rendered YAML content, or None on error
+    """
+    import re
+
+    try:
+        if node_name:
+            content = add_node_selector_to_vm_yaml(yaml_file, node_name, logger)
+            if content is None:
+                return None
+        else:
+            with open(yaml_file, 'r') as f:
+                content = f.read()
+
+        # The VM name is the first top-level metadata.name of the VirtualMachine document;
+        # it may be a literal name or a {{PLACEHOLDER}}, and blank lines may precede it
+        vm_name = None
+        for doc in re.split(r'^---\s*$', content, flags=re.MULTILINE):
+            if re.search(r'^kind:\s*VirtualMachine\s*$', doc, flags=re.MULTILINE):
+                match = re.search(r'^metadata:\s*\n(?:(?:[ \t]+.*)?\n)*?[ \t]{2}name:\s*["\']?'
+                                  r'(\{\{\s*\w+\s*\}\}|[\w.-]+)', doc, flags=re.MULTILINE)
+                if match:
+                    vm_name = match.group(1)
+                break
+        if not vm_name:
+            if logger:
+                logger.error(f"No VirtualMachine name found in {yaml_file}")
+            return None
+
+        pattern = re.compile(
+            r'^(\s*(?:-\s+)?(?:name|claimName):\s*["\']?)(' + re.escape(vm_name) + r'(?:-[\w.-]*)?)(["\']?\s*)$',
+            flags=re.MULTILINE
+        )
+        return pattern.sub(
+            lambda m: m.group(1) + packed_resource_name(m.group(2), vm_name, packed_vm_name) + m.group(3),
+            content
+        )
+
+    except Exception as e:
+        if logger:
+            logger.error(f"Failed to render {yaml_file} as VM {packed_vm_name}: {e}")
+        return None
 
 
 def add_node_selector_to_vm_yaml(yaml_file: str, node_name: str,
@@ -1827,7 +3797,8 @@ def print_summary_table(
     results: List[Tuple],
     title: str = "Performance Test Summary",
     skip_clone: bool = False,
-    logger=None
+    logger=None,
+    guest_boot: Optional[Dict[str, dict]] = None
 ):
     """
     Print or log a formatted summary table of test results.
@@ -1837,6 +3808,8 @@ def print_summary_table(
         title: Table title
         skip_clone: If True, omit clone duration column and statistics
         logger: Optional logger instance. If provided, logs instead of printing.
+        guest_boot: Optional guest boot times per target (see collect_guest_boot_times);
+                    adds a guest-ready column and statistics
     """
     def output(msg=""):
         if logger:
@@ -1848,9 +3821,12 @@ def print_summary_table(
     output("=" * 95)
 
     if skip_clone:
-        header = f"{'Namespace':<30}{'Running(s)':<20}{'Ping(s)':<20}{'Status':<20}"
+        header = f"{'Namespace':<30}{'Running(s)':<20}{'Ping(s)':<20}"
     else:
-        header = f"{'Namespace':<30}{'Running(s)':<15}{'Ping(s)':<15}{'Clone(s)':<15}{'Status':<20}"
+        header = f"{'Namespace':<30}{'Running(s)':<15}{'Ping(s)':<15}{'Clone(s)':<15}"
+    if guest_boot is not None:
+        header += f"{'Guest(s)':<15}"
+    header += f"{'Status':<20}"
 
     output(header)
     output("-" * 95)
@@ -1860,6 +3836,7 @@ def print_summary_table(
     running_times = []
     ping_times = []
     clone_times = []
+    guest_times = []
 
     for result in sorted(results, key=lambda x: x[0]):
         ns, run_t, ping_t, clone_t, ok = result[:5]
@@ -1870,9 +3847,13 @@ def print_summary_table(
         status = f"{Colors.OKGREEN}Success{Colors.ENDC}" if ok else f"{Colors.FAIL}Failed{Colors.ENDC}"
 
         if skip_clone:
-            line = f"{ns:<30}{run_str:<20}{ping_str:<20}{status:<20}"
+            line = f"{ns:<30}{run_str:<20}{ping_str:<20}"
         else:
-            line = f"{ns:<30}{run_str:<15}{ping_str:<15}{clone_str:<15}{status:<20}"
+            line = f"{ns:<30}{run_str:<15}{ping_str:<15}{clone_str:<15}"
+        guest_t = (guest_boot or {}).get(ns, {}).get('guest_ready_time_sec')
+        if guest_boot is not None:
+            line += f"{guest_t:<15.2f}" if guest_t is not None else f"{'-':<15}"
+        line += f"{status:<20}"
 
         output(line)
 
@@ -1884,6 +3865,8 @@ def print_summary_table(
                 ping_times.append(ping_t)
             if not skip_clone and clone_t is not None:
                 clone_times.append(clone_t)
+            if guest_t is not None:
+                guest_times.append(guest_t)
         else:
             failed += 1
 
@@ -1908,11 +3891,24 @@ def print_summary_table(
         output(f"  Max Clone Duration:     {max(clone_times):.2f}s")
         output(f"  Min Clone Duration:     {min(clone_times):.2f}s")
 
+    if guest_times:
+        output(f"  Avg Guest Ready:        {sum(guest_times) / len(guest_times):.2f}s")
+        output(f"  Max Guest Ready:        {max(guest_times):.2f}s")
+        output(f"  Min Guest Ready:        {min(guest_times):.2f}s")
+
+    if guest_boot is not None:
+        output(f"\n  {'Percentiles (s)':<24}{'P50':>10}{'P95':>10}{'P99':>10}")
+        for label, values in (('Time to Running', running_times), ('Time to Ping', ping_times),
+                              ('Time to Guest Ready', guest_times)):
+            if values:
+                p50, p95, p99 = (calculate_percentile(values, p) for p in (50, 95, 99))
+                output(f"  {label:<24}{p50:>10.2f}{p95:>10.2f}{p99:>10.2f}")
+
     output("=" * 95)
 
 
 def save_results(args, results, base_dir="results", prefix="vm_creation_results",
-                 logger=None, skip_clone=False, total_time=None):
+                 logger=None, skip_clone=False, total_time=None, guest_boot=None):
     """
     Save test results into the specified results folder (or create a new one), including summary statistics.
 
@@ -1924,6 +3920,8 @@ def save_results(args, results, base_dir="results", prefix="vm_creation_results"
         logger: Logger instance (optional)
         skip_clone: If True, omit clone duration metrics from saved results and summaries
         total_time: Total time taken for the test (VM creation or boot storm)
+        guest_boot: Optional guest boot times per namespace (see collect_guest_boot_times);
+                    adds cloud-init, systemd and guest-ready columns and metrics
 
     Returns:
         Tuple of (json_path, csv_path, summary_json_path, summary_csv_path, output_dir)
@@ -1957,6 +3955,9 @@ def save_results(args, results, base_dir="results", prefix="vm_creation_results"
         }
         if not skip_clone:
             entry["clone_duration_sec"] = round(clone_t, 2) if clone_t is not None else None
+        if guest_boot is not None:
+            for key in GUEST_BOOT_METRICS:
+                entry[key] = guest_boot.get(ns, {}).get(key)
         data.append(entry)
 
     # Save detailed JSON
@@ -1983,13 +3984,7 @@ def save_results(args, results, base_dir="results", prefix="vm_creation_results"
     clone_times = [r[3] for r in results if r[3] is not None] if not skip_clone else []
 
     def calc_stats(name, values):
-        return {
-            "metric": name,
-            "avg": round(sum(values) / len(values), 2) if values else None,
-            "max": round(max(values), 2) if values else None,
-            "min": round(min(values), 2) if values else None,
-            "count": len(values),
-        }
+        return dict(metric=name, **summarize_distribution(values))
 
     metrics = [
         calc_stats("running_time_sec", running_times),
@@ -1997,6 +3992,9 @@ def save_results(args, results, base_dir="results", prefix="vm_creation_results"
     ]
     if not skip_clone:
         metrics.append(calc_stats("clone_duration_sec", clone_times))
+    if guest_boot is not None:
+        for key in GUEST_BOOT_METRICS:
+            metrics.append(calc_stats(key, [g[key] for g in guest_boot.values() if g.get(key) is not None]))
 
     # --- Add total test duration ---
     summary = {
@@ -2015,7 +4013,7 @@ def save_results(args, results, base_dir="results", prefix="vm_creation_results"
 
     # --- Save summary CSV ---
     with open(summary_csv_path, "w", newline="") as cf:
-        writer = csv.DictWriter(cf, fieldnames=["metric", "avg", "max", "min", "count"])
+        writer = csv.DictWriter(cf, fieldnames=["metric", "avg", "max", "min", "count", "p50", "p95", "p99"])
         writer.writeheader()
         for m in summary["metrics"]:
             writer.writerow(m)
@@ -2025,7 +4023,273 @@ def save_results(args, results, base_dir="results", prefix="vm_creation_results"
     return json_path, csv_path, summary_json_path, summary_csv_path, output_dir
 
 
-def save_migration_results(args, results, base_dir="results", logger=None, total_time=None):
+class MigrationScheduler:
+    """
+    Harness-side live migration scheduler with in-flight limits.
+
+    Runs ``run_migration(target, target_node)`` for every queued job while keeping at
+    most ``max_in_flight`` migrations in flight cluster-wide, ``max_per_source`` per
+    source node and ``max_per_target`` per explicit target node (0 disables a limit).
+    Of the jobs allowed to start, the one whose source and target nodes carry the
+    fewest in-flight migrations is admitted first (ties keep queue order), so load is
+    spread over the nodes instead of draining them one at a time.
+
+    Each job records when it was queued, admitted and finished, so the queueing delay
+    of the harness is reported separately from the active migration time.
+    """
+
+    def __init__(self, run_migration, max_in_flight: int, max_per_source: int = 0,
+                 max_per_target: int = 0, on_result=None,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            run_migration: Callable(target, target_node) performing one migration
+            max_in_flight: Cluster-wide limit of concurrent migrations
+            max_per_source: Limit of concurrent migrations per source node (0 = unlimited)
+            max_per_target: Limit of concurrent migrations per target node (0 = unlimited);
+                only applies to jobs with an explicit target node
+            on_result: Optional callable(target, result, error) invoked as jobs finish
+            logger: Logger instance
+        """
+        self.run_migration = run_migration
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_per_source = max_per_source
+        self.max_per_target = max_per_target
+        self.on_result = on_result
+        self.logger = logger
+        self.records: List[dict] = []
+        self.started_at = None
+        self.peak_in_flight = 0
+
+    def _eligible(self, job: dict, source_load: Dict[str, int], target_load: Dict[str, int]) -> bool:
+        if self.max_per_source and job['source_node'] and \
+                source_load.get(job['source_node'], 0) >= self.max_per_source:
+            return False
+        if self.max_per_target and job['target_node'] and \
+                target_load.get(job['target_node'], 0) >= self.max_per_target:
+            return False
+        return True
+
+    def _next_job(self, pending: List[dict], source_load: Dict[str, int],
+                  target_load: Dict[str, int]) -> Optional[dict]:
+        best = None
+        best_key = None
+        for job in pending:
+            if not self._eligible(job, source_load, target_load):
+                continue
+            key = (source_load.get(job['source_node'], 0) + target_load.get(job['target_node'], 0),
+                   job['order'])
+            if best_key is None or key < best_key:
+                best, best_key = job, key
+        return best
+
+    def _execute(self, job: dict):
+        try:
+            return self.run_migration(job['target'], job['target_node'])
+        finally:
+            job['finished_at'] = datetime.now()
+
+    def run(self, jobs: List[Tuple[str, Optional[str], Optional[str]]]) -> List[Tuple[str, object, Optional[Exception]]]:
+        """
+        Run all jobs under the configured limits.
+
+        Args:
+            jobs: List of (target, source_node, target_node) in queue order; a node may be
+                None when it is unknown or left to KubeVirt
+
+        Returns:
+            List of (target, result, error) in completion order; error is the exception
+            raised by run_migration, or None
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        self.started_at = datetime.now()
+        pending = [
+            {'order': i, 'target': target, 'source_node': source, 'target_node': dest,
+             'queued_at': self.started_at, 'admitted_at': None, 'finished_at': None,
+             'in_flight_at_admission': None, 'failed': False}
+            for i, (target, source, dest) in enumerate(jobs)
+        ]
+        self.records = list(pending)
+        in_flight = {}
+        source_load: Dict[str, int] = {}
+        target_load: Dict[str, int] = {}
+        results = []
+
+        if self.logger:
+            limits = [f"cluster={self.max_in_flight}"]
+            if self.max_per_source:
+                limits.append(f"per-source-node={self.max_per_source}")
+            if self.max_per_target:
+                limits.append(f"per-target-node={self.max_per_target}")
+            self.logger.info(f"Scheduling {len(pending)} migrations (in-flight limits: {', '.join(limits)})")
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            while pending or in_flight:
+                while pending and len(in_flight) < self.max_in_flight:
+                    job = self._next_job(pending, source_load, target_load)
+                    if job is None:
+                        break
+                    pending.remove(job)
+                    job['admitted_at'] = datetime.now()
+                    job['in_flight_at_admission'] = len(in_flight)
+                    if job['source_node']:
+                        source_load[job['source_node']] = source_load.get(job['source_node'], 0) + 1
+                    if job['target_node']:
+                        target_load[job['target_node']] = target_load.get(job['target_node'], 0) + 1
+                    in_flight[executor.submit(self._execute, job)] = job
+                    self.peak_in_flight = max(self.peak_in_flight, len(in_flight))
+                    if self.logger:
+                        wait_sec = (job['admitted_at'] - job['queued_at']).total_seconds()
+                        self.logger.debug(f"[{job['target']}] Admitted after {wait_sec:.1f}s in queue "
+                                          f"({job['source_node'] or 'unknown'} -> "
+                                          f"{job['target_node'] or 'auto'}, {len(in_flight)} in flight)")
+
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = in_flight.pop(future)
+                    if job['source_node']:
+                        source_load[job['source_node']] -= 1
+                    if job['target_node']:
+                        target_load[job['target_node']] -= 1
+                    try:
+                        result, error = future.result(), None
+                    except Exception as e:
+                        result, error = None, e
+                        job['failed'] = True
+                    results.append((job['target'], result, error))
+                    if self.on_result:
+                        self.on_result(job['target'], result, error)
+
+        return results
+
+    def get_records(self) -> List[dict]:
+        """Return one serializable record per job, with times in seconds since the run started."""
+        def offset(ts):
+            return round((ts - self.started_at).total_seconds(), 2) if ts else None
+
+        records = []
+        for job in self.records:
+            admitted, finished = job['admitted_at'], job['finished_at']
+            records.append({
+                'target': job['target'],
+                'source_node': job['source_node'],
+                'target_node': job['target_node'],
+                'queued_sec': offset(job['queued_at']),
+                'admitted_sec': offset(admitted),
+                'finished_sec': offset(finished),
+                'queue_wait_sec': round((admitted - job['queued_at']).total_seconds(), 2) if admitted else None,
+                'active_sec': round((finished - admitted).total_seconds(), 2) if admitted and finished else None,
+                'in_flight_at_admission': job['in_flight_at_admission'],
+            })
+        return records
+
+    def get_throughput_timeline(self, bucket_sec: int = 60) -> List[dict]:
+        """
+        Return migrations started, finished and in flight per time bucket.
+
+        Args:
+            bucket_sec: Bucket width in seconds (default: one minute)
+
+        Returns:
+            List of dicts, one per bucket, with the completion rate as migrations/minute
+        """
+        records = [r for r in self.get_records() if r['finished_sec'] is not None]
+        if not records:
+            return []
+        end = max(r['finished_sec'] for r in records)
+
+        def in_flight(ts):
+            return sum(1 for r in records if r['admitted_sec'] <= ts < r['finished_sec'])
+
+        timeline = []
+        lo = 0
+        while lo == 0 or lo < end:
+            hi = lo + bucket_sec
+            last = hi >= end
+            finished = sum(1 for r in records
+                           if lo <= r['finished_sec'] < hi or (last and r['finished_sec'] == hi))
+            admissions = [r['admitted_sec'] for r in records if lo <= r['admitted_sec'] < hi]
+            width = min(hi, end) - lo
+            timeline.append({
+                'start_sec': lo,
+                'end_sec': round(min(hi, end), 2),
+                'started': len(admissions),
+                'finished': finished,
+                'peak_in_flight': max(in_flight(ts) for ts in [lo] + admissions),
+                'migrations_per_min': round(finished * 60 / width, 2) if width > 0 else None,
+            })
+            lo = hi
+        return timeline
+
+
+def save_migration_schedule(scheduler: MigrationScheduler, base_dir: str,
+                            logger: Optional[logging.Logger] = None) -> Tuple[str, str, str]:
+    """
+    Save the per-VM schedule and the migration throughput timeline of a MigrationScheduler.
+
+    Args:
+        scheduler: Scheduler that ran the migrations
+        base_dir: Results directory of the run
+        logger: Logger instance
+
+    Returns:
+        Tuple of (schedule_json, throughput_timeline_csv, summary_json)
+    """
+    os.makedirs(base_dir, exist_ok=True)
+    records = scheduler.get_records()
+    timeline = scheduler.get_throughput_timeline()
+
+    schedule_path = os.path.join(base_dir, "migration_schedule.json")
+    timeline_path = os.path.join(base_dir, "migration_throughput_timeline.csv")
+    summary_path = os.path.join(base_dir, "summary_migration_schedule.json")
+
+    with open(schedule_path, "w") as f:
+        json.dump(records, f, indent=4)
+
+    with open(timeline_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["start_sec", "end_sec", "started", "finished",
+                                               "peak_in_flight", "migrations_per_min"])
+        writer.writeheader()
+        writer.writerows(timeline)
+
+    def stats(metric, values):
+        return dict(metric=metric, **summarize_distribution(values))
+
+    finished = [r for r in records if r['finished_sec'] is not None]
+    window = max((r['finished_sec'] for r in finished), default=0)
+    rates = [b['migrations_per_min'] for b in timeline if b['migrations_per_min'] is not None]
+    summary = {
+        "max_in_flight": scheduler.max_in_flight,
+        "max_per_source_node": scheduler.max_per_source or None,
+        "max_per_target_node": scheduler.max_per_target or None,
+        "scheduled_migrations": len(records),
+        "peak_in_flight": scheduler.peak_in_flight,
+        "schedule_window_sec": round(window, 2),
+        "overall_migrations_per_min": round(len(finished) * 60 / window, 2) if window else None,
+        "peak_migrations_per_min": max(rates) if rates else None,
+        "metrics": [
+            stats("queue_wait_sec", [r['queue_wait_sec'] for r in records if r['queue_wait_sec'] is not None]),
+            stats("active_sec", [r['active_sec'] for r in records if r['active_sec'] is not None]),
+        ],
+    }
+    with open(summary_path, "w") as f:
+        json.dump(summary, f, indent=4)
+
+    if logger:
+        logger.info(f"Saved migration schedule to {schedule_path}")
+        logger.info(f"Saved migration throughput timeline to {timeline_path}")
+        if summary["overall_migrations_per_min"]:
+            logger.info(f"Migration throughput: {summary['overall_migrations_per_min']} migrations/min "
+                        f"over {summary['schedule_window_sec']}s "
+                        f"(peak {summary['peak_migrations_per_min']}/min, "
+                        f"peak in flight {summary['peak_in_flight']})")
+
+    return schedule_path, timeline_path, summary_path
+
+
+def save_migration_results(args, results, base_dir="results", logger=None, total_time=None,
+                           schedule=None, phases=None, downtime=None, requested_targets=None, transfer=None):
     """
     Save VM migration results (per-VM data and summary) into JSON and CSV files.
 
@@ -2035,6 +4299,18 @@ def save_migration_results(args, results, base_dir="results", logger=None, total
         base_dir: Parent folder
         logger: Logger instance
         total_time: Total wall-clock migration duration (sec)
+        schedule: Optional MigrationScheduler records; adds queue wait and active time per VM
+        phases: Optional dict mapping namespace to its VMIM phase breakdown
+            (see collect_vmim_phase_breakdowns); adds per-stage times and percentiles
+        downtime: Optional dict mapping namespace to its PingDowntimeProbe result;
+            adds network downtime and lost packets with percentiles
+        requested_targets: Optional dict mapping namespace to the target node that was
+            requested for it; adds placement accuracy
+        transfer: Optional dict mapping namespace to its MigrationTransferSampler result;
+            adds data transferred, bandwidth, dirty rate, iterations and migration mode
+
+    Besides the per-VM and summary files a source -> target node matrix
+    (migration_node_matrix.csv) is written.
     """
 
 
@@ -2057,6 +4333,7 @@ def save_migration_results(args, results, base_dir="results", logger=None, total
     summary_csv_path = os.path.join(output_dir, "summary_migration_results.csv")
 
     # --- Detailed per-VM results ---
+    scheduled = {r["target"]: r for r in schedule} if schedule is not None else {}
     data = []
     for ns, success, observed, source, target, vmim in results:
         entry = {
@@ -2067,6 +4344,26 @@ def save_migration_results(args, results, base_dir="results", logger=None, total
             "vmim_time_sec": round(vmim, 2) if vmim else None,
             "status": "Success" if success else "Failed",
         }
+        if downtime is not None:
+            probe = downtime.get(ns, {})
+            for metric in DOWNTIME_METRICS:
+                entry[metric] = probe.get(metric)
+        if transfer is not None:
+            stats = transfer.get(ns, {})
+            for metric in TRANSFER_METRICS:
+                entry[metric] = stats.get(metric)
+        if requested_targets is not None:
+            requested = requested_targets.get(ns)
+            entry["requested_target_node"] = requested
+            entry["placement_match"] = (target == requested) if requested and success else None
+        if schedule is not None:
+            record = scheduled.get(ns, {})
+            entry["queue_wait_sec"] = record.get("queue_wait_sec")
+            entry["active_sec"] = record.get("active_sec")
+        if phases is not None:
+            breakdown = phases.get(ns, {})
+            for stage, _, _ in MIGRATION_STAGES:
+                entry[stage] = breakdown.get(stage)
         data.append(entry)
 
     with open(json_path, "w") as jf:
@@ -2079,6 +4376,32 @@ def save_migration_results(args, results, base_dir="results", logger=None, total
     if logger:
         logger.info(f"Saved detailed migration results to {json_path}")
 
+    # --- Source -> target node matrix ---
+    matrix_path = os.path.join(output_dir, "migration_node_matrix.csv")
+    pairs = {}
+    for ns, success, observed, source, target, vmim in results:
+        pairs.setdefault((source or "Unknown", target or "Unknown"), []).append((success, observed, vmim))
+    with open(matrix_path, "w", newline="") as mf:
+        writer = csv.writer(mf)
+        writer.writerow(["source_node", "target_node", "migrations", "successful",
+                         "avg_observed_time_sec", "avg_vmim_time_sec", "p95_vmim_time_sec"])
+        for (source, target), runs in sorted(pairs.items()):
+            observed_ok = [o for s, o, _ in runs if s and o]
+            vmim_ok = [v for s, _, v in runs if s and v]
+            writer.writerow([
+                source, target, len(runs), sum(1 for s, _, _ in runs if s),
+                round(sum(observed_ok) / len(observed_ok), 2) if observed_ok else None,
+                round(sum(vmim_ok) / len(vmim_ok), 2) if vmim_ok else None,
+                round(calculate_percentile(vmim_ok, 95), 2) if vmim_ok else None,
+            ])
+
+    if phases is not None:
+        phases_path = os.path.join(output_dir, "migration_phases.json")
+        with open(phases_path, "w") as pf:
+            json.dump({ns: phases[ns] for ns in sorted(phases)}, pf, indent=4)
+        if logger:
+            logger.info(f"Saved VMIM phase transitions to {phases_path}")
+
     # --- Summary statistics ---
     total = len(results)
     successful = sum(1 for r in results if r[1])
@@ -2116,10 +4439,39 @@ def save_migration_results(args, results, base_dir="results", logger=None, total
         ],
     }
 
+    if requested_targets is not None:
+        targeted = [r for r in results if r[1] and requested_targets.get(r[0])]
+        matches = sum(1 for r in targeted if r[4] == requested_targets[r[0]])
+        summary["targeted_migrations"] = len(targeted)
+        summary["placement_matches"] = matches
+        summary["placement_accuracy_pct"] = round(matches * 100.0 / len(targeted), 2) if targeted else None
+
+    if transfer is not None:
+        modes = [transfer[r[0]].get("migration_mode") for r in results if r[1] and r[0] in transfer]
+        summary["postcopy_migrations"] = modes.count("PostCopy")
+        summary["precopy_migrations"] = modes.count("PreCopy")
+
+    successful_ns = {r[0] for r in results if r[1]}
+    extra_metrics = []
+    if phases is not None:
+        for stage, _, _ in MIGRATION_STAGES:
+            extra_metrics.append((stage, [b[stage] for ns, b in phases.items()
+                                          if ns in successful_ns and b.get(stage) is not None]))
+    if downtime is not None:
+        for metric in DOWNTIME_METRICS:
+            extra_metrics.append((metric, [d[metric] for ns, d in downtime.items()
+                                           if ns in successful_ns and d.get(metric) is not None]))
+    if transfer is not None:
+        for metric in TRANSFER_METRICS[1:]:
+            extra_metrics.append((metric, [t[metric] for ns, t in transfer.items()
+                                           if ns in successful_ns and t.get(metric) is not None]))
+    for metric, values in extra_metrics:
+        summary["metrics"].append(dict(metric=metric, **summarize_distribution(values, 3)))
+
     with open(summary_json_path, "w") as sf:
         json.dump(summary, sf, indent=4)
     with open(summary_csv_path, "w", newline="") as cf:
-        writer = csv.DictWriter(cf, fieldnames=["metric", "avg", "min", "max", "count"])
+        writer = csv.DictWriter(cf, fieldnames=["metric", "avg", "min", "max", "count", "p50", "p95", "p99"])
         writer.writeheader()
         for m in summary["metrics"]:
             if "avg" in m:
@@ -2129,6 +4481,9 @@ def save_migration_results(args, results, base_dir="results", logger=None, total
                     "min": m.get("min"),
                     "max": m.get("max"),
                     "count": m.get("count"),
+                    "p50": m.get("p50"),
+                    "p95": m.get("p95"),
+                    "p99": m.get("p99"),
                 })
 
     if logger:
@@ -2159,6 +4514,11 @@ def save_capacity_results(results: dict, base_dir: str = "results", storage_driv
             - capacity_reached: Whether capacity limit was reached
             - end_reason: Reason for test ending
             - phases_skipped: List of skipped phases
+            - scenario: Name of the chaos scenario
+            - pipelined: Whether iterations ran pipelined
+            - namespace_shards: Number of namespaces the VMs were spread over
+            - volume_concurrency: PVC resizes/clones allowed in flight at once
+            - time_to_capacity_sec: Seconds until capacity was reached, if it was
         base_dir: Base directory for results (default: "results")
         storage_driver: Storage driver for folder hierarchy (e.g., "portworx-3.6"). If None, uses "default"
         logger: Logger instance (optional)
@@ -2204,12 +4564,17 @@ def save_capacity_results(results: dict, base_dir: str = "results", storage_driv
             "volume_size": results.get('volume_size', 'N/A'),
             "vm_memory": results.get('vm_memory', 'N/A'),
             "vm_cpu_cores": results.get('vm_cpu_cores', 0),
+            "scenario": results.get('scenario', 'default'),
+            "pipelined": results.get('pipelined', False),
+            "namespace_shards": results.get('namespace_shards', 1),
+            "volume_concurrency": results.get('volume_concurrency'),
         },
         "results": {
             "iterations_completed": results.get('iterations_completed', 0),
             "total_vms": results.get('total_vms', 0),
             "total_pvcs": results.get('total_pvcs', 0),
             "capacity_reached": results.get('capacity_reached', False),
+            "time_to_capacity_sec": results.get('time_to_capacity_sec'),
             "end_reason": results.get('end_reason', 'unknown'),
         },
         "phases_skipped": results.get('phases_skipped', []),
@@ -2238,6 +4603,7 @@ def save_capacity_results(results: dict, base_dir: str = "results", storage_driv
         "total_pvcs": results.get('total_pvcs', 0),
         "iterations_completed": results.get('iterations_completed', 0),
         "capacity_reached": results.get('capacity_reached', False),
+        "time_to_capacity_sec": results.get('time_to_capacity_sec'),
         "total_test_duration_sec": duration_sec,
         "metrics": [
             {
@@ -2303,6 +4669,10 @@ def save_capacity_results(results: dict, base_dir: str = "results", storage_driv
             "metric": "Capacity Reached",
             "value": "Yes" if results.get('capacity_reached', False) else "No",
         },
+        {
+            "metric": "Time to Capacity (s)",
+            "value": results.get('time_to_capacity_sec') if results.get('time_to_capacity_sec') is not None else "N/A",
+        },
         {
             "metric": "End Reason",
             "value": results.get('end_reason', 'unknown'),
@@ -2327,6 +4697,372 @@ def save_capacity_results(results: dict, base_dir: str = "results", storage_driv
     return output_dir
 
 
+class RunJournal:
+    """
+    Append-only JSON-lines journal of benchmark events, used to resume interrupted runs.
+
+    Every event is written as one line and flushed to disk before record() returns,
+    so the journal survives a killed driver, a sleeping laptop or an OOM kill.
+    """
+
+    FILENAME = 'run_journal.jsonl'
+
+    def __init__(self, run_dir: str, logger: Optional[logging.Logger] = None):
+        import threading
+
+        os.makedirs(run_dir, exist_ok=True)
+        self.path = os.path.join(run_dir, self.FILENAME)
+        self.logger = logger
+        self._lock = threading.Lock()
+
+    def record(self, event: str, **fields):
+        """
+        Append one event to the journal.
+
+        Args:
+            event: Event type (e.g., 'vm_created', 'vm_result')
+            **fields: Event payload; datetime values are stored as ISO strings
+        """
+        entry = {'event': event, 'ts': datetime.now().isoformat()}
+        for key, value in fields.items():
+            entry[key] = value.isoformat() if isinstance(value, datetime) else value
+
+        line = json.dumps(entry, default=str)
+        with self._lock:
+            try:
+                with open(self.path, 'a') as f:
+                    f.write(line + '\n')
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                if self.logger:
+                    self.logger.error(f"Failed to write run journal {self.path}: {e}")
+
+    @classmethod
+    def exists(cls, run_dir: str) -> bool:
+        """Return True if run_dir contains a run journal."""
+        return os.path.isfile(os.path.join(run_dir, cls.FILENAME))
+
+    @classmethod
+    def load(cls, run_dir: str, logger: Optional[logging.Logger] = None) -> List[dict]:
+        """
+        Read all events from a run journal.
+
+        A truncated last line (the driver died mid-write) is skipped.
+
+        Args:
+            run_dir: Run directory containing the journal
+            logger: Logger instance
+
+        Returns:
+            List of event dicts in the order they were recorded
+        """
+        events = []
+        path = os.path.join(run_dir, cls.FILENAME)
+        with open(path, 'r') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    if logger:
+                        logger.warning(f"Skipping unreadable journal line {line_no} in {path}")
+        return events
+
+
+def restore_args_from_journal(args, events: List[dict], keep: Tuple[str, ...] = ()) -> dict:
+    """
+    Restore the CLI configuration recorded in a run journal onto parsed args.
+
+    Args:
+        args: Parsed CLI arguments of the resuming invocation
+        events: Events loaded with RunJournal.load()
+        keep: Argument names whose value from the resuming invocation wins
+
+    Returns:
+        The 'run_started' event
+
+    Raises:
+        ValueError: If the journal has no 'run_started' event
+    """
+    started = next((e for e in events if e.get('event') == 'run_started'), None)
+    if not started:
+        raise ValueError("run journal has no 'run_started' event")
+
+    for key, value in started.get('config', {}).items():
+        if key in keep or key.startswith('_'):
+            continue
+        setattr(args, key, value)
+    return started
+
+
+def journal_config(args, exclude: Tuple[str, ...] = ('resume',)) -> dict:
+    """Return the JSON-serializable CLI configuration to record in a run journal (secrets excluded)."""
+    return {
+        key: value for key, value in vars(args).items()
+        if not key.startswith('_') and key not in exclude and not _is_sensitive_arg(key)
+    }
+
+
+# Two-sided 95% Student-t critical values for 1..30 degrees of freedom
+_T_CRITICAL_95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+
+
+def describe_repetitions(values: List[float]) -> dict:
+    """
+    Compute run-to-run statistics for one metric measured in several repetitions.
+
+    Args:
+        values: Metric value of each repetition, in run order
+
+    Returns:
+        Dict with mean, sample standard deviation, coefficient of variation,
+        95% confidence interval of the mean and the warm-up effect (first
+        repetition compared with the mean of the rest)
+    """
+    n = len(values)
+    mean = sum(values) / n
+    stdev = (sum((v - mean) ** 2 for v in values) / (n - 1)) ** 0.5 if n > 1 else None
+
+    ci_low = ci_high = None
+    if stdev is not None:
+        t = _T_CRITICAL_95[n - 2] if n - 1 <= len(_T_CRITICAL_95) else 1.96
+        margin = t * stdev / n ** 0.5
+        ci_low, ci_high = mean - margin, mean + margin
+
+    rest_mean = sum(values[1:]) / (n - 1) if n > 1 else None
+    warmup_pct = None
+    if rest_mean:
+        warmup_pct = (values[0] - rest_mean) / rest_mean * 100
+
+    def r(value, digits=2):
+        return round(value, digits) if value is not None else None
+
+    return {
+        'count': n,
+        'values': [r(v, 4) for v in values],
+        'mean': r(mean, 4),
+        'stdev': r(stdev, 4),
+        'cv_pct': r(stdev / mean * 100) if stdev is not None and mean else None,
+        'ci95_low': r(ci_low, 4),
+        'ci95_high': r(ci_high, 4),
+        'min': r(min(values), 4),
+        'max': r(max(values), 4),
+        'first': r(values[0], 4),
+        'rest_mean': r(rest_mean, 4),
+        'warmup_effect_pct': r(warmup_pct),
+    }
+
+
+def collect_summary_metrics(results_dir: str) -> dict:
+    """
+    Collect the headline metrics of one run from its summary_*.json files.
+
+    The average of every entry in a summary's "metrics" list and every numeric
+    top-level field (e.g. total_test_duration_sec) become one headline value,
+    keyed as "<summary name>.<metric>".
+
+    Args:
+        results_dir: Results directory of a single run
+
+    Returns:
+        Dict mapping metric key to value
+    """
+    import glob
+
+    metrics = {}
+    for path in sorted(glob.glob(os.path.join(results_dir, 'summary_*.json'))):
+        name = os.path.basename(path)[len('summary_'):-len('.json')]
+        try:
+            with open(path) as f:
+                summary = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+
+        for key, value in summary.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                metrics[f"{name}.{key}"] = value
+        for entry in summary.get('metrics', []):
+            value = entry.get('avg')
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                metrics[f"{name}.{entry.get('metric')}"] = value
+    return metrics
+
+
+def save_repetition_summary(run_dir: str, rep_dirs: List[str],
+                            logger: Optional[logging.Logger] = None) -> Optional[str]:
+    """
+    Aggregate the headline metrics of several repetitions into one summary.
+
+    Writes repeat_summary.json and repeat_summary.csv into the run directory and
+    logs a table of mean, CV, 95% confidence interval and warm-up effect.
+
+    Args:
+        run_dir: Run directory holding one sub-directory per repetition
+        rep_dirs: Results directory of each repetition, in run order
+        logger: Logger instance
+
+    Returns:
+        Path of repeat_summary.json, or None if no repetition produced results
+    """
+    per_rep = [collect_summary_metrics(d) for d in rep_dirs]
+    keys = sorted({k for m in per_rep for k in m})
+    if not keys:
+        if logger:
+            logger.warning("No summary results found in any repetition")
+        return None
+
+    metrics = []
+    for key in keys:
+        # Only repetitions that reported the metric take part in its statistics
+        values = [m[key] for m in per_rep if key in m]
+        metrics.append({'metric': key, **describe_repetitions(values)})
+
+    summary = {
+        'repetitions': len(rep_dirs),
+        'repetition_dirs': [os.path.relpath(d, run_dir) for d in rep_dirs],
+        'metrics': metrics,
+    }
+    json_path = os.path.join(run_dir, 'repeat_summary.json')
+    with open(json_path, 'w') as f:
+        json.dump(summary, f, indent=4)
+
+    csv_path = os.path.join(run_dir, 'repeat_summary.csv')
+    fields = ['metric', 'count', 'mean', 'stdev', 'cv_pct', 'ci95_low', 'ci95_high',
+              'min', 'max', 'first', 'rest_mean', 'warmup_effect_pct']
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(metrics)
+
+    if logger:
+        def fmt(value):
+            return f"{value:.2f}" if value is not None else "N/A"
+
+        logger.info("\n" + "=" * 130)
+        logger.info(f"REPEATABILITY ACROSS {len(rep_dirs)} REPETITIONS")
+        logger.info("=" * 130)
+        logger.info(f"{'Metric':<55} {'Mean':>12} {'CV %':>8} {'95% CI':>27} {'Warm-up %':>12}")
+        logger.info("-" * 130)
+        for m in metrics:
+            ci = f"[{fmt(m['ci95_low'])}, {fmt(m['ci95_high'])}]"
+            logger.info(f"{m['metric']:<55} {fmt(m['mean']):>12} {fmt(m['cv_pct']):>8} {ci:>27} "
+                        f"{fmt(m['warmup_effect_pct']):>12}")
+        logger.info("=" * 130)
+        logger.info("Warm-up % compares the first repetition with the mean of the rest")
+        logger.info(f"Saved repetition summary to {json_path}")
+    return json_path
+
+
+def strip_cli_options(argv: List[str], options: Tuple[str, ...],
+                      list_options: Tuple[str, ...] = ()) -> List[str]:
+    """
+    Remove options that take one value (both "--opt value" and "--opt=value") from argv.
+
+    Args:
+        argv: Command line arguments without the program name
+        options: Option names to remove
+        list_options: Option names to remove together with all values up to the next option
+
+    Returns:
+        The remaining arguments
+    """
+    result = []
+    skip_next = False
+    skip_values = False
+    for arg in argv:
+        if skip_values:
+            if not arg.startswith('-'):
+                continue
+            skip_values = False
+        if skip_next:
+            skip_next = False
+            continue
+        if arg in list_options:
+            skip_values = True
+            continue
+        if arg in options:
+            skip_next = True
+            continue
+        if any(arg.startswith(f"{opt}=") for opt in options):
+            continue
+        result.append(arg)
+    return result
+
+
+def run_repeated_benchmark(script_path: str, repeat: int, run_dir: str, settle_time: int,
+                           logger: Optional[logging.Logger] = None,
+                           teardown=None, argv: Optional[List[str]] = None) -> int:
+    """
+    Run a benchmark script K times and report run-to-run statistics.
+
+    Each repetition re-runs the script with the same arguments in a separate
+    process and saves its results to rep-NN under the shared run directory.
+    Between repetitions the optional teardown callable removes what the
+    repetition created, then the cluster is left to settle.
+
+    Args:
+        script_path: Path of the benchmark script
+        repeat: Number of repetitions
+        run_dir: Run directory for all repetitions
+        settle_time: Seconds to wait between repetitions
+        logger: Logger instance
+        teardown: Callable run after every repetition except the last, or None
+        argv: Script arguments (default: sys.argv[1:])
+
+    Returns:
+        0 if every repetition succeeded, 1 otherwise
+    """
+    base_argv = strip_cli_options(argv if argv is not None else sys.argv[1:],
+                                  ('--repeat', '--settle-time', '--output-dir'))
+    os.makedirs(run_dir, exist_ok=True)
+
+    rep_dirs = []
+    failures = 0
+    for rep in range(1, repeat + 1):
+        rep_dir = os.path.join(run_dir, f"rep-{rep:02d}")
+        cmd = [sys.executable, script_path] + base_argv + ['--save-results', '--output-dir', rep_dir]
+        if logger:
+            logger.info("\n" + "=" * 80)
+            logger.info(f"REPETITION {rep}/{repeat}")
+            logger.info("=" * 80)
+
+        rep_start = time.time()
+        returncode = subprocess.run(cmd).returncode
+        rep_dirs.append(rep_dir)
+        if returncode != 0:
+            failures += 1
+            if logger:
+                logger.warning(f"Repetition {rep} exited with code {returncode}")
+        elif logger:
+            logger.info(f"Repetition {rep} finished in {time.time() - rep_start:.1f}s")
+
+        if rep < repeat:
+            if teardown:
+                if logger:
+                    logger.info(f"Tearing down repetition {rep} before the next one...")
+                try:
+                    teardown()
+                except Exception as e:
+                    if logger:
+                        logger.error(f"Teardown after repetition {rep} failed: {e}")
+            if settle_time > 0:
+                if logger:
+                    logger.info(f"Letting the cluster settle for {settle_time}s...")
+                time.sleep(settle_time)
+
+    save_repetition_summary(run_dir, rep_dirs, logger)
+    if failures and logger:
+        logger.warning(f"{failures}/{repeat} repetitions reported failures")
+    return 0 if failures == 0 else 1
+
+
 def validate_prerequisites(ssh_pod: str, ssh_pod_ns: str, logger: logging.Logger) -> bool:
     """
     Validate that prerequisites are met before running tests.
@@ -2678,6 +5414,147 @@ def delete_vm_snapshot(snapshot_name: str, namespace: str,
         return False
 
 
+def create_vm_restore(vm_name: str, snapshot_name: str, restore_name: str, namespace: str,
+                      logger: Optional[logging.Logger] = None) -> bool:
+    """
+    Create a VirtualMachineRestore that restores a VM from a snapshot.
+
+    The VM must be stopped; KubeVirt replaces its volumes with volumes
+    restored from the snapshot.
+
+    Args:
+        vm_name: VM name to restore
+        snapshot_name: VirtualMachineSnapshot to restore from
+        restore_name: Restore name
+        namespace: Namespace name
+        logger: Logger instance
+
+    Returns:
+        True if the restore was created, False otherwise
+    """
+    try:
+        restore_yaml = f"""apiVersion: snapshot.kubevirt.io/v1alpha1
+kind: VirtualMachineRestore
+metadata:
+  name: {restore_name}
+  namespace: {namespace}
+spec:
+  target:
+    apiGroup: kubevirt.io
+    kind: VirtualMachine
+    name: {vm_name}
+  virtualMachineSnapshotName: {snapshot_name}
+"""
+        count_kubectl_call()
+        process = subprocess.Popen(
+            ['kubectl', 'apply', '-f', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        stdout, stderr = process.communicate(input=restore_yaml)
+
+        if process.returncode != 0:
+            if logger:
+                logger.error(f"[{namespace}] Failed to create restore {restore_name}: {stderr}")
+            return False
+
+        if logger:
+            logger.info(f"[{namespace}] Restore {restore_name} of VM {vm_name} from {snapshot_name} created")
+        return True
+
+    except Exception as e:
+        if logger:
+            logger.error(f"[{namespace}] Failed to create restore {restore_name}: {e}")
+        return False
+
+
+def wait_for_restore_complete(restore_name: str, namespace: str, timeout: int = 1800,
+                              poll_interval: int = 2, logger: Optional[logging.Logger] = None) -> bool:
+    """
+    Wait for a VirtualMachineRestore to complete, i.e. all volumes are restored.
+
+    Args:
+        restore_name: Restore name
+        namespace: Namespace name
+        timeout: Timeout in seconds
+        poll_interval: Polling interval in seconds
+        logger: Logger instance
+
+    Returns:
+        True if the restore completed, False on timeout
+    """
+    start_time = time.time()
+
+    while time.time() - start_time < timeout:
+        try:
+            returncode, stdout, stderr = run_kubectl_command(
+                ['get', 'vmrestore', restore_name, '-n', namespace, '-o', 'json'],
+                check=False,
+                logger=logger
+            )
+
+            if returncode == 0:
+                status = json.loads(stdout).get('status', {})
+                if status.get('complete'):
+                    if logger:
+                        logger.info(f"[{namespace}] Restore {restore_name} is complete")
+                    return True
+
+                for condition in status.get('conditions', []):
+                    if condition.get('type') == 'Ready' and condition.get('status') == 'False' \
+                            and condition.get('reason'):
+                        if logger:
+                            logger.debug(f"[{namespace}] Restore not ready: {condition.get('reason')} - "
+                                         f"{condition.get('message', '')}")
+
+            time.sleep(poll_interval)
+
+        except Exception as e:
+            if logger:
+                logger.error(f"[{namespace}] Error checking restore status: {e}")
+            time.sleep(poll_interval)
+
+    if logger:
+        logger.error(f"[{namespace}] Timeout waiting for restore {restore_name}")
+    return False
+
+
+def delete_vm_restore(restore_name: str, namespace: str,
+                      logger: Optional[logging.Logger] = None) -> bool:
+    """
+    Delete a VirtualMachineRestore.
+
+    Args:
+        restore_name: Restore name
+        namespace: Namespace name
+        logger: Logger instance
+
+    Returns:
+        True if deleted successfully, False otherwise
+    """
+    try:
+        returncode, stdout, stderr = run_kubectl_command(
+            ['delete', 'vmrestore', restore_name, '-n', namespace, '--ignore-not-found'],
+            check=False,
+            logger=logger
+        )
+
+        if returncode == 0:
+            if logger:
+                logger.info(f"[{namespace}] Deleted restore {restore_name}")
+            return True
+        if logger:
+            logger.error(f"[{namespace}] Failed to delete restore: {stderr}")
+        return False
+
+    except Exception as e:
+        if logger:
+            logger.error(f"[{namespace}] Failed to delete restore {restore_name}: {e}")
+        return False
+
+
 def get_pvc_size(pvc_name: str, namespace: str, logger: Optional[logging.Logger] = None) -> Optional[str]:
     """
     Get current size of a PVC.
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Namespace Pool Manager for KubeVirt Benchmark Suite
+
+Keeps a labelled pool of pre-provisioned test namespaces (cloud-init secret,
+RBAC, quotas, ...) so benchmark runs can lease them with --namespace-pool
+instead of creating namespaces and secrets inside the measured window.
+Runs wipe their VMs, DataVolumes and PVCs and return the namespaces to the
+pool when they finish.
+
+Usage:
+    python3 namespace_pool.py fill --pool perf --start 1 --end 50 --secret-yaml secret.yaml
+    python3 namespace_pool.py status --pool perf
+    python3 namespace_pool.py release --pool perf --start 1 --end 50
+    python3 namespace_pool.py drain --pool perf
+"""
+
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path for imports
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.common import (
+    setup_logging, list_namespace_pool, fill_namespace_pool, release_pool_namespaces,
+    cleanup_namespace_resources, delete_namespaces_parallel, wait_for_namespaces_deleted
+)
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description='Manage a pool of pre-provisioned benchmark namespaces',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Provision kubevirt-perf-test-1..50 with the cloud-init secret
+  %(prog)s fill --pool perf --start 1 --end 50 --secret-yaml my-cloudinit-secret.yaml
+
+  # Show pool members and their leases
+  %(prog)s status --pool perf
+
+  # Wipe and force-release namespaces left leased by an aborted run
+  %(prog)s release --pool perf --start 1 --end 50
+
+  # Delete every namespace of the pool
+  %(prog)s drain --pool perf
+        """
+    )
+
+    parser.add_argument(
+        'action',
+        choices=['fill', 'status', 'release', 'drain'],
+        help='Pool action'
+    )
+    parser.add_argument(
+        '--pool',
+        type=str,
+        required=True,
+        help='Pool name (value of the virtbench.io/namespace-pool label)'
+    )
+    parser.add_argument(
+        '--namespace-prefix',
+        type=str,
+        default='kubevirt-perf-test',
+        help='Namespace prefix (default: kubevirt-perf-test)'
+    )
+    parser.add_argument(
+        '--start',
+        type=int,
+        default=1,
+        help='Starting namespace index (default: 1)'
+    )
+    parser.add_argument(
+        '--end',
+        type=int,
+        help='Ending namespace index (required for fill and release)'
+    )
+    parser.add_argument(
+        '--secret-yaml',
+        type=str,
+        help='Cloud-init secret YAML applied into every pool namespace'
+    )
+    parser.add_argument(
+        '--manifest',
+        type=str,
+        nargs='+',
+        default=[],
+        help='Extra YAML files (RBAC, quotas, ...) applied into every pool namespace'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=20,
+        help='Number of namespaces to process in parallel (default: 20)'
+    )
+    parser.add_argument(
+        '--log-level',
+        type=str,
+        default='INFO',
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+        help='Logging level (default: INFO)'
+    )
+    parser.add_argument(
+        '--kubeconfig',
+        type=str,
+        help='Path to kubeconfig file'
+    )
+
+    args = parser.parse_args()
+
+    if args.action in ('fill', 'release') and args.end is None:
+        parser.error(f"--end is required for '{args.action}'")
+    for path in ([args.secret_yaml] if args.secret_yaml else []) + args.manifest:
+        if not os.path.exists(path):
+            parser.error(f"File not found: {path}")
+
+    return args
+
+
+def print_pool_status(pool: str, members: dict, logger):
+    """Print pool members grouped by lease owner"""
+    leased = {ns: owner for ns, owner in members.items() if owner}
+    logger.info("=" * 80)
+    logger.info(f"NAMESPACE POOL: {pool}")
+    logger.info("=" * 80)
+    logger.info(f"  Namespaces:  {len(members)}")
+    logger.info(f"  Free:        {len(members) - len(leased)}")
+    logger.info(f"  Leased:      {len(leased)}")
+    for owner in sorted(set(leased.values())):
+        owned = sorted(ns for ns, o in leased.items() if o == owner)
+        logger.info(f"    {owner}: {len(owned)} namespaces ({owned[0]} .. {owned[-1]})")
+    logger.info("=" * 80)
+
+
+def main():
+    """Main execution function"""
+    args = parse_args()
+
+    if args.kubeconfig:
+        os.environ['KUBECONFIG'] = args.kubeconfig
+
+    logger = setup_logging(log_file=None, log_level=args.log_level)
+
+    if args.action == 'fill':
+        namespaces = [f"{args.namespace_prefix}-{i}" for i in range(args.start, args.end + 1)]
+        ready = fill_namespace_pool(args.pool, namespaces, args.secret_yaml, args.manifest,
+                                    args.batch_size, logger)
+        sys.exit(0 if len(ready) == len(namespaces) else 1)
+
+    members = list_namespace_pool(args.pool, logger)
+    if members is None:
+        sys.exit(1)
+
+    if args.action == 'status':
+        print_pool_status(args.pool, members, logger)
+
+    elif args.action == 'release':
+        namespaces = [f"{args.namespace_prefix}-{i}" for i in range(args.start, args.end + 1)]
+        namespaces = [ns for ns in namespaces if ns in members]
+        with ThreadPoolExecutor(max_workers=args.batch_size) as executor:
+            list(executor.map(lambda ns: cleanup_namespace_resources(ns, None, False, logger), namespaces))
+        release_pool_namespaces(args.pool, namespaces, logger)
+
+    elif args.action == 'drain':
+        namespaces = sorted(members)
+        successful, failed = delete_namespaces_parallel(namespaces, args.batch_size, logger)
+        wait_for_namespaces_deleted(successful, logger=logger)
+        logger.info(f"Drained pool '{args.pool}': {len(successful)} namespaces deleted, {len(failed)} failed")
+        sys.exit(0 if not failed else 1)
+
+
+if __name__ == '__main__':
+    main()
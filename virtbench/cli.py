@@ -19,6 +19,8 @@ from virtbench.commands import (
     fio,
     elbencho,
     disk_ops,
+    namespace_pool,
+    snapshot_restore,
     validate,
     version,
     vm_ops,
@@ -76,10 +78,12 @@ def cli(ctx, log_level, log_file, kubeconfig, timeout, uuid):
       migration            Run VM migration benchmark
       chaos-benchmark      Run chaos benchmark (concurrent VM/volume operations)
       failure-recovery     Run failure recovery benchmark
+      snapshot-restore     Run VM snapshot restore benchmark
       fio                  Run FIO benchmark across VMs
       elbencho             Manage elbencho workloads on VMs
       disk-ops             Run disk hotplug/coldplug benchmark
       vm-ops               VM operations (drain, rebalance, snapshot, blkdiscard, power)
+      namespace-pool       Manage a pool of pre-provisioned namespaces
       validate-cluster     Validate cluster prerequisites
       version              Print version information
 
@@ -127,10 +131,12 @@ cli.add_command(datasource_clone.datasource_clone)
 cli.add_command(migration.migration)
 cli.add_command(chaos.chaos_benchmark)
 cli.add_command(failure_recovery.failure_recovery)
+cli.add_command(snapshot_restore.snapshot_restore)
 cli.add_command(fio.fio)
 cli.add_command(elbencho.elbencho)
 cli.add_command(disk_ops.disk_ops)
 cli.add_command(vm_ops.vm_ops)
+cli.add_command(namespace_pool.namespace_pool)
 cli.add_command(validate.validate_cluster)
 cli.add_command(version.version)
 
@@ -17,17 +17,45 @@ console = Console()
 @click.option('--storage-class', required=False, help='Storage class name (required unless --cleanup-only)')
 @click.option('--concurrency', '-c', required=True, type=int, help='Number of concurrent operations (REQUIRED)')
 @click.option('--namespace', '-n', default='virt-chaos-benchmark', help='Namespace for test resources')
+@click.option('--namespace-shards', default=1, type=int,
+              help='Spread the VMs over this many namespaces, <namespace>-1 .. <namespace>-N (default: 1)')
 @click.option('--vms', default=5, type=int, help='Number of VMs to create per iteration')
 @click.option('--max-iterations', default=0, type=int, help='Maximum number of iterations (0 for unlimited)')
 @click.option('--data-volume-count', default=1, type=int, help='Number of data volumes per VM (default: 1)')
 @click.option('--min-vol-size', default='30Gi', help='Minimum volume size (e.g., 30Gi, 100Mi)')
 @click.option('--min-vol-inc-size', default='10Gi', help='Volume size increment for resize (e.g., 10Gi, 50Mi)')
+@click.option('--volume-concurrency', default=10, type=int,
+              help='PVC resizes/clones in flight at once, shared by all VMs')
 @click.option('--vm-yaml', default='examples/vm-templates/vm-template.yaml', help='Path to VM YAML template')
 @click.option('--vm-name', default='rhel-9-vm', help='Base VM name')
 @click.option('--datasource-name', default='rhel9', help='DataSource name')
 @click.option('--datasource-namespace', default='openshift-virtualization-os-images', help='DataSource namespace')
 @click.option('--vm-memory', default='2048M', help='VM memory')
 @click.option('--vm-cpu-cores', default=1, type=int, help='VM CPU cores')
+@click.option('--scenario', type=click.Path(exists=True),
+              help='YAML scenario declaring the operations of an iteration (default: the five classic phases)')
+@click.option('--pipelined', is_flag=True,
+              help='Move every VM through the scenario on its own; admit new VMs under --max-in-flight')
+@click.option('--capacity-search', is_flag=True,
+              help='Only search the maximum schedulable VMs: grow from --vms geometrically, then bisect')
+@click.option('--search-growth', default=2.0, type=float,
+              help='Capacity search: growth factor until the first failure (default: 2)')
+@click.option('--search-precision', default=1, type=int,
+              help='Capacity search: stop bisecting at this many VMs of uncertainty (default: 1)')
+@click.option('--search-max', default=0, type=int,
+              help='Capacity search: never probe more than this many VMs (0 = no limit)')
+@click.option('--open-loop', default=0, type=int, metavar='SECONDS',
+              help='Open-loop mode: issue a weighted operation mix at a steady arrival rate for N seconds (0 = off)')
+@click.option('--arrival-rate', default=6.0, type=float, help='Open-loop arrivals per minute (default: 6)')
+@click.option('--arrival-process', default='poisson', type=click.Choice(['poisson', 'fixed']),
+              help='Open-loop inter-arrival times (default: poisson)')
+@click.option('--op-mix', default='create-vm=40,resize-volumes=20,snapshot-vm=20,restart-vm=20',
+              help='Open-loop operation weights, e.g. create-vm=40,restart-vm=20')
+@click.option('--max-in-flight', default=20, type=int,
+              help='Open loop: running operations before arrivals are rejected; '
+                   'pipelined: VMs in the pipeline at once (default: 20)')
+@click.option('--window', default=60, type=int, help='Open-loop reporting window in seconds (default: 60)')
+@click.option('--seed', default=None, type=int, help='Random seed for open-loop arrivals')
 @click.option('--skip-resize', is_flag=True, help='Skip volume resize phase')
 @click.option('--skip-clone', is_flag=True, help='Skip volume clone phase')
 @click.option('--skip-snapshot', is_flag=True, help='Skip VM snapshot phase')
@@ -37,7 +65,8 @@ console = Console()
 @click.option('--vm-timeout', default=1800, type=int, help='Total timeout for VM to reach Running state (default: 1800)')
 @click.option('--max-create-retries', default=5, type=int, help='Maximum retries for VM creation (default: 5)')
 @click.option('--cleanup/--no-cleanup', default=False, help='Delete test resources after completion')
-@click.option('--cleanup-only', is_flag=True, help='Only cleanup resources from previous runs')
+@click.option('--cleanup-only', is_flag=True,
+              help='Only cleanup resources from previous runs, including every <namespace>-<n> shard')
 @click.option('--save-results', is_flag=True, help='Save results to JSON/CSV files in results directory')
 @click.option('--results-dir', default='results', help='Directory to save results (default: results)')
 @click.option('--storage-driver', default=None,
@@ -64,6 +93,21 @@ def chaos_benchmark(ctx, **kwargs):
       # Skip specific phases
       virtbench chaos-benchmark --storage-class YOUR-STORAGE-CLASS --concurrency 2 --skip-clone
 
+      # Open-loop mixed load for 30 minutes on a pool of 20 VMs
+      virtbench chaos-benchmark --storage-class YOUR-STORAGE-CLASS --concurrency 4 --vms 20 \
+        --open-loop 1800 --arrival-rate 12
+
+      # Find the maximum VM density to within 4 VMs
+      virtbench chaos-benchmark --storage-class YOUR-STORAGE-CLASS --concurrency 10 --vms 16 \
+        --capacity-search --search-precision 4
+
+      # Run a YAML scenario
+      virtbench chaos-benchmark --storage-class YOUR-STORAGE-CLASS --concurrency 2 \
+        --scenario chaos-benchmark/scenarios/fan-out.yaml
+
+      # Spread the VMs over 8 namespaces
+      virtbench chaos-benchmark --storage-class YOUR-STORAGE-CLASS --concurrency 4 --namespace-shards 8
+
       # Cleanup only mode
       virtbench chaos-benchmark --cleanup-only --concurrency 1
     """
@@ -86,6 +130,7 @@ def chaos_benchmark(ctx, **kwargs):
     if kwargs['cleanup_only']:
         python_args = {
             'namespace': kwargs['namespace'],
+            'namespace-shards': kwargs['namespace_shards'],
             'concurrency': kwargs['concurrency'],
             'log-level': kwargs['log_level'],
             'cleanup-only': True,
@@ -128,11 +173,13 @@ def chaos_benchmark(ctx, **kwargs):
         'storage-class': kwargs['storage_class'],
         'concurrency': kwargs['concurrency'],
         'namespace': kwargs['namespace'],
+        'namespace-shards': kwargs['namespace_shards'],
         'vms': kwargs['vms'],
         'max-iterations': kwargs['max_iterations'],
         'data-volume-count': kwargs['data_volume_count'],
         'min-vol-size': kwargs['min_vol_size'],
         'min-vol-inc-size': kwargs['min_vol_inc_size'],
+        'volume-concurrency': kwargs['volume_concurrency'],
         'vm-yaml': str(template_path),
         'vm-name': kwargs['vm_name'],
         'datasource-name': kwargs['datasource_name'],
@@ -145,6 +192,26 @@ def chaos_benchmark(ctx, **kwargs):
         'log-level': kwargs['log_level'],
     }
 
+    if kwargs.get('scenario'):
+        python_args['scenario'] = str(Path(kwargs['scenario']).resolve())
+    if kwargs['pipelined']:
+        python_args['pipelined'] = True
+        python_args['max-in-flight'] = kwargs['max_in_flight']
+    if kwargs['capacity_search']:
+        python_args['capacity-search'] = True
+        python_args['search-growth'] = kwargs['search_growth']
+        python_args['search-precision'] = kwargs['search_precision']
+        python_args['search-max'] = kwargs['search_max']
+    if kwargs['open_loop']:
+        python_args['open-loop'] = kwargs['open_loop']
+        python_args['arrival-rate'] = kwargs['arrival_rate']
+        python_args['arrival-process'] = kwargs['arrival_process']
+        python_args['op-mix'] = kwargs['op_mix']
+        python_args['max-in-flight'] = kwargs['max_in_flight']
+        python_args['window'] = kwargs['window']
+        if kwargs.get('seed') is not None:
+            python_args['seed'] = kwargs['seed']
+
     # Add skip flags
     if kwargs['skip_resize']:
         python_args['skip-resize'] = True
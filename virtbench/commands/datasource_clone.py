@@ -18,6 +18,8 @@ console = Console()
 @click.option('--start', '-s', default=1, type=int, help='Start index for test namespaces')
 @click.option('--end', '-e', default=10, type=int, help='End index for test namespaces')
 @click.option('--vm-name', '-n', default='rhel-9-vm', help='VM resource name')
+@click.option('--vms-per-namespace', default=1, type=int,
+              help='Number of VMs per namespace, named <vm-name>-1 .. <vm-name>-N')
 @click.option('--vm-template',
               default='examples/vm-templates/rhel9-vm-datasource.yaml',
               help='Path to VM template YAML')
@@ -30,6 +32,10 @@ console = Console()
 @click.option('--ping-timeout', default=300, type=int, help='Timeout for ping tests in seconds')
 @click.option('--ssh-pod', default='ssh-test-pod', help='Pod name for ping tests')
 @click.option('--ssh-pod-ns', default='default', help='Namespace for SSH test pod')
+@click.option('--guest-boot-metrics', is_flag=True,
+              help='Report time to guest-ready (cloud-init/systemd finished) via SSH after ping')
+@click.option('--vm-user', default='cloud-user', help='VM SSH user for --guest-boot-metrics')
+@click.option('--vm-password', default='changeme', help='VM SSH password for --guest-boot-metrics')
 @click.option('--cleanup/--no-cleanup', default=False, help='Delete test resources after completion')
 @click.option('--cleanup-on-failure/--no-cleanup-on-failure', default=False,
               help='Clean up resources even if tests fail')
@@ -38,6 +44,8 @@ console = Console()
 @click.option('--yes', '-y', is_flag=True, help='Skip confirmation prompt for cleanup')
 @click.option('--skip-namespace-creation', is_flag=True,
               help='Skip namespace creation (use existing namespaces)')
+@click.option('--namespace-pool',
+              help='Lease pre-provisioned namespaces from this pool (see: virtbench namespace-pool)')
 @click.option('--boot-storm', is_flag=True,
               help='After initial test, shutdown all VMs and test boot storm')
 @click.option('--skip-vm-creation', is_flag=True,
@@ -48,12 +56,23 @@ console = Console()
               help='Number of namespaces to create in parallel')
 @click.option('--single-node', is_flag=True, help='Run all VMs on a single node')
 @click.option('--node-name', help='Specific node name for single-node testing')
+@click.option('--node-names', multiple=True,
+              help='Pin VMs round-robin across these nodes (comma-separated or repeated flag)')
+@click.option('--node-scaling',
+              help='Comma-separated node counts (e.g. 1,2,4,8): run the boot storm on each and '
+                   'report VMs/sec per node and scaling efficiency')
 @click.option('--save-results', is_flag=True,
               help='Save detailed results (JSON and CSV) to results folder')
 @click.option('--results-folder', default='results',
               help='Base directory to store test results')
 @click.option('--storage-driver', help='Storage driver label for results path (for example: portworx-3.6, ceph)')
 @click.option('--log-file', type=click.Path(), help='Log file path (auto-generated if not specified)')
+@click.option('--repeat', default=1, type=int,
+              help='Run the whole test K times with cleanup in between and report run-to-run statistics')
+@click.option('--settle-time', default=60, type=int,
+              help='Seconds to let the cluster settle between repetitions (default: 60)')
+@click.option('--resume', type=click.Path(exists=True, file_okay=False),
+              help='Resume an interrupted run from its results directory (settings are restored from its run journal)')
 @click.pass_context
 def datasource_clone(ctx, **kwargs):
     """
@@ -78,6 +97,12 @@ def datasource_clone(ctx, **kwargs):
 
       # Single node test
       virtbench datasource-clone --start 1 --end 10 --single-node --node-name worker-1
+
+      # 200 VMs packed 20 per namespace
+      virtbench datasource-clone --start 1 --end 10 --vms-per-namespace 20
+
+      # Boot storm throughput on 1, 2, 4 and 8 nodes
+      virtbench datasource-clone --start 1 --end 100 --node-scaling 1,2,4,8 --save-results
     """
     print_banner("DataSource Clone Benchmark")
     
@@ -150,6 +175,10 @@ def datasource_clone(ctx, **kwargs):
         python_args['skip-namespace-creation'] = True
     if kwargs['boot_storm']:
         python_args['boot-storm'] = True
+    if kwargs['guest_boot_metrics']:
+        python_args['guest-boot-metrics'] = True
+        python_args['vm-user'] = kwargs['vm_user']
+        python_args['vm-password'] = kwargs['vm_password']
     if kwargs['skip_vm_creation']:
         python_args['skip-vm-creation'] = True
     if kwargs['single_node']:
@@ -160,12 +189,31 @@ def datasource_clone(ctx, **kwargs):
     # Add optional args
     if kwargs.get('node_name'):
         python_args['node-name'] = kwargs['node_name']
+    node_names = [n.strip() for value in kwargs.get('node_names') or () for n in value.split(',') if n.strip()]
+    if node_names:
+        python_args['node-names'] = node_names
+    if kwargs.get('node_scaling'):
+        try:
+            python_args['node-scaling'] = [int(n) for n in kwargs['node_scaling'].split(',') if n.strip()]
+        except ValueError:
+            console.print(f"[red]Error: --node-scaling must be comma-separated integers: "
+                          f"{kwargs['node_scaling']}[/red]")
+            sys.exit(1)
     if kwargs.get('storage_driver'):
         python_args['storage-driver'] = kwargs['storage_driver']
     if kwargs.get('num_disks'):
         python_args['num-disks'] = kwargs['num_disks']
     if secret_yaml_path:
         python_args['secret-yaml'] = str(secret_yaml_path)
+    if kwargs.get('resume'):
+        python_args['resume'] = kwargs['resume']
+    if kwargs['vms_per_namespace'] > 1:
+        python_args['vms-per-namespace'] = kwargs['vms_per_namespace']
+    if kwargs.get('namespace_pool'):
+        python_args['namespace-pool'] = kwargs['namespace_pool']
+    if kwargs['repeat'] > 1:
+        python_args['repeat'] = kwargs['repeat']
+        python_args['settle-time'] = kwargs['settle_time']
 
     # Add log-file only when explicitly requested. With --save-results, the
     # script creates the run directory first and writes the log next to JSON/CSV.
@@ -21,6 +21,8 @@ console = Console()
 @click.option('--start', '-s', type=int, required=True, help='Start namespace index')
 @click.option('--end', '-e', type=int, required=True, help='End namespace index')
 @click.option('--vm-name', '-n', required=True, help='VM name in each namespace')
+@click.option('--vms-per-namespace', default=1, type=int,
+              help='Number of VMs per namespace, named <vm-name>-1 .. <vm-name>-N')
 @click.option('--action', '-a', required=True,
               type=click.Choice(['run-all', 'deploy', 'start', 'stop', 'restart', 'status',
                                  'stop-all', 'change-workload', 'gather-results', 'cleanup']),
@@ -156,6 +158,8 @@ def elbencho(ctx, **kwargs):
     cmd.extend(['--start', str(kwargs['start'])])
     cmd.extend(['--end', str(kwargs['end'])])
     cmd.extend(['--vm-name', kwargs['vm_name']])
+    if kwargs['vms_per_namespace'] > 1:
+        cmd.extend(['--vms-per-namespace', str(kwargs['vms_per_namespace'])])
     cmd.extend(['--action', action])
 
     # Deploy parameters
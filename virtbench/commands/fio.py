@@ -21,9 +21,13 @@ console = Console()
 @click.option('--end', '-e', required=True, type=int, help='End index for test namespaces')
 @click.option('--storage-class', help='Storage class name (required for deploy/run-all)')
 @click.option('--vm-name', '-n', default='fio-vm', help='VM resource name')
+@click.option('--vms-per-namespace', default=1, type=int,
+              help='Number of VMs per namespace, named <vm-name>-1 .. <vm-name>-N')
 @click.option('--vm-template', default='examples/vm-templates/fio-vm-template.yaml',
               help='Path to VM template YAML')
 @click.option('--namespace-prefix', default='fio-benchmark', help='Namespace prefix')
+@click.option('--namespace-pool',
+              help='Lease pre-provisioned namespaces from this pool (see: virtbench namespace-pool)')
 @click.option('--concurrency', '-c', default=20, type=int, help='Max parallel threads')
 @click.option('--fio-runtime', default=300, type=int, help='FIO runtime in seconds')
 @click.option('--fio-bs', default='4k', help='Block size (e.g., 4k, 8k, 64k)')
@@ -45,6 +49,10 @@ console = Console()
 @click.option('--ssh-pod-ns', default='default', help='SSH helper pod namespace')
 @click.option('--vm-user', default='cloud-user', help='VM SSH user')
 @click.option('--vm-password', default='changeme', help='VM SSH password')
+@click.option('--repeat', default=1, type=int,
+              help='Run the whole test K times with cleanup in between and report run-to-run statistics')
+@click.option('--settle-time', default=60, type=int,
+              help='Seconds to let the cluster settle between repetitions (default: 60)')
 @click.option('--log-file', type=click.Path(), help='Log file path')
 @click.option('--log-level', default='INFO',
               type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR']))
@@ -121,8 +129,12 @@ def fio(ctx, **kwargs):
     if kwargs['storage_class']:
         cmd.extend(['--storage-class', kwargs['storage_class']])
     cmd.extend(['--vm-name', kwargs['vm_name']])
+    if kwargs['vms_per_namespace'] > 1:
+        cmd.extend(['--vms-per-namespace', str(kwargs['vms_per_namespace'])])
     cmd.extend(['--vm-template', str(vm_template_path)])
     cmd.extend(['--namespace-prefix', kwargs['namespace_prefix']])
+    if kwargs.get('namespace_pool'):
+        cmd.extend(['--namespace-pool', kwargs['namespace_pool']])
     cmd.extend(['--concurrency', str(kwargs['concurrency'])])
     cmd.extend(['--fio-runtime', str(kwargs['fio_runtime'])])
     cmd.extend(['--fio-bs', kwargs['fio_bs']])
@@ -133,6 +145,9 @@ def fio(ctx, **kwargs):
     cmd.extend(['--results-dir', kwargs['results_dir']])
     cmd.extend(['--storage-driver', kwargs['storage_driver']])
     cmd.extend(['--disks-per-vm', kwargs['disks_per_vm']])
+    if kwargs['repeat'] > 1:
+        cmd.extend(['--repeat', str(kwargs['repeat'])])
+        cmd.extend(['--settle-time', str(kwargs['settle_time'])])
     cmd.extend(['--log-level', kwargs['log_level']])
 
     # Collection settings
@@ -29,11 +29,15 @@ def _normalize_source_nodes(values):
 @click.option('--start', '-s', default=1, type=int, help='Start index for test namespaces')
 @click.option('--end', '-e', default=10, type=int, help='End index for test namespaces')
 @click.option('--vm-name', '-n', default='rhel-9-vm', help='VM resource name')
+@click.option('--vms-per-namespace', default=1, type=int,
+              help='Number of VMs per namespace, named <vm-name>-1 .. <vm-name>-N')
 @click.option('--vm-template',
               default='examples/vm-templates/rhel9-vm-datasource.yaml',
               help='Path to VM template YAML')
 @click.option('--storage-class', help='Storage class name (required with --create-vms)')
 @click.option('--namespace-prefix', default='migration', help='Namespace prefix')
+@click.option('--namespace-pool',
+              help='With --create-vms, lease pre-provisioned namespaces from this pool')
 @click.option('--source-node', help='Source node for VM creation and migration')
 @click.option('--source-nodes', multiple=True,
               help='Multi-node evacuation: list of source nodes whose VMs will all be migrated '
@@ -52,6 +56,10 @@ def _normalize_source_nodes(values):
 @click.option('--interleaved-scheduling', is_flag=True,
               help='Interleave parallel migration scheduling across detected nodes')
 @click.option('--concurrency', '-c', default=50, type=int, help='Max parallel threads')
+@click.option('--max-per-source-node', default=0, type=int,
+              help='Max concurrent migrations leaving one node (0 = unlimited)')
+@click.option('--max-per-target-node', default=0, type=int,
+              help='Max concurrent migrations into one node when the harness picks targets (0 = unlimited)')
 @click.option('--poll-interval', default=1, type=int, help='Seconds between status checks')
 @click.option('--migration-timeout', default=600, type=int, help='Timeout for migration in seconds')
 @click.option('--max-migration-retries', default=3, type=int,
@@ -63,12 +71,46 @@ def _normalize_source_nodes(values):
 @click.option('--skip-ping', is_flag=True, help='Skip ping validation after migration')
 @click.option('--ssh-pod', default='ssh-test-pod', help='SSH pod name for ping tests (default: ssh-test-pod)')
 @click.option('--ssh-pod-ns', default='default', help='SSH pod namespace (default: default)')
+@click.option('--downtime-probe', type=click.Choice(['pod', 'guest']),
+              help='Ping continuously during each migration to measure network downtime '
+                   '(pod: SSH pod pings the VM; guest: the VM pings the SSH pod)')
+@click.option('--downtime-probe-interval', default=0.01, type=float,
+              help='Seconds between downtime probe pings (default: 0.01)')
+@click.option('--vm-user', default='cloud-user', help='VM SSH user for --downtime-probe guest and --dirty-rate')
+@click.option('--vm-password', default='changeme', help='VM SSH password for --downtime-probe guest and --dirty-rate')
+@click.option('--transfer-stats', is_flag=True,
+              help='Sample libvirt transfer statistics (data, bandwidth, dirty rate, iterations, '
+                   'pre-copy/post-copy) during each migration')
+@click.option('--transfer-stats-interval', default=2.0, type=float,
+              help='Seconds between transfer statistics samples (default: 2)')
 @click.option('--cleanup/--no-cleanup', default=False, help='Delete test resources after completion')
 @click.option('--yes', '-y', is_flag=True, help='Skip confirmation prompts')
 @click.option('--save-results', is_flag=True, help='Save detailed results to results folder')
 @click.option('--results-folder', default='../results', help='Base directory to store test results')
 @click.option('--storage-driver', help='Storage driver label for results path (for example: portworx-3.6, ceph)')
 @click.option('--log-file', type=click.Path(), help='Log file path (auto-generated if not specified)')
+@click.option('--soak-rounds', default=0, type=int,
+              help='Soak mode: migrate the same VMs back and forth for N rounds (0 = off)')
+@click.option('--soak-duration', default=0, type=int,
+              help='Soak mode: keep starting rounds until N seconds have passed (0 = off)')
+@click.option('--soak-drift-threshold', default=20.0, type=float,
+              help='Flag a soak slowdown above this percentage (default: 20)')
+@click.option('--dirty-rate', 'dirty_rates', multiple=True, type=float,
+              help='Dirty-rate sweep: migrate once per rate (MiB/s) with a memory-dirtying workload '
+                   'in every guest; 0 = idle baseline (repeatable)')
+@click.option('--dirty-wss', default=1024, type=int,
+              help='Working-set size of the dirty-page workload in MiB (default: 1024)')
+@click.option('--dirty-warmup', default=30, type=int,
+              help='Seconds the workload runs before migrating (default: 30)')
+@click.option('--concurrency-sweep', default=0, type=int, metavar='MAX',
+              help='Concurrency sweep: migrate once per in-flight limit 1, 2, 4, ... MAX and fit the '
+                   'Universal Scalability Law (0 = off)')
+@click.option('--repeat', default=1, type=int,
+              help='Run the whole test K times with cleanup in between and report run-to-run statistics')
+@click.option('--settle-time', default=60, type=int,
+              help='Seconds to let the cluster settle between repetitions (default: 60)')
+@click.option('--resume', type=click.Path(exists=True, file_okay=False),
+              help='Resume an interrupted run from its results directory (settings are restored from its run journal)')
 @click.pass_context
 def migration(ctx, **kwargs):
     """
@@ -152,6 +194,8 @@ def migration(ctx, **kwargs):
         'vm-template': str(template_path),
         'namespace-prefix': kwargs['namespace_prefix'],
         'concurrency': kwargs['concurrency'],
+        'max-per-source-node': kwargs['max_per_source_node'],
+        'max-per-target-node': kwargs['max_per_target_node'],
         'poll-interval': kwargs['poll_interval'],
         'migration-timeout': kwargs['migration_timeout'],
         'max-migration-retries': kwargs['max_migration_retries'],
@@ -184,6 +228,14 @@ def migration(ctx, **kwargs):
         python_args['save-results'] = True
     if kwargs['skip_ping']:
         python_args['skip-ping'] = True
+    if kwargs.get('downtime_probe'):
+        python_args['downtime-probe'] = kwargs['downtime_probe']
+        python_args['downtime-probe-interval'] = kwargs['downtime_probe_interval']
+        python_args['vm-user'] = kwargs['vm_user']
+        python_args['vm-password'] = kwargs['vm_password']
+    if kwargs.get('transfer_stats'):
+        python_args['transfer-stats'] = True
+        python_args['transfer-stats-interval'] = kwargs['transfer_stats_interval']
 
     # Add optional args
     if kwargs.get('source_node'):
@@ -197,6 +249,27 @@ def migration(ctx, **kwargs):
         python_args['target-node'] = kwargs['target_node']
     if kwargs.get('storage_driver'):
         python_args['storage-driver'] = kwargs['storage_driver']
+    if kwargs.get('resume'):
+        python_args['resume'] = kwargs['resume']
+    if kwargs['vms_per_namespace'] > 1:
+        python_args['vms-per-namespace'] = kwargs['vms_per_namespace']
+    if kwargs.get('namespace_pool'):
+        python_args['namespace-pool'] = kwargs['namespace_pool']
+    if kwargs['soak_rounds'] or kwargs['soak_duration']:
+        python_args['soak-rounds'] = kwargs['soak_rounds']
+        python_args['soak-duration'] = kwargs['soak_duration']
+        python_args['soak-drift-threshold'] = kwargs['soak_drift_threshold']
+    if kwargs.get('dirty_rates'):
+        python_args['dirty-rates'] = list(kwargs['dirty_rates'])
+        python_args['dirty-wss'] = kwargs['dirty_wss']
+        python_args['dirty-warmup'] = kwargs['dirty_warmup']
+        python_args['vm-user'] = kwargs['vm_user']
+        python_args['vm-password'] = kwargs['vm_password']
+    if kwargs['concurrency_sweep']:
+        python_args['concurrency-sweep'] = kwargs['concurrency_sweep']
+    if kwargs['repeat'] > 1:
+        python_args['repeat'] = kwargs['repeat']
+        python_args['settle-time'] = kwargs['settle_time']
     
     # Add log-file only when explicitly requested. With --save-results, the
     # script creates the run directory and writes migration.log next to JSON/CSV.
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Namespace pool command
+"""
+import click
+import subprocess
+import sys
+from pathlib import Path
+from rich.console import Console
+
+from virtbench.common import print_banner, build_python_command
+
+console = Console()
+
+
+@click.command('namespace-pool')
+@click.argument('action', type=click.Choice(['fill', 'status', 'release', 'drain']))
+@click.option('--pool', required=True, help='Pool name')
+@click.option('--namespace-prefix', default='kubevirt-perf-test', help='Namespace prefix')
+@click.option('--start', '-s', default=1, type=int, help='Starting namespace index')
+@click.option('--end', '-e', type=int, help='Ending namespace index (required for fill and release)')
+@click.option('--secret-yaml', type=click.Path(exists=True),
+              help='Cloud-init secret YAML applied into every pool namespace')
+@click.option('--manifest', multiple=True, type=click.Path(exists=True),
+              help='Extra YAML (RBAC, quotas, ...) applied into every pool namespace (repeatable)')
+@click.option('--batch-size', default=20, type=int, help='Namespaces to process in parallel')
+@click.pass_context
+def namespace_pool(ctx, action, **kwargs):
+    """
+    Manage a pool of pre-provisioned namespaces
+
+    Pool namespaces are created and provisioned (secret, RBAC, quotas) ahead of
+    time. Benchmarks lease them with --namespace-pool, so namespace and secret
+    creation stays out of the measured window, and return them after wiping
+    their VMs, DataVolumes and PVCs.
+
+    \b
+    Actions:
+      fill      Create and provision namespaces and add them to the pool
+      status    Show pool members and their leases
+      release   Wipe and force-release namespaces left leased by an aborted run
+      drain     Delete every namespace of the pool
+
+    \b
+    Examples:
+      # Provision 50 namespaces with the cloud-init secret
+      virtbench namespace-pool fill --pool perf -s 1 -e 50 \\
+        --namespace-prefix datasource-clone --secret-yaml my-cloudinit-secret.yaml
+
+      # Run a benchmark on leased namespaces
+      virtbench datasource-clone -s 1 -e 50 --storage-class YOUR-STORAGE-CLASS \\
+        --namespace-pool perf
+
+      # Remove the pool
+      virtbench namespace-pool drain --pool perf
+    """
+    print_banner("Namespace Pool")
+
+    repo_root = ctx.obj.repo_root
+    script_path = repo_root / 'utils' / 'namespace_pool.py'
+
+    if not script_path.exists():
+        console.print(f"[red]Error: Script not found: {script_path}[/red]")
+        sys.exit(1)
+
+    python_args = {
+        'log-level': ctx.obj.log_level.upper(),
+        'pool': kwargs['pool'],
+        'namespace-prefix': kwargs['namespace_prefix'],
+        'start': kwargs['start'],
+        'end': kwargs['end'],
+        'batch-size': kwargs['batch_size'],
+    }
+
+    if kwargs.get('secret_yaml'):
+        python_args['secret-yaml'] = str(Path(kwargs['secret_yaml']).resolve())
+    if kwargs.get('manifest'):
+        python_args['manifest'] = [str(Path(m).resolve()) for m in kwargs['manifest']]
+
+    if ctx.obj.kubeconfig:
+        python_args['kubeconfig'] = ctx.obj.kubeconfig
+
+    cmd = build_python_command(script_path, python_args)
+    cmd.insert(2, action)
+
+    console.print(f"[dim]Running: {' '.join(cmd[:3])} ...[/dim]")
+    console.print()
+
+    try:
+        result = subprocess.run(cmd, cwd=repo_root)
+        sys.exit(result.returncode)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Interrupted by user[/yellow]")
+        sys.exit(130)
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
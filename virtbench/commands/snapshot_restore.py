@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Snapshot restore benchmark command
+"""
+import click
+import subprocess
+import sys
+from rich.console import Console
+
+from virtbench.common import print_banner, build_python_command, generate_log_filename
+
+console = Console()
+
+
+@click.command('snapshot-restore')
+@click.option('--start', '-s', default=1, type=int, help='Starting namespace index')
+@click.option('--end', '-e', default=10, type=int, help='Ending namespace index')
+@click.option('--vm-name', '-n', default='rhel-9-vm', help='VM name in every namespace')
+@click.option('--namespace-prefix', default='kubevirt-perf-test', help='Namespace prefix')
+@click.option('--concurrency', '-c', default=10, type=int, help='VMs snapshotted and restored at a time')
+@click.option('--poll-interval', default=2, type=int, help='Seconds between status checks')
+@click.option('--snapshot-timeout', default=600, type=int, help='Timeout for a snapshot to become ready (seconds)')
+@click.option('--restore-timeout', default=1800, type=int, help='Timeout for a restore to complete (seconds)')
+@click.option('--vm-timeout', default=900, type=int, help='Timeout for a VM to stop or reach Running (seconds)')
+@click.option('--ping-timeout', default=600, type=int, help='Timeout for the guest to answer ping and SSH (seconds)')
+@click.option('--skip-ping', is_flag=True, help='Do not wait for the restored guest to answer ping')
+@click.option('--skip-checksum', is_flag=True, help='Do not write and verify the checksum file in the guest')
+@click.option('--checksum-size-mb', default=64, type=int, help='Size of the checksum file in MiB')
+@click.option('--ssh-pod', default='ssh-test-pod', help='SSH pod name for ping and checksum')
+@click.option('--ssh-pod-ns', default='default', help='SSH pod namespace')
+@click.option('--vm-user', default='cloud-user', help='Guest SSH user')
+@click.option('--vm-password', default='changeme', help='Guest SSH password')
+@click.option('--cleanup', is_flag=True, help='Delete the snapshots and restore objects after the test')
+@click.option('--save-results', is_flag=True, help='Save results to JSON/CSV files in the results folder')
+@click.option('--results-folder', default='results', help='Base directory to store test results')
+@click.option('--storage-driver', help='Storage driver label for results path (for example: portworx-3.6, ceph)')
+@click.option('--log-file', type=click.Path(), help='Log file path (auto-generated if not specified)')
+@click.option('--log-level', default='INFO', type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR']),
+              help='Logging level')
+@click.pass_context
+def snapshot_restore(ctx, **kwargs):
+    """
+    Run snapshot restore benchmark
+
+    Snapshots the VMs of existing namespaces, then restores them from the
+    snapshots with VirtualMachineRestore, --concurrency VMs at a time. Each
+    restore is timed through its phases (restore created, volumes restored,
+    VM Running, guest ping), and a checksum of a file written before the
+    snapshot proves the data came back.
+
+    \b
+    Examples:
+      # Restore the VMs of kubevirt-perf-test-1..50, 10 at a time
+      virtbench snapshot-restore --start 1 --end 50 --concurrency 10 --save-results
+
+      # Restore everything at once, without guest checks
+      virtbench snapshot-restore -s 1 -e 50 -c 50 --skip-ping --skip-checksum
+
+      # Delete the snapshots and restore objects afterwards
+      virtbench snapshot-restore -s 1 -e 10 --cleanup
+    """
+    print_banner("Snapshot Restore Benchmark")
+
+    repo_root = ctx.obj.repo_root
+    script_path = repo_root / 'snapshot-restore' / 'measure-snapshot-restore.py'
+
+    if not script_path.exists():
+        console.print(f"[red]Error: Script not found: {script_path}[/red]")
+        sys.exit(1)
+
+    console.print(f"[cyan]Namespaces: {kwargs['namespace_prefix']}-{kwargs['start']} .. "
+                  f"{kwargs['namespace_prefix']}-{kwargs['end']}[/cyan]")
+    console.print(f"[cyan]Concurrency: {kwargs['concurrency']}[/cyan]")
+
+    # Map CLI args to Python script args
+    python_args = {
+        'start': kwargs['start'],
+        'end': kwargs['end'],
+        'vm-name': kwargs['vm_name'],
+        'namespace-prefix': kwargs['namespace_prefix'],
+        'concurrency': kwargs['concurrency'],
+        'poll-interval': kwargs['poll_interval'],
+        'snapshot-timeout': kwargs['snapshot_timeout'],
+        'restore-timeout': kwargs['restore_timeout'],
+        'vm-timeout': kwargs['vm_timeout'],
+        'ping-timeout': kwargs['ping_timeout'],
+        'checksum-size-mb': kwargs['checksum_size_mb'],
+        'ssh-pod': kwargs['ssh_pod'],
+        'ssh-pod-ns': kwargs['ssh_pod_ns'],
+        'vm-user': kwargs['vm_user'],
+        'vm-password': kwargs['vm_password'],
+        'results-folder': kwargs['results_folder'],
+        'log-level': kwargs['log_level'],
+    }
+
+    if kwargs['skip_ping']:
+        python_args['skip-ping'] = True
+    if kwargs['skip_checksum']:
+        python_args['skip-checksum'] = True
+    if kwargs['cleanup']:
+        python_args['cleanup'] = True
+    if kwargs['save_results']:
+        python_args['save-results'] = True
+    if kwargs.get('storage_driver'):
+        python_args['storage-driver'] = kwargs['storage_driver']
+
+    # Add log-file
+    if kwargs.get('log_file'):
+        python_args['log-file'] = kwargs['log_file']
+    elif ctx.obj.log_file:
+        python_args['log-file'] = ctx.obj.log_file
+    else:
+        python_args['log-file'] = generate_log_filename('snapshot-restore')
+
+    # Build and run command
+    cmd = build_python_command(script_path, python_args)
+
+    console.print(f"[dim]Running: {' '.join(cmd[:2])} ...[/dim]")
+    console.print()
+
+    try:
+        result = subprocess.run(cmd, cwd=repo_root)
+        sys.exit(result.returncode)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Interrupted by user[/yellow]")
+        sys.exit(130)
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
@@ -112,6 +112,11 @@ def vm_ops():
 @click.option('--uncordon-after', is_flag=True, help='Uncordon node after drain completes')
 @click.option('--wait-between', type=int, default=None,
               help='Seconds to wait between nodes (simulates reboot, default: 0)')
+@click.option('--max-unavailable', type=int, default=None,
+              help='Sequential mode: nodes drained at the same time (default: 1)')
+@click.option('--track-migrations', is_flag=True,
+              help='Record evacuation migrations per drain and save a rolling upgrade report')
+@click.option('--output-dir', type=click.Path(), default=None, help='Directory for the --track-migrations report')
 @click.option('--dry-run', is_flag=True, help='Show what would be done without draining')
 @click.option('--log-file', type=click.Path(), default=None, help='Path to log file')
 @click.pass_context
@@ -119,11 +124,11 @@ def drain_nodes(ctx, **kwargs):
     """Drain Kubernetes nodes and measure drain time."""
     print_banner("VM-Ops: Drain Nodes")
     args = {'nodes': list(kwargs['nodes']), 'log-level': ctx.obj.log_level.upper()}
-    for k in ('timeout', 'grace_period', 'wait_between'):
+    for k in ('timeout', 'grace_period', 'wait_between', 'max_unavailable', 'output_dir'):
         if kwargs[k] is not None:
             args[k.replace('_', '-')] = kwargs[k]
     for flag in ('parallel', 'ignore_daemonsets', 'delete_emptydir',
-                 'force', 'uncordon_after', 'dry_run'):
+                 'force', 'uncordon_after', 'track_migrations', 'dry_run'):
         if kwargs[flag]:
             args[flag.replace('_', '-')] = True
     if kwargs['log_file']:
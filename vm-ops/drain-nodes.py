@@ -22,20 +22,39 @@ Usage:
     python3 drain-nodes.py --nodes worker-1 worker-2 worker-3 \
         --timeout 1800 --uncordon-after --wait-between 120
 
+    # Rolling upgrade, two nodes at a time, with the evacuation migrations of every drain
+    python3 drain-nodes.py --nodes worker-1 worker-2 worker-3 worker-4 \
+        --timeout 1800 --uncordon-after --wait-between 120 --max-unavailable 2 --track-migrations
+
     # Dry run
     python3 drain-nodes.py --nodes worker-1 --dry-run
 """
 
 import argparse
+import csv
 import json
 import logging
+import os
 import subprocess
 import sys
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Tuple, Dict
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.common import (
+    run_kubectl_command, VMPlacementIndex, get_vmim_phase_breakdown, parse_k8s_timestamp,
+    summarize_distribution, MIGRATION_STAGES,
+)
+
+# Annotation KubeVirt puts on the VMIMs it creates for evicted VMIs (value: the drained node)
+EVACUATION_ANNOTATION = "kubevirt.io/evacuationMigration"
+
+# Parallel VMIM reads when collecting the evacuation migrations after the roll
+MIGRATION_COLLECT_CONCURRENCY = 20
+
 
 def setup_logging(level: str = "INFO", log_file: str = None) -> logging.Logger:
     """Configure logging to console and optionally to a file."""
@@ -270,6 +289,144 @@ def uncordon_node(node_name: str, logger: logging.Logger) -> bool:
         return False
 
 
+def get_evacuation_migrations(nodes: List[str], since: datetime, logger: logging.Logger) -> List[Dict]:
+    """
+    List the VMIMs KubeVirt created to evacuate VMIs from the given nodes.
+
+    Drains evict virt-launcher pods; with evictionStrategy LiveMigrate KubeVirt
+    answers each eviction with a VMIM annotated kubevirt.io/evacuationMigration=<node>.
+    Only VMIMs created since `since` (one second of slack for the timestamp
+    resolution) are returned.
+    """
+    returncode, stdout, stderr = run_kubectl_command(
+        ["get", "virtualmachineinstancemigration", "-A", "-o", "json"], check=False, timeout=120, logger=logger
+    )
+    if returncode != 0:
+        logger.warning(f"Could not list VMIMs: {stderr.strip()}")
+        return []
+    try:
+        items = json.loads(stdout).get("items", [])
+    except json.JSONDecodeError:
+        return []
+
+    migrations = []
+    for item in items:
+        meta = item.get("metadata", {})
+        node = meta.get("annotations", {}).get(EVACUATION_ANNOTATION)
+        created = parse_k8s_timestamp(meta.get("creationTimestamp"))
+        if node not in nodes or not created or created < since - timedelta(seconds=1):
+            continue
+        state = item.get("status", {}).get("migrationState", {}) or {}
+        migrations.append({
+            "node": node,
+            "namespace": meta.get("namespace", ""),
+            "vmi": item.get("spec", {}).get("vmiName") or meta.get("labels", {}).get("kubevirt.io/vmi-name", ""),
+            "vmim": meta.get("name", ""),
+            "phase": item.get("status", {}).get("phase", "Unknown"),
+            "source_node": state.get("sourceNode"),
+            "target_node": state.get("targetNode"),
+        })
+    return migrations
+
+
+def collect_drain_migrations(results: List[Dict], since: datetime, concurrency: int,
+                             logger: logging.Logger) -> None:
+    """
+    Attach the VMIs each drain evicted and their evacuation migrations to the drain results.
+
+    Every VMIM gets its VMIM time (created -> Succeeded) and stage breakdown;
+    VMIs that were on the node but have no evacuation VMIM are reported as
+    evicted without live migration.
+    """
+    migrations = get_evacuation_migrations([r["node"] for r in results], since, logger)
+
+    def with_stages(migration):
+        breakdown = get_vmim_phase_breakdown(migration["vmi"], migration["namespace"], logger,
+                                             migration_name=migration["vmim"]) or {}
+        events = breakdown.get("events", {})
+        created, succeeded = parse_k8s_timestamp(events.get("created")), parse_k8s_timestamp(events.get("Succeeded"))
+        migration["vmim_time_sec"] = round((succeeded - created).total_seconds(), 2) \
+            if created and succeeded and migration["phase"] == "Succeeded" else None
+        for stage, _, _ in MIGRATION_STAGES:
+            migration[stage] = breakdown.get(stage)
+        return migration
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        migrations = list(executor.map(with_stages, migrations))
+
+    for r in results:
+        r["migrations"] = sorted((m for m in migrations if m["node"] == r["node"]),
+                                 key=lambda m: (m["namespace"], m["vmi"]))
+        migrated = {(m["namespace"], m["vmi"]) for m in r["migrations"]}
+        r["evicted_without_migration"] = [f"{ns}/{name}" for ns, name in r.get("vmis_before", [])
+                                          if (ns, name) not in migrated]
+        succeeded = sum(1 for m in r["migrations"] if m["phase"] == "Succeeded")
+        logger.info(f"[{r['node']}] {len(r.get('vmis_before', []))} VMIs before drain, "
+                    f"{succeeded}/{len(r['migrations'])} evacuation migrations succeeded"
+                    + (f", {len(r['evicted_without_migration'])} evicted without live migration"
+                       if r["evicted_without_migration"] else ""))
+
+
+def save_rolling_upgrade_results(output_dir: str, results: List[Dict], wall_time: float,
+                                 max_unavailable: int, logger: logging.Logger) -> Dict:
+    """Save per-node drain timelines, per-VMI migrations and the rolling upgrade summary."""
+    os.makedirs(output_dir, exist_ok=True)
+
+    def iso(value):
+        return value.isoformat() if isinstance(value, datetime) else value
+
+    nodes = [{k: iso(v) for k, v in r.items()} for r in results]
+    for r in nodes:
+        r["vmis_before"] = [f"{ns}/{name}" for ns, name in r.get("vmis_before", [])]
+    with open(os.path.join(output_dir, "rolling_upgrade_nodes.json"), "w") as f:
+        json.dump(nodes, f, indent=4)
+
+    node_fields = ["batch", "node", "success", "start_time", "end_time", "duration_seconds",
+                   "wait_seconds", "uncordon_time", "vmis_before", "migrations", "migrations_succeeded",
+                   "evicted_without_migration"]
+    with open(os.path.join(output_dir, "rolling_upgrade_nodes.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=node_fields)
+        writer.writeheader()
+        for r in nodes:
+            writer.writerow({
+                **{k: r.get(k) for k in node_fields},
+                "vmis_before": len(r["vmis_before"]),
+                "migrations": len(r.get("migrations", [])),
+                "migrations_succeeded": sum(1 for m in r.get("migrations", []) if m["phase"] == "Succeeded"),
+                "evicted_without_migration": len(r.get("evicted_without_migration", [])),
+            })
+
+    migrations = [dict(m, batch=r.get("batch")) for r in results for m in r.get("migrations", [])]
+    migration_fields = ["batch", "node", "namespace", "vmi", "vmim", "phase", "source_node", "target_node",
+                        "vmim_time_sec"] + [stage for stage, _, _ in MIGRATION_STAGES]
+    with open(os.path.join(output_dir, "rolling_upgrade_migrations.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=migration_fields)
+        writer.writeheader()
+        writer.writerows({k: m.get(k) for k in migration_fields} for m in migrations)
+
+    succeeded = [m for m in migrations if m["phase"] == "Succeeded"]
+    summary = {
+        "total_upgrade_wall_time_sec": round(wall_time, 2),
+        "max_unavailable": max_unavailable,
+        "nodes": len(results),
+        "nodes_drained": sum(1 for r in results if r["success"]),
+        "drain_time_sec": summarize_distribution([r["duration_seconds"] for r in results if r["success"]]),
+        "per_node_drain_time_sec": {r["node"]: round(r["duration_seconds"], 2) for r in results},
+        "vmis_evicted": sum(len(r.get("vmis_before", [])) for r in results),
+        "migrations": len(migrations),
+        "migrations_succeeded": len(succeeded),
+        "evicted_without_migration": sum(len(r.get("evicted_without_migration", [])) for r in results),
+        "vmim_time_sec": summarize_distribution([m["vmim_time_sec"] for m in succeeded if m["vmim_time_sec"] is not None]),
+    }
+    for stage, _, _ in MIGRATION_STAGES:
+        summary[stage] = summarize_distribution([m[stage] for m in succeeded if m.get(stage) is not None])
+    with open(os.path.join(output_dir, "summary_rolling_upgrade.json"), "w") as f:
+        json.dump(summary, f, indent=4)
+
+    logger.info(f"Rolling upgrade results saved under: {output_dir}")
+    return summary
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Drain Kubernetes nodes and measure drain time"
@@ -292,6 +449,14 @@ def main():
                         help="Uncordon node after drain completes")
     parser.add_argument("--wait-between", type=int, default=0,
                         help="Seconds to wait between nodes (simulates reboot time, default: 0)")
+    parser.add_argument("--max-unavailable", type=int, default=1,
+                        help="Sequential mode: nodes drained at the same time (default: 1)")
+    parser.add_argument("--track-migrations", action="store_true",
+                        help="Record the VMIs each drain evicted and their evacuation migrations with "
+                             "VMIM stages, and save a rolling upgrade report")
+    parser.add_argument("--output-dir", default=None,
+                        help="Directory for the --track-migrations report "
+                             "(default: results/<timestamp>_rolling_upgrade_<N>nodes)")
     parser.add_argument("--dry-run", action="store_true",
                         help="Show what would be done without draining")
     parser.add_argument("--log-level", default="INFO",
@@ -300,9 +465,10 @@ def main():
                         help="Path to log file (auto-generated if not specified)")
 
     args = parser.parse_args()
+    if args.max_unavailable < 1:
+        parser.error("--max-unavailable must be >= 1")
 
     # Always log to a file
-    import os
     log_file = args.log_file
     if not log_file:
         os.makedirs("logs", exist_ok=True)
@@ -326,6 +492,10 @@ def main():
         logger.info(f"Wait between nodes: {args.wait_between}s ({args.wait_between / 60:.1f} min)")
     if args.uncordon_after and not args.parallel:
         logger.info("Mode: OCP UPGRADE SIMULATION (drain -> uncordon -> next)")
+        if args.max_unavailable > 1:
+            logger.info(f"Max unavailable: {args.max_unavailable} nodes")
+    if args.track_migrations:
+        logger.info("Tracking evacuation migrations per drain")
     if args.dry_run:
         logger.info("DRY-RUN MODE - No actual drain will be performed")
     logger.info("=" * 80)
@@ -338,8 +508,14 @@ def main():
 
     overall_start = datetime.now()
     all_results = []
+    # VMIs on each node right before its drain, for --track-migrations
+    index = VMPlacementIndex(logger) if args.track_migrations else None
 
     if args.parallel:
+        vmis_before = {}
+        if index:
+            index.refresh()
+            vmis_before = {node: index.vms_on_node(node) for node in args.nodes}
         # Drain nodes in parallel
         with ThreadPoolExecutor(max_workers=len(args.nodes)) as executor:
             futures = {
@@ -355,6 +531,7 @@ def main():
                 node = futures[future]
                 try:
                     result = future.result()
+                    result["vmis_before"] = vmis_before.get(node, [])
                     all_results.append(result)
                 except Exception as e:
                     logger.error(f"[{node}] Exception: {e}")
@@ -365,24 +542,44 @@ def main():
                         "error": str(e)
                     })
     else:
-        # Drain nodes sequentially (simulates OCP upgrade behavior)
-        for i, node in enumerate(args.nodes):
-            result = drain_node(
-                node, args.timeout, args.grace_period,
-                args.ignore_daemonsets, args.delete_emptydir,
-                args.force, logger, args.dry_run
-            )
-            all_results.append(result)
-
-            # Uncordon immediately after this node (OCP upgrade simulation)
-            if args.uncordon_after and not args.dry_run and result["success"]:
+        # Drain nodes sequentially, --max-unavailable at a time (simulates OCP upgrade behavior)
+        batches = [args.nodes[i:i + args.max_unavailable] for i in range(0, len(args.nodes), args.max_unavailable)]
+        for batch_no, batch in enumerate(batches, 1):
+            if args.max_unavailable > 1:
+                logger.info(f"Batch {batch_no}/{len(batches)}: {', '.join(batch)}")
+            vmis_before = {}
+            if index:
+                index.refresh()
+                vmis_before = {node: index.vms_on_node(node) for node in batch}
+
+            with ThreadPoolExecutor(max_workers=len(batch)) as executor:
+                batch_results = list(executor.map(
+                    lambda node: drain_node(
+                        node, args.timeout, args.grace_period,
+                        args.ignore_daemonsets, args.delete_emptydir,
+                        args.force, logger, args.dry_run
+                    ),
+                    batch
+                ))
+            for result in batch_results:
+                result["batch"] = batch_no
+                result["vmis_before"] = vmis_before.get(result["node"], [])
+            all_results.extend(batch_results)
+
+            # Uncordon immediately after this batch (OCP upgrade simulation)
+            drained = [r for r in batch_results if r["success"]]
+            if args.uncordon_after and not args.dry_run and drained:
                 if args.wait_between > 0:
-                    logger.info(f"[{node}] Simulating reboot/update, waiting {args.wait_between}s...")
+                    logger.info(f"[{', '.join(r['node'] for r in drained)}] Simulating reboot/update, "
+                                f"waiting {args.wait_between}s...")
                     time.sleep(args.wait_between)
-                uncordon_node(node, logger)
+                for r in drained:
+                    r["wait_seconds"] = args.wait_between
+                    uncordon_node(r["node"], logger)
+                    r["uncordon_time"] = datetime.now()
 
-            # Wait before next node
-            if i < len(args.nodes) - 1 and args.wait_between > 0 and not args.uncordon_after:
+            # Wait before next batch
+            if batch_no < len(batches) and args.wait_between > 0 and not args.uncordon_after:
                 logger.info(f"Waiting {args.wait_between}s before next node...")
                 time.sleep(args.wait_between)
 
@@ -393,9 +590,22 @@ def main():
         for result in all_results:
             if result["success"]:
                 uncordon_node(result["node"], logger)
+                result["uncordon_time"] = datetime.now()
 
     overall_elapsed = (datetime.now() - overall_start).total_seconds()
 
+    # Evacuation VMIMs and their stages are read after the roll so the API reads stay out of the timings
+    upgrade_summary = None
+    if args.track_migrations and not args.dry_run:
+        logger.info("")
+        logger.info("Collecting evacuation migrations...")
+        collect_drain_migrations(all_results, overall_start, MIGRATION_COLLECT_CONCURRENCY, logger)
+        output_dir = args.output_dir or os.path.join(
+            "results", f"{overall_start.strftime('%Y%m%d-%H%M%S')}_rolling_upgrade_{len(args.nodes)}nodes"
+        )
+        upgrade_summary = save_rolling_upgrade_results(output_dir, all_results, overall_elapsed,
+                                                       args.max_unavailable, logger)
+
     # Print VMI distribution AFTER drain
     logger.info("")
     logger.info("=" * 80)
@@ -447,6 +657,26 @@ def main():
 
     logger.info("=" * 80)
 
+    if upgrade_summary:
+        logger.info("")
+        logger.info("ROLLING UPGRADE:")
+        logger.info(f"  Total upgrade wall time: {upgrade_summary['total_upgrade_wall_time_sec']:.2f}s "
+                    f"({upgrade_summary['total_upgrade_wall_time_sec'] / 60:.2f} min)")
+        logger.info(f"  VMIs evicted:            {upgrade_summary['vmis_evicted']}")
+        logger.info(f"  Live migrations:         {upgrade_summary['migrations_succeeded']}/"
+                    f"{upgrade_summary['migrations']} succeeded")
+        if upgrade_summary['evicted_without_migration']:
+            logger.info(f"  Evicted w/o migration:   {upgrade_summary['evicted_without_migration']}")
+        logger.info(f"  {'Migration latency':<24} {'Avg':>8} {'P50':>8} {'P95':>8} {'P99':>8} {'Max':>8}")
+        for key in ["vmim_time_sec"] + [stage for stage, _, _ in MIGRATION_STAGES]:
+            dist = upgrade_summary[key]
+            label = "VMIM time" if key == "vmim_time_sec" else "  " + key[:-len("_sec")].replace("_", " ").title()
+            if dist["count"]:
+                logger.info(f"  {label:<24} " + " ".join(f"{dist[s]:>7.2f}s" for s in ("avg", "p50", "p95", "p99", "max")))
+            else:
+                logger.info(f"  {label:<24} {'N/A':>8}")
+        logger.info("=" * 80)
+
     # Print failures
     if failed_count > 0:
         logger.info("")